@@ -11,6 +11,7 @@
 
 import numpy as np
 from warnings import warn
+from copy import deepcopy
 
 import Legacy.trunk.S as SUAVE
 
@@ -21,7 +22,7 @@ from Legacy.trunk.S.Attributes.Planets import Earth
 
 from Legacy.trunk.S.Analyses.Mission.Segments.Conditions import Conditions
 
-from Legacy.trunk.S.Core import Units
+from Legacy.trunk.S.Core import Units, Data
 from Legacy.trunk.S.Core.Arrays import atleast_2d_col
 
 
@@ -41,6 +42,10 @@ class US_Standard_1976(Atmospheric):
     U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
     """
     
+    _layers = None
+    _checked = None
+    _memo = None
+    
     def __defaults__(self):
         """This sets the default values for the analysis to function.
 
@@ -62,6 +67,9 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # reuse the values of the last call when it had the same altitudes
+        self.settings.memoize_altitude = False
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
@@ -96,69 +104,69 @@ class US_Standard_1976(Atmospheric):
             altitude                             [m]
             temperature                          [K]
             pressure                             [Pa]
+          settings.memoize_altitude              [boolean]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
+        layers    = self.compute_layer_constants()
         
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
+        # check properties, once for each fluid and planet
+        self.check_properties()
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
+        
+        # reuse the last values for the same altitudes
+        memoize = self.settings.memoize_altitude
+        memo    = self._memo
+        if memoize and memo is not None and memo.layers is layers and memo.var_gamma == var_gamma \
+           and memo.altitude.shape == zs.shape and np.array_equal(memo.altitude,zs) \
+           and np.array_equal(memo.temperature_deviation,delta_isa):
+            atmo_data = Conditions()
+            atmo_data.expand_rows(zs.shape[0])
+            for key,value in memo.values.items():
+                atmo_data[key] = value.copy()
+            return atmo_data
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = layers.altitude[0]
+        zmax = layers.altitude[-1]   
         
         # convert geometric to geopotential altitude
-        zs = zs/(1 + zs/Rad)
+        z = zs/(1 + zs/layers.mean_radius)
         
         # check ranges
-        if np.amin(zs) < zmin:
+        if np.amin(z) < zmin:
             print("Warning: altitude requested below minimum for this atmospheric model; returning values for h = -2.0 km")
-            zs[zs < zmin] = zmin
-        if np.amax(zs) > zmax:
+            z[z < zmin] = zmin
+        if np.amax(z) > zmax:
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
-            zs[zs > zmax] = zmax        
-
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+            z[z > zmax] = zmax        
+
+        # find the layer of each altitude, an altitude on a break is in the layer above it as the values at the 
+        # edges are the same
+        i_layer = np.searchsorted(layers.altitude,z,side='right') - 1
+        np.clip(i_layer,0,len(layers.lapse_rate)-1,out=i_layer)
+        z0    = layers.altitude[i_layer]
+        T0    = layers.temperature[i_layer]
+        p0    = layers.pressure[i_layer]
+        alpha = layers.lapse_rate[i_layer]
         
         # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        dz   = z - z0
+        grav = layers.gravity
+        R    = layers.gas_constant
+        if not layers.isothermal.any():
+            p = p0 * ( (1.-alpha*dz/T0) **layers.exponent[i_layer] )
+        else:
+            i_isoth    = layers.isothermal[i_layer]
+            i_adiab    = ~i_isoth
+            p          = np.empty_like(z)
+            p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+            p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **layers.exponent[i_layer[i_adiab]] )
         
         T   = T0 - dz*alpha + delta_isa
         rho = gas.compute_density(T,p)
@@ -178,7 +186,114 @@ class US_Standard_1976(Atmospheric):
         atmo_data.thermal_conductivity = K
         atmo_data.prandtl_number       = Pr
         
+        if memoize:
+            memo                       = Data()
+            memo.layers                = layers
+            memo.var_gamma             = var_gamma
+            memo.altitude              = np.array(zs)
+            memo.temperature_deviation = np.array(delta_isa)
+            memo.values                = {key:value.copy() for key,value in atmo_data.items()}
+            self._memo                 = memo
+        
         return atmo_data
+    
+    def compute_layer_constants(self):
+        """Computes the constants of each layer between the altitude breaks, which are kept until the values of the
+        breaks, gas constant, gravity or radius change, in place as well.
+
+        Assumptions:
+        None
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        layers.
+          altitude                               [m]
+          temperature                            [K]
+          pressure                               [Pa]
+          lapse_rate                             [K/m]
+          isothermal                             [boolean]
+          exponent                               [-]
+           
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          planet.mean_radius                     [m]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        breaks = self.breaks
+        values = (breaks.altitude, breaks.temperature, breaks.pressure, self.fluid_properties.gas_specific_constant,
+                  self.planet.sea_level_gravity, self.planet.mean_radius)
+        key    = tuple([(np.shape(v), np.asarray(v,dtype=float).tobytes()) for v in values])
+        layers = self._layers
+        if layers is not None and key == layers.key:
+            return layers
+        
+        grav  = self.planet.sea_level_gravity
+        R     = self.fluid_properties.gas_specific_constant
+        alpha = -(breaks.temperature[1:] - breaks.temperature[:-1])/ \
+                 (breaks.altitude[1:]    - breaks.altitude[:-1])
+        
+        layers              = Data()
+        layers.key          = key
+        layers.altitude     = np.array(breaks.altitude,dtype=float)
+        layers.temperature  = np.array(breaks.temperature[:-1],dtype=float)
+        layers.pressure     = np.array(breaks.pressure[:-1],dtype=float)
+        layers.lapse_rate   = alpha
+        layers.isothermal   = (alpha == 0.)
+        layers.exponent     = 1.*grav/(np.where(layers.isothermal,1.,alpha)*R)
+        layers.gravity      = grav
+        layers.gas_constant = R
+        layers.mean_radius  = self.planet.mean_radius
+        self._layers        = layers
+        self._memo          = None
+        
+        return layers
+    
+    def check_properties(self):
+        """Warns when the fluid is not air or the planet is not Earth, checked again only when the values of the fluid
+        or the planet change.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        None
+           
+        Properties Used:
+        self.
+          fluid_properties
+          planet
+        """
+        
+        gas     = self.fluid_properties
+        planet  = self.planet
+        checked = self._checked
+        if checked is not None and checked[0] == gas and checked[1] == planet:
+            return
+        
+        if not gas == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')  
+        self._checked = (deepcopy(gas), deepcopy(planet))
+        
+        return
 
 
 # ----------------------------------------------------------------------
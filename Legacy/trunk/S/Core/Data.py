@@ -6,6 +6,7 @@
 #           May 2020, E. Botero
 #           Jul 2021, E. Botero
 #           Oct 2021, E. Botero
+#           Oct 2026, RCAIDE Team
 
 
 
@@ -25,8 +26,10 @@ chars = string.punctuation + string.whitespace
 t_table = str.maketrans( chars          + string.ascii_uppercase , 
                             '_'*len(chars) + string.ascii_lowercase )
 
-dictgetitem = dict.__getitem__
+dictgetitem  = dict.__getitem__
+dictget      = dict.get
 objgetattrib = object.__getattribute__
+missing      = object()
 
 # ----------------------------------------------------------------------
 #   Data
@@ -37,6 +40,10 @@ class Data(dict):
     """ An extension of the Python dict which allows for both tag and '.' usage.
         This is an unordered dictionary. So indexing it will not produce deterministic results.
         This has less overhead than ordering. If ordering is needed use DataOrdered().
+        
+        Keys are looked up before attributes without raising an exception. Attributes that are not keys, such as
+        the class level attributes of subclasses and the values set on them, are kept in the instance __dict__, 
+        so a Data() holds no reference to itself and is freed by reference counting.
        
         Assumptions:
         N/A
@@ -49,7 +56,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Checks if it is a key, but if it is not treats it as an object
     
             Source:
             N/A
@@ -63,16 +70,17 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,missing)
+        if v is missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
             This one tries to treat k as an object, if that fails it treats it as a key.
+            Names that are not attributes of the class are keys, as only those are set on the instance.
     
             Source:
             N/A
@@ -87,6 +95,9 @@ class Data(dict):
             Properties Used:
             N/A    
         """
+        if getattr(type(self),k,missing) is missing:
+            self[k] = v
+            return
         try:
             objgetattrib(self, k)
         except:
@@ -119,6 +130,33 @@ class Data(dict):
         else:
             object.__delattr__(self, k)
     
+    def __copy__(self):
+        """ A shallow copy, used by copy.copy(). The values of the keys and of the attributes are shared with the
+            original, and the defaults are not run again.
+            
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            copied
+    
+            Properties Used:
+            N/A    
+        """  
+        copied = dict.__new__(type(self))
+        dict.update(copied,self)
+        attributes = objgetattrib(self,'__dict__')
+        if attributes:
+            objgetattrib(copied,'__dict__').update(attributes)
+        
+        return copied
+    
     def __defaults__(self):
         """ A stub for all classes that come later
             
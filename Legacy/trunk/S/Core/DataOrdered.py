@@ -681,11 +681,11 @@ class DataOrdered(OrderedDict):
         """        
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
-        #if not self.has_key(key) and not hasattr(self.__class__,key):
+        # existing keys are found in the map without an attribute lookup
+        map  = dict.__getitem__(self,'_map')
+        if key not in map and not hasattr(self,key) and not hasattr(self.__class__,key):
             root = dict.__getitem__(self,'_root')
             last = root[0]
-            map  = dict.__getitem__(self,'_map')
             last[1] = root[0] = map[key] = [last, root, key]
         OrderedDict.__setattr__(self,key, value)
 
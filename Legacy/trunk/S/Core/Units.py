@@ -5,7 +5,8 @@
 # Modified: Feb 2016, T. MacDonald
 
 """ Implements base unit conversion style programming
-    by monkey patching Pint
+    by monkey patching Pint, the conversion factors are
+    kept in a table filled in on first use of each unit
 """
 
 
@@ -16,7 +17,7 @@
 from Legacy.trunk.S.Plugins.pint import UnitRegistry
 from Legacy.trunk.S.Plugins.pint.quantity import _Quantity
 
-Units = UnitRegistry()
+registry = UnitRegistry()
 
 
 # ------------------------------------------------------------
@@ -80,53 +81,167 @@ def __rdiv__(self,other):
         return self.magnitude
 
 # yay monkey patching!
-Units.Quantity.__mul__      = __rmul__
-Units.Quantity.__rmul__     = __rmul__
-Units.Quantity.__div__      = __rdiv__
-Units.Quantity.__truediv__  = __rdiv__
-Units.Quantity.__rdiv__     = __rdiv__
-Units.Quantity.__rtruediv__ = __rdiv__
-Units.Quantity.__getattr__  = getattr
-Units.Quantity.__array_prepare__ = None
-Units.Quantity.__array_wrap__    = None
-
-# doc string
-Units.__doc__ = \
-""" SUAVE.Attributes.Units()
-    Unit conversion toolbox
-    Works by converting values in to and out of the base unit
-    
-    Important Note and Warning - 
-        This does not enforce unit consistency!!!
-        Unit consistency is the responsibility of the user
-    
-    Usage:
-      from Legacy.trunk.S.Core import Units
-      a = 4. * Units.mm  # convert in to base unit
-      b = a  / Units.mm  # convert out of base unit
-      
-    Comments:
-      Retreving an attribute of Units (ie Units.mm) returns 
-      the conversion ratio to the base unit.  So in the above
-      example Units.mm = 0.001, which is the conversion ratio
-      to meters.  Thus the * (multiplication) operation converts 
-      from the current units to the base units and / (division) 
-      operation converts from the base units to the desired units.
-     
-    Base Units:
-      mass        : kilogram
-      length      : meters
-      time        : seconds
-      temperature : Kelvin
-      angle       : radian
-      current     : Ampere
-      luminsoity  : candela
-      
-    
-    Based on the Pint package, included in SUAVE.Plugins
-    https://pint.readthedocs.org/en/latest/
-    
-"""
+registry.Quantity.__mul__      = __rmul__
+registry.Quantity.__rmul__     = __rmul__
+registry.Quantity.__div__      = __rdiv__
+registry.Quantity.__truediv__  = __rdiv__
+registry.Quantity.__rdiv__     = __rdiv__
+registry.Quantity.__rtruediv__ = __rdiv__
+registry.Quantity.__getattr__  = getattr
+registry.Quantity.__array_prepare__ = None
+registry.Quantity.__array_wrap__    = None
+
+
+# ------------------------------------------------------------
+#   Unit Table
+# ------------------------------------------------------------
+
+## @ingroup Core
+class Unit_Table(object):
+    """ SUAVE.Attributes.Units()
+        Unit conversion toolbox
+        Works by converting values in to and out of the base unit
+        
+        Important Note and Warning - 
+            This does not enforce unit consistency!!!
+            Unit consistency is the responsibility of the user
+        
+        Usage:
+          from Legacy.trunk.S.Core import Units
+          a = 4. * Units.mm  # convert in to base unit
+          b = a  / Units.mm  # convert out of base unit
+          
+        Comments:
+          Retreving an attribute of Units (ie Units.mm) returns 
+          the conversion ratio to the base unit.  So in the above
+          example Units.mm = 0.001, which is the conversion ratio
+          to meters.  Thus the * (multiplication) operation converts 
+          from the current units to the base units and / (division) 
+          operation converts from the base units to the desired units.
+          
+          The ratio of a unit is found with Pint the first time the
+          unit is used, after which it is a plain number stored in the
+          table, so a conversion is a single multiplication. Units 
+          with an offset to their base unit (ie Units.degF) are still
+          converted by Pint.
+         
+        Base Units:
+          mass        : kilogram
+          length      : meters
+          time        : seconds
+          temperature : Kelvin
+          angle       : radian
+          current     : Ampere
+          luminsoity  : candela
+          
+        
+        Based on the Pint package, included in SUAVE.Plugins
+        https://pint.readthedocs.org/en/latest/
+    """
+
+    def __init__(self, registry):
+        """ Makes an empty table of the units of a Pint registry
+
+            Assumptions:
+            The registry has the Units monkey patches
+
+            Source:
+            N/A
+
+            Inputs:
+            registry   [UnitRegistry]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        object.__setattr__(self, '_registry'   , registry)
+        object.__setattr__(self, '_expressions', {})
+
+    def __getattr__(self, name):
+        """ Finds the ratio of a unit the first time it is used, e.g. Units.mm,
+            later lookups find it in the instance dictionary
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        ratio = unit_ratio(self._registry, getattr(self._registry, name))
+        object.__setattr__(self, name, ratio)
+        return ratio
+
+    def __getitem__(self, expression):
+        """ Finds the ratio of a unit expression, e.g. Units['m/s'] """
+        ratio = self._expressions.get(expression)
+        if ratio is None:
+            ratio = unit_ratio(self._registry, self._registry[expression])
+            self._expressions[expression] = ratio
+        return ratio
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Units is read-only, it cannot set %r' % name)
+
+    def __delattr__(self, name):
+        raise AttributeError('Units is read-only, it cannot delete %r' % name)
+
+    def __dir__(self):
+        return dir(self._registry)
+
+## @ingroup Core
+class Offset_Unit(object):
+    """ A unit with an offset to its base unit, e.g. degF, which is converted by Pint
+    """
+
+    # numpy arrays defer to the conversions below
+    __array_ufunc__ = None
+
+    def __init__(self, quantity):
+        self._registry = quantity._REGISTRY
+        self._units    = quantity._units
+
+    def __rmul__(self, other):
+        """ Converts in to the base unit """
+        return other * self._registry.Quantity(1, self._units)
+
+    __mul__ = __rmul__
+
+    def __rtruediv__(self, other):
+        """ Converts out of the base unit """
+        return other / self._registry.Quantity(1, self._units)
+
+    __rdiv__ = __rtruediv__
+
+    def __repr__(self):
+        return '<Offset_Unit(%s)>' % self._units
+
+## @ingroup Core
+def unit_ratio(registry, quantity):
+    """ Finds the conversion ratio of a unit to its base unit
+
+        Assumptions:
+        A unit that converts 1 to an int, e.g. kilogram, keeps the int
+        so that ints stay ints, as with Pint
+
+        Source:
+        N/A
+
+        Inputs:
+        registry   [UnitRegistry]
+        quantity   - unit with a magnitude of 1   [Quantity]
+
+        Outputs:
+        ratio      - conversion ratio, or an Offset_Unit   [float]
+
+        Properties Used:
+        N/A
+    """
+    units = quantity._units
+    if 0 * registry.Quantity(1, units) != 0:
+        return Offset_Unit(quantity)
+    return 1 * registry.Quantity(1, units)
+
+
+Units = Unit_Table(registry)
 
 
 # ------------------------------------------------------------
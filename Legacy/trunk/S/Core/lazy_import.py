@@ -0,0 +1,143 @@
+## @ingroup Core
+# lazy_import.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+import types
+import importlib
+import importlib.util
+
+# ----------------------------------------------------------------------
+#  Lazy Import
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def lazy_import(package, submodules=(), attributes=None, star_modules=()):
+    """Makes the contents of a package load on first access instead of when the package is imported. Used in a
+    package __init__ in place of 'from . import Aerodynamics' as
+
+        __getattr__, __dir__ = lazy_import(__name__, submodules = ['Aerodynamics','Energy'])
+
+    Access paths are unchanged, e.g. RCAIDE.Library.Methods.Energy imports the Energy subpackage the first time it
+    is used and stores it in the package like a regular import would. Since a package no longer imports its
+    siblings, importing one module only imports the packages on its own path. A name loaded from a module of the
+    same name, e.g. 'from .Vortex_Lattice import Vortex_Lattice', stays the class or function when that module is
+    imported directly before the name is used.
+
+    Assumptions:
+    Names of star_modules replace those of earlier star_modules, as with a sequence of 'from .X import *'
+
+    Source:
+    PEP 562 -- Module __getattr__ and __dir__
+
+    Inputs:
+    package         - __name__ of the package                                              [string]
+    submodules      - subpackages and modules loaded by 'from . import X'                  [list]
+    attributes      - names loaded by 'from .X import name', mapped to their module '.X',
+                      or to (module, name) for 'from module import name as alias'          [dict]
+    star_modules    - subpackages whose names are loaded by 'from .X import *'             [list]
+
+    Outputs:
+    __getattr__     - module attribute lookup                                              [function]
+    __dir__         - module attribute listing                                             [function]
+
+    Properties Used:
+    N/A
+    """
+
+    module     = sys.modules[package]
+    namespace  = module.__dict__
+    submodules = tuple(submodules) + tuple(m for m in star_modules if m not in submodules)
+    attributes = dict(attributes or {})
+    if attributes or star_modules:
+        namespace['__lazy_attributes__'] = attributes
+        namespace['__lazy_star_modules__'] = tuple(star_modules)
+        module.__class__ = Lazy_Package
+
+    def __getattr__(name):
+        if name in star_modules and name not in attributes:
+            # 'from .X import *' replaces the module X by the name X it defines
+            value = importlib.import_module('.' + name,package)
+            if name in public_names(value):
+                value = getattr(value,name)
+        elif name in attributes:
+            source = attributes[name]
+            if isinstance(source,tuple):
+                value = import_name(source[0],source[1],package)
+            else:
+                value = import_name(source,name,package)
+        elif name in submodules:
+            value = importlib.import_module('.' + name,package)
+        elif name == '__all__':
+            # 'from package import *' loads everything
+            value = set(submodules) | set(attributes)
+            value.update(n for n,v in list(namespace.items()) if not n.startswith('_') and v is not lazy_import)
+            for module in star_modules:
+                value.update(public_names(importlib.import_module('.' + module,package)))
+            value = sorted(value)
+        elif star_modules and not name.startswith('_'):
+            for module in reversed(star_modules):
+                module = importlib.import_module('.' + module,package)
+                if name in public_names(module):
+                    value = getattr(module,name)
+                    break
+            else:
+                value = import_submodule(name,package)
+        else:
+            value = import_submodule(name,package)
+
+        # the import of a submodule sets it in the package, names loaded from a module of the same name win
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(submodules) | set(attributes))
+
+    return __getattr__, __dir__
+
+## @ingroup Core
+class Lazy_Package(types.ModuleType):
+    """A package with names that are loaded on first use. Importing a submodule sets it in its package, which would
+    replace a name of the same name that was not loaded yet, e.g. the class of the same name or a function of a star
+    module of the same name.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value,types.ModuleType) and value.__name__ == self.__name__ + '.' + name:
+            attributes   = self.__dict__.get('__lazy_attributes__',{})
+            star_modules = self.__dict__.get('__lazy_star_modules__',())
+            if attributes.get(name) == '.' + name:
+                value = getattr(value,name)
+            elif name in star_modules and name not in attributes and name in public_names(value):
+                value = getattr(value,name)
+        types.ModuleType.__setattr__(self,name,value)
+
+## @ingroup Core
+def import_name(module, name, package):
+    """Imports a name as 'from module import name' does, which may be a submodule of the module."""
+    module = importlib.import_module(module,package)
+    try:
+        return getattr(module,name)
+    except AttributeError:
+        return importlib.import_module('.' + name,module.__name__)
+
+## @ingroup Core
+def import_submodule(name, package):
+    """Imports a submodule that is not listed in the package __init__, which an eager import of a sibling would
+    have set in the package as well."""
+    if name.startswith('_') or importlib.util.find_spec(package + '.' + name) is None:
+        raise AttributeError('module %r has no attribute %r' % (package,name))
+    return importlib.import_module('.' + name,package)
+
+## @ingroup Core
+def public_names(module):
+    """Names a 'from module import *' would load."""
+    names = getattr(module,'__all__',None)
+    if names is None:
+        names = [name for name in vars(module).keys() if not name.startswith('_')]
+    return names
@@ -6,7 +6,6 @@
 
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
 import numpy as np
-import scipy as sp
 
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
@@ -33,6 +32,7 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     Outputs:
        va  - axially-induced velocity from rotor wake
        vt  - tangentially-induced velocity from rotor wake
+       wake_inputs.converged - convergence of the inflow angle at each blade station
     
     Properties Used:
     None
@@ -49,9 +49,10 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    PSI_final, converged  = newton_inflow_solve(PSI,wake_inputs,rotor,rotor.sol_tolerance)
+    wake_inputs.converged = converged
     
-    if ier!=1:
+    if not np.all(converged):
         print("Rotor BEVW did not converge to a solution (Stall)")
     
     # Calculate the velocities given PSI
@@ -61,6 +62,78 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     return va, vt
 
 
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def newton_inflow_solve(PSI, wake_inputs, rotor, tolerance, maximum_iterations=100, maximum_step=0.2):
+    """
+    Solves the BEVW iteration for the inflow angle with a safeguarded Newton method.
+    The residual of each blade station only depends on its own inflow angle, so all
+    the stations take their step at once from the analytical derivative.
+
+    Assumptions:
+    The residual increases with the inflow angle around the solution, as the
+    circulation of the wake grows and the one of the blade falls. Each station keeps
+    the largest angle with a negative residual and the smallest one with a positive
+    residual. It bisects them when the Newton step leaves them or is more than half
+    of the previous step. Until both are found, the steps are limited to maximum_step and go
+    against the residual where the slope is not positive. A station converges when
+    its step is below the tolerance, relative to its inflow angle.
+
+    Source:
+    Press, W. H., et al., "Numerical Recipes", rtsafe, Cambridge University Press
+
+    Inputs:
+       PSI                        initial inflow angle                            [rad]
+       wake_inputs                inputs of the rotor wake                        [-]
+       rotor                      rotor                                           [-]
+       tolerance                  relative tolerance of the inflow angle          [-]
+       maximum_iterations         maximum number of iterations                    [-]
+       maximum_step               maximum step of the inflow angle                [rad]
+
+    Outputs:
+       PSI                        inflow angle                                    [rad]
+       converged                  convergence of each blade station               [-]
+
+    """
+    PSI          = np.array(PSI,dtype=float)
+    converged    = np.zeros(PSI.shape,dtype=bool)
+    PSI_low      = np.full(PSI.shape,-np.inf)
+    PSI_high     = np.full(PSI.shape,np.inf)
+    step_limit   = np.full(PSI.shape,float(maximum_step))
+    previous     = np.full(PSI.shape,np.inf)
+    R, dR_dpsi   = compute_dR_dpsi(PSI,wake_inputs,rotor)
+    for i in range(maximum_iterations):
+        PSI_low  = np.where(R < 0,np.maximum(PSI_low,PSI),PSI_low)
+        PSI_high = np.where(R > 0,np.minimum(PSI_high,PSI),PSI_high)
+
+        # Newton step where the slope is positive, a step against the residual otherwise
+        with np.errstate(divide='ignore',invalid='ignore'):
+            step = np.where(dR_dpsi > 0,R/dR_dpsi,np.sign(R)*step_limit)
+        step     = np.clip(step,-step_limit,step_limit)
+
+        # bisection of the stations with both bounds, if the step leaves them or is too slow
+        PSI_new  = PSI - step
+        bounded  = np.isfinite(PSI_low) & np.isfinite(PSI_high)
+        bisect   = bounded & ((PSI_new <= np.minimum(PSI_low,PSI_high)) | (PSI_new >= np.maximum(PSI_low,PSI_high)) |
+                              (abs(2*step) > abs(previous)))
+        PSI_new  = np.where(bisect,0.5*(PSI_low + PSI_high),PSI_new)
+        PSI_new  = np.where(converged,PSI,PSI_new)
+        step     = PSI - PSI_new
+
+        R_new, dR_dpsi_new = compute_dR_dpsi(PSI_new,wake_inputs,rotor)
+
+        # steps to residuals that cannot be computed are rejected and the steps are shortened
+        valid              = np.isfinite(R_new) & np.isfinite(dR_dpsi_new)
+        step_limit[~valid] = 0.5*step_limit[~valid]
+        PSI                = np.where(valid,PSI_new,PSI)
+        R                  = np.where(valid,R_new,R)
+        dR_dpsi            = np.where(valid,dR_dpsi_new,dR_dpsi)
+        previous           = np.where(valid,step,previous)
+        converged         |= valid & (abs(step) <= tolerance*np.maximum(abs(PSI),tolerance))
+        if np.all(converged):
+            break
+
+    return PSI, converged
+
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def iteration(PSI, wake_inputs, rotor):
     """
@@ -194,10 +267,12 @@ def va_vt(PSI, wake_inputs, rotor):
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def compute_dR_dpsi(PSI,wake_inputs,rotor):
     """
-    Computes the analytical derivative for the BEVW iteration.
+    Computes the residual of the BEVW iteration and its analytical derivative with
+    respect to the inflow angle of each blade station.
 
     Assumptions:
-    N/A
+    The lift coefficients of the airfoil polars are the bilinear interpolation of
+    interp2d, so their slopes are the ones of the interpolation cells.
 
     Source:
     N/A
@@ -217,68 +292,161 @@ def compute_dR_dpsi(PSI,wake_inputs,rotor):
        piece                      output of a step in tip loss calculation        [-]
 
     Outputs:
-       dR_dpsi                    derivative of residual wrt inflow angle         [-]
+       Rsquiggly                  residual on circulation                         [m^2/s]
+       dR_dpsi                    derivative of residual wrt inflow angle         [m^2/s]
 
     """
     # Unpack inputs to rotor wake fidelity zero
     U               = wake_inputs.velocity_total
     Ua              = wake_inputs.velocity_axial
     Ut              = wake_inputs.velocity_tangential
+    use_2d_analysis = wake_inputs.use_2d_analysis
     beta            = wake_inputs.twist_distribution
+    c               = wake_inputs.chord_distribution
     r               = wake_inputs.radius_distribution
+    a               = wake_inputs.speed_of_sounds
+    nu              = wake_inputs.dynamic_viscosities
     ctrl_pts        = wake_inputs.ctrl_pts
     Nr              = wake_inputs.Nr
-    Na              = wake_inputs.Na    
+    Na              = wake_inputs.Na
 
     # Unpack rotor data        
-    R        = rotor.tip_radius
-    B        = rotor.number_of_blades      
-    
-    # Reshape PSI because the solver gives it flat
-    if wake_inputs.use_2d_analysis:
-        PSI    = np.reshape(PSI,(ctrl_pts,Nr,Na))
-    else:
-        PSI    = np.reshape(PSI,(ctrl_pts,Nr))    
-    
-    
-    # An analytical derivative for dR_dpsi used in the Newton iteration for the BEVW
-    # This was solved symbolically in Matlab and exported
-    # compute velocities
+    R            = rotor.tip_radius
+    B            = rotor.number_of_blades
+    tc           = rotor.thickness_to_chord
+    airfoils     = rotor.Airfoils
+    a_loc        = rotor.airfoil_polar_stations
+
+    # compute velocities and their derivatives
     sin_psi      = np.sin(PSI)
     cos_psi      = np.cos(PSI)
     Wa           = 0.5*Ua + 0.5*U*sin_psi
     Wt           = 0.5*Ut + 0.5*U*cos_psi
-    
+    vt           = Ut - Wt
+    dWa          = 0.5*U*cos_psi
+    dWt          = -0.5*U*sin_psi
+
+    # compute blade airfoil forces and properties
+    Cl, Cdval, alpha, Ma, W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+    dW           = (Wa*dWa + Wt*dWt)/W
+    dalpha       = (Wa*dWt - Wt*dWa)/(W*W)
+    Re           = (W*c)/nu
+    dRe          = (dW*c)/nu
+    dCl          = compute_dCl(Cl,alpha,dalpha,Re,dRe,Ma,dW/a,airfoils,a_loc,tc)
+
+    # compute inflow velocity and tip loss factor and their derivatives
     lamdaw, F, piece = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
-    
-    pi          = np.pi
-    pi2         = np.pi**2
-    BB          = B*B
-    BBB         = BB*B
-    f_wt_2      = 4*Wt*Wt
-    f_wa_2      = 4*Wa*Wa
-    arccos_piece = np.arccos(piece)
-    Ucospsi     = U*cos_psi
-    Usinpsi     = U*sin_psi
-    Utcospsi    = Ut*cos_psi
-    Uasinpsi    = Ua*sin_psi
-    UapUsinpsi  = (Ua + Usinpsi)
-    utpUcospsi  = (Ut + Ucospsi)
-    utpUcospsi2 = utpUcospsi*utpUcospsi
-    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-    dR_dpsi     = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
-                   (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                   + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                   - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
-                    (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
-                    r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
-                    Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
-
-    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-    
-    # This needs to be made into a jacobian
-    dR_dpsi = dR_dpsi.flatten()
-    L       = np.size(PSI)
-    jac     = np.eye(L)*dR_dpsi
-    
-    return jac
\ No newline at end of file
+    dlamdaw      = r*(dWa*Wt - Wa*dWt)/(R*Wt*Wt)
+    dlamdaw      = np.where(lamdaw <= 1e-12,0.,dlamdaw)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        dF       = (2./np.pi)*piece*np.log(piece)*dlamdaw/(lamdaw*np.sqrt(1. - piece*piece))
+    dF[~np.isfinite(dF)] = 0.
+
+    # compute Newton residual on circulation and its derivative
+    K           = 4.*lamdaw*R/(np.pi*B*r)
+    S           = (1.+K*K)**0.5
+    dS          = K*(4.*dlamdaw*R/(np.pi*B*r))/S
+    Gamma       = vt*(4.*np.pi*r/B)*F*(1.+(4.*lamdaw*R/(np.pi*B*r))*(4.*lamdaw*R/(np.pi*B*r)))**0.5
+    Rsquiggly   = Gamma - 0.5*W*c*Cl
+    dR_dpsi     = (4.*np.pi*r/B)*(-dWt*F*S + vt*dF*S + vt*F*dS) - 0.5*c*(dW*Cl + W*dCl)
+
+    return Rsquiggly, dR_dpsi
+
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def compute_dCl(Cl,alpha,dalpha,Re,dRe,Ma,dMa,airfoils,a_loc,tc):
+    """
+    Computes the derivative of the lift coefficients of compute_airfoil_aerodynamics
+    from the derivatives of the angle of attack, Reynolds number and Mach number.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       Cl                         lift coefficients                               [-]
+       alpha, dalpha              angle of attack and its derivative              [rad]
+       Re, dRe                    Reynolds number and its derivative              [-]
+       Ma, dMa                    Mach number and its derivative                  [-]
+       airfoils                   airfoils of the rotor                           [-]
+       a_loc                      airfoil of each radial station                  [-]
+       tc                         thickness to chord ratio                        [-]
+
+    Outputs:
+       dCl                        derivative of the lift coefficients             [-]
+
+    """
+    a_loc = np.array(a_loc)
+    if np.any(a_loc) != None:
+        dCl = np.zeros(np.shape(Cl))
+        for jj,airfoil in enumerate(airfoils):
+            locs = a_loc == jj
+            if not np.any(locs):
+                continue
+            pd           = airfoil.polars
+            dCl_dRe, dCl_dalpha = interp2d_slopes(Re[:,locs],alpha[:,locs],pd.reynolds_numbers,pd.angle_of_attacks,pd.lift_coefficients)
+            dCl[:,locs]  = dCl_dRe*dRe[:,locs] + dCl_dalpha*dalpha[:,locs]
+    else:
+        # lift slope of 2*pi up to the maximum lift coefficient
+        tc_1 = tc*100
+        Cl_max_ref = -0.0009*tc_1**3 + 0.0217*tc_1**2 - 0.0442*tc_1 + 0.7005
+        Cl_max_ref[Cl_max_ref<0.7] = 0.7
+        Re_ref     = 9.*10**6
+        Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
+        Cl0        = 2.*np.pi*alpha
+        dCl0       = 2.*np.pi*dalpha
+        stall      = Cl0>Cl1maxp
+        Cl0        = np.where(stall,Cl1maxp,Cl0)
+        dCl0       = np.where(stall,0.1*Cl1maxp*dRe/Re,dCl0)
+        Cl0[alpha>=np.pi/2]  = 0.
+        dCl0[alpha>=np.pi/2] = 0.
+
+        # derivative of the Karman-Tsien scaling
+        KT_cond    = np.logical_and((Ma<1.),(Cl0>0))
+        with np.errstate(divide='ignore',invalid='ignore'):
+            s      = (1-Ma*Ma)**0.5
+            ds     = -Ma*dMa/s
+            D      = s + ((Ma*Ma)/(1+s))*Cl0/2
+            dD     = ds + ((2*Ma*dMa*(1+s) - Ma*Ma*ds)/((1+s)*(1+s)))*Cl0/2 + ((Ma*Ma)/(1+s))*dCl0/2
+            dCl    = np.where(KT_cond,dCl0/D - Cl0*dD/(D*D),dCl0)
+
+    return dCl
+
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def interp2d_slopes(x,y,xp,yp,zp):
+    """
+    Computes the partial derivatives of the bilinear interpolation of interp2d.
+
+    Assumptions:
+    The points are located in the cells of interp2d, which extrapolates linearly
+    outside of the grid.
+
+    Source:
+    N/A
+
+    Inputs:
+       x, y                       points at which to interpolate                  [-]
+       xp, yp                     grid points                                     [-]
+       zp                         function values on the grid                     [-]
+
+    Outputs:
+       dz_dx, dz_dy               partial derivatives at the points               [-]
+
+    """
+    ix = np.clip(np.searchsorted(xp, x, side="right"), 1, len(xp) - 1)
+    iy = np.clip(np.searchsorted(yp, y, side="right"), 1, len(yp) - 1)
+
+    z_11 = zp[ix - 1, iy - 1]
+    z_21 = zp[ix, iy - 1]
+    z_12 = zp[ix - 1, iy]
+    z_22 = zp[ix, iy]
+    dx   = xp[ix] - xp[ix - 1]
+    dy   = yp[iy] - yp[iy - 1]
+    tx   = (x - xp[ix - 1])/dx
+    ty   = (y - yp[iy - 1])/dy
+
+    dz_dx = ((1 - ty)*(z_21 - z_11) + ty*(z_22 - z_12))/dx
+    dz_dy = ((1 - tx)*(z_12 - z_11) + tx*(z_22 - z_21))/dy
+
+    return dz_dx, dz_dy
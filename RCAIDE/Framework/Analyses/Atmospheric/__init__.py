@@ -9,6 +9,8 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Analyses.Atmospheric.Atmospheric import Atmospheric
-from Legacy.trunk.S.Analyses.Atmospheric.US_Standard_1976 import US_Standard_1976
-from Legacy.trunk.S.Analyses.Atmospheric.Constant_Temperature import Constant_Temperature
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Atmospheric':('Legacy.trunk.S.Analyses.Atmospheric.Atmospheric','Atmospheric'),
+                                                           'US_Standard_1976':('Legacy.trunk.S.Analyses.Atmospheric.US_Standard_1976','US_Standard_1976'),
+                                                           'Constant_Temperature':('Legacy.trunk.S.Analyses.Atmospheric.Constant_Temperature','Constant_Temperature')})
\ No newline at end of file
@@ -9,4 +9,6 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Analyses.Planets.Planet import Planet
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Planet':('Legacy.trunk.S.Analyses.Planets.Planet','Planet')})
\ No newline at end of file
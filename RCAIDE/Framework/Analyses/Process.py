@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------------------------------------------------------   
 from RCAIDE.Framework.Core import ContainerOrdered
 from RCAIDE.Framework.Core import Data 
+from .Profiler             import profiler
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Process
@@ -46,6 +47,10 @@ class Process(ContainerOrdered):
                 N/A
             """        
         
+        # instrumented evaluation when the profiler is recording
+        if profiler.active:
+            return profiler.evaluate(self,*args,**kwarg)
+        
         results = Data() 
         
         for tag,step in self.items():  
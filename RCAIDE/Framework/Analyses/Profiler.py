@@ -0,0 +1,361 @@
+## @ingroup Analyses
+# RCAIDE/Framework/Analyses/Profiler.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+
+# python imports
+import numpy as np
+import time
+import json
+import csv
+import tracemalloc
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Profiler
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Analyses
+class Profiler(Data):
+    """ RCAIDE.Framework.Analyses.Profiler()
+
+        Records the wall time, number of calls and optionally the peak memory allocation of every step of every
+        Process, keyed by the path of the step, e.g. base_mission.cruise.iterate.conditions.aerodynamics. The solver
+        statistics of every converged segment are recorded as well. A single profiler is shared by all processes:
+
+            from RCAIDE.Framework.Analyses.Profiler import profiler
+            profiler.start()
+            mission.evaluate()
+            profiler.stop()
+            print(profiler.summary())
+            profiler.save('profile.json')
+
+            Assumptions:
+            Times of a step include the times of its sub-steps. Peak allocations are measured with tracemalloc, which
+            slows down the evaluation, and are only recorded when the profiler is started with memory=True.
+
+            Source:
+            N/A
+    """
+
+    _frames  = None
+    _peaks   = None
+    _tracing = False
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.tag     = 'profiler'
+        self.active  = False
+        self.memory  = False
+        self.steps   = {}
+        self.solver  = {}
+
+    def start(self,memory=False):
+        """Starts recording, earlier records are kept.
+
+            Assumptions:
+            tracemalloc is only started if it is not already tracing
+
+            Source:
+            N/A
+
+            Inputs:
+            memory   - record the peak allocation of each step     [boolean]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.memory  = memory
+        self._frames = []
+        self._peaks  = []
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self.active  = True
+
+    def stop(self):
+        """Stops recording.
+
+            Assumptions:
+            tracemalloc is only stopped if the profiler started it
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.active = False
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def reset(self):
+        """Removes all records.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.steps   = {}
+        self.solver  = {}
+
+    def __enter__(self):
+        """Starts recording in a with statement."""
+        self.start(self.memory)
+        return self
+
+    def __exit__(self,*args):
+        """Stops recording at the end of a with statement."""
+        self.stop()
+
+    def evaluate(self,process,*args,**kwarg):
+        """Evaluates the steps of a process, recording each of them.
+
+            Assumptions:
+            A process evaluated on a different object than the enclosing process, e.g. a segment inside a mission,
+            starts a new path from the enclosing path and the tag of that object. A process that is called directly
+            instead of as a step, e.g. segment.process.iterate inside the root finder, is named by its key in the
+            process of the object.
+
+            Source:
+            N/A
+
+            Inputs:
+            process                     [Process]
+            args, kwarg                 - arguments of the steps
+
+            Outputs:
+            Results of the Evaluate Functions
+
+            Properties Used:
+            N/A
+        """
+
+        frames = self._frames
+        peaks  = self._peaks
+        owner  = args[0] if args else None
+        pushed = not (frames and frames[-1]['owner'] is owner and frames[-1]['step'] is process)
+        if pushed:
+            name = process_name(owner,process)
+            if frames and frames[-1]['owner'] is owner:
+                # e.g. the process of an analysis evaluated by a step continues the path of that step
+                root = frames[-1]['root']
+                base = join_path(root,name) if name else join_path(frames[-1]['base'],'.'.join(frames[-1]['names']))
+            else:
+                root = join_path(frames[-1]['root'] if frames else '',getattr(owner,'tag',None))
+                base = join_path(root,name)
+            frames.append({'owner':owner,'root':root,'base':base,'names':[],'step':None})
+        frame = frames[-1]
+
+        results = Data()
+        try:
+            for tag,step in process.items():
+                frame['names'].append(tag)
+                frame['step'] = step
+                path          = join_path(frame['base'],'.'.join(frame['names']))
+
+                if self.memory:
+                    # the peak so far belongs to the enclosing step
+                    current, peak = tracemalloc.get_traced_memory()
+                    if peaks:
+                        peaks[-1] = max(peaks[-1],peak)
+                    peaks.append(0)
+                    tracemalloc.reset_peak()
+                tic = time.perf_counter()
+
+                try:
+                    if hasattr(step,'evaluate'):
+                        result = step.evaluate(*args,**kwarg)
+                    else:
+                        result = step(*args,**kwarg)
+                finally:
+                    frame['names'].pop()
+
+                elapsed = time.perf_counter() - tic
+                record  = self.steps.get(path)
+                if record is None:
+                    record = {'calls':0,'time':0.,'peak_memory':0}
+                    self.steps[path] = record
+                record['calls'] += 1
+                record['time']  += elapsed
+                if self.memory:
+                    step_peak             = max(tracemalloc.get_traced_memory()[1],peaks.pop())
+                    record['peak_memory'] = max(record['peak_memory'],step_peak - current)
+                    if peaks:
+                        peaks[-1] = max(peaks[-1],step_peak)
+
+                results[tag] = result
+        finally:
+            if pushed:
+                frames.pop()
+            if not frames:
+                del peaks[:]
+
+        return results
+
+    def record_solver(self,segment,infodict,converged):
+        """Records the statistics of a root finder solve of a segment.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                     [Segment]
+            infodict                    - full output of the root finder  [dict]
+            converged                   [boolean]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        frames = self._frames
+        path   = frames[-1]['root'] if frames else segment.tag
+        record = self.solver.get(path)
+        if record is None:
+            record = {'solves':0,'function_evaluations':0,'jacobian_evaluations':0,'residual_norm':0.,'converged':True}
+            self.solver[path] = record
+        record['solves']               += 1
+        record['function_evaluations'] += int(infodict.get('nfev',0))
+        record['jacobian_evaluations'] += int(infodict.get('njev',0))
+        record['residual_norm']         = float(np.linalg.norm(infodict.get('fvec',0.)))
+        record['converged']             = record['converged'] and bool(converged)
+
+    def summary(self,number_of_steps=None):
+        """Returns a table of the recorded steps sorted by total time, followed by the solver statistics.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            number_of_steps             - number of steps in the table, all if None  [int]
+
+            Outputs:
+            table                       [string]
+
+            Properties Used:
+            N/A
+        """
+
+        steps = sorted(self.steps.items(),key=lambda item: -item[1]['time'])
+        if number_of_steps is not None:
+            steps = steps[:number_of_steps]
+        width = max([len(path) for path,record in steps] + [4])
+
+        lines = ['%-*s %10s %12s %12s %14s' % (width,'step','calls','time [s]','per call [s]','peak mem [MB]')]
+        for path,record in steps:
+            lines.append('%-*s %10d %12.4f %12.6f %14.3f' % (width,path,record['calls'],record['time'],
+                                                              record['time']/record['calls'],
+                                                              record['peak_memory']/2.**20))
+
+        if self.solver:
+            width = max([len(path) for path in self.solver.keys()] + [7])
+            lines.append('')
+            lines.append('%-*s %8s %10s %10s %14s %10s' % (width,'segment','solves','nfev','njev','residual norm','converged'))
+            for path,record in self.solver.items():
+                lines.append('%-*s %8d %10d %10d %14.3e %10s' % (width,path,record['solves'],
+                                                                  record['function_evaluations'],
+                                                                  record['jacobian_evaluations'],
+                                                                  record['residual_norm'],record['converged']))
+
+        return '\n'.join(lines)
+
+    def save(self,filename):
+        """Saves the records as JSON, or as CSV if the filename ends in .csv. The CSV holds the steps only.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            filename                    [string]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        if filename.endswith('.csv'):
+            with open(filename,'w',newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['step','calls','time','peak_memory'])
+                for path,record in self.steps.items():
+                    writer.writerow([path,record['calls'],record['time'],record['peak_memory']])
+        else:
+            with open(filename,'w') as f:
+                json.dump({'steps':self.steps,'solver':self.solver},f,indent=1)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def join_path(path,name):
+    """Appends a name to a dotted path, empty names are skipped."""
+    if not name:
+        return path
+    return path + '.' + name if path else name
+
+def process_name(owner,process):
+    """Finds the key of a process in the process of its owner, None if it is not one of its steps."""
+    steps = getattr(owner,'process',None)
+    if steps is None or steps is process or not hasattr(steps,'items'):
+        return None
+    for key,step in steps.items():
+        if step is process:
+            return key
+    return None
+
+# the profiler used by every Process
+profiler = Profiler()
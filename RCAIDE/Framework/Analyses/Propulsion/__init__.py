@@ -9,7 +9,10 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero    import Rotor_Wake_Fidelity_Zero
-from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_One     import Rotor_Wake_Fidelity_One
-from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_Two     import Rotor_Wake_Fidelity_Two
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Rotor_Wake_Fidelity_Zero':('Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero','Rotor_Wake_Fidelity_Zero'),
+                                                           'Rotor_Wake_Fidelity_One':('Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_One','Rotor_Wake_Fidelity_One'),
+                                                           'Rotor_Wake_Fidelity_Two':('Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_Two','Rotor_Wake_Fidelity_Two')})
+
 from .Ducted_Fan_Design_Code import Ducted_Fan_Design_Code
\ No newline at end of file
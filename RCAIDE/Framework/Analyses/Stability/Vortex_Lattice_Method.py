@@ -110,6 +110,11 @@ class Vortex_Lattice_Method(Stability):
         self.settings.leading_edge_suction_multiplier               = 1.0  
         self.settings.use_VORLAX_matrix_calculation                 = False
         self.settings.floating_point_precision                      = np.float32 
+        self.settings.use_surrogate_cache                           = False
+        self.settings.surrogate_cache_directory                     = None   # the user cache directory if None
+        self.settings.surrogate_cache_size                          = 2**28   # bytes
+        self.settings.training_workers                              = 1       # processes evaluating the training points
+        self.settings.max_vlm_memory                                = None    # bytes of a block of induced velocities, None for a single block
     
         # conditions table, used for surrogate model training
         self.training                                               = Data()
@@ -11,6 +11,7 @@
 
 from .Analysis  import Analysis 
 from .Process   import Process
+from .Profiler  import Profiler
 from .Settings  import Settings
 from .Vehicle   import Vehicle 
 
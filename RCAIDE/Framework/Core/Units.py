@@ -6,8 +6,9 @@
 
 from RCAIDE.Framework.Plugins.pint import UnitRegistry
 from RCAIDE.Framework.Plugins.pint.quantity import _Quantity
+from Legacy.trunk.S.Core.Units import Unit_Table
 
-Units = UnitRegistry()
+registry = UnitRegistry()
 
 
 # ------------------------------------------------------------
@@ -68,53 +69,19 @@ def __rdiv__(self,other):
         return self.magnitude
 
 # yay monkey patching!
-Units.Quantity.__mul__      = __rmul__
-Units.Quantity.__rmul__     = __rmul__
-Units.Quantity.__div__      = __rdiv__
-Units.Quantity.__truediv__  = __rdiv__
-Units.Quantity.__rdiv__     = __rdiv__
-Units.Quantity.__rtruediv__ = __rdiv__
-Units.Quantity.__getattr__  = getattr
-Units.Quantity.__array_prepare__ = None
-Units.Quantity.__array_wrap__    = None
-
-# doc string
-Units.__doc__ = \
-""" SUAVE.Attributes.Units()
-    Unit conversion toolbox
-    Works by converting values in to and out of the base unit
-    
-    Important Note and Warning - 
-        This does not enforce unit consistency!!!
-        Unit consistency is the responsibility of the user
-    
-    Usage:
-      from Legacy.trunk.S.Core import Units
-      a = 4. * Units.mm  # convert in to base unit
-      b = a  / Units.mm  # convert out of base unit
-      
-    Comments:
-      Retreving an attribute of Units (ie Units.mm) returns 
-      the conversion ratio to the base unit.  So in the above
-      example Units.mm = 0.001, which is the conversion ratio
-      to meters.  Thus the * (multiplication) operation converts 
-      from the current units to the base units and / (division) 
-      operation converts from the base units to the desired units.
-     
-    Base Units:
-      mass        : kilogram
-      length      : meters
-      time        : seconds
-      temperature : Kelvin
-      angle       : radian
-      current     : Ampere
-      luminsoity  : candela
-      
-    
-    Based on the Pint package, included in SUAVE.Plugins
-    https://pint.readthedocs.org/en/latest/
-    
-"""
+registry.Quantity.__mul__      = __rmul__
+registry.Quantity.__rmul__     = __rmul__
+registry.Quantity.__div__      = __rdiv__
+registry.Quantity.__truediv__  = __rdiv__
+registry.Quantity.__rdiv__     = __rdiv__
+registry.Quantity.__rtruediv__ = __rdiv__
+registry.Quantity.__getattr__  = getattr
+registry.Quantity.__array_prepare__ = None
+registry.Quantity.__array_wrap__    = None
+
+# conversion ratios are found with pint on the first use of a unit,
+# see Unit_Table for the usage
+Units = Unit_Table(registry)
 
 
 # ------------------------------------------------------------
@@ -10,6 +10,9 @@
 
 # Package imports 
 import numpy as np
+import hashlib
+import pickle
+import copy
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  interp2d
@@ -57,6 +60,91 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
 
     return z
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  Polar_Table
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Core
+class Polar_Table(object):
+    """
+    Bilinear interpolation of several functions on the same grid, e.g. the lift and drag polars of an airfoil. The
+    spacing of the axes and the bilinear coefficients of each cell are computed once, so each evaluation locates the
+    points once and gathers the coefficients of all the functions together. The values are the ones of ``interp2d``,
+    to round-off.
+    Args:
+        xp, yp: 1D arrays of increasing grid points of the two axes
+        zp: 2D arrays of function values, each satisfying `zp[i, j] = f(xp[i], yp[j])`
+    """
+
+    def __init__(self,xp,yp,*zp):
+        self.xp = np.asarray(xp,dtype=float)
+        self.yp = np.asarray(yp,dtype=float)
+        self.x_spacing, self.x_scale = axis_spacing(self.xp)
+        self.y_spacing, self.y_scale = axis_spacing(self.yp)
+
+        # coefficients of z = a + b*tx + c*ty + d*tx*ty in each cell, for all the functions
+        zp   = np.stack([np.asarray(z,dtype=float) for z in zp])
+        z_11 = zp[:,:-1,:-1]
+        z_21 = zp[:,1:,:-1]
+        z_12 = zp[:,:-1,1:]
+        z_22 = zp[:,1:,1:]
+        coefficients      = np.stack([z_11,z_21 - z_11,z_12 - z_11,z_22 - z_21 - z_12 + z_11])
+        self.coefficients = coefficients.reshape(4,len(zp),-1)
+
+    def __call__(self,x,y,out=None):
+        """
+        Evaluates the functions at points, extrapolating linearly from the edge cells outside of the grid.
+        Args:
+            x, y: arrays of points at which to interpolate, which are broadcast together
+            out: optional tuple of arrays to hold the value of each function
+        Returns:
+            tuple of arrays `z` satisfying `z[k][i] = f_k(x[i], y[i])`
+        """
+        x, y   = np.broadcast_arrays(x,y)
+        shape  = x.shape
+        x, y   = np.atleast_1d(x,y)
+        ix, tx = locate(x,self.xp,self.x_spacing,self.x_scale)
+        iy, ty = locate(y,self.yp,self.y_spacing,self.y_scale)
+        ix    *= len(self.yp) - 1
+        ix    += iy
+        a, b, c, d = self.coefficients[:,:,ix]
+        if out is None:
+            out = tuple(np.empty(shape) for z in a)
+        for k in range(len(a)):
+            z  = out[k] if out[k].ndim else out[k].reshape(1)
+            np.multiply(d[k],tx,out=d[k])
+            d[k] += c[k]
+            d[k] *= ty
+            np.multiply(b[k],tx,out=b[k])
+            np.add(a[k],b[k],out=z)
+            z += d[k]
+
+        return tuple(out)
+
+def axis_spacing(xp):
+    """Spacing of a uniform axis, None otherwise, and the inverse of the spacing of each cell."""
+    dx      = np.diff(xp)
+    spacing = (xp[-1] - xp[0])/(len(xp) - 1) if len(xp) > 1 else None
+    if spacing is None or not np.allclose(dx,spacing,rtol=1E-9,atol=0):
+        spacing = None
+    return spacing, 1/dx
+
+def locate(x,xp,spacing,scale):
+    """Cells of points along an axis and their position in the cell, which is outside of [0,1] if the point is
+    outside of the axis."""
+    if spacing is None:
+        i  = np.searchsorted(xp,x,side='right')
+        np.clip(i,1,len(xp) - 1,out=i)
+        i -= 1
+        t  = x - xp[i]
+        t *= scale[i]
+    else:
+        t  = x - xp[0]
+        t /= spacing
+        with np.errstate(invalid='ignore'):
+            i = np.clip(np.floor(t),0,len(xp) - 2).astype(np.intp)
+        t -= i
+    return i, t
+
 # ----------------------------------------------------------------------------------------------------------------------
 # orientation_product
 # ----------------------------------------------------------------------------------------------------------------------
@@ -308,4 +396,150 @@ def new_tensor(a):
     
     T = np.resize(T,[n_a,3,3])
     
-    return T
\ No newline at end of file
+    return T
+
+# ----------------------------------------------------------------------------------------------------------------------
+# content_hash
+# ----------------------------------------------------------------------------------------------------------------------  
+## @ingroup Core
+def content_hash(*items,exclude=()):
+    """Computes a hash of the contents of Data objects, arrays and values, which can be used as the key of a cache of
+    results computed from them. Equal contents give the same hash, in a new interpreter as well.
+
+    Assumptions:
+    The keys of a Data object are hashed in their order, since it can set the order of the results, e.g. of the
+    panels of the wings. Classes and functions are hashed by their name and other objects by their pickle, or by
+    their identity if they cannot be pickled. Instance attributes of a Data object which are not keys are skipped.
+
+    Source:
+    N/A
+
+    Inputs:
+    items        - Data objects, dicts, lists, arrays and values             [-]
+    exclude      - keys to skip at any depth, e.g. results stored in a Data  [list]
+
+    Outputs:
+    key          - hexadecimal digest                                        [string]
+
+    Properties Used:
+    N/A
+    """
+    digest  = hashlib.sha1()
+    exclude = set(exclude)
+    for item in items:
+        update_content_hash(digest,item,exclude,set())
+
+    return digest.hexdigest()
+
+def update_content_hash(digest,item,exclude,visited):
+    """Feeds the contents of an item to a hash, see content_hash."""
+
+    if isinstance(item,np.ndarray):
+        digest.update(('ndarray %s %s;' % (item.dtype.str,item.shape)).encode())
+        if item.dtype.hasobject:
+            for value in item.flat:
+                update_content_hash(digest,value,exclude,visited)
+        else:
+            digest.update(np.ascontiguousarray(item).tobytes())
+    elif item is None or isinstance(item,(bool,int,float,complex,str,bytes,np.generic)):
+        digest.update(('%s %r;' % (type(item).__name__,item)).encode())
+    elif isinstance(item,type) or callable(item) and hasattr(item,'__qualname__'):
+        digest.update(('%s %s.%s;' % (type(item).__name__,item.__module__,item.__qualname__)).encode())
+    elif isinstance(item,(dict,list,tuple,set)):
+        if id(item) in visited:
+            digest.update(b'cycle;')
+            return
+        visited.add(id(item))
+        digest.update(('%s.%s %d;' % (type(item).__module__,type(item).__qualname__,len(item))).encode())
+        if isinstance(item,dict):
+            for key in item.keys():
+                if key in exclude:
+                    continue
+                update_content_hash(digest,key,exclude,visited)
+                update_content_hash(digest,dict.__getitem__(item,key),exclude,visited)
+        else:
+            values = sorted(item,key=repr) if isinstance(item,set) else item
+            for value in values:
+                update_content_hash(digest,value,exclude,visited)
+        visited.discard(id(item))
+    else:
+        try:
+            digest.update(pickle.dumps(item,protocol=4))
+        except Exception:
+            digest.update(('%s id %d;' % (type(item).__qualname__,id(item))).encode())
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+# shared_view
+# ----------------------------------------------------------------------------------------------------------------------  
+## @ingroup Core
+def shared_view(item,write_protect=True):
+    """Copies a Data object, e.g. the conditions of a propulsor, without copying its arrays: the Data objects and dicts
+    are copied, so keys can be set on the copy without changing the original, and the arrays are views of the arrays
+    of the original. The results of one propulsor or battery module are shared this way with the identical ones.
+
+    Assumptions:
+    With write_protect, the views are read-only, so writing into them in place raises an error instead of silently
+    changing the original. A consumer writing into an array of the copy replaces it by its own copy first, see
+    unshare_array. Values other than arrays, Data objects and dicts are shared as they are.
+
+    Source:
+    N/A
+
+    Inputs:
+    item           - Data object, dict or array                           [-]
+    write_protect  - flag making the shared arrays read-only              [boolean]
+
+    Outputs:
+    shared         - copy of the item sharing the arrays of the original  [-]
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(item,np.ndarray):
+        shared = item.view()
+        shared.flags.writeable = not write_protect and item.flags.writeable
+    elif isinstance(item,dict):
+        shared = copy.copy(item)
+        for key, value in dict.items(item):
+            if isinstance(value,np.ndarray):
+                value = value.view()
+                value.flags.writeable = not write_protect and value.flags.writeable
+            elif isinstance(value,dict):
+                value = shared_view(value,write_protect)
+            dict.__setitem__(shared,key,value)
+    else:
+        shared = item
+
+    return shared
+
+## @ingroup Core
+def unshare_array(data,key):
+    """Returns an array of a Data object to be written into in place. An array write-protected by shared_view is
+    first replaced by a copy, so the original it is shared with does not change.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    data           - Data object or dict                                  [-]
+    key            - key of the array                                     [string]
+
+    Outputs:
+    array          - writeable array stored under the key                 [-]
+
+    Properties Used:
+    N/A
+    """
+
+    array = data[key]
+    if not array.flags.writeable:
+        array     = array.copy()
+        data[key] = array
+
+    return array
@@ -14,4 +14,5 @@ from Legacy.trunk.S.Core.Diffed_Data   import Diffed_Data, diff
 from Legacy.trunk.S.Core               import ContainerOrdered , redirect
 from .Container                        import Container
 from .Utilities                        import * 
-from .Units                            import Units
\ No newline at end of file
+from .Units                            import Units
+from Legacy.trunk.S.Core.lazy_import   import lazy_import
\ No newline at end of file
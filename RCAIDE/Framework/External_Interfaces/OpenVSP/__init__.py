@@ -10,7 +10,9 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
  
-from Legacy.trunk.S.Input_Output.OpenVSP.get_vsp_measurements import get_vsp_measurements
-from Legacy.trunk.S.Input_Output.OpenVSP.write_vsp_mesh       import write_vsp_mesh
-from Legacy.trunk.S.Input_Output.OpenVSP.vsp_write            import write
-from Legacy.trunk.S.Input_Output.OpenVSP.mach_slices          import mach_slices
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'get_vsp_measurements':('Legacy.trunk.S.Input_Output.OpenVSP.get_vsp_measurements','get_vsp_measurements'),
+                                                           'write_vsp_mesh':('Legacy.trunk.S.Input_Output.OpenVSP.write_vsp_mesh','write_vsp_mesh'),
+                                                           'write':('Legacy.trunk.S.Input_Output.OpenVSP.vsp_write','write'),
+                                                           'mach_slices':('Legacy.trunk.S.Input_Output.OpenVSP.mach_slices','mach_slices')})
\ No newline at end of file
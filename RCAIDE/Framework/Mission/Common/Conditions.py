@@ -27,7 +27,8 @@ class Conditions(Data):
         None   
     """ 
 
-    _size = 1
+    _size   = 1
+    _layout = None
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
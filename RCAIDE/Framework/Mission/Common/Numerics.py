@@ -47,8 +47,17 @@ class Numerics(Conditions):
         """           
         self.tag                              = 'numerics' 
         self.number_of_control_points         = 16
+        self.adaptive_control_points          = False
+        self.minimum_number_of_control_points = 5
+        self.maximum_number_of_control_points = 33
+        self.adaptive_tolerance               = 1e-4
+        self.discretization_error             = None
         self.discretization_method            = chebyshev_data 
         self.solver_jacobian                  = "none"
+        self.contiguous_state                 = False
+        self.jacobian_sparsity                = None
+        self.jacobian_colors                  = None
+        self.jacobian_probes                  = 1
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
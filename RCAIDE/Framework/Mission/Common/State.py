@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 # RCAIDE imports
-from RCAIDE.Framework.Core        import DataOrdered
+from RCAIDE.Framework.Core        import DataOrdered, Data
 from .Conditions        import Conditions
 from .Unknowns          import Unknowns
 from .Residuals         import Residuals
@@ -146,14 +146,14 @@ class Container(State):
             None
         """              
         
-        state_out = State()
+        state_out  = State()
+        sub_states = list(self.segments.values())
         
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        for key in ['unknowns','conditions','residuals']:
+            state_out[key].update(sub_states[0][key])
+            if len(sub_states) > 1:
+                others         = [sub_state[key] for sub_state in sub_states[1:]]
+                state_out[key] = merge_data(state_out[key],others,state_out[key].__class__)
             
         return state_out
         
@@ -186,4 +186,49 @@ def append_array(A,B=None):
     if isinstance(A,np.ndarray) and isinstance(B,np.ndarray):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+    
+# ----------------------------------------------------------------------------------------------------------------------
+# merge_data
+# ---------------------------------------------------------------------------------------------------------------------- 
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def merge_data(A,others,klass):
+    """ Stacks every array of a data structure with the matching arrays of the others in a single allocation. The
+        result is the same as applying append_array with do_recursive once per other structure, without restacking
+        the growing arrays.
+
+        Assumptions:
+        Keys missing from another structure leave the value unchanged, values that can not be stacked are dropped
+
+        Source:
+        N/A
+
+        Inputs:
+        A      [Data]
+        others [list]
+        klass  [class]
+
+        Outputs:
+        C      [Data]
+
+        Properties Used:
+        None
+    """       
+    C = klass()
+    for k,a in A.items():
+        values = []
+        for B in others:
+            if not isinstance(B,Data):
+                values.append(B)
+            elif k in B:
+                values.append(B[k])
+        
+        if not values:
+            C[k] = a
+        elif isinstance(a,Data):
+            C[k] = merge_data(a,values,klass)
+        elif isinstance(a,np.ndarray) and all(isinstance(b,np.ndarray) for b in values):
+            C[k] = np.vstack([a] + values)
+            
+    return C
\ No newline at end of file
@@ -11,7 +11,7 @@
 import RCAIDE
 from RCAIDE.Library.Mission.Common.Segments    import  sequential_segments
 from RCAIDE.Library.Mission.Common.Pre_Process import  aerodynamics,stability, energy,emissions, set_residuals_and_unknowns
-from RCAIDE.Framework.Core                               import Container as ContainerBase
+from RCAIDE.Framework.Core                               import Container as ContainerBase, Data
 from RCAIDE.Framework.Analyses                           import Process 
 from . import Segments
 
@@ -50,6 +50,11 @@ class Sequential_Segments(Segments.Segment.Container):
 
         self.tag = 'mission'
         
+        # seed each segment with its last converged solution, stored by mission and segment tag. A store may be
+        # shared by missions that are rebuilt with the same tags
+        self.warm_start       = False
+        self.warm_start_store = Data()
+        
         #   Initialize   
         self.process.initialize                                = Process() 
         self.process.initialize.aero                           = aerodynamics
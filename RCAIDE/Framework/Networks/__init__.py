@@ -9,17 +9,19 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Components.Energy.Networks import Battery_Ducted_Fan                           as legacy_battery_ducted_fan
-from Legacy.trunk.S.Components.Energy.Networks import Ducted_Fan                                   as legacy_ducted_fan 
-from Legacy.trunk.S.Components.Energy.Networks import Liquid_Rocket                                as legacy_liquid_rocket
-from Legacy.trunk.S.Components.Energy.Networks import Propulsor_Surrogate                          as legacy_propulsor_surrogate
-from Legacy.trunk.S.Components.Energy.Networks import PyCycle                                      as legacy_pycycle
-from Legacy.trunk.S.Components.Energy.Networks import Ramjet                                       as legacy_ramjet
-from Legacy.trunk.S.Components.Energy.Networks import Scramjet                                     as legacy_scramjet
-from Legacy.trunk.S.Components.Energy.Networks import Serial_Hybrid_Ducted_Fan                     as legacy_serial_hybrid_ducted_fan 
-from Legacy.trunk.S.Components.Energy.Networks import Turboelectric_HTS_Ducted_Fan                 as legacy_turboelectric_hts_ducted_fan
-from Legacy.trunk.S.Components.Energy.Networks import Turboelectric_HTS_Dynamo_Ducted_Fan          as legacy_turboelectric_hts_dynamo_ducted_fan
-from Legacy.trunk.S.Components.Energy.Networks import Turbojet_Super                               as legacy_turbojet
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'legacy_battery_ducted_fan':('Legacy.trunk.S.Components.Energy.Networks','Battery_Ducted_Fan'),
+                                                           'legacy_ducted_fan':('Legacy.trunk.S.Components.Energy.Networks','Ducted_Fan'),
+                                                           'legacy_liquid_rocket':('Legacy.trunk.S.Components.Energy.Networks','Liquid_Rocket'),
+                                                           'legacy_propulsor_surrogate':('Legacy.trunk.S.Components.Energy.Networks','Propulsor_Surrogate'),
+                                                           'legacy_pycycle':('Legacy.trunk.S.Components.Energy.Networks','PyCycle'),
+                                                           'legacy_ramjet':('Legacy.trunk.S.Components.Energy.Networks','Ramjet'),
+                                                           'legacy_scramjet':('Legacy.trunk.S.Components.Energy.Networks','Scramjet'),
+                                                           'legacy_serial_hybrid_ducted_fan':('Legacy.trunk.S.Components.Energy.Networks','Serial_Hybrid_Ducted_Fan'),
+                                                           'legacy_turboelectric_hts_ducted_fan':('Legacy.trunk.S.Components.Energy.Networks','Turboelectric_HTS_Ducted_Fan'),
+                                                           'legacy_turboelectric_hts_dynamo_ducted_fan':('Legacy.trunk.S.Components.Energy.Networks','Turboelectric_HTS_Dynamo_Ducted_Fan'),
+                                                           'legacy_turbojet':('Legacy.trunk.S.Components.Energy.Networks','Turbojet_Super')})
  
 from .Network       import Network
 from .Fuel          import Fuel
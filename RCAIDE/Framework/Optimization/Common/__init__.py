@@ -11,8 +11,11 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
  
 from .Nexus                      import Nexus
-from Legacy.trunk.S.Optimization.read_optimization_outputs  import read_optimization_outputs
-from Legacy.trunk.S.Optimization.write_optimization_outputs import write_optimization_outputs
-from Legacy.trunk.S.Optimization.carpet_plot                import carpet_plot
-from Legacy.trunk.S.Optimization.line_plot                  import line_plot  
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'read_optimization_outputs':('Legacy.trunk.S.Optimization.read_optimization_outputs','read_optimization_outputs'),
+                                                           'write_optimization_outputs':('Legacy.trunk.S.Optimization.write_optimization_outputs','write_optimization_outputs'),
+                                                           'carpet_plot':('Legacy.trunk.S.Optimization.carpet_plot','carpet_plot'),
+                                                           'line_plot':('Legacy.trunk.S.Optimization.line_plot','line_plot')})
+
 from .helper_functions                       import * 
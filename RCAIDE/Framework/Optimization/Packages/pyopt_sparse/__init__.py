@@ -10,4 +10,6 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Optimization.Package_Setups import pyoptsparse_setup
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'pyoptsparse_setup':('Legacy.trunk.S.Optimization.Package_Setups','pyoptsparse_setup')})
\ No newline at end of file
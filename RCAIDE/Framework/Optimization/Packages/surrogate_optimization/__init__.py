@@ -10,4 +10,6 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Optimization.Surrogate_Optimization import Surrogate_Optimization
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Surrogate_Optimization':('Legacy.trunk.S.Optimization.Surrogate_Optimization','Surrogate_Optimization')})
\ No newline at end of file
@@ -10,7 +10,9 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Optimization.Package_Setups      import TRMM 
-from Legacy.trunk.S.Optimization.Package_Setups.TRMM import TRMM_setup
-from Legacy.trunk.S.Optimization.Package_Setups.TRMM import Trust_Region
-from Legacy.trunk.S.Optimization.Package_Setups.TRMM import Trust_Region_Optimization
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'TRMM':('Legacy.trunk.S.Optimization.Package_Setups','TRMM'),
+                                                           'TRMM_setup':('Legacy.trunk.S.Optimization.Package_Setups.TRMM','TRMM_setup'),
+                                                           'Trust_Region':('Legacy.trunk.S.Optimization.Package_Setups.TRMM','Trust_Region'),
+                                                           'Trust_Region_Optimization':('Legacy.trunk.S.Optimization.Package_Setups.TRMM','Trust_Region_Optimization')})
\ No newline at end of file
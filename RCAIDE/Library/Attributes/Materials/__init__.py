@@ -10,16 +10,19 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 from .Solid                                                       import Solid
-from Legacy.trunk.S.Attributes.Solids.Unidirectional_Carbon_Fiber import Unidirectional_Carbon_Fiber
-from Legacy.trunk.S.Attributes.Solids.Bidirectional_Carbon_Fiber  import Bidirectional_Carbon_Fiber
-from Legacy.trunk.S.Attributes.Solids.Carbon_Fiber_Honeycomb      import Carbon_Fiber_Honeycomb
-from Legacy.trunk.S.Attributes.Solids.Epoxy                       import Epoxy
-from Legacy.trunk.S.Attributes.Solids.Aluminum_Rib                import Aluminum_Rib
-from Legacy.trunk.S.Attributes.Solids.Paint                       import Paint
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Unidirectional_Carbon_Fiber':('Legacy.trunk.S.Attributes.Solids.Unidirectional_Carbon_Fiber','Unidirectional_Carbon_Fiber'),
+                                                           'Bidirectional_Carbon_Fiber':('Legacy.trunk.S.Attributes.Solids.Bidirectional_Carbon_Fiber','Bidirectional_Carbon_Fiber'),
+                                                           'Carbon_Fiber_Honeycomb':('Legacy.trunk.S.Attributes.Solids.Carbon_Fiber_Honeycomb','Carbon_Fiber_Honeycomb'),
+                                                           'Epoxy':('Legacy.trunk.S.Attributes.Solids.Epoxy','Epoxy'),
+                                                           'Aluminum_Rib':('Legacy.trunk.S.Attributes.Solids.Aluminum_Rib','Aluminum_Rib'),
+                                                           'Paint':('Legacy.trunk.S.Attributes.Solids.Paint','Paint'),
+                                                           'Acrylic':('Legacy.trunk.S.Attributes.Solids.Acrylic','Acrylic'),
+                                                           'Steel':('Legacy.trunk.S.Attributes.Solids.Steel','Steel'),
+                                                           'Nickel':('Legacy.trunk.S.Attributes.Solids.Nickel','Nickel'),
+                                                           'Titanium':('Legacy.trunk.S.Attributes.Solids.Titanium','Titanium'),
+                                                           'Magnesium':('Legacy.trunk.S.Attributes.Solids.Magnesium','Magnesium')})
+
 from .Aluminum                                                    import Aluminum
-from .Polyetherimide                                              import  Polyetherimide
-from Legacy.trunk.S.Attributes.Solids.Acrylic                     import Acrylic
-from Legacy.trunk.S.Attributes.Solids.Steel                       import Steel
-from Legacy.trunk.S.Attributes.Solids.Nickel                      import Nickel
-from Legacy.trunk.S.Attributes.Solids.Titanium                    import Titanium
-from Legacy.trunk.S.Attributes.Solids.Magnesium                   import Magnesium
\ No newline at end of file
+from .Polyetherimide                                              import  Polyetherimide
\ No newline at end of file
@@ -9,4 +9,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Components.Costs.Costs import Industrial_Costs, Operating_Costs
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Industrial_Costs':('Legacy.trunk.S.Components.Costs.Costs','Industrial_Costs'),
+                                                           'Operating_Costs':('Legacy.trunk.S.Components.Costs.Costs','Operating_Costs')})
\ No newline at end of file
@@ -13,7 +13,9 @@
 from .Electronic_Speed_Controller                  import Electronic_Speed_Controller
 from .Fuel_Selector                                import Fuel_Selector
 from .Solar_Logic                                  import Solar_Logic
-from Legacy.trunk.S.Components.Energy.Distributors import HTS_DC_Dynamo_Basic
-from Legacy.trunk.S.Components.Energy.Distributors import HTS_DC_Supply 
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'HTS_DC_Dynamo_Basic':('Legacy.trunk.S.Components.Energy.Distributors','HTS_DC_Dynamo_Basic'),
+                                                           'HTS_DC_Supply':('Legacy.trunk.S.Components.Energy.Distributors','HTS_DC_Supply')})
 
 
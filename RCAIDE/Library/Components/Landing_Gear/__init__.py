@@ -9,6 +9,8 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Components.Landing_Gear.Landing_Gear import Landing_Gear
-from Legacy.trunk.S.Components.Landing_Gear.Main_Landing_Gear import Main_Landing_Gear
-from Legacy.trunk.S.Components.Landing_Gear.Nose_Landing_Gear import Nose_Landing_Gear
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'Landing_Gear':('Legacy.trunk.S.Components.Landing_Gear.Landing_Gear','Landing_Gear'),
+                                                           'Main_Landing_Gear':('Legacy.trunk.S.Components.Landing_Gear.Main_Landing_Gear','Main_Landing_Gear'),
+                                                           'Nose_Landing_Gear':('Legacy.trunk.S.Components.Landing_Gear.Nose_Landing_Gear','Nose_Landing_Gear')})
\ No newline at end of file
@@ -94,9 +94,26 @@ class Rotor(Component):
         self.variable_pitch                    = False
         self.electric_propulsion_fraction      = 1.0
 
-        # Initialize the default wake set to Fidelity Zero 
-        self.Wake                      = Rotor_Wake_Fidelity_Zero() 
-        
+        # Initialize the default wake set to Fidelity Zero
+        self.Wake                      = Rotor_Wake_Fidelity_Zero()
+
+        # precomputed performance map, evaluated in place of the BEMT once computed by compute_rotor_performance_map.
+        # The default map covers advance ratios of 0 to 2 and tip Mach numbers of 0.1 to 0.8 only, at zero pitch
+        # command, no edgewise velocity and sea level. An axis with a single value is not interpolated, add values to
+        # cover variable pitch, edgewise flight or altitude, points away from a single value raise a warning
+        self.performance_map                                            = Data()
+        self.performance_map.active                                     = False
+        self.performance_map.advance_ratios                             = np.linspace(0.,2.,21)
+        self.performance_map.tip_mach_numbers                           = np.linspace(0.1,0.8,8)
+        self.performance_map.pitch_commands                             = np.array([0.])
+        self.performance_map.edgewise_advance_ratios                    = np.array([0.])   # used with the 2D analysis
+        self.performance_map.altitudes                                  = np.array([0.])
+        self.performance_map.workers                                    = 1                # processes evaluating the grid points
+        self.performance_map.points_per_evaluation                      = 500              # grid points in one BEMT evaluation
+        self.performance_map.accuracy_check_points                      = None             # sample points compared to the BEMT
+        self.performance_map.accuracy                                   = None
+        self.performance_map.surrogates                                 = None
+
         # blade optimization parameters     
         self.optimization_parameters                                    = Data() 
         self.optimization_parameters.tip_mach_range                     = [0.3,0.7] 
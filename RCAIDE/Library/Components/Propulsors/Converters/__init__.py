@@ -14,26 +14,29 @@
 from .Combustor                                  import Combustor
 from .Compressor                                 import Compressor
 from .Compression_Nozzle                         import Compression_Nozzle
-from Legacy.trunk.S.Components.Energy.Converters import de_Laval_Nozzle
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'de_Laval_Nozzle':('Legacy.trunk.S.Components.Energy.Converters','de_Laval_Nozzle'),
+                                                           'Fuel_Cell':('Legacy.trunk.S.Components.Energy.Converters','Fuel_Cell'),
+                                                           'Gearbox':('Legacy.trunk.S.Components.Energy.Converters','Gearbox'),
+                                                           'Generator_Zero_Fid':('Legacy.trunk.S.Components.Energy.Converters','Generator_Zero_Fid'),
+                                                           'Motor_HTS_Rotor':('Legacy.trunk.S.Components.Energy.Converters','Motor_HTS_Rotor'),
+                                                           'Motor_Lo_Fid':('Legacy.trunk.S.Components.Energy.Converters','Motor_Lo_Fid'),
+                                                           'Propeller_Lo_Fid':('Legacy.trunk.S.Components.Energy.Converters','Propeller_Lo_Fid'),
+                                                           'Rocket_Combustor':('Legacy.trunk.S.Components.Energy.Converters','Rocket_Combustor'),
+                                                           'Solar_Panel':('Legacy.trunk.S.Components.Energy.Converters','Solar_Panel')})
+
 from .Expansion_Nozzle                           import Expansion_Nozzle
 from .Fan                                        import Fan
-from Legacy.trunk.S.Components.Energy.Converters import Fuel_Cell
-from Legacy.trunk.S.Components.Energy.Converters import Gearbox
-from Legacy.trunk.S.Components.Energy.Converters import Generator_Zero_Fid
 from .Engine                                     import Engine
 from .Lift_Rotor                                 import Lift_Rotor
-from Legacy.trunk.S.Components.Energy.Converters import Motor_HTS_Rotor
-from Legacy.trunk.S.Components.Energy.Converters import Motor_Lo_Fid
 from .DC_Motor                                   import DC_Motor
 from .Ducted_Fan                                 import Ducted_Fan
-from Legacy.trunk.S.Components.Energy.Converters import Propeller_Lo_Fid
 from .Propeller                                  import Propeller
 from .Ram                                        import Ram
-from Legacy.trunk.S.Components.Energy.Converters import Rocket_Combustor
 from .Rotor                                      import Rotor
 from .Prop_Rotor                                 import Prop_Rotor
 from .Offtake_Shaft                              import Offtake_Shaft
-from Legacy.trunk.S.Components.Energy.Converters import Solar_Panel
 from .Supersonic_Nozzle                          import Supersonic_Nozzle
 from .Turbine                                    import Turbine
 
@@ -10,8 +10,11 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Methods.Aerodynamics.AERODAS import AERODAS_setup
-from Legacy.trunk.S.Methods.Aerodynamics.AERODAS import finite_aspect_ratio
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'AERODAS_setup':('Legacy.trunk.S.Methods.Aerodynamics.AERODAS','AERODAS_setup'),
+                                                           'finite_aspect_ratio':('Legacy.trunk.S.Methods.Aerodynamics.AERODAS','finite_aspect_ratio'),
+                                                           'section_properties':('Legacy.trunk.S.Methods.Aerodynamics.AERODAS','section_properties')})
+
 from .post_stall_coefficients import post_stall_coefficients
-from .pre_stall_coefficients import pre_stall_coefficients
-from Legacy.trunk.S.Methods.Aerodynamics.AERODAS import section_properties
\ No newline at end of file
+from .pre_stall_coefficients import pre_stall_coefficients
\ No newline at end of file
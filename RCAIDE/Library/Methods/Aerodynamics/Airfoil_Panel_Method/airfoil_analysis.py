@@ -16,6 +16,7 @@ from .heads_method         import heads_method
 from .aero_coeff           import aero_coeff
 from .chordwise_distribution import chordwise_distribution
 from .cf_filter            import cf_filter
+from .surface_points       import surface_points, gather_surface_points
 
 # pacakge imports  
 import numpy as np  
@@ -540,11 +541,13 @@ def concatenate_surfaces(X_BOT,X_TOP,FUNC_BOT_SURF,FUNC_TOP_SURF,npanel,ncases,n
     Properties Used:
     N/A  
     '''  
-    FUNC = np.zeros((npanel,ncases,ncpts))  
-    
-    for case in range(ncases):
-        for cpt in range(ncpts):   
-            top_func          = FUNC_TOP_SURF[:,case,cpt][X_TOP[:,case,cpt].mask == False] 
-            bot_func          = FUNC_BOT_SURF[:,case,cpt][X_BOT[:,case,cpt].mask == False]                  
-            FUNC[:,case,cpt]  = np.concatenate([bot_func[::-1],top_func])
+    # the points of the bottom surface in reverse order, followed by those of the top surface 
+    bot_order, n_bot = surface_points(X_BOT.mask)
+    top_order, n_top = surface_points(X_TOP.mask)
+    rows             = np.arange(npanel)[:,None,None]
+    bot_func         = gather_surface_points(FUNC_BOT_SURF,bot_order,n_bot)
+    top_func         = gather_surface_points(FUNC_TOP_SURF,top_order,n_top)
+    bot_func         = np.take_along_axis(bot_func,np.clip(n_bot - 1 - rows,0,npanel-1),axis=0)
+    top_func         = np.take_along_axis(top_func,np.clip(rows - n_bot,0,npanel-1),axis=0)
+    FUNC             = np.where(rows < n_bot,bot_func,top_func)
     return FUNC
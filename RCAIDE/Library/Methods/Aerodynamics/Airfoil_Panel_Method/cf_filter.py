@@ -33,10 +33,9 @@ def cf_filter(ncpts,ncases,npanel,CF):
     n_f = n/10
     n_r = n/20
     
-    for i in range(ncpts):
-        for j in range(ncases):
-                CF_new[int(n_r):int((n/2)-(n_f)),j,i] = lfilter(b, a, CF[int(n_r):int((n/2)-(n_f)),j,i])
-                CF_new[int((n/2)+(n_f)):int(n-(n_r)),j,i] = lfilter(b, a, CF[int((n/2)+(n_f)):int(n-(n_r)),j,i])
+    # filter all the cases and control points at once
+    CF_new[int(n_r):int((n/2)-(n_f))] = lfilter(b, a, CF[int(n_r):int((n/2)-(n_f))], axis = 0)
+    CF_new[int((n/2)+(n_f)):int(n-(n_r))] = lfilter(b, a, CF[int((n/2)+(n_f)):int(n-(n_r))], axis = 0)
     
     return CF_new
                 
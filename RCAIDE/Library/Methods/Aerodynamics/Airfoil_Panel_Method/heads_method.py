@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports    
 from RCAIDE.Framework.Core import Data 
+from .surface_points       import surface_points, gather_surface_points, scatter_surface_points
 
 # package imports  
 import numpy as np 
@@ -58,150 +59,105 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFactor
     Properties Used:
     N/A
     """    
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)      
+    # Gather the points of the turbulent surface of all the cases and control points, which are marched at once. 
+    # There is no turbulent surface where its length is zero 
+    order, n     = surface_points(TURBULENT_COORD.mask)
+    n[TURBULENT_SURF == 0.0] = 0
+    x_i          = gather_surface_points(TURBULENT_COORD,order,n)
+    Ve_i         = gather_surface_points(VE_I,order,n)
+    dVe_i        = gather_surface_points(DVE_I,order,n)
+    turbulent    = n > 0 
+    l            = np.where(turbulent,TURBULENT_SURF,1.)
+    Re_L         = RE_L*np.ones_like(l)
+    nu           = l/Re_L 
+    dx           = np.diff(x_i,axis=0)
+    
+    H            = np.zeros_like(x_i) 
+    H[0]         = ShapeFactor_0
+    Theta        = np.zeros_like(x_i)
+    Theta[0]     = np.where(turbulent,THETA_0,1.)
+    H1           = np.zeros_like(x_i) 
+    H1[0]        = (DEL_0 - DELTA_STAR_0)/Theta[0]
+    H1[0][H1[0]<3.3] = 3.417285
+    
+    cf           = np.zeros_like(x_i)
+    cf[0]        = CF_0
+    VeThetaH1    = np.zeros_like(x_i)
+    VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
+    
+    # The slopes of Theta and VeThetaH1 only depend on the previous grid point, so the iteration of the variables at 
+    # a grid point converges with the first values
+    for i in range(1,np.max(n,initial=1)):
+        # get Theta and VeThetaH1
+        Theta[i], VeThetaH1[i] = RK4(dx[i-1], x_i[i-1], Theta[i-1], VeThetaH1[i-1], dTheta_by_dx, dVeThetaH1_by_dx,
+                                     cf[i-1], H[i-1], Ve_i[i-1], dVe_i[i-1])
+        VeThetaH1[i] = np.where(np.isnan(VeThetaH1[i]),VeThetaH1[i-1],VeThetaH1[i])
+       
+        # get H1
+        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
+        
+        # get H
+        H[i] = getH(H1[i])
+        
+        # get skin friction
+        cf[i] = getcf(Re_L, l, Ve_i[i], H[i], Theta[i])
+    
+    delta_star   = H*Theta
+    Re_theta     = (Re_L/l)*Ve_i*Theta
+    Re_x         = (Ve_i*x_i)/nu
+    delta        = (Theta*H1) + delta_star
     
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                def getcf(ind, H, THETA):
-                    ReTheta = (Re_L/l)*Ve_i[ind]*THETA;
-                    cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268);
-                    return cf_var
-
-
-                def getH(H1_var):
-                    if H1_var<3.3:
-                        H_var = 3.0
-                    elif H1_var < 5.39142:
-                        H_var = 0.6778 + 1.153793*(H1_var-3.3)**-0.32637;
-                    elif H1_var >= 5.39142:
-                        H_var = 1.1 + 0.8598636*(H1_var - 3.3)**-0.777;
-                    return H_var
-                
-             
-                # define RK4 slope function for Theta
-                def dTheta_by_dx(index, X, THETA, VETHETAH1):
-                    return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
-                
-                # define RK4 slope function for VeThetaH1
-                def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
-                    return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
-                
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                Re_L         = RE_L[case,cpt] 
-                nu           = l/Re_L 
-                n            = len(x_i)
-                dx           = np.diff(x_i)
-                
-                H            = np.zeros(n) 
-                H[0]         = ShapeFactor_0[case,cpt]
-                Theta        = np.zeros(n)
-                Theta[0]     = THETA_0[case,cpt]
-                H1           = np.zeros(n) 
-                H1[0]        = (DEL_0[case,cpt] - DELTA_STAR_0[case,cpt])/THETA_0[case,cpt]
-                if H1[0]<3.3:
-                    H1[0] = 3.417285
-                
-                cf           = np.zeros(n)
-                cf[0]        = CF_0[case,cpt] 
-                VeThetaH1    = np.zeros(n)
-                VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
-                
-                for i in range(1,n):
-                    # initialise the variable values at the current grid point using previous grid points (to define the error functions)
-                    H_er = H[i-1];  cf_er = cf[i-1];  H1_er = H1[i-1];  Theta_er = Theta[i-1];
-                    # assign previous grid point values of H and Cf to start RK4
-                    H[i] = H[i-1]; cf[i] = cf[i-1];
-                    
-                    #assume some error values
-                    erH = 0.2; erH1 = 0.2; erTheta = 0.2; ercf = 0.2;
-                    
-                    # iterate to get the variables at the grid point
-                    while abs(erH)>0.00001 or abs(erH1)>0.00001 or abs(erTheta)>0.00001 or abs(ercf)>0.00001:
-                        
-                        # get Theta and VeThetaH1
-                        Theta[i], VeThetaH1[i] = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
-                        if np.isnan(VeThetaH1[i]):
-                            VeThetaH1[i] = VeThetaH1[i-1]
-                       
-                        # get H1
-                        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
-                        
-                        # get H
-                        H[i] = getH(H1[i])
-                        
-                        # get skin friction
-                        cf[i] = getcf(i, H[i], Theta[i])
-                        
-                        # define errors
-                        erH = (H[i]-H_er)/H[i];
-                        erH1 = (H1[i]-H1_er)/H1[i];
-                        erTheta = (Theta[i]-Theta_er)/Theta[i];
-                        ercf = (cf[i]-cf_er)/cf[i];
-                        
-                        # assign current iteration variable values to the Var_er
-                        H_er = H[i]
-                        H1_er = H1[i]
-                        Theta_er = Theta[i]
-                        cf_er = cf[i]
-                
-                
-                delta_star   = H*Theta
-                Re_theta     = (Re_L/l)*Ve_i*Theta
-                Re_x         = (Ve_i*x_i)/nu
-                delta        = (Theta*H1) + delta_star
-                
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,Theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,delta_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta)
-
     RESULTS = Data(
-            X_H          = X_H,      
-            THETA_H      = THETA_H,   
-            DELTA_STAR_H = DELTA_STAR_H,
-            H_H          = H_H,       
-            CF_H         = CF_H,   
-            RE_THETA_H   = RE_THETA_H,   
-            RE_X_H       = RE_X_H,    
-            DELTA_H      = DELTA_H,   
+            X_H          = scatter_surface_points(x_i,order,n),      
+            THETA_H      = scatter_surface_points(Theta,order,n),   
+            DELTA_STAR_H = scatter_surface_points(delta_star,order,n),
+            H_H          = scatter_surface_points(H,order,n),       
+            CF_H         = scatter_surface_points(cf,order,n),   
+            RE_THETA_H   = scatter_surface_points(Re_theta,order,n),   
+            RE_X_H       = scatter_surface_points(Re_x,order,n),    
+            DELTA_H      = scatter_surface_points(delta,order,n),   
         )    
 
     return  RESULTS
 
+def getcf(Re_L, l, Ve, H, THETA):
+    """ Skin friction coefficient of the turbulent boundary layer """
+    ReTheta = (Re_L/l)*Ve*THETA
+    cf_var  = 0.246*(10**(-0.678*H))*(ReTheta**-0.268)
+    return cf_var
+
+def getH(H1_var):
+    """ Shape factor of the turbulent boundary layer from the mass entrainment shape factor, H1 """
+    H_var       = np.full_like(H1_var,np.nan)
+    idx1        = H1_var < 3.3
+    idx2        = (H1_var >= 3.3) & (H1_var < 5.39142)
+    idx3        = H1_var >= 5.39142
+    H_var[idx1] = 3.0
+    H_var[idx2] = 0.6778 + 1.153793*(H1_var[idx2]-3.3)**-0.32637
+    H_var[idx3] = 1.1 + 0.8598636*(H1_var[idx3] - 3.3)**-0.777
+    return H_var
+
+def dTheta_by_dx(X, THETA, VETHETAH1, cf, H, Ve, dVe):
+    """ RK4 slope function for Theta """
+    return 0.5*cf - (THETA/Ve)*(2+H)*(dVe)
+
+def dVeThetaH1_by_dx(X, THETA, VETHETAH1, cf, H, Ve, dVe):
+    """ RK4 slope function for VeThetaH1 """
+    return Ve*0.0306*(((VETHETAH1/(Ve*THETA))-3)**-0.6169)
 
-def RK4(ind, dx, x, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope):
-    k1 = Theta_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
-    l1 = VeThetaH1_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
+def RK4(dx, x, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope, *args):
+    k1 = Theta_slope(x,  Theta_var,  VeThetaH1_var, *args)
+    l1 = VeThetaH1_slope(x,  Theta_var,  VeThetaH1_var, *args)
     
-    k2 = Theta_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
-    l2 = VeThetaH1_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
+    k2 = Theta_slope(x + (dx/2),  Theta_var + (k1*dx/2),  VeThetaH1_var + (l1*dx/2), *args)
+    l2 = VeThetaH1_slope(x + (dx/2),  Theta_var + (k1*dx/2),  VeThetaH1_var + (l1*dx/2), *args)
     
-    k3 = Theta_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
-    l3 = VeThetaH1_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
+    k3 = Theta_slope(x + (dx/2),  Theta_var + (k2*dx/2),  VeThetaH1_var + (l2*dx/2), *args)
+    l3 = VeThetaH1_slope(x + (dx/2),  Theta_var + (k2*dx/2),  VeThetaH1_var + (l2*dx/2), *args)
     
-    k4 = Theta_slope(ind,  x[ind] + dx[ind],  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
-    l4 = VeThetaH1_slope(ind,  x[ind] + dx[ind],  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
+    k4 = Theta_slope(x + dx,  Theta_var + (k3*dx),  VeThetaH1_var + (l2*dx), *args)
+    l4 = VeThetaH1_slope(x + dx,  Theta_var + (k3*dx),  VeThetaH1_var + (l2*dx), *args)
     
-    Theta_new = Theta_var[ind] + ((dx[ind]/6)*(k1 + 2*k2 + 2*k3 + k4))
-    VeThetaH1_new = VeThetaH1_var[ind] + ((dx[ind]/6)*(l1 + 2*l2 + 2*l3 + l4))
+    Theta_new = Theta_var + ((dx/6)*(k1 + 2*k2 + 2*k3 + k4))
+    VeThetaH1_new = VeThetaH1_var + ((dx/6)*(l1 + 2*l2 + 2*l3 + l4))
     return Theta_new, VeThetaH1_new 
\ No newline at end of file
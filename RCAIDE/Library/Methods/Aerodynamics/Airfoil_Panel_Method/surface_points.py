@@ -0,0 +1,97 @@
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+# RCAIDE/Methods/Aerodynamics/Airfoil_Panel_Method/surface_points.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# surface_points
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def surface_points(mask):
+    """ Computes the order of the points of a surface for all cases and control points, which lists the points
+    that are not masked first, in their order along the surface
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    mask   - mask of the points that are not on the surface, npanel x ncases x ncpts  [boolean]
+
+    Outputs:
+    order  - indices of the surface points first, then of the masked points          [unitless]
+    n      - number of surface points of each case and control point                [unitless]
+
+    Properties Used:
+    N/A
+    """
+    mask  = np.ma.getmaskarray(mask) if np.ma.isMaskedArray(mask) else np.asarray(mask,dtype=bool)
+    order = np.argsort(mask,axis=0,kind='stable')
+    n     = np.sum(~mask,axis=0)
+
+    return order, n
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def gather_surface_points(values,order,n):
+    """ Gathers the values at the points of a surface, so that the surface points of all the cases and control points
+    start at the first row. The rows after the last surface point repeat its value, so that the surface can be
+    marched for all the cases and control points at once.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    values - values at all the points, npanel x ncases x ncpts  [multiple units]
+    order  - order of the points from surface_points            [unitless]
+    n      - number of surface points from surface_points       [unitless]
+
+    Outputs:
+    values - values at the surface points                       [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    rows   = np.arange(np.shape(order)[0]).reshape((-1,) + (1,)*(np.ndim(order) - 1))
+    index  = np.take_along_axis(order,np.minimum(rows,np.maximum(n - 1,0)),axis=0)
+
+    return np.take_along_axis(np.ma.getdata(values),index,axis=0)
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def scatter_surface_points(values,order,n):
+    """ Puts the values at the surface points gathered by gather_surface_points back at their points, and zeros at
+    the masked points
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    values - values at the surface points                       [multiple units]
+    order  - order of the points from surface_points            [unitless]
+    n      - number of surface points from surface_points       [unitless]
+
+    Outputs:
+    values - values at all the points, npanel x ncases x ncpts  [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    rows   = np.arange(np.shape(order)[0]).reshape((-1,) + (1,)*(np.ndim(order) - 1))
+    FUNC   = np.zeros(np.shape(order))
+    np.put_along_axis(FUNC,order,np.where(rows < n,values,0.),axis=0)
+
+    return FUNC
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Data 
+from .surface_points       import surface_points, gather_surface_points, scatter_surface_points
 
 # pacakge imports  
 import numpy as np
@@ -53,104 +54,99 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     Properties Used:
     N/A
     """ 
-    # Initialize vectors
-    X_T          = np.zeros((npanel,ncases,ncpts))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(ncpts):
-            
-            def dy_by_dx(index, X, Y):
-                return 0.45*nu*Ve_i[index]**5            
-            
-            l              = L[case,cpt]
-            theta_0        = THETA_0 
-            Re_L           = RE_L[case,cpt]
-            nu             = l/Re_L    
-            x_i            = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i           = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i          = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False]
-            n              = len(x_i)
-            dx_i           = np.diff(x_i)
-            theta2_Ve6     = np.zeros(n)
-            theta2_Ve6[0]  = (theta_0**2)*Ve_i[0]**6
-            
-            # determine (Theta**2)*(Ve**6)
-            for i in range(1,n):
-                theta2_Ve6[i] = RK4(i-1, dx_i, x_i, theta2_Ve6, dy_by_dx)
-            
-            # Compute momentum thickness
-            theta       = np.sqrt(theta2_Ve6/Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-                
-            # Thwaites separation criteria 
-            lambda_val  = theta**2*dVe_i/nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) > tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i*theta/nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i*x_i/nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val, Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    # Gather the points of the surface of all the cases and control points, which are marched at once 
+    order, n       = surface_points(X_I.mask)
+    x_i            = gather_surface_points(X_I,order,n)
+    Ve_i           = gather_surface_points(VE_I,*surface_points(VE_I.mask))
+    dVe_i          = gather_surface_points(DVE_I,*surface_points(DVE_I.mask))
+    on_surface     = np.arange(npanel)[:,None,None] < n
+    nu             = np.ma.getdata(L)/RE_L
+    theta_0        = THETA_0 
+    dx_i           = np.diff(x_i,axis=0)
+    theta2_Ve6     = np.zeros_like(x_i)
+    theta2_Ve6[0]  = (theta_0**2)*Ve_i[0]**6
     
+    # determine (Theta**2)*(Ve**6)
+    for i in range(1,np.max(n,initial=1)):
+        theta2_Ve6[i] = RK4(dx_i[i-1], x_i[i-1], theta2_Ve6[i-1], dy_by_dx, nu, Ve_i[i-1])
+    
+    # Compute momentum thickness
+    theta       = np.sqrt(theta2_Ve6/Ve_i**6)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta       = replace_unconverged(theta,tol,on_surface)
+        
+    # Thwaites separation criteria 
+    lambda_val  = theta**2*dVe_i/nu 
+    
+    # Compute H 
+    H           = getH(lambda_val)
+    H[H<0]      = 1E-6   # H cannot be negative 
+    # find H values that do not converge and replace them with neighbor
+    H           = replace_unconverged(H,tol,on_surface)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta    = Ve_i*theta/nu
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x        = Ve_i*x_i/nu
+    
+    # Compute skin friction 
+    cf          = abs(getcf(lambda_val, Re_theta)) 
+    
+    # Compute displacement thickness
+    del_star    = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta       = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]    = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]     = 1E-5
+    
+    # Store results at the points that are not masked
     RESULTS = Data(
-        X_T          = X_T,      
-        THETA_T      = THETA_T,   
-        DELTA_STAR_T = DELTA_STAR_T,
-        H_T          = H_T,       
-        CF_T         = CF_T,      
-        RE_THETA_T   = RE_THETA_T,   
-        RE_X_T       = RE_X_T,    
-        DELTA_T      = DELTA_T,  
+        X_T          = scatter_surface_points(x_i,order,n),      
+        THETA_T      = scatter_surface_points(theta,order,n),   
+        DELTA_STAR_T = scatter_surface_points(del_star,order,n),
+        H_T          = scatter_surface_points(H,order,n),       
+        CF_T         = scatter_surface_points(cf,order,n),      
+        RE_THETA_T   = scatter_surface_points(Re_theta,order,n),   
+        RE_X_T       = scatter_surface_points(Re_x,order,n),    
+        DELTA_T      = scatter_surface_points(delta,order,n),  
     )    
     
     return RESULTS
-            
 
+def dy_by_dx(X, Y, nu, Ve):
+    """ Slope of (Theta**2)*(Ve**6) along the surface """
+    return 0.45*nu*Ve**5
+
+def replace_unconverged(var,tol,on_surface):
+    """ Replaces the values of a surface that change by more than tol from the previous point by the value of the 
+    previous point, for the cases and control points where more than one value does so
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    var        - values at the surface points                             [multiple units]
+    tol        - boundary layer error correction tolerance                [unitless]
+    on_surface - flag of the rows that are surface points                 [boolean]
+
+    Outputs:  
+    var        - values with the unconverged values replaced              [multiple units]
 
+    Properties Used:
+    N/A
+    """ 
+    unconverged  = (abs((var[1:] - var[:-1])/var[:-1]) > tol) & on_surface[1:]
+    unconverged &= np.sum(unconverged,axis=0) > 1
+    var[1:]      = np.where(unconverged,var[:-1],var[1:])
+    return var
 
 def getH(lambda_val ): 
     """ Computes the shape factor, H
@@ -202,12 +198,11 @@ def getcf(lambda_val , Re_theta):
     return cf
 
 
-def RK4(ind, dx, x, Var1, Slope1):
-    m1 = Slope1(ind,  x[ind],  Var1[ind])
-    m2 = Slope1(ind,  x[ind] + dx[ind]/2,  Var1[ind] + m1*dx[ind]/2)
-    m3 = Slope1(ind,  x[ind] + dx[ind]/2,  Var1[ind] + m2*dx[ind]/2)
-    m4 = Slope1(ind,  x[ind] + dx[ind],  Var1[ind] + m3*dx[ind])
+def RK4(dx, x, Var1, Slope1, *args):
+    m1 = Slope1(x,  Var1, *args)
+    m2 = Slope1(x + dx/2,  Var1 + m1*dx/2, *args)
+    m3 = Slope1(x + dx/2,  Var1 + m2*dx/2, *args)
+    m4 = Slope1(x + dx,  Var1 + m3*dx, *args)
     
-    change = (dx[ind]/6)*(m1 + 2*m2 + 2*m3 + m4)
-    return Var1[ind] + change            
-            
+    change = (dx/6)*(m1 + 2*m2 + 2*m3 + m4)
+    return Var1 + change
\ No newline at end of file
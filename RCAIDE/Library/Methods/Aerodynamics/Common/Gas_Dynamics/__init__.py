@@ -10,4 +10,7 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Gas_Dynamics.Oblique_Shock import oblique_shock_relations, theta_beta_mach
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'oblique_shock_relations':('Legacy.trunk.S.Methods.Aerodynamics.Common.Gas_Dynamics.Oblique_Shock','oblique_shock_relations'),
+                                                           'theta_beta_mach':('Legacy.trunk.S.Methods.Aerodynamics.Common.Gas_Dynamics.Oblique_Shock','theta_beta_mach')})
\ No newline at end of file
@@ -10,9 +10,11 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.windmilling_drag                  import windmilling_drag
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.asymmetry_drag                    import asymmetry_drag
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.estimate_2ndseg_lift_drag_ratio   import estimate_2ndseg_lift_drag_ratio
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.compressible_turbulent_flat_plate import compressible_turbulent_flat_plate
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.compressible_mixed_flat_plate     import compressible_mixed_flat_plate
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.wave_drag_lift                    import wave_drag_lift
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'windmilling_drag':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.windmilling_drag','windmilling_drag'),
+                                                           'asymmetry_drag':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.asymmetry_drag','asymmetry_drag'),
+                                                           'estimate_2ndseg_lift_drag_ratio':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.estimate_2ndseg_lift_drag_ratio','estimate_2ndseg_lift_drag_ratio'),
+                                                           'compressible_turbulent_flat_plate':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.compressible_turbulent_flat_plate','compressible_turbulent_flat_plate'),
+                                                           'compressible_mixed_flat_plate':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.compressible_mixed_flat_plate','compressible_mixed_flat_plate'),
+                                                           'wave_drag_lift':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.wave_drag_lift','wave_drag_lift')})
\ No newline at end of file
@@ -8,7 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------   
  
-from RCAIDE.Framework.Core import interp2d 
+from RCAIDE.Framework.Core import Polar_Table 
 
 # package imports 
 import numpy as np
@@ -74,25 +74,23 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
             # return the 2D Cl and CDval of shape (ctrl_pts, Nr, Na)
             Cl      = np.zeros((ctrl_pts,Nr,Na))
             Cdval   = np.zeros((ctrl_pts,Nr,Na))
-            for jj,airfoil in enumerate(airfoils):
-                pd              = airfoil.polars
-                Cl_af           = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients) 
-                Cdval_af        = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs            = np.where(a_loc == jj )
-                Cl[:,locs,:]    = Cl_af[:,locs,:]
-                Cdval[:,locs,:] = Cdval_af[:,locs,:]
         else:
             # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
             Cl      = np.zeros((ctrl_pts,Nr))
             Cdval   = np.zeros((ctrl_pts,Nr))
 
-            for jj,airfoil in enumerate(airfoils):
-                pd            = airfoil.polars
-                Cl_af         = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                Cdval_af      = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs          = np.where(a_loc == jj )
-                Cl[:,locs]    = Cl_af[:,locs]
-                Cdval[:,locs] = Cdval_af[:,locs]
+        # each airfoil is only looked up at the radial stations that use it
+        Re_stations    = np.broadcast_to(Re,Cl.shape)
+        alpha_stations = np.broadcast_to(alpha,Cl.shape)
+        for jj,airfoil in enumerate(airfoils):
+            locs = a_loc == jj
+            if not np.any(locs):
+                continue
+            table = airfoil_polar_table(airfoil.polars)
+            if np.all(locs):
+                table(Re_stations,alpha_stations,out=(Cl,Cdval))
+            else:
+                Cl[:,locs], Cdval[:,locs] = table(Re_stations[:,locs],alpha_stations[:,locs])
     else:
         # Estimate Cl max
         tc_1 = tc*100
@@ -125,6 +123,45 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
 
     return Cl, Cdval, alpha, Ma, W, Re  
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  airfoil_polar_table
+# ----------------------------------------------------------------------------------------------------------------------   
+## @ingroup Methods-Aerodynamics-Common-Lift
+def airfoil_polar_table(polars):
+    """
+    table = airfoil_polar_table(polars)
+
+    Returns the table of the lift and drag polars of an airfoil, which is built
+    the first time the polars are used and kept for the next evaluations.
+
+    Assumptions:
+    The table is kept on the polars, outside of their keys, with the values
+    of the polar arrays. It is built again when the polars change, in place
+    as well, and is freed with the airfoil.
+
+    Source:
+    N/A
+
+    Inputs:
+    polars.
+       reynolds_numbers         Reynolds numbers of the polars            [-]
+       angle_of_attacks         angles of attack of the polars            [rad]
+       lift_coefficients        lift coefficients                         [-]
+       drag_coefficients        drag coefficients                         [-]
+
+    Outputs:
+       table                    Polar_Table of the lift and drag          [-]
+
+    """
+    arrays = (polars.reynolds_numbers,polars.angle_of_attacks,polars.lift_coefficients,polars.drag_coefficients)
+    key    = tuple([(np.shape(array),np.asarray(array,dtype=float).tobytes()) for array in arrays])
+    entry  = polars.__dict__.get('_polar_table')
+    if entry is None or entry[0] != key:
+        entry = (key,Polar_Table(*arrays))
+        object.__setattr__(polars,'_polar_table',entry)
+
+    return entry[1]
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_inflow_and_tip_loss
 # ----------------------------------------------------------------------------------------------------------------------   
@@ -11,13 +11,17 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
 
 
-from Legacy.trunk.S.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_max_lift_coeff                         import compute_max_lift_coeff
-from Legacy.trunk.S.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_flap_lift                              import compute_flap_lift
-from Legacy.trunk.S.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_slat_lift                              import compute_slat_lift 
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'compute_max_lift_coeff':('Legacy.trunk.S.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_max_lift_coeff','compute_max_lift_coeff'),
+                                                           'compute_flap_lift':('Legacy.trunk.S.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_flap_lift','compute_flap_lift'),
+                                                           'compute_slat_lift':('Legacy.trunk.S.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_slat_lift','compute_slat_lift'),
+                                                           'generate_propeller_grid':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_propeller_grid','generate_propeller_grid'),
+                                                           'generate_wing_wake_grid':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_wing_wake_grid','generate_wing_wake_grid'),
+                                                           'compute_wing_wake':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_wake','compute_wing_wake'),
+                                                           'compute_propeller_nonuniform_freestream':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_propeller_nonuniform_freestream','compute_propeller_nonuniform_freestream')})
+
 from .BET_calculations                                                                                     import compute_airfoil_aerodynamics 
 from .BET_calculations                                                                                     import compute_inflow_and_tip_loss
-from .fuselage_correction                                                                                  import fuselage_correction 
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_propeller_grid                 import generate_propeller_grid
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_wing_wake_grid                 import generate_wing_wake_grid
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_wake                       import compute_wing_wake
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_propeller_nonuniform_freestream import compute_propeller_nonuniform_freestream
\ No newline at end of file
+from .BET_calculations                                                                                     import airfoil_polar_table
+from .fuselage_correction                                                                                  import fuselage_correction 
\ No newline at end of file
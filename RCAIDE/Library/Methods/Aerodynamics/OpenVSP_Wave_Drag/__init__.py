@@ -10,5 +10,7 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Methods.Aerodynamics.OpenVSP_Wave_Drag.wave_drag_volume           import wave_drag_volume
-from Legacy.trunk.S.Methods.Aerodynamics.OpenVSP_Wave_Drag.compressibility_drag_total import compressibility_drag_total
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'wave_drag_volume':('Legacy.trunk.S.Methods.Aerodynamics.OpenVSP_Wave_Drag.wave_drag_volume','wave_drag_volume'),
+                                                           'compressibility_drag_total':('Legacy.trunk.S.Methods.Aerodynamics.OpenVSP_Wave_Drag.compressibility_drag_total','compressibility_drag_total')})
\ No newline at end of file
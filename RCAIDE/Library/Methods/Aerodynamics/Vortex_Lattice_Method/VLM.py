@@ -12,6 +12,7 @@
 
 # package imports 
 import numpy as np 
+import scipy.linalg
 from RCAIDE.Framework.Core import Data
 from .compute_wing_induced_velocity      import compute_wing_induced_velocity
 from .generate_vortex_distribution       import generate_vortex_distribution 
@@ -94,6 +95,7 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [float16/32/64]
+    settings.max_vlm_memory                    [bytes], memory of a block of induced velocities, None for one block
        
     conditions.aerodynamics.angles.alpha    [radians]
     conditions.aerodynamics.angles.beta   [radians]
@@ -245,30 +247,32 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
 
-    # Build induced velocity matrix, C_mn
-    # This is not affected by AoA, so we can use unique mach numbers only
+    # Build Aerodynamic Influence Coefficient Matrix for each unique mach number. This is not affected by AoA, 
+    # so we can use unique mach numbers only. The flow tangency angles are the same for all cases, so the induced 
+    # velocities are projected onto the normals as they are computed, in blocks of settings.max_vlm_memory bytes
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
+    max_memory    = settings.get('max_vlm_memory',None)
+    if not use_VORLAX_induced_velocity:
+        normals   = np.stack([np.sin(delta[0])*np.cos(phi[0]),
+                              np.cos(delta[0])*np.sin(phi[0]),
+                              -(np.cos(phi[0])*np.cos(delta[0]))],axis=-1)  # validated from book eqn 7.42 
+        A_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True,
+                                                                          max_memory=max_memory,normals=normals)
+    else:
+        # the normalwash in the VORLAX frame is the influence coefficient matrix, the body-frame velocities are not kept
+        _, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True,max_memory=max_memory,
+                                                                    normals=np.zeros((VD.n_cp,3)))
+        A_small = EW_small
     
-    C_mn  = C_mn_small[inv,:,:,:]
     RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
-    
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
-    else:
-        A = EW
 
-    # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+    # Compute vortex strength, factoring A once for all the cases of each unique mach number
+    GAMMA  = solve_vortex_strengths(A_small,RHS,inv)
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -405,7 +409,7 @@ def VLM(conditions,settings,geometry):
     # ONLY PERFORMED FOR COSINE CHORDWISE SPACING (LAX = 0).    
     # ** TO DO ** Add cosine spacing (earlier in VLM) to properly capture the magnitude of these earlier.
     # Right now, this computation still happens with linear spacing, though its effects are underestimated.
-    CLE = compute_rotation_effects(VD, settings, EW, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+    CLE = compute_rotation_effects(VD, settings, EW_small, inv, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                                    rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX)    
     
     # Leading edge suction multiplier. See documentation. This is a negative integer if used
@@ -540,7 +544,7 @@ def VLM(conditions,settings,geometry):
 # ----------------------------------------------------------------------
 #  CLE rotation effects helper function
 # ----------------------------------------------------------------------
-def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+def compute_rotation_effects(VD, settings, EW_small, inv, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                              rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX):
     """ This computes the effects of the freestream and aircraft rotation rate on 
     CLE, the induced flow at the leading edge
@@ -560,11 +564,9 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     ##    return 0 #CLE not calculated till later for linear spacing
     
     # Computate rotational effects (pitch, roll, yaw rates) on LE suction
-    # pick leading edge strip values for EW and reshape GAMMA -> gamma accordingly
-    EW    = EW_small[: ,LE_ind, :]
-    n_tot_strips = EW.shape[1]
-    gamma = np.array(np.split(np.repeat(GAMMA, n_tot_strips, axis=0), len_mach))
-    CLE = (EW*gamma).sum(axis=2)
+    # pick leading edge strip values for EW of the mach number of each case, and broadcast GAMMA over the strips
+    EW    = EW_small[: ,LE_ind, :][inv]
+    CLE   = (EW*GAMMA[:,None,:]).sum(axis=2)
     
     # Up till EFFINC, some of the following values were computed in compute_RHS_matrix().
     #     EFFINC and ALOC are calculated the exact same way, except for the XGIRO term.
@@ -607,3 +609,33 @@ def strip_cumsum(arr, chord_breaks, strip_lengths):
     offsets[:,0]  = 0
     offsets = np.repeat(offsets, strip_lengths, axis=1)
     return cumsum - offsets
+
+# ----------------------------------------------------------------------
+#  Vortex strengths of all cases from one factorization per mach number
+# ----------------------------------------------------------------------
+def solve_vortex_strengths(A_small, RHS, inv):
+    """ Solves A GAMMA = RHS for every case, where the cases of the same mach number
+    share one influence matrix. Each matrix is LU factored once and the RHS of all
+    the cases of its mach number are solved together.
+    
+    Assumptions:
+    A is factored in the precision of the product of A and RHS, as np.linalg.solve does
+    
+    Inputs:
+    A_small   - influence matrix of each unique mach number    [n_mach x n_cp x n_cp]
+    RHS       - right hand side of each case                   [n_cases x n_cp]
+    inv       - index of the unique mach number of each case   [n_cases]
+    
+    Outputs:
+    GAMMA     - vortex strength of each case                   [n_cases x n_cp]
+    """    
+    inv   = np.ravel(inv)
+    dtype = np.result_type(A_small, RHS)
+    GAMMA = np.empty(RHS.shape, dtype=dtype)
+    for i_mach in range(A_small.shape[0]):
+        cases = np.flatnonzero(inv == i_mach)
+        if len(cases) == 0:
+            continue
+        LU           = scipy.linalg.lu_factor(A_small[i_mach].astype(dtype), check_finite=False)
+        GAMMA[cases] = scipy.linalg.lu_solve(LU, RHS[cases].T.astype(dtype), check_finite=False).T
+    return GAMMA
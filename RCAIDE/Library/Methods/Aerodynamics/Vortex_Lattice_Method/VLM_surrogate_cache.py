@@ -0,0 +1,228 @@
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_surrogate_cache.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import  Data, content_hash
+
+# package imports
+import os
+import shutil
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Settings
+# ----------------------------------------------------------------------------------------------------------------------
+
+# changed whenever the training tables are computed differently, which invalidates the stored tables
+surrogate_cache_version = 1
+
+# settings that do not change the training tables
+cache_settings   = ['vortex_distribution','use_surrogate_cache','surrogate_cache_directory','surrogate_cache_size',
+                    'training_workers','max_vlm_memory']
+
+# training results, the rest of aerodynamics.training are the training grids
+training_results = ['subsonic','supersonic','transonic']
+
+# flags set by the training
+training_flags   = ['aileron_flag','elevator_flag','rudder_flag','flap_flag','slat_flag']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Surrogate Cache
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def VLM_surrogate_cache_key(aerodynamics):
+    """Computes the key of the training tables of a VLM analysis in the surrogate cache.
+
+    Assumptions:
+        The tables depend on the wings, fuselages, reference area and center of gravity of the vehicle, on the
+        networks when the propeller wake model is used, on the settings of the analysis and on the training grids.
+        The deflections of the control surfaces are not part of the key, since the training sets them to zero.
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        key                : hexadecimal digest    [string]
+    """
+    vehicle  = aerodynamics.vehicle
+    settings = aerodynamics.settings
+    networks = vehicle.networks if settings.propeller_wake_model else None
+    training = aerodynamics.training
+    grids    = [(tag,training[tag]) for tag in training.keys() if tag not in training_results]
+
+    return content_hash(surrogate_cache_version,vehicle.wings,vehicle.fuselages,vehicle.reference_area,
+                        vehicle.mass_properties.center_of_gravity,networks,settings,grids,
+                        exclude = cache_settings + ['deflection'])
+
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def load_VLM_surrogates(aerodynamics):
+    """Loads the training tables of a VLM analysis from the surrogate cache, if the same vehicle, settings and
+    training grids were trained before. The tables are loaded into aerodynamics.training with the reference values
+    and control surface flags of the training, and the deflections of the control surfaces of the vehicle are set to
+    zero as the training does.
+
+    Assumptions:
+        A table that cannot be read is treated as missing
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        found              : tables were loaded    [boolean]
+    """
+    directory = surrogate_cache_directory(aerodynamics.settings)
+    reset_control_surfaces(aerodynamics.vehicle)
+    path      = os.path.join(directory,VLM_surrogate_cache_key(aerodynamics))
+    if not os.path.isdir(path):
+        return False
+    try:
+        entry    = RCAIDE.load(path,mmap_mode=None)
+        training = [(tag,entry.training[tag]) for tag in training_results]
+        flags    = [(tag,entry.flags[tag]) for tag in training_flags]
+        # the last use orders the eviction
+        os.utime(path)
+    except (OSError,ValueError,TypeError,KeyError,AttributeError):
+        return False
+
+    for tag,table in training:
+        aerodynamics.training[tag] = table
+    for tag in entry.reference_values.keys():
+        aerodynamics.reference_values[tag] = entry.reference_values[tag]
+    for tag,flag in flags:
+        aerodynamics[tag] = flag
+
+    return True
+
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def save_VLM_surrogates(aerodynamics):
+    """Stores the training tables of a VLM analysis in the surrogate cache. The least recently used tables are
+    removed when the cache is larger than settings.surrogate_cache_size.
+
+    Assumptions:
+        The tables are written next to their entry and moved into place, so analyses running in parallel read
+        either a complete entry or none. A failed write leaves the cache without the entry.
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        None
+    """
+    settings  = aerodynamics.settings
+    directory = surrogate_cache_directory(settings)
+
+    # the key is computed with the deflections of the training, which are zero
+    key       = VLM_surrogate_cache_key(aerodynamics)
+
+    entry                  = Data()
+    entry.training         = Data()
+    entry.reference_values = Data()
+    entry.flags            = Data()
+    for tag in training_results:
+        entry.training[tag] = aerodynamics.training[tag]
+    for tag in aerodynamics.reference_values.keys():
+        entry.reference_values[tag] = aerodynamics.reference_values[tag]
+    for tag in training_flags:
+        entry.flags[tag] = aerodynamics[tag]
+
+    try:
+        os.makedirs(directory,exist_ok=True)
+        RCAIDE.save(entry,os.path.join(directory,key),binary_format=True)
+    except OSError:
+        return
+
+    evict_VLM_surrogates(directory,settings.surrogate_cache_size,keep=key)
+
+    return
+
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def clear_VLM_surrogate_cache(aerodynamics=None,directory=None):
+    """Removes stored training tables from the surrogate cache, those of one VLM analysis if it is given, otherwise
+    all of them.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis, None for all tables                           [unitless]
+        directory          : cache directory, that of the analysis or the default if None [string]
+
+    Returns:
+        None
+    """
+    if directory is None:
+        directory = surrogate_cache_directory(aerodynamics.settings if aerodynamics is not None else Data())
+    if not os.path.isdir(directory):
+        return
+
+    if aerodynamics is not None:
+        keys = [VLM_surrogate_cache_key(aerodynamics)]
+    else:
+        keys = os.listdir(directory)
+    for key in keys:
+        shutil.rmtree(os.path.join(directory,key),ignore_errors=True)
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def surrogate_cache_directory(settings):
+    """Directory of the surrogate cache, settings.surrogate_cache_directory or RCAIDE/VLM_surrogates in the user
+    cache directory."""
+    directory = settings.get('surrogate_cache_directory',None)
+    if directory is None:
+        root      = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA') or \
+                    os.path.join(os.path.expanduser('~'),'.cache')
+        directory = os.path.join(root,'RCAIDE','VLM_surrogates')
+    return directory
+
+def reset_control_surfaces(vehicle):
+    """Sets the deflections of the control surfaces to zero, as the training does."""
+    for wing in vehicle.wings:
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection = 0.0
+    return
+
+def evict_VLM_surrogates(directory,size,keep=None):
+    """Removes the least recently used tables until the cache is at most size bytes, keeping the tables keep."""
+    entries = []
+    total   = 0
+    for key in os.listdir(directory):
+        path = os.path.join(directory,key)
+        if not os.path.isdir(path) or key.endswith('.tmp') or key.endswith('.old'):
+            continue
+        try:
+            entry_size = sum(os.path.getsize(os.path.join(root,name)) for root,dirs,names in os.walk(path) for name in names)
+            entries.append((os.path.getmtime(path),entry_size,key))
+        except OSError:
+            continue
+        total += entry_size
+
+    for last_use,entry_size,key in sorted(entries):
+        if total <= size:
+            break
+        if key == keep:
+            continue
+        shutil.rmtree(os.path.join(directory,key),ignore_errors=True)
+        total -= entry_size
+
+    return
@@ -10,15 +10,20 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift                           import generate_vortex_distribution, compute_unit_normal 
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_VD_helpers       import postprocess_VD, compute_panel_area, compute_unit_normal
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.make_VLM_wings            import make_VLM_wings  
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.deflect_control_surface   import deflect_control_surface
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'postprocess_VD':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_VD_helpers','postprocess_VD'),
+                                                           'compute_panel_area':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_VD_helpers','compute_panel_area'),
+                                                           'compute_unit_normal':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_VD_helpers','compute_unit_normal'),
+                                                           'make_VLM_wings':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.make_VLM_wings','make_VLM_wings'),
+                                                           'deflect_control_surface':('Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.deflect_control_surface','deflect_control_surface')})
+
 from .compute_RHS_matrix                      import compute_RHS_matrix 
 from .compute_wing_induced_velocity           import compute_wing_induced_velocity 
-from .generate_vortex_distribution            import generate_vortex_distribution
+from .generate_vortex_distribution            import generate_vortex_distribution, clear_vortex_distribution_cache
 from .train_VLM_surrogates                    import train_VLM_surrogates
 from .build_VLM_surrogates                    import build_VLM_surrogates 
+from .VLM_surrogate_cache                     import load_VLM_surrogates, save_VLM_surrogates, clear_VLM_surrogate_cache, VLM_surrogate_cache_key
 from .VLM                                     import VLM
 from .evaluate_VLM import *  
 
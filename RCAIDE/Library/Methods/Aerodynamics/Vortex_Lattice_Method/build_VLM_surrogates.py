@@ -11,6 +11,13 @@ from RCAIDE.Framework.Core import  Data
 # package imports 
 from scipy.interpolate                                           import RegularGridInterpolator
 from scipy import interpolate
+import numpy                                                     as np 
+
+# coefficients stacked by the surrogates of each perturbation variable
+stacked_coefficients = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+
+# regimes stacked by the surrogates, in the order of the blending weights
+stacked_regimes      = ['subsonic','transonic','supersonic']
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -36,8 +43,63 @@ def build_VLM_surrogates(aerodynamics):
     surrogates.subsonic    =  build_surrogate(aerodynamics, training.subsonic) 
     surrogates.supersonic  =  build_surrogate(aerodynamics, training.supersonic)
     surrogates.transonic   =  build_surrogate(aerodynamics, training.transonic)
+    surrogates.stacked     =  build_stacked_surrogates(aerodynamics)
     return
 
+def build_stacked_surrogates(aerodynamics):
+    """Builds one surrogate per perturbation variable that gives all coefficients of the three regimes at once,
+    so that a query finds the cell of its points once for the eight coefficients and the three regimes.
+    
+    Assumptions:
+        The tables of the regimes are sampled on the union of their Mach numbers. The linear surrogates of the
+        regimes are linear in each cell of the union grid, also where they extrapolate, so the stacked surrogate
+        gives their values to round-off.
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless] 
+        
+    Returns: 
+        stacked            : surrogates of the perturbation variables, with values of shape
+                             (points, regimes, coefficients)   [unitless]
+    """
+    surrogates     = aerodynamics.surrogates
+    training       = aerodynamics.training
+    mach_data      = np.unique(np.concatenate([training[regime].Mach for regime in stacked_regimes]))
+    
+    variables      = [('alpha'  , training.angle_of_attack), 
+                      ('beta'   , training.sideslip_angle), 
+                      ('u'      , training.u), 
+                      ('v'      , training.v), 
+                      ('w'      , training.w), 
+                      ('p'      , training.roll_rate), 
+                      ('q'      , training.pitch_rate), 
+                      ('r'      , training.yaw_rate)]
+    if aerodynamics.aileron_flag: 
+        variables.append(('delta_a', training.aileron_deflection))
+    if aerodynamics.elevator_flag: 
+        variables.append(('delta_e', training.elevator_deflection))
+    if aerodynamics.rudder_flag: 
+        variables.append(('delta_r', training.rudder_deflection))
+    if aerodynamics.flap_flag: 
+        variables.append(('delta_f', training.flap_deflection))
+    if aerodynamics.slat_flag: 
+        variables.append(('delta_s', training.slat_deflection))
+        
+    stacked = Data()
+    for variable, x_data in variables:
+        X, M   = np.meshgrid(x_data, mach_data, indexing = 'ij')
+        pts    = np.stack((X.flatten(), M.flatten()), axis = 1)
+        values = np.zeros((len(x_data), len(mach_data), len(stacked_regimes), len(stacked_coefficients)))
+        for j, regime in enumerate(stacked_regimes): 
+            for k, coefficient in enumerate(stacked_coefficients): 
+                values[:,:,j,k] = np.reshape(surrogates[regime][coefficient + '_' + variable](pts), X.shape)
+        stacked[variable] = RegularGridInterpolator((x_data,mach_data),values,method = 'linear',   bounds_error=False, fill_value=None)
+    
+    return stacked
+
 def build_surrogate(aerodynamics, training):
     
     # unpack data
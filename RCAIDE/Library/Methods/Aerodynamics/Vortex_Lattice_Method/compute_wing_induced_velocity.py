@@ -13,7 +13,7 @@
 import numpy as np 
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,max_memory=None,normals=None):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -21,6 +21,12 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     Outside of a call to the VLM() function itself, EW does not need to be computed, as C_mn 
     provides the same information in the body-frame. 
+    
+    The receiving points are processed in blocks small enough for the intermediate arrays of a block to take 
+    about max_memory bytes, and each block is written into the preallocated outputs. All the receiving points
+    are processed at once if max_memory is None. With normals, the induced velocities are projected onto the 
+    normal of each receiving point as they are computed, and the influence coefficient matrix is returned in 
+    place of C_mn.
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,16 +35,19 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     2. VORLAX Source Code
 
     Inputs: 
-    VD       - vehicle vortex distribution                    [Unitless] 
-    mach                                                      [Unitless] 
+    VD         - vehicle vortex distribution                    [Unitless] 
+    mach                                                        [Unitless] 
+    compute_EW - compute the normalwash in the VORLAX frame     [Boolean] 
+    max_memory - memory of the intermediate arrays of a block   [bytes] 
+    normals    - components of the normal of each receiving 
+                 point, n_cp x 3                                [Unitless] 
     
     Outputs:                                
-    C_mn     - total induced velocity matrix                  [Unitless] 
+    C_mn     - total induced velocity matrix, or the influence 
+               coefficient matrix if normals are given          [Unitless] 
     s        - semispan of the horshoe vortex                 [m] 
-    t        - tangent of the horshoe vortex                  [-] 
-    CHORD    - chord length for a panel                       [m] 
     RFLAG    - sonic vortex flag                              [boolean] 
-    ZETA     - tangent incidence angle of the chordwise strip [-] 
+    EW       - normalwash in the VORLAX frame                 [Unitless] 
 
     Properties Used:
     N/A
@@ -57,24 +66,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=np.float32)
     YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=np.float32)
     ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=np.float32)
-    XA1   = np.array(np.atleast_2d(VD.XA1*1.),dtype=np.float32)
-    YA1   = np.array(np.atleast_2d(VD.YA1*1.),dtype=np.float32)
-    ZA1   = np.array(np.atleast_2d(VD.ZA1*1.),dtype=np.float32)
-    XB1   = np.array(np.atleast_2d(VD.XB1*1.),dtype=np.float32)
-    YB1   = np.array(np.atleast_2d(VD.YB1*1.),dtype=np.float32)
-    ZB1   = np.array(np.atleast_2d(VD.ZB1*1.),dtype=np.float32)
-    XA2   = np.array(np.atleast_2d(VD.XA2*1.),dtype=np.float32)
-    YA2   = np.array(np.atleast_2d(VD.YA2*1.),dtype=np.float32)
-    ZA2   = np.array(np.atleast_2d(VD.ZA2*1.),dtype=np.float32)
-    XB2   = np.array(np.atleast_2d(VD.XB2*1.),dtype=np.float32)
-    YB2   = np.array(np.atleast_2d(VD.YB2*1.),dtype=np.float32)
-    ZB2   = np.array(np.atleast_2d(VD.ZB2*1.),dtype=np.float32)
     XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=np.float32)
     YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=np.float32)
     ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=np.float32)
-    XA_TE = np.array(np.atleast_2d(VD.XA_TE*1.),dtype=np.float32)
-    XB_TE = np.array(np.atleast_2d(VD.XB_TE*1.),dtype=np.float32)
-    
     
     # Panel Dihedral Angle, using AH and BH location
     D      = np.sqrt((YAH-YBH)**2+(ZAH-ZBH)**2)
@@ -87,17 +81,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     # ------------------------------------------------------------------------------------------- 
     # If YBH is negative, flip A and B, ie negative side of the airplane. Vortex order flips
     boolean = YAH>YBH
-    XA1[boolean], XB1[boolean] = XB1[boolean], XA1[boolean]
-    YA1[boolean], YB1[boolean] = YB1[boolean], YA1[boolean]
-    ZA1[boolean], ZB1[boolean] = ZB1[boolean], ZA1[boolean]
-    XA2[boolean], XB2[boolean] = XB2[boolean], XA2[boolean]
-    YA2[boolean], YB2[boolean] = YB2[boolean], YA2[boolean]
-    ZA2[boolean], ZB2[boolean] = ZB2[boolean], ZA2[boolean]    
     XAH[boolean], XBH[boolean] = XBH[boolean], XAH[boolean]
     YAH[boolean], YBH[boolean] = YBH[boolean], YAH[boolean] 
     ZAH[boolean], ZBH[boolean] = ZBH[boolean], ZAH[boolean]
-
-    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
     
     # These vortices will use AH and BH, rather than the typical location
     xa = XAH
@@ -112,11 +98,6 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     yc = 0.5*(ya+yb)
     zc = 0.5*(za+zb)
     
-    # This is the receiving point, or the control points
-    xo = XC.T
-    yo = YC.T
-    zo = ZC.T
-    
     # Incline the vortex
     theta    = np.arctan2(zb-za,yb-ya)
     costheta = np.cos(theta)
@@ -125,7 +106,126 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     # rotated axes
     x1bar = (xb - xc)
     y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
+    s     = np.abs(y1bar)
+    t     = x1bar/y1bar  
+    
+    # The notation in this method is flipped from the paper
+    B2 = np.atleast_3d(mach**2-1.)
+    
+    # Allocate the outputs, which the blocks of receiving points fill
+    block_size = induced_velocity_block_size(n_mach,n_cp,max_memory)
+    RFLAG      = np.ones((n_mach,n_cp),dtype=np.int8)
+    if normals is None:
+        C_mn   = np.zeros((n_mach,n_cp,n_cp,3),dtype=np.float32)
+    else:
+        C_mn   = np.zeros((n_mach,n_cp,n_cp),dtype=np.result_type(np.float32,normals))
+    if compute_EW == True:
+        EW     = np.zeros((n_mach,n_cp,n_cp),dtype=np.float32)
+    else:
+        # Assume that this function is being used outside of VLM, EW is not needed
+        EW     = np.nan
+        
+    for start in range(0,n_cp,block_size):
+        rows = slice(start,min(start + block_size,n_cp))
+        
+        # This is the receiving point, or the control points
+        xo = XC.T[rows]
+        yo = YC.T[rows]
+        zo = ZC.T[rows]
+        
+        U, V, W, RFLAG_block = compute_induced_velocity_block(VD,xo,yo,zo,xc,yc,zc,costheta,sintheta,s,t,B2,n_mach,n_cp,
+                                                              TE_ind,LE_ind,start)
+        RFLAG = RFLAG_block 
+        
+        # Rotate into the vehicle frame and pack into a velocity matrix
+        if normals is None:
+            C_mn[:,rows,:,0] = U
+            C_mn[:,rows,:,1] = V*costheta - W*sintheta
+            C_mn[:,rows,:,2] = V*sintheta + W*costheta
+        else:
+            n_hat         = np.atleast_3d(normals[rows])
+            C_mn[:,rows]  = np.multiply(U,n_hat[:,0]) \
+                          + np.multiply(V*costheta - W*sintheta,n_hat[:,1]) \
+                          + np.multiply(V*sintheta + W*costheta,n_hat[:,2])
+        
+        if compute_EW == True:
+            # Calculate the W velocity in the VORLAX frame for later calcs
+            # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
+            COS1   = np.cos(DL.T[rows] - DL)
+            SIN1   = np.sin(DL.T[rows] - DL) 
+            WEIGHT = 1
+            
+            EW[:,rows] = (W*COS1-V*SIN1)*WEIGHT
+            
+    # the semispan is the same for every receiving point
+    s = np.broadcast_to(s,(n_cp,n_cp))
+
+    return C_mn, s, RFLAG, EW
+
+def induced_velocity_block_size(n_mach,n_cp,max_memory):
+    """ This computes the number of receiving points of a block of compute_wing_induced_velocity, so that the
+    intermediate arrays of a block take about max_memory bytes
+
+    Assumptions: 
+    A block holds about 48 single precision arrays with one value per mach number, receiving point and panel
+
+    Source:  
+    None
+
+    Inputs: 
+    n_mach       number of mach numbers                       [-]
+    n_cp         number of control points                     [-]
+    max_memory   memory of the intermediate arrays of a block [bytes] 
+    
+    Outputs:           
+    block_size   number of receiving points of a block        [-]
+
+    Properties Used:
+    N/A
+    """  
+    if max_memory is None:
+        return max(n_cp,1)
+    row_memory = 48*4*n_mach*n_cp
+    block_size = int(max_memory // max(row_memory,1))
+    
+    return min(max(block_size,1),max(n_cp,1))
+
+def compute_induced_velocity_block(VD,xo,yo,zo,xc,yc,zc,costheta,sintheta,s,t,B2,n_mach,n_cp,TE_ind,LE_ind,start):
+    """ This computes the velocities induced by every panel on a block of receiving points 
+
+    Assumptions: 
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
     
+    2. VORLAX Source Code
+
+    Inputs: 
+    VD           vehicle vortex distribution                   [Unitless] 
+    xo,yo,zo     receiving points of the block                 [m]
+    xc,yc,zc     middle front of the vortices                  [m]
+    costheta     cosine of the inclination of the vortices     [-]
+    sintheta     sine of the inclination of the vortices       [-]
+    s            semispan of the horshoe vortex                [m] 
+    t            tangent of the horshoe vortex                 [-] 
+    B2           mach^2-1 (-beta2)                             [-] 
+    n_mach       number of mach numbers                        [-]
+    n_cp         number of control points                      [-]
+    TE_ind       indices of the trailing edge                  [-]
+    LE_ind       indices of the leading edge                   [-]
+    start        index of the first receiving point of the block [-]
+    
+    Outputs:           
+    U       X velocity        [unitless]
+    V       Y velocity        [unitless]
+    W       Z velocity        [unitless]
+    RFLAG   sonic vortex flag [boolean] 
+
+    Properties Used:
+    N/A
+    """  
     xobar = (xo - xc)
     yobar = (yo - yc)*costheta + (zo - zc)*sintheta
     zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
@@ -134,8 +234,6 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     shape   = np.shape(xobar)
     shape_0 = shape[0]
     shape_1 = shape[1]
-    s       = np.abs(y1bar)
-    t       = x1bar/y1bar  
     s       = np.repeat(s,shape_0,axis=0)
     t       = np.repeat(t,shape_0,axis=0)
     
@@ -150,9 +248,6 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
     XTY = xobar - t*yobar
     
-    # The notation in this method is flipped from the paper
-    B2 = np.atleast_3d(mach**2-1.)
-    
     # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
     TOL    = s /500.0
     TOLSQ  = TOL *TOL
@@ -193,27 +288,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     if np.sum(sup)>0:
         U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
+                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind,start)
          
-    
-    # Rotate into the vehicle frame and pack into a velocity matrix
-    C_mn = np.stack([U, V*costheta - W*sintheta, V*sintheta + W*costheta],axis=-1)
-    
-    
-    if compute_EW == True:
-        # Calculate the W velocity in the VORLAX frame for later calcs
-        # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
-        WEIGHT = 1
-        
-        EW = (W*COS1-V*SIN1)*WEIGHT
-    else:
-        # Assume that this function is being used outside of VLM, EW is not needed
-        EW = np.nan
-        
-
-    return C_mn, s, RFLAG, EW
+    return U, V, W, RFLAG
     
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
@@ -285,7 +362,7 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind, start=0):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -321,6 +398,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     n_cp         number of control points                     [-]
     TE_ind       indices of the trailing edge                 [-]
     LE_ind       indices of the leading edge                  [-]
+    start        index of the first receiving point           [-]
     
 
     
@@ -422,8 +500,9 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
+    size   = shape[2]
     n_mach = shape[0]    
+    rows   = slice(start,start + shape[1])
     T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
     T2F = np.zeros((n_mach,size))
     T2A = np.zeros((n_mach,size))
@@ -449,14 +528,14 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     
     FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
     FLAG_bool[TRANS<0] = True
-    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
+    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))[:,rows]
     
 
     # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
     WWAVE   = np.zeros(shape,dtype=np.float32)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
+    eye     = np.eye(n_cp,dtype=np.int8)[rows]
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
@@ -475,27 +554,51 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     W[FLAG_bool_rep]  = 0. # Default to zero
 
     # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
+    # The indices are those of the full matrix of all the receiving points, of which this block holds the rows
+    FLAG_ind          = np.array(np.where(TRANS<0))
+    FLAG_bool_self    = FLAG_ind[0]*size*size + FLAG_ind[1]*(size + 1)
+    set_block_values(W,FLAG_bool_self,2.,start,size) # It's own value, -2
     
     # The panels before and after go to -1
     FLAG_bool_bef = FLAG_bool_self - 1
     FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
-    
-    W = np.reshape(W,shape)
+    set_block_values(W,FLAG_bool_bef,-1.,start,size)
+    set_block_values(W,FLAG_bool_aft,-1.,start,size)
 
     return U, V, W, RFLAG
 
 
+def set_block_values(W,indices,value,start,size):
+    """ This sets the values of a block of rows of the normalwash matrix, given the flat indices of the values 
+    in the matrix of all the receiving points
+
+    Assumptions: 
+    Negative indices count from the end of the matrix
+
+    Source:  
+    None
+
+    Inputs: 
+    W        normalwash of the block of receiving points  [unitless]
+    indices  flat indices in the full matrix              [-]
+    value    value to set                                 [unitless]
+    start    index of the first receiving point           [-]
+    size     number of control points                     [-]
+    
+    Outputs:           
+    None
+
+    Properties Used:
+    N/A
+    """   
+    n_mach        = np.shape(W)[0]
+    indices       = np.mod(indices,n_mach*size*size)
+    M, I, J       = np.unravel_index(indices,(n_mach,size,size))
+    in_block      = (I>=start) & (I<start + np.shape(W)[1])
+    W[M[in_block],I[in_block]-start,J[in_block]] = value
+    
+    return
+
 def supersonic_in_plane(RAD1,RAD2,Y1,Y2,TOL,XTY,CPI):
     """  This computes the induced velocities at each control point 
     in the special case where the vortices lie in the same plane
@@ -88,15 +88,16 @@ def evaluate_surrogate(state,settings,vehicle):
     h_sub            = lambda M:sub_trans_spline.compute(M)          
     sup_trans_spline = Cubic_Spline_Blender(hsup_max, hsup_min) 
     h_sup            = lambda M:sup_trans_spline.compute(M)    
+    
+    # blending weights of the subsonic, transonic and supersonic surrogates
+    weights          = compute_blending_weights(h_sub,h_sup,Mach)
+    stacked          = aerodynamics.surrogates.stacked
  
     # only compute derivative if control surface exists
     if aerodynamics.aileron_flag:  
         pts_delta_a    = np.hstack((delta_a,Mach))
         
-        results_delta_a =  compute_coefficients(sub_sur.Clift_delta_a,sub_sur.Cdrag_delta_a,sub_sur.CX_delta_a,sub_sur.CY_delta_a,sub_sur.CZ_delta_a,sub_sur.CL_delta_a,sub_sur.CM_delta_a, sub_sur.CN_delta_a,
-         trans_sur.Clift_delta_a,trans_sur.Cdrag_delta_a,trans_sur.CX_delta_a,trans_sur.CY_delta_a,trans_sur.CZ_delta_a,trans_sur.CL_delta_a,trans_sur.CM_delta_a, trans_sur.CN_delta_a,
-         sup_sur.Clift_delta_a,sup_sur.Cdrag_delta_a,sup_sur.CX_delta_a,sup_sur.CY_delta_a,sup_sur.CZ_delta_a,sup_sur.CL_delta_a,sup_sur.CM_delta_a, sup_sur.CN_delta_a,
-        h_sub,h_sup,Mach, pts_delta_a)
+        results_delta_a =  compute_stacked_coefficients(stacked.delta_a, weights, pts_delta_a)
          
         Clift_delta_a   = results_delta_a.Clift   
         Cdrag_delta_a   = results_delta_a.Cdrag   
@@ -111,10 +112,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.elevator_flag: 
         pts_delta_e    = np.hstack((delta_e,Mach))
 
-        results_delta_e =  compute_coefficients(sub_sur.Clift_delta_e,sub_sur.Cdrag_delta_e,sub_sur.CX_delta_e,sub_sur.CY_delta_e,sub_sur.CZ_delta_e,sub_sur.CL_delta_e,sub_sur.CM_delta_e, sub_sur.CN_delta_e,
-         trans_sur.Clift_delta_e,trans_sur.Cdrag_delta_e,trans_sur.CX_delta_e,trans_sur.CY_delta_e,trans_sur.CZ_delta_e,trans_sur.CL_delta_e,trans_sur.CM_delta_e, trans_sur.CN_delta_e,
-         sup_sur.Clift_delta_e,sup_sur.Cdrag_delta_e,sup_sur.CX_delta_e,sup_sur.CY_delta_e,sup_sur.CZ_delta_e,sup_sur.CL_delta_e,sup_sur.CM_delta_e, sup_sur.CN_delta_e,
-        h_sub,h_sup,Mach, pts_delta_e)
+        results_delta_e =  compute_stacked_coefficients(stacked.delta_e, weights, pts_delta_e)
          
         Clift_delta_e   = results_delta_e.Clift   
         Cdrag_delta_e   = results_delta_e.Cdrag   
@@ -128,10 +126,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.rudder_flag: 
         pts_delta_r    = np.hstack((delta_r,Mach))
         
-        results_delta_r =  compute_coefficients(sub_sur.Clift_delta_r,sub_sur.Cdrag_delta_r,sub_sur.CX_delta_r,sub_sur.CY_delta_r,sub_sur.CZ_delta_r,sub_sur.CL_delta_r,sub_sur.CM_delta_r, sub_sur.CN_delta_r,
-         trans_sur.Clift_delta_r,trans_sur.Cdrag_delta_r,trans_sur.CX_delta_r,trans_sur.CY_delta_r,trans_sur.CZ_delta_r,trans_sur.CL_delta_r,trans_sur.CM_delta_r, trans_sur.CN_delta_r,
-         sup_sur.Clift_delta_r,sup_sur.Cdrag_delta_r,sup_sur.CX_delta_r,sup_sur.CY_delta_r,sup_sur.CZ_delta_r,sup_sur.CL_delta_r,sup_sur.CM_delta_r, sup_sur.CN_delta_r,
-        h_sub,h_sup,Mach, pts_delta_r)
+        results_delta_r =  compute_stacked_coefficients(stacked.delta_r, weights, pts_delta_r)
          
         Clift_delta_r   = results_delta_r.Clift   
         Cdrag_delta_r   = results_delta_r.Cdrag   
@@ -145,10 +140,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.flap_flag:   
         pts_delta_f    = np.hstack((delta_f,Mach))
         
-        results_delta_f =  compute_coefficients(sub_sur.Clift_delta_f,sub_sur.Cdrag_delta_f,sub_sur.CX_delta_f,sub_sur.CY_delta_f,sub_sur.CZ_delta_f,sub_sur.CL_delta_f,sub_sur.CM_delta_f, sub_sur.CN_delta_f,
-         trans_sur.Clift_delta_f,trans_sur.Cdrag_delta_f,trans_sur.CX_delta_f,trans_sur.CY_delta_f,trans_sur.CZ_delta_f,trans_sur.CL_delta_f,trans_sur.CM_delta_f, trans_sur.CN_delta_f,
-         sup_sur.Clift_delta_f,sup_sur.Cdrag_delta_f,sup_sur.CX_delta_f,sup_sur.CY_delta_f,sup_sur.CZ_delta_f,sup_sur.CL_delta_f,sup_sur.CM_delta_f, sup_sur.CN_delta_f,
-        h_sub,h_sup,Mach, pts_delta_f)
+        results_delta_f =  compute_stacked_coefficients(stacked.delta_f, weights, pts_delta_f)
          
         Clift_delta_f   = results_delta_f.Clift   
         Cdrag_delta_f   = results_delta_f.Cdrag   
@@ -162,10 +154,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.slat_flag: 
         pts_delta_s    = np.hstack((delta_s,Mach)) 
         
-        results_delta_s =  compute_coefficients(sub_sur.Clift_delta_s,sub_sur.Cdrag_delta_s,sub_sur.CX_delta_s,sub_sur.CY_delta_s,sub_sur.CZ_delta_s,sub_sur.CL_delta_s,sub_sur.CM_delta_s, sub_sur.CN_delta_s,
-         trans_sur.Clift_delta_s,trans_sur.Cdrag_delta_s,trans_sur.CX_delta_s,trans_sur.CY_delta_s,trans_sur.CZ_delta_s,trans_sur.CL_delta_s,trans_sur.CM_delta_s, trans_sur.CN_delta_s,
-         sup_sur.Clift_delta_s,sup_sur.Cdrag_delta_s,sup_sur.CX_delta_s,sup_sur.CY_delta_s,sup_sur.CZ_delta_s,sup_sur.CL_delta_s,sup_sur.CM_delta_s, sup_sur.CN_delta_s,
-        h_sub,h_sup,Mach, pts_delta_s)
+        results_delta_s =  compute_stacked_coefficients(stacked.delta_s, weights, pts_delta_s)
          
         Clift_delta_s   = results_delta_s.Clift   
         Cdrag_delta_s   = results_delta_s.Cdrag   
@@ -194,10 +183,7 @@ def evaluate_surrogate(state,settings,vehicle):
     pts_r                = np.hstack((r,Mach))
     
     # Alpha 
-    results_alpha    = compute_coefficients( sub_sur.Clift_alpha,  sub_sur.Cdrag_alpha,  sub_sur.CX_alpha,  sub_sur.CY_alpha,  sub_sur.CZ_alpha,  sub_sur.CL_alpha,  sub_sur.CM_alpha,   sub_sur.CN_alpha,
-                                           trans_sur.Clift_alpha,trans_sur.Cdrag_alpha,trans_sur.CX_alpha,trans_sur.CY_alpha,trans_sur.CZ_alpha,trans_sur.CL_alpha,trans_sur.CM_alpha, trans_sur.CN_alpha,
-                                             sup_sur.Clift_alpha,  sup_sur.Cdrag_alpha,  sup_sur.CX_alpha,  sup_sur.CY_alpha,  sup_sur.CZ_alpha,  sup_sur.CL_alpha,  sup_sur.CM_alpha,   sup_sur.CN_alpha,
-                                              h_sub,h_sup,Mach, pts_alpha)        
+    results_alpha    = compute_stacked_coefficients(stacked.alpha, weights, pts_alpha)        
 
     Clift_alpha    = results_alpha.Clift   
     Cdrag_alpha    = results_alpha.Cdrag   
@@ -209,10 +195,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_alpha       = results_alpha.CN         
      
     # Beta 
-    results_beta =  compute_coefficients(sub_sur.Clift_beta,  sub_sur.Cdrag_beta,  sub_sur.CX_beta,  sub_sur.CY_beta,  sub_sur.CZ_beta,  sub_sur.CL_beta,  sub_sur.CM_beta,   sub_sur.CN_beta,
-                                       trans_sur.Clift_beta,trans_sur.Cdrag_beta,trans_sur.CX_beta,trans_sur.CY_beta,trans_sur.CZ_beta,trans_sur.CL_beta,trans_sur.CM_beta, trans_sur.CN_beta,
-                                         sup_sur.Clift_beta,  sup_sur.Cdrag_beta,  sup_sur.CX_beta,  sup_sur.CY_beta,  sup_sur.CZ_beta,  sup_sur.CL_beta,  sup_sur.CM_beta,   sup_sur.CN_beta,
-                                         h_sub,h_sup,Mach, pts_beta)
+    results_beta =  compute_stacked_coefficients(stacked.beta, weights, pts_beta)
      
     Clift_beta   = results_beta.Clift   
     Cdrag_beta   = results_beta.Cdrag   
@@ -224,10 +207,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_beta      = results_beta.CN 
 
     # u  
-    results_u    =  compute_coefficients(sub_sur.Clift_u,  sub_sur.Cdrag_u,  sub_sur.CX_u,  sub_sur.CY_u,  sub_sur.CZ_u,  sub_sur.CL_u,  sub_sur.CM_u,   sub_sur.CN_u,
-                                       trans_sur.Clift_u,trans_sur.Cdrag_u,trans_sur.CX_u,trans_sur.CY_u,trans_sur.CZ_u,trans_sur.CL_u,trans_sur.CM_u, trans_sur.CN_u,
-                                         sup_sur.Clift_u,  sup_sur.Cdrag_u,  sup_sur.CX_u,  sup_sur.CY_u,  sup_sur.CZ_u,  sup_sur.CL_u,  sup_sur.CM_u,   sup_sur.CN_u,
-                                         h_sub,h_sup,Mach, pts_u)
+    results_u    =  compute_stacked_coefficients(stacked.u, weights, pts_u)
      
     Clift_u   = results_u.Clift   
     Cdrag_u   = results_u.Cdrag   
@@ -239,10 +219,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_u      = results_u.CN          
 
     # v  
-    results_v    =  compute_coefficients(sub_sur.Clift_v,  sub_sur.Cdrag_v,  sub_sur.CX_v,  sub_sur.CY_v,  sub_sur.CZ_v,  sub_sur.CL_v,  sub_sur.CM_v,   sub_sur.CN_v,
-                                       trans_sur.Clift_v,trans_sur.Cdrag_v,trans_sur.CX_v,trans_sur.CY_v,trans_sur.CZ_v,trans_sur.CL_v,trans_sur.CM_v, trans_sur.CN_v,
-                                         sup_sur.Clift_v,  sup_sur.Cdrag_v,  sup_sur.CX_v,  sup_sur.CY_v,  sup_sur.CZ_v,  sup_sur.CL_v,  sup_sur.CM_v,   sup_sur.CN_v,
-                                         h_sub,h_sup,Mach, pts_v)
+    results_v    =  compute_stacked_coefficients(stacked.v, weights, pts_v)
      
     Clift_v   = results_v.Clift   
     Cdrag_v   = results_v.Cdrag   
@@ -254,10 +231,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_v      = results_v.CN       
 
     # w  
-    results_w    =  compute_coefficients(sub_sur.Clift_w,  sub_sur.Cdrag_w,  sub_sur.CX_w,  sub_sur.CY_w,  sub_sur.CZ_w,  sub_sur.CL_w,  sub_sur.CM_w,   sub_sur.CN_w,
-                                       trans_sur.Clift_w,trans_sur.Cdrag_w,trans_sur.CX_w,trans_sur.CY_w,trans_sur.CZ_w,trans_sur.CL_w,trans_sur.CM_w, trans_sur.CN_w,
-                                         sup_sur.Clift_w,  sup_sur.Cdrag_w,  sup_sur.CX_w,  sup_sur.CY_w,  sup_sur.CZ_w,  sup_sur.CL_w,  sup_sur.CM_w,   sup_sur.CN_w,
-                                        h_sub,h_sup,Mach, pts_w)
+    results_w    =  compute_stacked_coefficients(stacked.w, weights, pts_w)
      
     Clift_w   = results_w.Clift   
     Cdrag_w   = results_w.Cdrag   
@@ -270,10 +244,7 @@ def evaluate_surrogate(state,settings,vehicle):
     
 
     # p  
-    results_p    =  compute_coefficients(sub_sur.Clift_p,  sub_sur.Cdrag_p,  sub_sur.CX_p,  sub_sur.CY_p,  sub_sur.CZ_p,  sub_sur.CL_p,  sub_sur.CM_p,   sub_sur.CN_p,
-                                       trans_sur.Clift_p,trans_sur.Cdrag_p,trans_sur.CX_p,trans_sur.CY_p,trans_sur.CZ_p,trans_sur.CL_p,trans_sur.CM_p, trans_sur.CN_p,
-                                         sup_sur.Clift_p,  sup_sur.Cdrag_p,  sup_sur.CX_p,  sup_sur.CY_p,  sup_sur.CZ_p,  sup_sur.CL_p,  sup_sur.CM_p,   sup_sur.CN_p,
-                                        h_sub,h_sup,Mach, pts_p)
+    results_p    =  compute_stacked_coefficients(stacked.p, weights, pts_p)
      
     Clift_p   = results_p.Clift   
     Cdrag_p   = results_p.Cdrag   
@@ -286,10 +257,7 @@ def evaluate_surrogate(state,settings,vehicle):
      
 
     # q  
-    results_q    =  compute_coefficients(sub_sur.Clift_q,  sub_sur.Cdrag_q,  sub_sur.CX_q,  sub_sur.CY_q,  sub_sur.CZ_q,  sub_sur.CL_q,  sub_sur.CM_q,   sub_sur.CN_q,
-                                       trans_sur.Clift_q,trans_sur.Cdrag_q,trans_sur.CX_q,trans_sur.CY_q,trans_sur.CZ_q,trans_sur.CL_q,trans_sur.CM_q, trans_sur.CN_q,
-                                         sup_sur.Clift_q,  sup_sur.Cdrag_q,  sup_sur.CX_q,  sup_sur.CY_q,  sup_sur.CZ_q,  sup_sur.CL_q,  sup_sur.CM_q,   sup_sur.CN_q,
-                                        h_sub,h_sup,Mach, pts_q)
+    results_q    =  compute_stacked_coefficients(stacked.q, weights, pts_q)
      
     Clift_q   = results_q.Clift   
     Cdrag_q   = results_q.Cdrag   
@@ -301,10 +269,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_q      = results_q.CN
     
     # r  
-    results_r    =  compute_coefficients(sub_sur.Clift_r,  sub_sur.Cdrag_r,  sub_sur.CX_r,  sub_sur.CY_r,  sub_sur.CZ_r,  sub_sur.CL_r,  sub_sur.CM_r,   sub_sur.CN_r,
-                                       trans_sur.Clift_r,trans_sur.Cdrag_r,trans_sur.CX_r,trans_sur.CY_r,trans_sur.CZ_r,trans_sur.CL_r,trans_sur.CM_r, trans_sur.CN_r,
-                                         sup_sur.Clift_r,  sup_sur.Cdrag_r,  sup_sur.CX_r,  sup_sur.CY_r,  sup_sur.CZ_r,  sup_sur.CL_r,  sup_sur.CM_r,   sup_sur.CN_r,
-                                        h_sub,h_sup,Mach, pts_r)
+    results_r    =  compute_stacked_coefficients(stacked.r, weights, pts_r)
      
     Clift_r   = results_r.Clift   
     Cdrag_r   = results_r.Cdrag   
@@ -431,59 +396,59 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.slat.static_stability.coefficients.N          = CN_delta_s                     
      
     
-    conditions.static_stability.derivatives.Clift_alpha = compute_stability_derivative(sub_sur.dClift_dalpha ,trans_sur.dClift_dalpha ,sup_sur.dClift_dalpha , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_alpha    = compute_stability_derivative(sub_sur.dCX_dalpha    ,trans_sur.dCX_dalpha    ,sup_sur.dCX_dalpha    , h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_alpha    = compute_stability_derivative(sub_sur.dCY_dalpha    ,trans_sur.dCY_dalpha    ,sup_sur.dCY_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_alpha    = compute_stability_derivative(sub_sur.dCZ_dalpha    ,trans_sur.dCZ_dalpha    ,sup_sur.dCZ_dalpha    , h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_alpha    = compute_stability_derivative(sub_sur.dCL_dalpha    ,trans_sur.dCL_dalpha    ,sup_sur.dCL_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_alpha    = compute_stability_derivative(sub_sur.dCM_dalpha    ,trans_sur.dCM_dalpha    ,sup_sur.dCM_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_alpha    = compute_stability_derivative(sub_sur.dCN_dalpha    ,trans_sur.dCN_dalpha    ,sup_sur.dCN_dalpha    , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_beta  = compute_stability_derivative(sub_sur.dClift_dbeta  ,trans_sur.dClift_dbeta  ,sup_sur.dClift_dbeta  , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_beta     = compute_stability_derivative(sub_sur.dCX_dbeta     ,trans_sur.dCX_dbeta     ,sup_sur.dCX_dbeta     , h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_beta     = compute_stability_derivative(sub_sur.dCY_dbeta     ,trans_sur.dCY_dbeta     ,sup_sur.dCY_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_beta     = compute_stability_derivative(sub_sur.dCZ_dbeta     ,trans_sur.dCZ_dbeta     ,sup_sur.dCZ_dbeta     , h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_beta     = compute_stability_derivative(sub_sur.dCL_dbeta     ,trans_sur.dCL_dbeta     ,sup_sur.dCL_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_beta     = compute_stability_derivative(sub_sur.dCM_dbeta     ,trans_sur.dCM_dbeta     ,sup_sur.dCM_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_beta     = compute_stability_derivative(sub_sur.dCN_dbeta     ,trans_sur.dCN_dbeta     ,sup_sur.dCN_dbeta     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_p     = compute_stability_derivative(sub_sur.dClift_dp     ,trans_sur.dClift_dp     ,sup_sur.dClift_dp     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_q     = compute_stability_derivative(sub_sur.dClift_dq     ,trans_sur.dClift_dq     ,sup_sur.dClift_dq     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_r     = compute_stability_derivative(sub_sur.dClift_dr     ,trans_sur.dClift_dr     ,sup_sur.dClift_dr     , h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_u        = compute_stability_derivative(sub_sur.dCX_du, trans_sur.dCX_du, sup_sur.dCX_du, h_sub,h_sup,Mach)   
-    conditions.static_stability.derivatives.CX_v        = compute_stability_derivative(sub_sur.dCX_dv, trans_sur.dCX_dv, sup_sur.dCX_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_w        = compute_stability_derivative(sub_sur.dCX_dw, trans_sur.dCX_dw, sup_sur.dCX_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_u        = compute_stability_derivative(sub_sur.dCY_du, trans_sur.dCY_du, sup_sur.dCY_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_v        = compute_stability_derivative(sub_sur.dCY_dv, trans_sur.dCY_dv, sup_sur.dCY_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_w        = compute_stability_derivative(sub_sur.dCY_dw, trans_sur.dCY_dw, sup_sur.dCY_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_u        = compute_stability_derivative(sub_sur.dCZ_du, trans_sur.dCZ_du, sup_sur.dCZ_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_v        = compute_stability_derivative(sub_sur.dCZ_dv, trans_sur.dCZ_dv, sup_sur.dCZ_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_w        = compute_stability_derivative(sub_sur.dCZ_dw, trans_sur.dCZ_dw, sup_sur.dCZ_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_u        = compute_stability_derivative(sub_sur.dCL_du, trans_sur.dCL_du, sup_sur.dCL_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_v        = compute_stability_derivative(sub_sur.dCL_dv, trans_sur.dCL_dv, sup_sur.dCL_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_w        = compute_stability_derivative(sub_sur.dCL_dw, trans_sur.dCL_dw, sup_sur.dCL_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_u        = compute_stability_derivative(sub_sur.dCM_du, trans_sur.dCM_du, sup_sur.dCM_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_v        = compute_stability_derivative(sub_sur.dCM_dv, trans_sur.dCM_dv, sup_sur.dCM_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_w        = compute_stability_derivative(sub_sur.dCM_dw, trans_sur.dCM_dw, sup_sur.dCM_dw, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_u        = compute_stability_derivative(sub_sur.dCN_du, trans_sur.dCN_du, sup_sur.dCN_du, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_v        = compute_stability_derivative(sub_sur.dCN_dv, trans_sur.dCN_dv, sup_sur.dCN_dv, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_w        = compute_stability_derivative(sub_sur.dCN_dw, trans_sur.dCN_dw, sup_sur.dCN_dw, h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CX_p        = compute_stability_derivative(sub_sur.dCX_dp, trans_sur.dCX_dp, sup_sur.dCX_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_q        = compute_stability_derivative(sub_sur.dCX_dq, trans_sur.dCX_dq, sup_sur.dCX_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_r        = compute_stability_derivative(sub_sur.dCX_dr, trans_sur.dCX_dr, sup_sur.dCX_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_p        = compute_stability_derivative(sub_sur.dCY_dp, trans_sur.dCY_dp, sup_sur.dCY_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_q        = compute_stability_derivative(sub_sur.dCY_dq, trans_sur.dCY_dq, sup_sur.dCY_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_r        = compute_stability_derivative(sub_sur.dCY_dr, trans_sur.dCY_dr, sup_sur.dCY_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_p        = compute_stability_derivative(sub_sur.dCZ_dp, trans_sur.dCZ_dp, sup_sur.dCZ_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_q        = compute_stability_derivative(sub_sur.dCZ_dq, trans_sur.dCZ_dq, sup_sur.dCZ_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_r        = compute_stability_derivative(sub_sur.dCZ_dr, trans_sur.dCZ_dr, sup_sur.dCZ_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_p        = compute_stability_derivative(sub_sur.dCL_dp, trans_sur.dCL_dp, sup_sur.dCL_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_q        = compute_stability_derivative(sub_sur.dCL_dq, trans_sur.dCL_dq, sup_sur.dCL_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_r        = compute_stability_derivative(sub_sur.dCL_dr, trans_sur.dCL_dr, sup_sur.dCL_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_p        = compute_stability_derivative(sub_sur.dCM_dp, trans_sur.dCM_dp, sup_sur.dCM_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_q        = compute_stability_derivative(sub_sur.dCM_dq, trans_sur.dCM_dq, sup_sur.dCM_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_r        = compute_stability_derivative(sub_sur.dCM_dr, trans_sur.dCM_dr, sup_sur.dCM_dr, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_p        = compute_stability_derivative(sub_sur.dCN_dp, trans_sur.dCN_dp, sup_sur.dCN_dp, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_q        = compute_stability_derivative(sub_sur.dCN_dq, trans_sur.dCN_dq, sup_sur.dCN_dq, h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_r        = compute_stability_derivative(sub_sur.dCN_dr, trans_sur.dCN_dr, sup_sur.dCN_dr, h_sub,h_sup,Mach) 
+    conditions.static_stability.derivatives.Clift_alpha = compute_stability_derivative(sub_sur.dClift_dalpha ,trans_sur.dClift_dalpha ,sup_sur.dClift_dalpha , weights, Mach)
+    conditions.static_stability.derivatives.CX_alpha    = compute_stability_derivative(sub_sur.dCX_dalpha    ,trans_sur.dCX_dalpha    ,sup_sur.dCX_dalpha    , weights, Mach)  
+    conditions.static_stability.derivatives.CY_alpha    = compute_stability_derivative(sub_sur.dCY_dalpha    ,trans_sur.dCY_dalpha    ,sup_sur.dCY_dalpha    , weights, Mach)
+    conditions.static_stability.derivatives.CZ_alpha    = compute_stability_derivative(sub_sur.dCZ_dalpha    ,trans_sur.dCZ_dalpha    ,sup_sur.dCZ_dalpha    , weights, Mach) 
+    conditions.static_stability.derivatives.CL_alpha    = compute_stability_derivative(sub_sur.dCL_dalpha    ,trans_sur.dCL_dalpha    ,sup_sur.dCL_dalpha    , weights, Mach)
+    conditions.static_stability.derivatives.CM_alpha    = compute_stability_derivative(sub_sur.dCM_dalpha    ,trans_sur.dCM_dalpha    ,sup_sur.dCM_dalpha    , weights, Mach)
+    conditions.static_stability.derivatives.CN_alpha    = compute_stability_derivative(sub_sur.dCN_dalpha    ,trans_sur.dCN_dalpha    ,sup_sur.dCN_dalpha    , weights, Mach)
+    conditions.static_stability.derivatives.Clift_beta  = compute_stability_derivative(sub_sur.dClift_dbeta  ,trans_sur.dClift_dbeta  ,sup_sur.dClift_dbeta  , weights, Mach)
+    conditions.static_stability.derivatives.CX_beta     = compute_stability_derivative(sub_sur.dCX_dbeta     ,trans_sur.dCX_dbeta     ,sup_sur.dCX_dbeta     , weights, Mach)  
+    conditions.static_stability.derivatives.CY_beta     = compute_stability_derivative(sub_sur.dCY_dbeta     ,trans_sur.dCY_dbeta     ,sup_sur.dCY_dbeta     , weights, Mach)
+    conditions.static_stability.derivatives.CZ_beta     = compute_stability_derivative(sub_sur.dCZ_dbeta     ,trans_sur.dCZ_dbeta     ,sup_sur.dCZ_dbeta     , weights, Mach) 
+    conditions.static_stability.derivatives.CL_beta     = compute_stability_derivative(sub_sur.dCL_dbeta     ,trans_sur.dCL_dbeta     ,sup_sur.dCL_dbeta     , weights, Mach)
+    conditions.static_stability.derivatives.CM_beta     = compute_stability_derivative(sub_sur.dCM_dbeta     ,trans_sur.dCM_dbeta     ,sup_sur.dCM_dbeta     , weights, Mach)
+    conditions.static_stability.derivatives.CN_beta     = compute_stability_derivative(sub_sur.dCN_dbeta     ,trans_sur.dCN_dbeta     ,sup_sur.dCN_dbeta     , weights, Mach)
+    conditions.static_stability.derivatives.Clift_p     = compute_stability_derivative(sub_sur.dClift_dp     ,trans_sur.dClift_dp     ,sup_sur.dClift_dp     , weights, Mach)
+    conditions.static_stability.derivatives.Clift_q     = compute_stability_derivative(sub_sur.dClift_dq     ,trans_sur.dClift_dq     ,sup_sur.dClift_dq     , weights, Mach)
+    conditions.static_stability.derivatives.Clift_r     = compute_stability_derivative(sub_sur.dClift_dr     ,trans_sur.dClift_dr     ,sup_sur.dClift_dr     , weights, Mach)
+    conditions.static_stability.derivatives.CX_u        = compute_stability_derivative(sub_sur.dCX_du, trans_sur.dCX_du, sup_sur.dCX_du, weights, Mach)   
+    conditions.static_stability.derivatives.CX_v        = compute_stability_derivative(sub_sur.dCX_dv, trans_sur.dCX_dv, sup_sur.dCX_dv, weights, Mach)
+    conditions.static_stability.derivatives.CX_w        = compute_stability_derivative(sub_sur.dCX_dw, trans_sur.dCX_dw, sup_sur.dCX_dw, weights, Mach)
+    conditions.static_stability.derivatives.CY_u        = compute_stability_derivative(sub_sur.dCY_du, trans_sur.dCY_du, sup_sur.dCY_du, weights, Mach)
+    conditions.static_stability.derivatives.CY_v        = compute_stability_derivative(sub_sur.dCY_dv, trans_sur.dCY_dv, sup_sur.dCY_dv, weights, Mach)
+    conditions.static_stability.derivatives.CY_w        = compute_stability_derivative(sub_sur.dCY_dw, trans_sur.dCY_dw, sup_sur.dCY_dw, weights, Mach)
+    conditions.static_stability.derivatives.CZ_u        = compute_stability_derivative(sub_sur.dCZ_du, trans_sur.dCZ_du, sup_sur.dCZ_du, weights, Mach)
+    conditions.static_stability.derivatives.CZ_v        = compute_stability_derivative(sub_sur.dCZ_dv, trans_sur.dCZ_dv, sup_sur.dCZ_dv, weights, Mach)
+    conditions.static_stability.derivatives.CZ_w        = compute_stability_derivative(sub_sur.dCZ_dw, trans_sur.dCZ_dw, sup_sur.dCZ_dw, weights, Mach)
+    conditions.static_stability.derivatives.CL_u        = compute_stability_derivative(sub_sur.dCL_du, trans_sur.dCL_du, sup_sur.dCL_du, weights, Mach)
+    conditions.static_stability.derivatives.CL_v        = compute_stability_derivative(sub_sur.dCL_dv, trans_sur.dCL_dv, sup_sur.dCL_dv, weights, Mach)
+    conditions.static_stability.derivatives.CL_w        = compute_stability_derivative(sub_sur.dCL_dw, trans_sur.dCL_dw, sup_sur.dCL_dw, weights, Mach)
+    conditions.static_stability.derivatives.CM_u        = compute_stability_derivative(sub_sur.dCM_du, trans_sur.dCM_du, sup_sur.dCM_du, weights, Mach)
+    conditions.static_stability.derivatives.CM_v        = compute_stability_derivative(sub_sur.dCM_dv, trans_sur.dCM_dv, sup_sur.dCM_dv, weights, Mach)
+    conditions.static_stability.derivatives.CM_w        = compute_stability_derivative(sub_sur.dCM_dw, trans_sur.dCM_dw, sup_sur.dCM_dw, weights, Mach)
+    conditions.static_stability.derivatives.CN_u        = compute_stability_derivative(sub_sur.dCN_du, trans_sur.dCN_du, sup_sur.dCN_du, weights, Mach)
+    conditions.static_stability.derivatives.CN_v        = compute_stability_derivative(sub_sur.dCN_dv, trans_sur.dCN_dv, sup_sur.dCN_dv, weights, Mach)
+    conditions.static_stability.derivatives.CN_w        = compute_stability_derivative(sub_sur.dCN_dw, trans_sur.dCN_dw, sup_sur.dCN_dw, weights, Mach) 
+    conditions.static_stability.derivatives.CX_p        = compute_stability_derivative(sub_sur.dCX_dp, trans_sur.dCX_dp, sup_sur.dCX_dp, weights, Mach)
+    conditions.static_stability.derivatives.CX_q        = compute_stability_derivative(sub_sur.dCX_dq, trans_sur.dCX_dq, sup_sur.dCX_dq, weights, Mach)
+    conditions.static_stability.derivatives.CX_r        = compute_stability_derivative(sub_sur.dCX_dr, trans_sur.dCX_dr, sup_sur.dCX_dr, weights, Mach)
+    conditions.static_stability.derivatives.CY_p        = compute_stability_derivative(sub_sur.dCY_dp, trans_sur.dCY_dp, sup_sur.dCY_dp, weights, Mach)
+    conditions.static_stability.derivatives.CY_q        = compute_stability_derivative(sub_sur.dCY_dq, trans_sur.dCY_dq, sup_sur.dCY_dq, weights, Mach)
+    conditions.static_stability.derivatives.CY_r        = compute_stability_derivative(sub_sur.dCY_dr, trans_sur.dCY_dr, sup_sur.dCY_dr, weights, Mach)
+    conditions.static_stability.derivatives.CZ_p        = compute_stability_derivative(sub_sur.dCZ_dp, trans_sur.dCZ_dp, sup_sur.dCZ_dp, weights, Mach)
+    conditions.static_stability.derivatives.CZ_q        = compute_stability_derivative(sub_sur.dCZ_dq, trans_sur.dCZ_dq, sup_sur.dCZ_dq, weights, Mach)
+    conditions.static_stability.derivatives.CZ_r        = compute_stability_derivative(sub_sur.dCZ_dr, trans_sur.dCZ_dr, sup_sur.dCZ_dr, weights, Mach)
+    conditions.static_stability.derivatives.CL_p        = compute_stability_derivative(sub_sur.dCL_dp, trans_sur.dCL_dp, sup_sur.dCL_dp, weights, Mach)
+    conditions.static_stability.derivatives.CL_q        = compute_stability_derivative(sub_sur.dCL_dq, trans_sur.dCL_dq, sup_sur.dCL_dq, weights, Mach)
+    conditions.static_stability.derivatives.CL_r        = compute_stability_derivative(sub_sur.dCL_dr, trans_sur.dCL_dr, sup_sur.dCL_dr, weights, Mach)
+    conditions.static_stability.derivatives.CM_p        = compute_stability_derivative(sub_sur.dCM_dp, trans_sur.dCM_dp, sup_sur.dCM_dp, weights, Mach)
+    conditions.static_stability.derivatives.CM_q        = compute_stability_derivative(sub_sur.dCM_dq, trans_sur.dCM_dq, sup_sur.dCM_dq, weights, Mach)
+    conditions.static_stability.derivatives.CM_r        = compute_stability_derivative(sub_sur.dCM_dr, trans_sur.dCM_dr, sup_sur.dCM_dr, weights, Mach)
+    conditions.static_stability.derivatives.CN_p        = compute_stability_derivative(sub_sur.dCN_dp, trans_sur.dCN_dp, sup_sur.dCN_dp, weights, Mach)
+    conditions.static_stability.derivatives.CN_q        = compute_stability_derivative(sub_sur.dCN_dq, trans_sur.dCN_dq, sup_sur.dCN_dq, weights, Mach)
+    conditions.static_stability.derivatives.CN_r        = compute_stability_derivative(sub_sur.dCN_dr, trans_sur.dCN_dr, sup_sur.dCN_dr, weights, Mach) 
 
     for wing in vehicle.wings:   
         inviscid_wing_lifts = compute_coefficient(sub_sur.Clift_wing_alpha[wing.tag],trans_sur.Clift_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag],h_sub,h_sup,Mach,pts_alpha)
@@ -550,8 +515,15 @@ def evaluate_no_surrogate(state,settings,vehicle):
 
     return
 
-def compute_stability_derivative(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach): 
-    derivative = h_sub(Mach)*sub_sur(Mach) +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_sur(Mach)  + h_sup(Mach)*sup_sur(Mach) 
+def compute_blending_weights(h_sub,h_sup,Mach): 
+    """Weights of the subsonic, transonic and supersonic surrogates at each Mach number, shape (points, 3)"""
+    sub_weight = h_sub(Mach)
+    sup_weight = h_sup(Mach)
+    weights    = np.hstack((sub_weight, 1 - (sup_weight + sub_weight), sup_weight))
+    return weights
+
+def compute_stability_derivative(sub_sur,trans_sur,sup_sur,weights,Mach): 
+    derivative = weights[:,0:1]*sub_sur(Mach) +   weights[:,1:2]*trans_sur(Mach)  + weights[:,2:3]*sup_sur(Mach) 
     return derivative
 
 def compute_coefficients(sub_sur_Clift,sub_sur_Cdrag,sub_sur_CX,sub_sur_CY,sub_sur_CZ,sub_sur_CL,sub_sur_CM,sub_sur_CN,
@@ -603,6 +575,23 @@ def compute_coefficients(sub_sur_Clift,sub_sur_Cdrag,sub_sur_CX,sub_sur_CY,sub_s
     return results
 
 
+def compute_stacked_coefficients(stacked_sur, weights, pts): 
+    """Blends the coefficients of the three regimes given by a stacked surrogate, which finds the cell of the
+    points once for all of them."""
+    values        = stacked_sur(pts)
+    coefficients  = weights[:,0,None]*values[:,0] + weights[:,1,None]*values[:,1] + weights[:,2,None]*values[:,2]
+    
+    results       = Data() 
+    results.Clift = coefficients[:,0,None]
+    results.Cdrag = coefficients[:,1,None]
+    results.CX    = coefficients[:,2,None]
+    results.CY    = coefficients[:,3,None]
+    results.CZ    = coefficients[:,4,None]
+    results.CL    = coefficients[:,5,None]
+    results.CM    = coefficients[:,6,None]
+    results.CN    = coefficients[:,7,None]
+    return results
+
 def compute_coefficient(sub_sur_coef,trans_sur_coef, sup_sur_coef, h_sub,h_sup,Mach, pts): 
 
     #  subsonic 
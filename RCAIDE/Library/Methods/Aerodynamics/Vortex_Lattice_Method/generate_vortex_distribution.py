@@ -11,13 +11,27 @@
 
 # package imports 
 import numpy as np
+import os
+from copy import copy
 
-from RCAIDE.Framework.Core                                       import  Data
+from RCAIDE.Framework.Core                                       import  Data, content_hash
 from RCAIDE.Library.Components.Wings                             import All_Moving_Surface
 from RCAIDE.Library.Components.Fuselages                         import Fuselage 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method   import postprocess_VD, make_VLM_wings , deflect_control_surface
-from RCAIDE.Library.Methods.Geometry.Airfoil                     import import_airfoil_geometry
+from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_geometry import import_airfoil_geometry
  
+# ----------------------------------------------------------------------
+#  Vortex Distribution Cache
+# ----------------------------------------------------------------------
+
+# vortex distributions of the latest geometries, keyed by the content hash of the geometry and the settings
+vortex_distribution_cache      = {}
+vortex_distribution_cache_size = 8
+
+# settings read by the discretization
+discretization_settings = ['spanwise_cosine_spacing','model_fuselage','floating_point_precision','discretize_control_surfaces',
+                           'number_of_spanwise_vortices','number_of_chordwise_vortices','wing_spanwise_vortices',
+                           'wing_chordwise_vortices','fuselage_spanwise_vortices','fuselage_chordwise_vortices']
 
 # ----------------------------------------------------------------------
 #  Generate Vortex Distribution
@@ -57,6 +71,10 @@ def generate_vortex_distribution(geometry,settings):
     In addition, all control surfaces should be appended directly
        to the wing, not the wing segments    
     
+    The vortex distribution is cached, keyed by a hash of the contents of the wings, fuselages, airfoil coordinate 
+    files and discretization settings. A call with the same wings, fuselages and settings returns a shallow copy of 
+    the same VD object, so values can be set on it but its arrays must not be changed in place.
+    
     For control surfaces, "positve" deflection corresponds to the RH rule where the axis of rotation is the OUTBOARD-pointing hinge vector
     symmetry: the LH rule is applied to the reflected surface for non-ailerons. Ailerons follow a RH rule for both sides
     
@@ -82,6 +100,18 @@ def generate_vortex_distribution(geometry,settings):
     N/A 
          
     '''
+    # ---------------------------------------------------------------------------------------
+    # Return the vortex distribution of the same geometry and settings if it was generated
+    # ---------------------------------------------------------------------------------------        
+    key = content_hash(geometry.wings,geometry.fuselages,[settings.get(name) for name in discretization_settings],
+                       airfoil_coordinate_files(geometry.wings),exclude=['vortex_distribution'])
+    VD  = vortex_distribution_cache.pop(key,None)
+    if VD is not None:
+        vortex_distribution_cache[key] = VD
+        VD                             = copy(VD)
+        geometry.vortex_distribution   = VD
+        return VD
+    
     # ---------------------------------------------------------------------------------------
     # STEP 0: Unpack settings
     # ---------------------------------------------------------------------------------------        
@@ -247,6 +277,12 @@ def generate_vortex_distribution(geometry,settings):
     
     VD = postprocess_VD(VD, settings)
     
+    # keep the latest vortex distributions, the callers set their own values on a copy, e.g. VD.XBAR in the VLM
+    vortex_distribution_cache[key] = VD
+    while len(vortex_distribution_cache) > vortex_distribution_cache_size:
+        del vortex_distribution_cache[next(iter(vortex_distribution_cache))]
+    VD = copy(VD)
+    
     # pack VD into geometry
     geometry.vortex_distribution = VD
     
@@ -254,6 +290,67 @@ def generate_vortex_distribution(geometry,settings):
     
     return VD 
 
+# ----------------------------------------------------------------------
+#  Clear Vortex Distribution Cache
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def clear_vortex_distribution_cache():
+    """ Removes the cached vortex distributions, so that the next call of generate_vortex_distribution() 
+    discretizes the geometry again
+
+    Assumptions: 
+    None
+
+    Source:   
+    None
+    
+    Inputs:   
+    None
+    
+    Outputs:   
+    None
+    
+    Properties Used:
+    N/A
+    """ 
+    vortex_distribution_cache.clear()
+    
+    return 
+
+# ----------------------------------------------------------------------
+#  Airfoil Coordinate Files
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def airfoil_coordinate_files(item,contents=None):
+    """ Reads the contents of the airfoil coordinate files of the wings, which are part of the key of the cached
+    vortex distributions
+
+    Assumptions: 
+    Files that cannot be read are keyed by their path only
+
+    Source:   
+    None
+    
+    Inputs:   
+    item       - wings, or any Data below them      [Unitless]
+    
+    Outputs:   
+    contents   - contents of each coordinate file   [bytes]
+    
+    Properties Used:
+    N/A
+    """ 
+    if contents is None:
+        contents = []
+    for key,value in item.items():
+        if isinstance(value,dict):
+            airfoil_coordinate_files(value,contents)
+        elif key == 'coordinate_file' and isinstance(value,str) and os.path.isfile(value):
+            with open(value,'rb') as f:
+                contents.append(f.read())
+    
+    return contents
+
 
 # ----------------------------------------------------------------------
 #  Discretize Wings
@@ -8,8 +8,10 @@
 import RCAIDE 
 from RCAIDE.Framework.Core import  Data 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM import  VLM
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_surrogate_cache import  load_VLM_surrogates, save_VLM_surrogates
 # package imports
 import numpy                                                     as np 
+from concurrent.futures import ProcessPoolExecutor
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -18,7 +20,10 @@ def train_VLM_surrogates(aerodynamics):
     """Call methods to run VLM for sample point evaluation. 
     
     Assumptions:
-        None
+        With settings.use_surrogate_cache, the tables of an analysis with the same vehicle, settings and training
+        grids are loaded from the surrogate cache instead of being trained, and new tables are stored in it.
+        With settings.training_workers > 1, the sample points are evaluated by that many processes, which give
+        the same tables as a serial training.
         
     Source:
         None
@@ -29,6 +34,9 @@ def train_VLM_surrogates(aerodynamics):
     Returns: 
         None    
     """
+    use_cache     = aerodynamics.settings.use_surrogate_cache
+    if use_cache and load_VLM_surrogates(aerodynamics):
+        return 
  
     Mach          = aerodynamics.training.Mach 
     training      = aerodynamics.training  
@@ -36,13 +44,23 @@ def train_VLM_surrogates(aerodynamics):
     sub_Mach      = Mach[:sub_len] 
     sup_Mach      = Mach[sub_len:] 
     
-    training.subsonic    =  train_model(aerodynamics, sub_Mach)  
-    training.supersonic  =  train_model(aerodynamics, sup_Mach)
+    # the sample points of both regimes are evaluated together, in parallel with settings.training_workers > 1
+    sub_cases     = training_cases(aerodynamics, sub_Mach)
+    sup_cases     = training_cases(aerodynamics, sup_Mach)
+    results       = evaluate_training_cases(aerodynamics, sub_cases + sup_cases)
+    
+    training.subsonic    =  train_model(aerodynamics, sub_Mach, iter(results[:len(sub_cases)]))  
+    training.supersonic  =  train_model(aerodynamics, sup_Mach, iter(results[len(sub_cases):]))
     training.transonic   =  train_trasonic_model(aerodynamics, training.subsonic,training.supersonic,sub_Mach, sup_Mach) 
+    
+    if use_cache:
+        save_VLM_surrogates(aerodynamics)
     return 
     
-def train_model(aerodynamics, Mach): 
-    """Sub function that call methods to run VLM for sample point evaluation. 
+def training_cases(aerodynamics, Mach): 
+    """Sub function that lists the sample points of the training at the given Mach numbers, the sweeps in 
+    angle of attack, sideslip, velocities and rates, then the deflections of each control surface. The control 
+    surfaces of the vehicle are set to zero deflection. 
     
     Assumptions:
         None
@@ -52,13 +70,224 @@ def train_model(aerodynamics, Mach):
 
     Args:
         aerodynamics       : VLM analysis          [unitless] 
+        Mach               : Mach numbers          [unitless] 
         
     Returns: 
-        None    
+        cases              : sample points, with their conditions and the deflected control surface (wing tag,
+                             control surface tag, deflection) or None   [unitless]    
+    """     
+    
+    AoA            = aerodynamics.training.angle_of_attack                  
+    Beta           = aerodynamics.training.sideslip_angle
+    u              = aerodynamics.training.u
+    v              = aerodynamics.training.v
+    w              = aerodynamics.training.w
+    pitch_rate     = aerodynamics.training.pitch_rate
+    roll_rate      = aerodynamics.training.roll_rate
+    yaw_rate       = aerodynamics.training.yaw_rate  
+    len_Mach       = len(Mach)        
+    cases          = []
+    
+    for wing in aerodynamics.vehicle.wings: 
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection  =  0.0
+    
+    # Alpha
+    AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T 
+    Machs      = np.atleast_2d(np.repeat(Mach,len(AoA))).T        
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Beta 
+    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len(Beta))).T        
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(rows= len(Machs))
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Velocity u 
+    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len(u))).T                   
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.freestream.mach_number               = Machs + Machs*u_s 
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Velocity v 
+    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len(v))).T    
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.arcsin(v_s)       
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Velocity w 
+    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len(w))).T
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.arcsin(w_s)
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Pitch Rate 
+    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len(pitch_rate))).T
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Roll Rate 
+    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len(roll_rate))).T
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.freestream.mach_number               = Machs  
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # Yaw Rate 
+    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len(yaw_rate))).T
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.freestream.mach_number               = Machs 
+    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound  
+    cases.append(Data(conditions = conditions, deflection = None))
+    
+    # control surfaces, in the order of train_model, the flaps use the rudder deflections
+    control_surface_types = [(RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron , 'aileron' , aerodynamics.training.aileron_deflection),
+                             (RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator, 'elevator', aerodynamics.training.elevator_deflection),
+                             (RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder  , 'rudder'  , aerodynamics.training.rudder_deflection),
+                             (RCAIDE.Library.Components.Wings.Control_Surfaces.Flap    , 'flap'    , aerodynamics.training.rudder_deflection),
+                             (RCAIDE.Library.Components.Wings.Control_Surfaces.Slat    , 'slat'    , aerodynamics.training.slat_deflection)]
+    for control_surface_type, name, delta in control_surface_types: 
+        for wing in aerodynamics.vehicle.wings: 
+            for control_surface in wing.control_surfaces:  
+                if type(control_surface) != control_surface_type:
+                    continue
+                for d_i in range(len(delta)):   
+                    Delta_s                                         = np.atleast_2d(np.tile(delta[d_i],len_Mach).T.flatten()).T 
+                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
+                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+                    conditions.freestream.mach_number               = Machs 
+                    conditions.control_surfaces[name].deflection    = np.ones_like(Machs)*Delta_s
+                    cases.append(Data(conditions = conditions, deflection = (wing.tag, control_surface.tag, delta[d_i]))) 
+    
+    return cases
+
+def evaluate_training_cases(aerodynamics, cases): 
+    """Sub function that runs the VLM at the sample points of the training. With settings.training_workers > 1 
+    the cases are shared among that many processes, each of which receives the vehicle once. 
+    
+    Assumptions:
+        A process evaluates a case as the serial training does, so the results are the same
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                       [unitless] 
+        cases              : sample points of training_cases    [unitless] 
+        
+    Returns: 
+        results            : results of evaluate_VLM for each case [unitless]    
+    """     
+    vehicle  = aerodynamics.vehicle
+    settings = aerodynamics.settings
+    workers  = settings.get('training_workers',1)
+    
+    if workers is None or workers <= 1 or len(cases) <= 1:
+        return [evaluate_training_case(case, vehicle, settings) for case in cases]
+    
+    with ProcessPoolExecutor(max_workers = min(workers,len(cases)), initializer = set_training_vehicle,
+                             initargs = (vehicle, settings)) as pool:
+        results = list(pool.map(evaluate_training_case, cases))
+    
+    return results
+
+def evaluate_training_case(case, vehicle = None, settings = None): 
+    """Sub function that runs the VLM at one sample point of the training, with its control surface deflected. 
+    Without a vehicle, the vehicle and settings given to the process by set_training_vehicle are used.
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        case               : sample point of training_cases    [unitless] 
+        vehicle            : vehicle configuration             [unitless] 
+        settings           : VLM analysis settings             [unitless] 
+        
+    Returns: 
+        results            : results of evaluate_VLM           [unitless]    
+    """     
+    if vehicle is None:
+        vehicle  = training_vehicle.vehicle
+        settings = training_vehicle.settings
+        
+    if case.deflection is None:
+        return evaluate_VLM(case.conditions,settings,vehicle)
+    
+    wing_tag, control_surface_tag, deflection = case.deflection
+    control_surface              = vehicle.wings[wing_tag].control_surfaces[control_surface_tag]
+    config_delta                 = 1 * control_surface.deflection
+    control_surface.deflection   = deflection
+    try:
+        results = evaluate_VLM(case.conditions,settings,vehicle)
+    finally:
+        # reset deflection 
+        control_surface.deflection = config_delta
+    
+    return results
+
+# vehicle and settings of a training process
+training_vehicle = Data(vehicle = None, settings = None)
+
+def set_training_vehicle(vehicle, settings):
+    """Stores the vehicle and settings in a training process, once per process."""
+    training_vehicle.vehicle  = vehicle
+    training_vehicle.settings = settings
+    return
+    
+def train_model(aerodynamics, Mach, results): 
+    """Sub function that builds the training tables from the VLM results of the sample points. 
+    
+    Assumptions:
+        The results are in the order of the cases of training_cases
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                          [unitless] 
+        Mach               : Mach numbers of the tables            [unitless] 
+        results            : iterator over the results of the cases [unitless] 
+        
+    Returns: 
+        training           : training tables                       [unitless]    
     """    
 
     vehicle        = aerodynamics.vehicle
-    settings       = aerodynamics.settings
     AoA            = aerodynamics.training.angle_of_attack                  
     Beta           = aerodynamics.training.sideslip_angle
     training       = Data()
@@ -67,7 +296,6 @@ def train_model(aerodynamics, Mach):
     # loop through wings to determine what control surfaces are present 
     for wing in aerodynamics.vehicle.wings: 
         for control_surface in wing.control_surfaces:
-            control_surface.deflection  =  0.0
             if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
                 delta_a                    = aerodynamics.training.aileron_deflection
                 len_d_a                    = len(delta_a)
@@ -108,18 +336,8 @@ def train_model(aerodynamics, Mach):
     # --------------------------------------------------------------------------------------------------------------
     # Alpha
     # --------------------------------------------------------------------------------------------------------------
-    
-    # Setup new array shapes for vectorization 
-    # stakcing 9x9 matrices into one horizontal line(81)  
-    AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T 
-    Machs      = np.atleast_2d(np.repeat(Mach,len_AoA)).T        
-    
-    # reset conditions  
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_= evaluate_VLM(conditions,settings,vehicle)
+
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_ = next(results)
     
     Clift_alpha   = np.reshape(Clift_res,(len_Mach,len_AoA)).T 
     Cdrag_alpha   = np.reshape(Cdrag_res,(len_Mach,len_AoA)).T 
@@ -158,16 +376,8 @@ def train_model(aerodynamics, Mach):
     # --------------------------------------------------------------------------------------------------------------
     # Beta 
     # --------------------------------------------------------------------------------------------------------------
-    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T        
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.expand_rows(rows= len(Machs))
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
     
     Clift_beta = np.reshape(Clift_res,(len_Mach,len_Beta)).T - Clift_alpha_0
     Cdrag_beta = np.reshape(Cdrag_res,(len_Mach,len_Beta)).T - Cdrag_alpha_0                                
@@ -181,14 +391,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------      
     # Velocity u 
     # -------------------------------------------------------
-    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T                   
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs + Machs*u_s 
     
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
     
     Clift_u     = np.reshape(Clift_res,(len_Mach,len_u)).T - Clift_alpha_0
     Cdrag_u     = np.reshape(Cdrag_res,(len_Mach,len_u)).T - Cdrag_alpha_0
@@ -202,16 +406,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity v 
     # -------------------------------------------------------
-    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_v)).T    
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.aerodynamics.angles.beta             = np.arcsin(v_s)       
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
     
     Clift_v     = np.reshape(Clift_res,(len_Mach,len_v)).T - Clift_alpha_0
     Cdrag_v     = np.reshape(Cdrag_res,(len_Mach,len_v)).T - Cdrag_alpha_0
@@ -225,15 +421,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity w 
     # -------------------------------------------------------
-    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
-     
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.arcsin(w_s)
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)
+
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
     
     Clift_w     = np.reshape(Clift_res,(len_Mach,len_w)).T - Clift_alpha_0
     Cdrag_w     = np.reshape(Cdrag_res,(len_Mach,len_w)).T - Cdrag_alpha_0
@@ -247,17 +436,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Pitch Rate 
     # -------------------------------------------------------
-    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
     
     Clift_q     = np.reshape(Clift_res,(len_Mach,len_q)).T - Clift_alpha_0
     Cdrag_q     = np.reshape(Cdrag_res,(len_Mach,len_q)).T - Cdrag_alpha_0
@@ -271,17 +451,9 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Roll  Rate 
     # -------------------------------------------------------    
-    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs  
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
         
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)  
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
         
     Clift_p     = np.reshape(Clift_res,(len_Mach,len_p)).T - Clift_alpha_0
     Cdrag_p     = np.reshape(Cdrag_res,(len_Mach,len_p)).T - Cdrag_alpha_0
@@ -295,17 +467,9 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Yaw Rate 
     # -------------------------------------------------------        
-    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs 
-    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound  
     
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
     
     Clift_r     = np.reshape(Clift_res,(len_Mach,len_r)).T - Clift_alpha_0
     Cdrag_r     = np.reshape(Cdrag_res,(len_Mach,len_r)).T - Cdrag_alpha_0
@@ -488,18 +652,9 @@ def train_model(aerodynamics, Mach):
                     CL_d_a         = np.zeros((len_d_a,len_Mach)) 
                     CM_d_a         = np.zeros((len_d_a,len_Mach)) 
                     CN_d_a         = np.zeros((len_d_a,len_Mach))
-                    config_delta_a = 1 * control_surface.deflection
                     for a_i in range(len_d_a):   
-                        Delta_a_s                                       = np.atleast_2d(np.tile(delta_a[a_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.aileron.deflection  = np.ones_like(Machs)*Delta_a_s
-                        control_surface.deflection                      = delta_a[a_i]
                         
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)   
+                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
                         Clift_d_a[a_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                         Cdrag_d_a[a_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                         CX_d_a[a_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -508,11 +663,7 @@ def train_model(aerodynamics, Mach):
                         CL_d_a[a_i,:]    = CL_res[:,0]   - CL_alpha_0[0,:]  
                         CM_d_a[a_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
                         CN_d_a[a_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:]
-                        
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_a 
 
-     
         training.Clift_delta_a  = Clift_d_a
         training.Cdrag_delta_a  = Cdrag_d_a 
         training.CX_delta_a     = CX_d_a 
@@ -548,18 +699,9 @@ def train_model(aerodynamics, Mach):
                     CM_d_e         = np.zeros((len_d_e,len_Mach)) 
                     CN_d_e         = np.zeros((len_d_e,len_Mach))
 
-                    config_delta_e = 1 * control_surface.deflection                
                     for e_i in range(len_d_e):   
-                        Delta_e_s                                       = np.atleast_2d(np.tile(delta_e[e_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.elevator.deflection = np.ones_like(Machs)*Delta_e_s
-                        control_surface.deflection                      = delta_e[e_i]
                         
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)   
+                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
                         Clift_d_e[e_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                         Cdrag_d_e[e_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                         CX_d_e[e_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -569,8 +711,6 @@ def train_model(aerodynamics, Mach):
                         CM_d_e[e_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
                         CN_d_e[e_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:]                   
     
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_e 
                     
         training.Clift_delta_e  = Clift_d_e
         training.Cdrag_delta_e  = Cdrag_d_e  
@@ -606,18 +746,9 @@ def train_model(aerodynamics, Mach):
                     CM_d_r         = np.zeros((len_d_r,len_Mach)) 
                     CN_d_r         = np.zeros((len_d_r,len_Mach))
 
-                    config_delta_r = 1 * control_surface.deflection                  
                     for r_i in range(len_d_r):   
-                        Delta_r_s                                       = np.atleast_2d(np.tile(delta_r[r_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.rudder.deflection  = np.ones_like(Machs)*Delta_r_s
-                        control_surface.deflection                      = delta_r[r_i]
                         
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)   
+                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
                         Clift_d_r[r_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                         Cdrag_d_r[r_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                         CX_d_r[r_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -627,8 +758,6 @@ def train_model(aerodynamics, Mach):
                         CM_d_r[r_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
                         CN_d_r[r_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:] 
     
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_r
                     
         training.Clift_delta_r  = Clift_d_r
         training.Cdrag_delta_r  = Cdrag_d_r     
@@ -663,18 +792,9 @@ def train_model(aerodynamics, Mach):
                     CM_d_f         = np.zeros((len_d_f,len_Mach)) 
                     CN_d_f         = np.zeros((len_d_f,len_Mach))
 
-                    config_delta_f = 1 * control_surface.deflection                      
                     for f_i in range(len_d_f):   
-                        Delta_f_s                                       = np.atleast_2d(np.tile(delta_f[f_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.flap.deflection     = np.ones_like(Machs)*Delta_f_s
-                        control_surface.deflection                      = delta_f[f_i]
                         
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)   
+                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
                         Clift_d_f[f_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                         Cdrag_d_f[f_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                         CX_d_f[f_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -684,8 +804,6 @@ def train_model(aerodynamics, Mach):
                         CM_d_f[f_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
                         CN_d_f[f_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:]         
     
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_f
         
         training.Clift_delta_f  = Clift_d_f    
         training.Cdrag_delta_f  = Cdrag_d_f    
@@ -721,18 +839,9 @@ def train_model(aerodynamics, Mach):
                     CM_d_s         = np.zeros((len_d_s,len_Mach)) 
                     CN_d_s         = np.zeros((len_d_s,len_Mach))
 
-                    config_delta_s = 1 * control_surface.deflection                  
                     for s_i in range(len_d_s):   
-                        Delta_s_s                                       = np.atleast_2d(np.tile(delta_f[f_i],len_Mach).T.flatten()).T 
-                        Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                        conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                        conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                        conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                        conditions.freestream.mach_number               = Machs 
-                        conditions.control_surfaces.slat.deflection     = np.ones_like(Machs)*Delta_s_s
-                        control_surface.deflection                      = delta_s[s_i]
                         
-                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_= evaluate_VLM(conditions,settings,vehicle)   
+                        Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_ = next(results)
                         Clift_d_s[s_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                         Cdrag_d_s[s_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                         CX_d_s[s_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -742,8 +851,6 @@ def train_model(aerodynamics, Mach):
                         CM_d_s[s_i,:]    = CM_res[:,0]   - CM_alpha_0[0,:]  
                         CN_d_s[s_i,:]    = CN_res[:,0]   - CN_alpha_0[0,:] 
     
-                    # reset deflection 
-                    control_surface.deflection =  config_delta_s                        
 
         training.Clift_delta_s  = Clift_d_s
         training.Cdrag_delta_s  = Cdrag_d_s
@@ -764,8 +871,6 @@ def train_model(aerodynamics, Mach):
     training.NP            = 0  
     
     return training
-        
-        
 
 def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub_Mach, sup_Mach): 
     """Sub function that call methods to run VLM for sample point evaluation. 
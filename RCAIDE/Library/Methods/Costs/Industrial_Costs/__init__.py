@@ -9,7 +9,9 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.estimate_hourly_rates          import estimate_hourly_rates
-from Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.estimate_escalation_factor     import estimate_escalation_factor
-from Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.distribute_non_recurring_cost  import distribute_non_recurring_cost
-from Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.compute_industrial_costs       import compute_industrial_costs
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'estimate_hourly_rates':('Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.estimate_hourly_rates','estimate_hourly_rates'),
+                                                           'estimate_escalation_factor':('Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.estimate_escalation_factor','estimate_escalation_factor'),
+                                                           'distribute_non_recurring_cost':('Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.distribute_non_recurring_cost','distribute_non_recurring_cost'),
+                                                           'compute_industrial_costs':('Legacy.trunk.S.Methods.Costs.Correlations.Industrial_Costs.compute_industrial_costs','compute_industrial_costs')})
\ No newline at end of file
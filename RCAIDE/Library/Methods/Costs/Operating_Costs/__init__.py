@@ -9,4 +9,6 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Methods.Costs.Correlations.Operating_Costs.compute_operating_costs import compute_operating_costs
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'compute_operating_costs':('Legacy.trunk.S.Methods.Costs.Correlations.Operating_Costs.compute_operating_costs','compute_operating_costs')})
\ No newline at end of file
@@ -10,6 +10,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports 
 import RCAIDE 
+from RCAIDE.Framework.Core               import   unshare_array
 from RCAIDE.Framework.Mission.Common     import   Conditions
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -172,18 +173,18 @@ def append_battery_segment_conditions(battery, bus, conditions, segment):
         else:                   
             battery_conditions.battery_discharge_flag           = True      
 
-        battery_conditions.maximum_initial_energy          = battery_initials.maximum_initial_energy 
-        battery_conditions.energy[:,0]                     = battery_initials.energy[-1,0]
-        battery_conditions.temperature[:,0]                = battery_initials.temperature[-1,0]
-        battery_conditions.cell.temperature[:,0]           = battery_initials.cell.temperature[-1,0]
-        battery_conditions.cell.cycle_in_day               = battery_initials.cell.cycle_in_day      
-        battery_conditions.cell.charge_throughput[:,0]     = battery_initials.cell.charge_throughput[-1,0]
-        battery_conditions.cell.resistance_growth_factor   = battery_initials.cell.resistance_growth_factor 
-        battery_conditions.cell.capacity_fade_factor       = battery_initials.cell.capacity_fade_factor 
-        battery_conditions.cell.state_of_charge[:,0]       = battery_initials.cell.state_of_charge[-1,0]
+        battery_conditions.maximum_initial_energy                       = battery_initials.maximum_initial_energy 
+        unshare_array(battery_conditions,'energy')[:,0]                 = battery_initials.energy[-1,0]
+        unshare_array(battery_conditions,'temperature')[:,0]            = battery_initials.temperature[-1,0]
+        unshare_array(battery_conditions.cell,'temperature')[:,0]       = battery_initials.cell.temperature[-1,0]
+        battery_conditions.cell.cycle_in_day                            = battery_initials.cell.cycle_in_day      
+        unshare_array(battery_conditions.cell,'charge_throughput')[:,0] = battery_initials.cell.charge_throughput[-1,0]
+        battery_conditions.cell.resistance_growth_factor                = battery_initials.cell.resistance_growth_factor 
+        battery_conditions.cell.capacity_fade_factor                    = battery_initials.cell.capacity_fade_factor 
+        unshare_array(battery_conditions.cell,'state_of_charge')[:,0]   = battery_initials.cell.state_of_charge[-1,0]
 
     if 'battery_cell_temperature' in segment:       
-        battery_conditions.temperature[:,0]          = segment.battery_cell_temperature 
-        battery_conditions.cell.temperature[:,0]     = segment.battery_cell_temperature     
+        unshare_array(battery_conditions,'temperature')[:,0]      = segment.battery_cell_temperature 
+        unshare_array(battery_conditions.cell,'temperature')[:,0] = segment.battery_cell_temperature     
 
     return    
\ No newline at end of file
@@ -8,9 +8,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
-from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Core import Units, shared_view
 import numpy as np  
-from copy import deepcopy
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_nmc_cell_performance
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -234,7 +233,7 @@ def reuse_stored_lfp_cell_data(battery,state,bus,coolant_lines, t_idx, delta_t,s
     N.A.        
     '''
    
-    state.conditions.energy[bus.tag].battery_modules[battery.tag] = deepcopy(state.conditions.energy[bus.tag].battery_modules[stored_battery_tag])
+    state.conditions.energy[bus.tag].battery_modules[battery.tag] = shared_view(state.conditions.energy[bus.tag].battery_modules[stored_battery_tag])
     
         
     return
\ No newline at end of file
@@ -10,9 +10,11 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # @ingroup Methods-Energy-Sources-Fuel_Cell
 
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.zero_fidelity            import zero_fidelity
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.larminie                 import larminie
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.setup_larminie           import setup_larminie
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.find_voltage_larminie    import find_voltage_larminie
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.find_power_larminie      import find_power_larminie
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.find_power_diff_larminie import find_power_diff_larminie
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'zero_fidelity':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.zero_fidelity','zero_fidelity'),
+                                                           'larminie':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.larminie','larminie'),
+                                                           'setup_larminie':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.setup_larminie','setup_larminie'),
+                                                           'find_voltage_larminie':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.find_voltage_larminie','find_voltage_larminie'),
+                                                           'find_power_larminie':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.find_power_larminie','find_power_larminie'),
+                                                           'find_power_diff_larminie':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Discharge.find_power_diff_larminie','find_power_diff_larminie')})
\ No newline at end of file
@@ -10,5 +10,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # @ingroup Methods-Energy-Sources-Fuel_Cell
 
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Sizing.initialize_from_power          import initialize_from_power
-from Legacy.trunk.S.Methods.Power.Fuel_Cell.Sizing.initialize_larminie_from_power import initialize_larminie_from_power 
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'initialize_from_power':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Sizing.initialize_from_power','initialize_from_power'),
+                                                           'initialize_larminie_from_power':('Legacy.trunk.S.Methods.Power.Fuel_Cell.Sizing.initialize_larminie_from_power','initialize_larminie_from_power')})
\ No newline at end of file
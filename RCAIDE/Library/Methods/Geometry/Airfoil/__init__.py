@@ -12,6 +12,7 @@
 
 from .compute_naca_4series        import compute_naca_4series 
 from .compute_airfoil_properties  import compute_airfoil_properties
+from .airfoil_polar_database      import airfoil_polar_key, load_airfoil_polars, save_airfoil_polars, clear_airfoil_polar_database
 from .import_airfoil_dat          import import_airfoil_dat
 from .import_airfoil_geometry     import import_airfoil_geometry 
 from .import_airfoil_polars       import import_airfoil_polars
@@ -0,0 +1,154 @@
+## @ingroup Library-Methods-Geometry-Airfoil
+# RCAIDE/Library/Methods/Geometry/Airfoil/airfoil_polar_database.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data, content_hash
+
+# package imports
+import os
+import shutil
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Settings
+# ----------------------------------------------------------------------------------------------------------------------
+
+# changed whenever the airfoil properties are computed differently, which invalidates the stored properties
+airfoil_polar_database_version = 1
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Airfoil Polar Database
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Geometry-Airfoil
+def airfoil_polar_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data,grids):
+    """Computes the key of the properties of an airfoil in the airfoil polar database.
+
+    Assumptions:
+        The properties depend on the airfoil geometry, on the contents of the polar files, on the use of the pre stall
+        data and on the grids of the analysis. The paths of the polar files are not part of the key, so copies of the
+        same files give the same key.
+
+    Source:
+        None
+
+    Args:
+        airfoil_geometry    : airfoil geometry points, None for the default airfoil  [unitless]
+        airfoil_polar_files : paths of the polar files, None if there are none        [string]
+        use_pre_stall_data  : pre stall data flag                                     [boolean]
+        grids               : angles of attack and reynolds numbers of the analysis   [unitless]
+
+    Returns:
+        key                 : hexadecimal digest                                      [string]
+    """
+    polars = None
+    if airfoil_polar_files is not None:
+        polars = []
+        for polar_file in airfoil_polar_files:
+            with open(polar_file,'rb') as f:
+                polars.append(f.read())
+
+    return content_hash(airfoil_polar_database_version,airfoil_geometry,polars,use_pre_stall_data,grids)
+
+## @ingroup Library-Methods-Geometry-Airfoil
+def load_airfoil_polars(key,directory=None):
+    """Loads the properties of an airfoil from the airfoil polar database. The arrays are memory mapped, so they are
+    read from disk as they are used and the pages are shared by the processes that load the same airfoil.
+
+    Assumptions:
+        Properties that cannot be read are treated as missing
+
+    Source:
+        None
+
+    Args:
+        key          : key of the airfoil from airfoil_polar_key            [string]
+        directory    : database directory, the user cache directory if None [string]
+
+    Returns:
+        Airfoil_Data : airfoil properties, None if they are not stored      [unitless]
+    """
+    path = os.path.join(airfoil_polar_database_directory(directory),key)
+    if not os.path.isdir(path):
+        return None
+    try:
+        Airfoil_Data = to_data(RCAIDE.load(path))
+    except (OSError,ValueError,TypeError,KeyError):
+        return None
+
+    return Airfoil_Data
+
+## @ingroup Library-Methods-Geometry-Airfoil
+def save_airfoil_polars(Airfoil_Data,key,directory=None):
+    """Stores the properties of an airfoil in the airfoil polar database.
+
+    Assumptions:
+        The properties are written next to their entry and moved into place, so processes sharing the database read
+        either a complete entry or none. A failed write leaves the database without the entry.
+
+    Source:
+        None
+
+    Args:
+        Airfoil_Data : airfoil properties                                   [unitless]
+        key          : key of the airfoil from airfoil_polar_key            [string]
+        directory    : database directory, the user cache directory if None [string]
+
+    Returns:
+        None
+    """
+    directory = airfoil_polar_database_directory(directory)
+    try:
+        os.makedirs(directory,exist_ok=True)
+        RCAIDE.save(Airfoil_Data,os.path.join(directory,key),binary_format=True)
+    except OSError:
+        pass
+
+    return
+
+## @ingroup Library-Methods-Geometry-Airfoil
+def clear_airfoil_polar_database(directory=None):
+    """Removes all the airfoil properties stored in the airfoil polar database.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        directory    : database directory, the user cache directory if None [string]
+
+    Returns:
+        None
+    """
+    directory = airfoil_polar_database_directory(directory)
+    if not os.path.isdir(directory):
+        return
+    for key in os.listdir(directory):
+        shutil.rmtree(os.path.join(directory,key),ignore_errors=True)
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def airfoil_polar_database_directory(directory=None):
+    """Directory of the airfoil polar database, directory or RCAIDE/airfoil_polars in the user cache directory."""
+    if directory is None:
+        root      = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA') or \
+                    os.path.join(os.path.expanduser('~'),'.cache')
+        directory = os.path.join(root,'RCAIDE','airfoil_polars')
+    return directory
+
+def to_data(data):
+    """Converts the nested data structures of a loaded airfoil to Data, as they are computed."""
+    converted = Data()
+    for key in data.keys():
+        converted[key] = to_data(data[key]) if isinstance(data[key],dict) else data[key]
+    return converted
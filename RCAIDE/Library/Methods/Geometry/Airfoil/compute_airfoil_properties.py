@@ -16,20 +16,35 @@ from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_polars
 from RCAIDE.Library.Methods.Geometry.Airfoil.compute_naca_4series                   import compute_naca_4series  
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.pre_stall_coefficients             import pre_stall_coefficients
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.post_stall_coefficients            import post_stall_coefficients
+from RCAIDE.Library.Methods.Geometry.Airfoil.airfoil_polar_database                 import airfoil_polar_key, load_airfoil_polars, save_airfoil_polars
 
 # numpy imports 
 import numpy as np
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  Analysis Grids
+# ----------------------------------------------------------------------------------------------------------------------   
+# angles of attack and reynolds numbers of the boundary layer analysis 
+boundary_layer_aoa_sweep = np.array([-4,0,2,4,8,10,14])*Units.degrees 
+boundary_layer_re_sweep  = np.array([1,5,10,30,50,75,100])*1E4  
+
+# angles of attack of the extended polars 
+extended_aoa_sweep_deg   = np.linspace(-14,90,105)
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_airfoil_properties
 # ----------------------------------------------------------------------------------------------------------------------   
 ## @ingroup Library-Methods-Geometry-Two_Dimensional-Airfoil
-def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True):
+def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True,use_database=False,database_directory=None):
     """This computes the aerodynamic properties and coefficients of an airfoil in stall regimes using pre-stall
     characterstics and AERODAS formation for post stall characteristics. This is useful for 
     obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
     are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com
     
+    With use_database, the properties are stored in the airfoil polar database under a hash of the airfoil geometry, 
+    the contents of the polar files and the analysis grids, and are loaded from it, memory mapped, when the same 
+    airfoil is computed again by any process sharing the database. 
+    
     Assumptions:
         None 
         
@@ -41,6 +56,8 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     airfoil_polar_files                     <string>
     boundary_layer_files                    <string>
     use_pre_stall_data                      [Boolean]
+    use_database                            [Boolean]
+    database_directory                      <string>, the user cache directory if None
     Outputs:
     airfoil_data.
         cl_polars                           [unitless]
@@ -70,6 +87,13 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Properties Used:
     N/A
     """     
+    if use_database:
+        key          = airfoil_polar_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data,
+                                         [boundary_layer_aoa_sweep,boundary_layer_re_sweep,extended_aoa_sweep_deg])
+        Airfoil_Data = load_airfoil_polars(key,database_directory)
+        if Airfoil_Data is not None:
+            return Airfoil_Data
+        
     Airfoil_Data   = Data()  
    
     # ----------------------------------------------------------------------------------------
@@ -97,7 +121,7 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
         Airfoil_Data.drag_coefficients             = airfoil_file_data.drag_coefficients 
         
     # Get all of the coefficients for AERODAS wings
-    AoA_sweep_deg         = np.linspace(-14,90,105)
+    AoA_sweep_deg         = extended_aoa_sweep_deg
     AoA_sweep_rad         = AoA_sweep_deg*Units.degrees    
     
     # Create an infinite aspect ratio wing
@@ -123,6 +147,9 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Airfoil_Data.angle_of_attacks    = AoA_sweep_rad 
     Airfoil_Data.lift_coefficients   = CL 
     Airfoil_Data.drag_coefficients   = CD    
+    
+    if use_database:
+        save_airfoil_polars(Airfoil_Data,key,database_directory)
         
     return Airfoil_Data
  
@@ -292,8 +319,8 @@ def compute_boundary_layer_properties(airfoil_geometry,Airfoil_Data):
         a_names                       = ['0012']                
         airfoil_geometry              = compute_naca_4series(a_names, npoints= 100)    
     
-    AoA_sweep = np.array([-4,0,2,4,8,10,14])*Units.degrees 
-    Re_sweep  = np.array([1,5,10,30,50,75,100])*1E4  
+    AoA_sweep = boundary_layer_aoa_sweep*1 
+    Re_sweep  = boundary_layer_re_sweep*1  
     AoA_vals  = np.tile(AoA_sweep[None,:],(len(Re_sweep) ,1))
     Re_vals   = np.tile(Re_sweep[:,None],(1, len(AoA_sweep)))     
     
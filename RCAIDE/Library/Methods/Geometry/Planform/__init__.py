@@ -11,15 +11,19 @@
 # @ingroup Methods-Geometry-Two_Dimensional
 
 from .convert_sweep import convert_sweep
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import fuselage_planform
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import horizontal_tail_planform
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import vertical_tail_planform
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import wing_planform
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import horizontal_tail_planform_raymer
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import set_origin_non_dimensional, set_origin_dimensional
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'fuselage_planform':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','fuselage_planform'),
+                                                           'horizontal_tail_planform':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','horizontal_tail_planform'),
+                                                           'vertical_tail_planform':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','vertical_tail_planform'),
+                                                           'wing_planform':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','wing_planform'),
+                                                           'horizontal_tail_planform_raymer':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','horizontal_tail_planform_raymer'),
+                                                           'set_origin_non_dimensional':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','set_origin_non_dimensional'),
+                                                           'set_origin_dimensional':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','set_origin_dimensional'),
+                                                           'vertical_tail_planform_raymer':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','vertical_tail_planform_raymer'),
+                                                           'wing_fuel_volume':('Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform','wing_fuel_volume'),
+                                                           'compute_span_location_from_chord_length':('Legacy.trunk.S.Methods.Geometry.Three_Dimensional.compute_span_location_from_chord_length','compute_span_location_from_chord_length'),
+                                                           'compute_chord_length_from_span_location':('Legacy.trunk.S.Methods.Geometry.Three_Dimensional.compute_chord_length_from_span_location','compute_chord_length_from_span_location')})
+
 from .wing_segmented_planform                                 import wing_segmented_planform, segment_properties
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import vertical_tail_planform_raymer
-from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Planform import wing_fuel_volume
 from .populate_control_sections import populate_control_sections
-from Legacy.trunk.S.Methods.Geometry.Three_Dimensional.compute_span_location_from_chord_length    import compute_span_location_from_chord_length
-from Legacy.trunk.S.Methods.Geometry.Three_Dimensional.compute_chord_length_from_span_location    import compute_chord_length_from_span_location 
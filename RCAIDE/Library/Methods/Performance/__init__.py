@@ -9,14 +9,18 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
  
-from Legacy.trunk.S.Methods.Performance.estimate_take_off_field_length    import estimate_take_off_field_length
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'estimate_take_off_field_length':('Legacy.trunk.S.Methods.Performance.estimate_take_off_field_length','estimate_take_off_field_length'),
+                                                           'estimate_landing_field_length':('Legacy.trunk.S.Methods.Performance.estimate_landing_field_length','estimate_landing_field_length'),
+                                                           'find_take_off_weight_given_tofl':('Legacy.trunk.S.Methods.Performance.find_take_off_weight_given_tofl','find_take_off_weight_given_tofl'),
+                                                           'V_n_diagram':('Legacy.trunk.S.Methods.Performance.V_n_diagram','V_n_diagram'),
+                                                           'propeller_range_endurance_speeds':('Legacy.trunk.S.Methods.Performance.propeller_range_endurance_speeds','propeller_range_endurance_speeds'),
+                                                           'stall_speed':('Legacy.trunk.S.Methods.Performance.propeller_range_endurance_speeds','stall_speed'),
+                                                           'electric_V_h_diagram':('Legacy.trunk.S.Methods.Performance.electric_V_h_diagram','electric_V_h_diagram'),
+                                                           'propeller_single_point':('Legacy.trunk.S.Methods.Performance.propeller_single_point','propeller_single_point'),
+                                                           'electric_payload_range':('Legacy.trunk.S.Methods.Performance.electric_payload_range','electric_payload_range'),
+                                                           'maximum_lift_to_drag':('Legacy.trunk.S.Methods.Performance.maximum_lift_to_drag','maximum_lift_to_drag')})
+
 from .estimate_stall_speed                                                import estimate_stall_speed
 from .payload_range_diagram                                               import payload_range_diagram
-from Legacy.trunk.S.Methods.Performance.estimate_landing_field_length     import estimate_landing_field_length
-from Legacy.trunk.S.Methods.Performance.find_take_off_weight_given_tofl   import find_take_off_weight_given_tofl
-from Legacy.trunk.S.Methods.Performance.V_n_diagram                       import V_n_diagram
-from Legacy.trunk.S.Methods.Performance.propeller_range_endurance_speeds  import propeller_range_endurance_speeds, stall_speed
-from Legacy.trunk.S.Methods.Performance.electric_V_h_diagram              import electric_V_h_diagram
-from Legacy.trunk.S.Methods.Performance.propeller_single_point            import propeller_single_point
-from Legacy.trunk.S.Methods.Performance.electric_payload_range            import electric_payload_range
-from Legacy.trunk.S.Methods.Performance.maximum_lift_to_drag              import maximum_lift_to_drag
@@ -13,7 +13,13 @@ from .compute_static_sea_level_performance                                    im
 from .append_avionics_conditions                                              import append_avionics_conditions
 from .append_payload_conditions                                               import append_payload_conditions
 
-from Legacy.trunk.S.Methods.Propulsion.fm_id                                  import fm_id
-from Legacy.trunk.S.Methods.Propulsion.fm_solver                              import fm_solver
-from Legacy.trunk.S.Methods.Propulsion.rayleigh                               import rayleigh
-from Legacy.trunk.S.Methods.Propulsion.nozzle_calculations                    import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle 
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'fm_id':('Legacy.trunk.S.Methods.Propulsion.fm_id','fm_id'),
+                                                           'fm_solver':('Legacy.trunk.S.Methods.Propulsion.fm_solver','fm_solver'),
+                                                           'rayleigh':('Legacy.trunk.S.Methods.Propulsion.rayleigh','rayleigh'),
+                                                           'exit_Mach_shock':('Legacy.trunk.S.Methods.Propulsion.nozzle_calculations','exit_Mach_shock'),
+                                                           'mach_area':('Legacy.trunk.S.Methods.Propulsion.nozzle_calculations','mach_area'),
+                                                           'normal_shock':('Legacy.trunk.S.Methods.Propulsion.nozzle_calculations','normal_shock'),
+                                                           'pressure_ratio_isentropic':('Legacy.trunk.S.Methods.Propulsion.nozzle_calculations','pressure_ratio_isentropic'),
+                                                           'pressure_ratio_shock_in_nozzle':('Legacy.trunk.S.Methods.Propulsion.nozzle_calculations','pressure_ratio_shock_in_nozzle')})
\ No newline at end of file
@@ -8,7 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
-from RCAIDE.Framework.Core import Units  
+from RCAIDE.Framework.Core import Units, shared_view  
 from RCAIDE.Library.Methods.Propulsors.Converters.Engine import compute_throttle_from_power
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import  compute_rotor_performance
 
@@ -106,8 +106,8 @@ def reuse_stored_ice_cs_prop_data(propulsor,state,fuel_line,stored_propulsor_tag
     engine_0                   = fuel_line.propulsors[stored_propulsor_tag].engine
     propeller_0                = fuel_line.propulsors[stored_propulsor_tag].propeller  
     
-    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag]
-    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]        = conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag] 
+    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag])
+    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]        = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag]) 
   
     thrust                  = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].thrust 
     power                   = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].power 
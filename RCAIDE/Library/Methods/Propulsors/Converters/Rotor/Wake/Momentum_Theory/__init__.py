@@ -8,5 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_Zero.compute_fidelity_zero_induced_velocity   import compute_fidelity_zero_induced_velocity 
-from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_Zero.compute_wake_contraction_matrix          import compute_wake_contraction_matrix
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'compute_fidelity_zero_induced_velocity':('Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_Zero.compute_fidelity_zero_induced_velocity','compute_fidelity_zero_induced_velocity'),
+                                                           'compute_wake_contraction_matrix':('Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_Zero.compute_wake_contraction_matrix','compute_wake_contraction_matrix')})
\ No newline at end of file
@@ -8,5 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities  import compute_fidelity_one_inflow_velocities 
-from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity           import compute_wake_induced_velocity
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'compute_fidelity_one_inflow_velocities':('Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities','compute_fidelity_one_inflow_velocities'),
+                                                           'compute_wake_induced_velocity':('Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity','compute_wake_induced_velocity')})
\ No newline at end of file
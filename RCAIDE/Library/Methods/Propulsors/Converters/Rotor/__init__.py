@@ -15,4 +15,6 @@ from .design_propeller          import design_propeller
 from .design_lift_rotor         import design_lift_rotor
 from .design_prop_rotor         import design_prop_rotor
 from .append_rotor_conditions   import append_rotor_conditions
-from .compute_rotor_performance import compute_rotor_performance
\ No newline at end of file
+from .compute_rotor_performance import compute_rotor_performance
+from .compute_rotor_performance_map import compute_rotor_performance_map, check_rotor_performance_map
+from .evaluate_rotor_performance_map import evaluate_rotor_performance_map
\ No newline at end of file
@@ -10,6 +10,7 @@
 from RCAIDE.Framework.Core                              import Data , Units, orientation_product, orientation_transpose 
 from RCAIDE.Framework.Analyses.Propulsion               import Rotor_Wake_Fidelity_One
 from RCAIDE.Library.Methods.Aerodynamics.Common.Lift    import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss  
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.evaluate_rotor_performance_map import evaluate_rotor_performance_map, rotor_performance_map_points
 
 # package imports
 import  numpy as  np 
@@ -18,7 +19,7 @@ import  numpy as  np
 #  Generalized Rotor Class
 # ---------------------------------------------------------------------------------------------------------------------- 
 ## @ingroup Energy-Propulsion-Converters
-def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.0, 0.0,0.0]]):
+def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.0, 0.0,0.0]],use_performance_map = True):
     """Analyzes a general rotor given geometry and operating conditions.
 
     Assumptions:
@@ -31,6 +32,9 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
     Leishman, Gordon J. Principles of helicopter aerodynamics
     Cambridge university press, 2006.
 
+    With an active rotor.performance_map, the loads and blade distributions are interpolated from the map instead,
+    as a 1D analysis averaged around the azimuth. use_performance_map = False runs the BEMT regardless.
+
     Inputs:
     rotor.inputs.omega                    [radian/s]
     conditions.freestream.
@@ -76,6 +80,7 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
        torque_coefficient                [-]
        power                             [W]
        power_coefficient                 [-]
+       inflow_converged                  [-] (Fidelity Zero wake)
 
     Properties Used:
     rotor.
@@ -116,6 +121,11 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
     if isinstance(rotor.Wake, Rotor_Wake_Fidelity_One):
         use_2d_analysis=True
 
+    # the performance map gives the loads averaged around the azimuth, which are those of a 1D analysis
+    use_performance_map = use_performance_map and rotor.performance_map.active
+    if use_performance_map:
+        use_2d_analysis = False
+
     # Check for variable pitch
     if np.any(pitch_c !=0) and not rotor.variable_pitch:
         print("Warning: pitch commanded for a fixed-pitch rotor. Changing to variable pitch rotor for weights analysis.")
@@ -179,7 +189,7 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
     psi_2d         = np.repeat(psi_2d[None, :, :], ctrl_pts, axis=0)
 
     # apply blade sweep to azimuthal position
-    if np.any(np.array([sweep])!=0):
+    if np.any(np.array([sweep])!=0) and not use_performance_map:
         use_2d_analysis     = True
         sweep_2d            = np.repeat(sweep[:, None], (1,Na))
         sweep_offset_angles = np.tan(sweep_2d/r_dim_2d)
@@ -215,7 +225,7 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
         
 
     # Include external velocities introduced by user
-    if nonuniform_freestream:
+    if nonuniform_freestream and not use_performance_map:
         use_2d_analysis   = True
 
         # include additional influences specified at rotor sections, shape=(ctrl_pts,Nr,Na)
@@ -269,58 +279,87 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
     #---------------------------------------------------------------------------
     # COMPUTE WAKE-INDUCED INFLOW VELOCITIES AND RESULTING ROTOR PERFORMANCE
     #---------------------------------------------------------------------------
-    # pack inputs
-    wake_inputs                       = Data()
-    wake_inputs.velocity_total        = U
-    wake_inputs.velocity_axial        = Ua
-    wake_inputs.velocity_tangential   = Ut
-    wake_inputs.ctrl_pts              = ctrl_pts
-    wake_inputs.Nr                    = Nr
-    wake_inputs.Na                    = Na        
-    wake_inputs.use_2d_analysis       = use_2d_analysis        
-    wake_inputs.twist_distribution    = beta
-    wake_inputs.chord_distribution    = c
-    wake_inputs.radius_distribution   = r
-    wake_inputs.speed_of_sounds       = a
-    wake_inputs.dynamic_viscosities   = nu
-
-    va, vt = rotor.Wake.evaluate(rotor,wake_inputs,conditions)
+    if use_performance_map:
+        # non-dimensional loads and blade distributions of the performance map at the operating points
+        points = rotor_performance_map_points(rotor,V_thrust,omega,pitch_c,a,conditions.freestream.altitude)
+        nd     = evaluate_rotor_performance_map(rotor.performance_map,points)
+
+        D            = 2*R
+        V_tip        = abs(omega)*R
+        thrust_scale = rho*(n*n)*(D*D*D*D)
+        torque_scale = thrust_scale*D
+
+        va     = nd.axial_induced_velocity*V_tip
+        vt     = nd.tangential_induced_velocity*V_tip
+        Wa     = nd.axial_velocity*V_tip
+        Wt     = nd.tangential_velocity*V_tip
+        W      = nd.velocity*V_tip
+        lamdaw = nd.inflow_ratio
+        Cl     = nd.lift_coefficient
+        Cd     = nd.drag_coefficient
+        alpha  = nd.effective_angle_of_attack
+        Ma     = W/a
+        Re     = W*c/nu
+        Gamma  = 0.5*W*c*Cl
+
+        blade_T_distribution     = nd.thrust_distribution*thrust_scale
+        blade_Q_distribution     = nd.torque_distribution*torque_scale
+        blade_dT_dr              = nd.dT_dr*thrust_scale/D
+        blade_dQ_dr              = nd.dQ_dr*torque_scale/D
+
+    else:
+        # pack inputs
+        wake_inputs                       = Data()
+        wake_inputs.velocity_total        = U
+        wake_inputs.velocity_axial        = Ua
+        wake_inputs.velocity_tangential   = Ut
+        wake_inputs.ctrl_pts              = ctrl_pts
+        wake_inputs.Nr                    = Nr
+        wake_inputs.Na                    = Na        
+        wake_inputs.use_2d_analysis       = use_2d_analysis        
+        wake_inputs.twist_distribution    = beta
+        wake_inputs.chord_distribution    = c
+        wake_inputs.radius_distribution   = r
+        wake_inputs.speed_of_sounds       = a
+        wake_inputs.dynamic_viscosities   = nu
+
+        va, vt = rotor.Wake.evaluate(rotor,wake_inputs,conditions)
     
-    # compute new blade velocities
-    Wa   = va + Ua
-    Wt   = Ut - vt
+        # compute new blade velocities
+        Wa   = va + Ua
+        Wt   = Ut - vt
 
-    lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
+        lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
 
-    # Compute aerodynamic forces based on specified input airfoil or surrogate
-    Cl, Cdval, alpha, Ma,W, Re = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+        # Compute aerodynamic forces based on specified input airfoil or surrogate
+        Cl, Cdval, alpha, Ma,W, Re = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
     
     
-    # compute HFW circulation at the blade
-    Gamma = 0.5*W*c*Cl  
+        # compute HFW circulation at the blade
+        Gamma = 0.5*W*c*Cl  
 
-    #---------------------------------------------------------------------------            
+        #---------------------------------------------------------------------------            
             
-    # tip loss correction for velocities, since tip loss correction is only applied to loads in prior BET iteration
-    va     = F*va
-    vt     = F*vt
-    lamdaw = r*(va+Ua)/(R*(Ut-vt))
+        # tip loss correction for velocities, since tip loss correction is only applied to loads in prior BET iteration
+        va     = F*va
+        vt     = F*vt
+        lamdaw = r*(va+Ua)/(R*(Ut-vt))
 
-    # More Cd scaling from Mach from AA241ab notes for turbulent skin friction
-    Tw_Tinf     = 1. + 1.78*(Ma*Ma)
-    Tp_Tinf     = 1. + 0.035*(Ma*Ma) + 0.45*(Tw_Tinf-1.)
-    Tp          = (Tp_Tinf)*T
-    Rp_Rinf     = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
-    Cd          = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
+        # More Cd scaling from Mach from AA241ab notes for turbulent skin friction
+        Tw_Tinf     = 1. + 1.78*(Ma*Ma)
+        Tp_Tinf     = 1. + 0.035*(Ma*Ma) + 0.45*(Tw_Tinf-1.)
+        Tp          = (Tp_Tinf)*T
+        Rp_Rinf     = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
+        Cd          = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
 
-    epsilon                  = Cd/Cl
-    epsilon[epsilon==np.inf] = 10.
+        epsilon                  = Cd/Cl
+        epsilon[epsilon==np.inf] = 10.
 
-    # thrust and torque and their derivatives on the blade.
-    blade_T_distribution     = rho*(Gamma*(Wt-epsilon*Wa))*deltar
-    blade_Q_distribution     = rho*(Gamma*(Wa+epsilon*Wt)*r)*deltar
-    blade_dT_dr              = rho*(Gamma*(Wt-epsilon*Wa))
-    blade_dQ_dr              = rho*(Gamma*(Wa+epsilon*Wt)*r)
+        # thrust and torque and their derivatives on the blade.
+        blade_T_distribution     = rho*(Gamma*(Wt-epsilon*Wa))*deltar
+        blade_Q_distribution     = rho*(Gamma*(Wa+epsilon*Wt)*r)*deltar
+        blade_dT_dr              = rho*(Gamma*(Wt-epsilon*Wa))
+        blade_dQ_dr              = rho*(Gamma*(Wa+epsilon*Wt)*r)
 
 
     if use_2d_analysis:
@@ -488,6 +527,10 @@ def compute_rotor_performance(propulsor,state,disributor,center_of_gravity= [[0.
                 figure_of_merit                   = FoM, 
         ) 
     
+    # convergence of the inflow at each blade station, if the wake reports it
+    if not use_performance_map and 'converged' in wake_inputs:
+        outputs.inflow_converged = wake_inputs.converged
+    
     conditions.energy[disributor.tag][propulsor.tag][rotor.tag] = outputs   
     
     return  
@@ -0,0 +1,284 @@
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+# RCAIDE/Library/Methods/Propulsors/Converters/Rotor/compute_rotor_performance_map.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+ # RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core                                                      import Data, orientation_product
+from RCAIDE.Framework.Analyses.Propulsion                                       import Rotor_Wake_Fidelity_Zero
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import compute_rotor_performance
+from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.evaluate_rotor_performance_map import performance_map_axes, \
+     performance_map_coefficients, blade_distributions, evaluate_rotor_performance_map
+
+# package imports
+import numpy as np
+from scipy.interpolate  import RegularGridInterpolator
+from concurrent.futures import ProcessPoolExecutor
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_rotor_performance_map
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def compute_rotor_performance_map(rotor):
+    """Tabulates the performance of a rotor with the BEMT over the grid of rotor.performance_map, after which
+    compute_rotor_performance interpolates the tables instead of running the BEMT. The grid points are evaluated
+    in blocks of points_per_evaluation, shared among that many processes with performance_map.workers > 1.
+    With performance_map.accuracy_check_points, the tables are then compared to the BEMT at these points.
+
+    Assumptions:
+    The coefficients depend on the advance ratio, tip Mach number, pitch command and edgewise advance ratio,
+    and on the Reynolds number through the altitude in the US Standard 1976 atmosphere. Loads are averaged
+    around the azimuth, and the direction of the edgewise velocity does not change them. An axis with a single
+    value is not interpolated, the map only holds at that value.
+
+    Source:
+    None
+
+    Inputs:
+    rotor.performance_map.
+      advance_ratios                     [-]
+      tip_mach_numbers                   [-]
+      pitch_commands                     [rad]
+      edgewise_advance_ratios            [-]
+      altitudes                          [m]
+      workers                            [-]
+      points_per_evaluation              [-]
+      accuracy_check_points              see check_rotor_performance_map
+
+    Outputs:
+    rotor.performance_map.
+      surrogates.axes                    - axes of the map with more than one value  [-]
+      surrogates.fixed_axes              - axes of the map with a single value       [-]
+      surrogates.fixed_values            - the value of each of the fixed axes       [-]
+      surrogates.coefficients            [-]
+      surrogates.blade_distributions     [-]
+      accuracy                           see check_rotor_performance_map
+      active                             [Boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    performance_map = rotor.performance_map
+    if not isinstance(rotor.Wake,Rotor_Wake_Fidelity_Zero):
+        raise Exception('the performance map of ' + rotor.tag + ' requires the Fidelity Zero wake')
+    if rotor.nonuniform_freestream:
+        raise Exception('the performance map of ' + rotor.tag + ' does not include a nonuniform freestream')
+
+    axes    = [np.atleast_1d(np.array(performance_map[tag],dtype=float)) for tag in performance_map_axes]
+    grids   = np.meshgrid(*axes,indexing='ij')
+    points  = np.stack([grid.ravel() for grid in grids],axis=1)
+
+    coefficients, distributions = evaluate_rotor_performance_points(rotor,points)
+
+    # the tables are interpolated along the axes with more than one value
+    varying = [i for i, axis in enumerate(axes) if len(axis) > 1] or [0]
+    grid    = tuple(axes[i] for i in varying)
+    coefficients  = coefficients.reshape(tuple(len(axis) for axis in grid) + coefficients.shape[1:])
+    distributions = distributions.reshape(tuple(len(axis) for axis in grid) + distributions.shape[1:])
+
+    performance_map.surrogates                     = Data()
+    performance_map.surrogates.axes                = varying
+    performance_map.surrogates.fixed_axes          = [i for i, axis in enumerate(axes) if len(axis) == 1]
+    performance_map.surrogates.fixed_values        = np.array([axes[i][0] for i in performance_map.surrogates.fixed_axes])
+    performance_map.surrogates.coefficients        = RegularGridInterpolator(grid,coefficients,method = 'linear', bounds_error=False, fill_value=None)
+    performance_map.surrogates.blade_distributions = RegularGridInterpolator(grid,distributions,method = 'linear', bounds_error=False, fill_value=None)
+    performance_map.active                         = True
+
+    if performance_map.accuracy_check_points is not None:
+        performance_map.accuracy = check_rotor_performance_map(rotor,performance_map.accuracy_check_points)
+
+    return
+
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def check_rotor_performance_map(rotor,sample_points):
+    """Compares the coefficients of the performance map of a rotor to the BEMT at sample points.
+
+    Assumptions:
+    Sample points without an axis of the map are at the first value of that axis
+
+    Source:
+    None
+
+    Inputs:
+    sample_points.
+      advance_ratios                     [-]
+      tip_mach_numbers                   [-]
+      pitch_commands                     [rad]
+      edgewise_advance_ratios            [-]
+      altitudes                          [m]
+
+    Outputs:
+    accuracy.
+      points                             see evaluate_rotor_performance_map
+      performance_map.<coefficient>      [-]
+      BEMT.<coefficient>                 [-]
+      error.<coefficient>                - performance map minus BEMT       [-]
+      maximum_relative_error.<coefficient> - largest error over the largest
+                                           magnitude of the BEMT            [-]
+
+    Properties Used:
+    N/A
+    """
+
+    performance_map = rotor.performance_map
+    values          = [np.atleast_1d(sample_points.get(tag,np.atleast_1d(performance_map[tag])[0])) for tag in performance_map_axes]
+    values          = np.broadcast_arrays(*[np.array(value,dtype=float).ravel() for value in values])
+    points          = np.stack(values,axis=1)
+
+    map_results     = evaluate_rotor_performance_map(performance_map,points)
+    coefficients, _ = evaluate_rotor_performance_points(rotor,points)
+
+    accuracy                        = Data()
+    accuracy.points                 = points
+    accuracy.performance_map        = Data()
+    accuracy.BEMT                   = Data()
+    accuracy.error                  = Data()
+    accuracy.maximum_relative_error = Data()
+    for i, tag in enumerate(performance_map_coefficients):
+        accuracy.performance_map[tag]        = map_results[tag][:,0]
+        accuracy.BEMT[tag]                   = coefficients[:,i]
+        accuracy.error[tag]                  = accuracy.performance_map[tag] - accuracy.BEMT[tag]
+        accuracy.maximum_relative_error[tag] = np.max(abs(accuracy.error[tag]))/np.max(abs(accuracy.BEMT[tag]))
+
+    return accuracy
+
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def evaluate_rotor_performance_points(rotor,points):
+    """Runs the BEMT at points of the performance map, in blocks of performance_map.points_per_evaluation shared
+    among performance_map.workers processes.
+
+    Assumptions:
+    A process evaluates a block as the serial evaluation does, so the results are the same
+
+    Source:
+    None
+
+    Inputs:
+    points                               see evaluate_rotor_performance_map
+
+    Outputs:
+    coefficients                         - coefficients at each point, shape (points,coefficients)          [-]
+    distributions                        - blade distributions at each point, shape (points,distributions,Nr) [-]
+
+    Properties Used:
+    N/A
+    """
+
+    performance_map = rotor.performance_map
+    workers         = performance_map.workers
+    n_blocks        = int(np.ceil(len(points)/max(performance_map.points_per_evaluation,1)))
+    blocks          = np.array_split(points,max(n_blocks,1))
+
+    if workers is None or workers <= 1 or len(blocks) <= 1:
+        results = [evaluate_rotor_performance_block(rotor,block) for block in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers = min(workers,len(blocks))) as pool:
+            results = list(pool.map(evaluate_rotor_performance_block,[rotor]*len(blocks),blocks))
+
+    coefficients  = np.concatenate([result[0] for result in results],axis=0)
+    distributions = np.concatenate([result[1] for result in results],axis=0)
+
+    return coefficients, distributions
+
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def evaluate_rotor_performance_block(rotor,points):
+    """Runs the BEMT at a block of points of the performance map, as control points of one evaluation of
+    compute_rotor_performance at the conditions of the points.
+
+    Assumptions:
+    The rotor is at full throttle, with its thrust axis along the body axes
+
+    Source:
+    None
+
+    Inputs:
+    points                               see evaluate_rotor_performance_map
+
+    Outputs:
+    coefficients                         - coefficients at each point, shape (points,coefficients)          [-]
+    distributions                        - blade distributions at each point, shape (points,distributions,Nr) [-]
+
+    Properties Used:
+    rotor.
+      tip_radius                         [m]
+      number_of_blades                   [-]
+    """
+
+    ctrl_pts   = len(points)
+    R          = rotor.tip_radius
+    D          = 2*R
+    B          = rotor.number_of_blades
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(points[:,4,None])
+    a          = atmo_data.speed_of_sound
+    rho        = atmo_data.density
+    omega      = points[:,1,None]*a/R
+    n          = omega/(2.*np.pi)
+    V_tip      = omega*R
+
+    # velocity in the rotor frame, and in the body frame of a rotor without commanded thrust vector angle
+    V_thrust       = np.zeros((ctrl_pts,3))
+    V_thrust[:,0]  = points[:,0]*V_tip[:,0]/np.pi
+    V_thrust[:,1]  = points[:,3]*V_tip[:,0]
+    commanded_TV   = np.zeros((ctrl_pts,1))
+    body2thrust, _ = rotor.body_to_prop_vel(commanded_TV)
+    V_body         = orientation_product(body2thrust,V_thrust)
+
+    # conditions of one evaluation of the BEMT at the points
+    propulsor   = Data(tag = 'performance_map', rotor = rotor)
+    distributor = Data(tag = 'performance_map')
+    state       = Data(conditions = Data())
+    conditions  = state.conditions
+    conditions.freestream                            = Data()
+    conditions.freestream.altitude                   = points[:,4,None]
+    conditions.freestream.density                    = rho
+    conditions.freestream.dynamic_viscosity          = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound             = a
+    conditions.freestream.temperature                = atmo_data.temperature
+    conditions.frames                                = Data(body = Data(), inertial = Data())
+    conditions.frames.body.transform_to_inertial     = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.inertial.velocity_vector       = V_body
+    conditions.energy                                = Data()
+    propulsor_conditions                             = Data(commanded_thrust_vector_angle = commanded_TV)
+    propulsor_conditions[rotor.tag]                  = Data(throttle      = np.ones((ctrl_pts,1)),
+                                                            omega         = omega,
+                                                            pitch_command = points[:,2,None])
+    conditions.energy[distributor.tag]               = Data()
+    conditions.energy[distributor.tag][propulsor.tag] = propulsor_conditions
+
+    compute_rotor_performance(propulsor,state,distributor,use_performance_map = False)
+    outputs = conditions.energy[distributor.tag][propulsor.tag][rotor.tag]
+
+    # blade distributions, averaged around the azimuth by a 2D analysis
+    def azimuthal_average(x):
+        return np.mean(x,axis=2) if np.ndim(x) == 3 else x
+
+    thrust_scale  = rho*(n*n)*(D*D*D*D)
+    torque_scale  = thrust_scale*D
+    distributions = Data()
+    distributions.axial_induced_velocity      = outputs.blade_axial_induced_velocity/V_tip
+    distributions.tangential_induced_velocity = outputs.blade_tangential_induced_velocity/V_tip
+    distributions.axial_velocity              = outputs.blade_axial_velocity/V_tip
+    distributions.tangential_velocity         = outputs.blade_tangential_velocity/V_tip
+    distributions.velocity                    = azimuthal_average(outputs.blade_velocity)/V_tip
+    distributions.inflow_ratio                = azimuthal_average(outputs.converged_inflow_ratio)
+    distributions.lift_coefficient            = azimuthal_average(outputs.lift_coefficient)
+    distributions.drag_coefficient            = azimuthal_average(outputs.drag_coefficient)
+    distributions.effective_angle_of_attack   = azimuthal_average(outputs.blade_effective_angle_of_attack)
+    distributions.thrust_distribution         = outputs.blade_thrust_distribution/thrust_scale
+    distributions.torque_distribution         = outputs.blade_torque_distribution/torque_scale
+    distributions.dT_dr                       = outputs.blade_dT_dr*D/thrust_scale
+    distributions.dQ_dr                       = outputs.blade_dQ_dr*D/torque_scale
+
+    # coefficients of the loads before they are limited by compute_rotor_performance
+    Ct = B*np.sum(distributions.thrust_distribution,axis=1)
+    Cq = B*np.sum(distributions.torque_distribution,axis=1)
+    Cp = 2*np.pi*Cq
+    coefficients  = np.stack([Ct,Cp,Cq],axis=1)
+
+    return coefficients, np.stack([distributions[tag] for tag in blade_distributions],axis=1)
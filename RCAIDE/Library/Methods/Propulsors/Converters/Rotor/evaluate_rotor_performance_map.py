@@ -0,0 +1,146 @@
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+# RCAIDE/Library/Methods/Propulsors/Converters/Rotor/evaluate_rotor_performance_map.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+ # RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+from warnings import warn
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Settings
+# ----------------------------------------------------------------------------------------------------------------------
+
+# axes of the performance map, in the order of the columns of the points
+performance_map_axes      = ['advance_ratios','tip_mach_numbers','pitch_commands','edgewise_advance_ratios','altitudes']
+
+# rotor coefficients of the performance map
+performance_map_coefficients = ['thrust_coefficient','power_coefficient','torque_coefficient']
+
+# distributions along the blade of the performance map, averaged around the azimuth. Velocities are divided by the
+# tip speed, loads by the density times the rotation rate squared and the diameter to the power of their dimension
+blade_distributions       = ['axial_induced_velocity','tangential_induced_velocity','axial_velocity',
+                             'tangential_velocity','velocity','inflow_ratio','lift_coefficient','drag_coefficient',
+                             'effective_angle_of_attack','thrust_distribution','torque_distribution','dT_dr','dQ_dr']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evaluate_rotor_performance_map
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def evaluate_rotor_performance_map(performance_map,points):
+    """Interpolates the non-dimensional rotor coefficients and blade distributions of a performance map.
+
+    Assumptions:
+    Linear interpolation between the grid points, and linear extrapolation outside of the grid. An axis of the
+    map with a single value is not interpolated, points away from that value are evaluated at it with a warning.
+
+    Source:
+    None
+
+    Inputs:
+    performance_map.surrogates           - computed by compute_rotor_performance_map
+    points                               - advance ratio, tip Mach number, pitch command, edgewise
+                                           advance ratio and altitude of each point             [-,-,rad,-,m]
+
+    Outputs:
+    results.
+      thrust_coefficient                 [-]
+      power_coefficient                  [-]
+      torque_coefficient                 [-]
+      <blade distributions>              [-]
+
+    Properties Used:
+    N/A
+    """
+
+    if performance_map.surrogates is None:
+        raise Exception('the performance map must be computed by compute_rotor_performance_map before it is used')
+
+    surrogates   = performance_map.surrogates
+    check_fixed_axes(surrogates,points)
+    points       = points[:,surrogates.axes]
+    coefficients = surrogates.coefficients(points)
+    distribution = surrogates.blade_distributions(points)
+
+    results = Data()
+    for i, tag in enumerate(performance_map_coefficients):
+        results[tag] = coefficients[:,i,None]
+    for i, tag in enumerate(blade_distributions):
+        results[tag] = distribution[:,i,:]
+
+    return results
+
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def check_fixed_axes(surrogates,points):
+    """Warns when points of a performance map are away from the value of an axis the map does not vary.
+
+    Assumptions:
+    Points within 1E-6 of the value, relative to the larger of the value and one, are at the value
+
+    Source:
+    None
+
+    Inputs:
+    surrogates.fixed_axes                [-]
+    surrogates.fixed_values              [-]
+    points                               - see evaluate_rotor_performance_map
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    for axis, value in zip(surrogates.fixed_axes,surrogates.fixed_values):
+        difference = np.abs(points[:,axis] - value)
+        if np.any(difference > 1E-6*max(abs(value),1.)):
+            warn('the rotor performance map only covers ' + performance_map_axes[axis] + ' = ' + str(value) +
+                 ', points up to ' + str(np.max(difference)) + ' away from it are evaluated at that value,'
+                 ' add values to performance_map.' + performance_map_axes[axis] + ' to cover them',RuntimeWarning)
+
+    return
+
+## @ingroup Methods-Energy-Propulsors-Converters-Rotor
+def rotor_performance_map_points(rotor,V_thrust,omega,pitch_command,speed_of_sound,altitude):
+    """Computes the points of the performance map of a rotor at its operating conditions.
+
+    Assumptions:
+    The direction of the edgewise velocity does not change the loads averaged around the azimuth
+
+    Source:
+    None
+
+    Inputs:
+    V_thrust                             - freestream velocity in the rotor frame  [m/s]
+    omega                                - angular velocity                        [rad/s]
+    pitch_command                        - blade pitch command                     [rad]
+    speed_of_sound                       - freestream speed of sound               [m/s]
+    altitude                             - altitude                                [m]
+
+    Outputs:
+    points                               - see evaluate_rotor_performance_map
+
+    Properties Used:
+    rotor.tip_radius                     [m]
+    """
+
+    R          = rotor.tip_radius
+    ctrl_pts   = len(V_thrust)
+    V_tip      = abs(omega[:,0])*R
+    V_tip_safe = np.where(V_tip > 0.,V_tip,1.)
+
+    points       = np.zeros((ctrl_pts,len(performance_map_axes)))
+    points[:,0]  = np.pi*V_thrust[:,0]/V_tip_safe
+    points[:,1]  = V_tip/speed_of_sound[:,0]
+    points[:,2]  = np.broadcast_to(pitch_command,(ctrl_pts,1))[:,0]
+    points[:,3]  = np.sqrt(V_thrust[:,1]**2 + V_thrust[:,2]**2)/V_tip_safe
+    points[:,4]  = np.broadcast_to(altitude,(ctrl_pts,1))[:,0]
+
+    return points
@@ -8,13 +8,13 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports   
+from RCAIDE.Framework.Core import shared_view
 from RCAIDE.Library.Methods.Propulsors.Modulators.Electronic_Speed_Controller.compute_esc_performance  import * 
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor.compute_motor_performance                   import *
 from RCAIDE.Library.Methods.Propulsors.Converters.Ducted_Fan.compute_ducted_fan_performance            import * 
 
 # pacakge imports  
 import numpy as np 
-from copy import deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_electric_ducted_fan_performance
@@ -130,9 +130,9 @@ def reuse_stored_electric_ducted_fan_data(propulsor,state,bus,stored_propulsor_t
     ducted_fan_0               = bus.propulsors[stored_propulsor_tag].ducted_fan 
     esc_0                      = bus.propulsors[stored_propulsor_tag].electronic_speed_controller
     
-    conditions.energy[bus.tag][propulsor.tag][motor.tag]        = deepcopy(conditions.energy[bus.tag][stored_propulsor_tag][motor_0.tag])
-    conditions.energy[bus.tag][propulsor.tag][ducted_fan.tag]   = deepcopy(conditions.energy[bus.tag][stored_propulsor_tag][ducted_fan_0.tag])
-    conditions.energy[bus.tag][propulsor.tag][esc.tag]          = deepcopy(conditions.energy[bus.tag][stored_propulsor_tag][esc_0.tag])
+    conditions.energy[bus.tag][propulsor.tag][motor.tag]        = shared_view(conditions.energy[bus.tag][stored_propulsor_tag][motor_0.tag])
+    conditions.energy[bus.tag][propulsor.tag][ducted_fan.tag]   = shared_view(conditions.energy[bus.tag][stored_propulsor_tag][ducted_fan_0.tag])
+    conditions.energy[bus.tag][propulsor.tag][esc.tag]          = shared_view(conditions.energy[bus.tag][stored_propulsor_tag][esc_0.tag])
   
     thrust                  = conditions.energy[bus.tag][propulsor.tag][ducted_fan.tag].thrust 
     power                   = conditions.energy[bus.tag][propulsor.tag][esc.tag].power 
@@ -8,12 +8,11 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
-from RCAIDE.Framework.Core import Units  
+from RCAIDE.Framework.Core import Units, shared_view  
 from RCAIDE.Library.Methods.Propulsors.Converters.Engine import compute_power_from_throttle
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import  compute_rotor_performance
 
 # pacakge imports  
-from copy import deepcopy
 import numpy as np 
 
 
@@ -115,8 +114,8 @@ def reuse_stored_ice_data(propulsor,state,fuel_line,stored_propulsor_tag,center_
     engine_0     = fuel_line.propulsors[stored_propulsor_tag].engine
     propeller_0  = fuel_line.propulsors[stored_propulsor_tag].propeller  
     
-    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag])
-    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]     = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag])
+    conditions.energy[fuel_line.tag][propulsor.tag][engine.tag]        = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag][engine_0.tag])
+    conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag]     = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag][propeller_0.tag])
   
     thrust                  = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].thrust 
     power                   = conditions.energy[fuel_line.tag][propulsor.tag][propeller.tag].power 
@@ -14,4 +14,6 @@ from .compute_thurst                                             import compute_
 from .size_core                                                  import size_core 
 from .compute_turbofan_performance                               import compute_turbofan_performance ,reuse_stored_turbofan_data
 from .design_turbofan                                            import design_turbofan   
-from Legacy.trunk.S.Methods.Propulsion.turbofan_emission_index   import turbofan_emission_index 
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'turbofan_emission_index':('Legacy.trunk.S.Methods.Propulsion.turbofan_emission_index','turbofan_emission_index')})
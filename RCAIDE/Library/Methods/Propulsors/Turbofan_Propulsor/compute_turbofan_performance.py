@@ -8,7 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
-from RCAIDE.Framework.Core import Data   
+from RCAIDE.Framework.Core import Data, shared_view   
 from RCAIDE.Library.Methods.Propulsors.Converters.Ram                import compute_ram_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Combustor          import compute_combustor_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Compressor         import compute_compressor_performance
@@ -19,7 +19,6 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import comp
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor            import compute_thrust
 
 import  numpy as  np
-from copy import  deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_performance
@@ -288,8 +287,8 @@ def reuse_stored_turbofan_data(turbofan,state,fuel_line,stored_propulsor_tag,cen
     N.A.        
     ''' 
     conditions                                      = state.conditions  
-    conditions.energy[fuel_line.tag][turbofan.tag]  = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag])
-    conditions.noise[fuel_line.tag][turbofan.tag]   = deepcopy(conditions.noise[fuel_line.tag][stored_propulsor_tag])
+    conditions.energy[fuel_line.tag][turbofan.tag]  = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag])
+    conditions.noise[fuel_line.tag][turbofan.tag]   = shared_view(conditions.noise[fuel_line.tag][stored_propulsor_tag])
     
     # compute moment  
     moment_vector      = 0*state.ones_row(3)
@@ -8,7 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
-from RCAIDE.Framework.Core import Data    
+from RCAIDE.Framework.Core import Data, shared_view    
 from RCAIDE.Library.Methods.Propulsors.Converters.Ram                import compute_ram_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Combustor          import compute_combustor_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Compressor         import compute_compressor_performance
@@ -19,7 +19,6 @@ from RCAIDE.Library.Methods.Propulsors.Turbojet_Propulsor            import comp
 
 # python imports 
 import  numpy as  np 
-from copy import  deepcopy
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_turbojet_performance
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -258,8 +257,8 @@ def reuse_stored_turbojet_data(turbojet,state,fuel_line,stored_propulsor_tag,cen
     N.A.        
     ''' 
     conditions                              = state.conditions  
-    conditions.energy[fuel_line.tag][turbojet.tag]  =deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag])
-    conditions.noise[fuel_line.tag][turbojet.tag]   =deepcopy(conditions.noise[fuel_line.tag][stored_propulsor_tag])
+    conditions.energy[fuel_line.tag][turbojet.tag]  = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag])
+    conditions.noise[fuel_line.tag][turbojet.tag]   = shared_view(conditions.noise[fuel_line.tag][stored_propulsor_tag])
     
     # compute moment  
     moment_vector      = 0*state.ones_row(3)
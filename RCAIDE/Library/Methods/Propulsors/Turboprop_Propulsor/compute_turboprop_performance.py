@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports      
 
-from RCAIDE.Framework.Core                                           import Data
+from RCAIDE.Framework.Core                                           import Data, shared_view
 from RCAIDE.Framework.Mission.Common                                 import Conditions
 from RCAIDE.Library.Methods.Propulsors.Converters.Ram                import compute_ram_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Combustor          import compute_combustor_performance
@@ -20,7 +20,6 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import comp
 from RCAIDE.Library.Methods.Propulsors.Turboprop_Propulsor           import compute_thrust
  
 # python imports 
-from   copy import deepcopy
 import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -227,8 +226,8 @@ def reuse_stored_turboprop_data(turboprop,state,fuel_line,stored_propulsor_tag,c
     N.A.        
     ''' 
     conditions                                      = state.conditions  
-    conditions.energy[fuel_line.tag][turboprop.tag]  = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag])
-    conditions.noise[fuel_line.tag][turboprop.tag]   = deepcopy(conditions.noise[fuel_line.tag][stored_propulsor_tag])
+    conditions.energy[fuel_line.tag][turboprop.tag]  = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag])
+    conditions.noise[fuel_line.tag][turboprop.tag]   = shared_view(conditions.noise[fuel_line.tag][stored_propulsor_tag])
     
     # compute moment  
     moment_vector      = 0*state.ones_row(3)
@@ -8,7 +8,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports      
-from RCAIDE.Framework.Core import Data   
+from RCAIDE.Framework.Core import Data, shared_view   
 from RCAIDE.Library.Methods.Propulsors.Converters.Ram                import compute_ram_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Combustor          import compute_combustor_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Compressor         import compute_compressor_performance
@@ -18,7 +18,6 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import comp
 from RCAIDE.Library.Methods.Propulsors.Turboshaft_Propulsor          import compute_power
  
 # python imports 
-from copy import deepcopy
 import numpy as np
 # ----------------------------------------------------------------------------------------------------------------------
 # compute_turboshaft_performance
@@ -209,8 +208,8 @@ def reuse_stored_turboshaft_data(turboshaft,state,fuel_line,stored_propulsor_tag
     N.A.        
     ''' 
     conditions                                        = state.conditions   
-    conditions.energy[fuel_line.tag][turboshaft.tag]  = deepcopy(conditions.energy[fuel_line.tag][stored_propulsor_tag])
-    conditions.noise[fuel_line.tag][turboshaft.tag]   = deepcopy(conditions.noise[fuel_line.tag][stored_propulsor_tag])
+    conditions.energy[fuel_line.tag][turboshaft.tag]  = shared_view(conditions.energy[fuel_line.tag][stored_propulsor_tag])
+    conditions.noise[fuel_line.tag][turboshaft.tag]   = shared_view(conditions.noise[fuel_line.tag][stored_propulsor_tag])
       
     power    = conditions.energy[fuel_line.tag][turboshaft.tag].power    
     moment   = 0*state.ones_row(3)
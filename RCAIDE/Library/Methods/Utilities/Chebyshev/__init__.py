@@ -10,5 +10,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # @ingroup Methods-Utilities
 
-from Legacy.trunk.S.Methods.Utilities.Chebyshev.chebyshev_data import chebyshev_data
-from Legacy.trunk.S.Methods.Utilities.Chebyshev.linear_data    import linear_data
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'chebyshev_data':('Legacy.trunk.S.Methods.Utilities.Chebyshev.chebyshev_data','chebyshev_data'),
+                                                           'linear_data':('Legacy.trunk.S.Methods.Utilities.Chebyshev.linear_data','linear_data')})
\ No newline at end of file
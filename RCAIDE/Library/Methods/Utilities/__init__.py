@@ -12,6 +12,8 @@
 
 from . import Chebyshev
 
-from Legacy.trunk.S.Methods.Utilities.soft_max                 import soft_max
-from Legacy.trunk.S.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
-from Legacy.trunk.S.Methods.Utilities.Cubic_Spline_Blender     import Cubic_Spline_Blender
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'soft_max':('Legacy.trunk.S.Methods.Utilities.soft_max','soft_max'),
+                                                           'latin_hypercube_sampling':('Legacy.trunk.S.Methods.Utilities.latin_hypercube_sampling','latin_hypercube_sampling'),
+                                                           'Cubic_Spline_Blender':('Legacy.trunk.S.Methods.Utilities.Cubic_Spline_Blender','Cubic_Spline_Blender')})
\ No newline at end of file
@@ -14,4 +14,6 @@ from .compute_piston_engine_weight                          import compute_pisto
 from .integrated_propulsion                                 import integrated_propulsion
 from .integrated_propulsion_general_aviation                import integrated_propulsion_general_aviation
 from .compute_motor_weight                                  import compute_motor_weight
-from Legacy.trunk.S.Methods.Weights.Dynamo_Supply.dynamo_supply_mass_estimation   import dynamo_supply_mass_estimation
\ No newline at end of file
+# legacy contents are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, attributes = {'dynamo_supply_mass_estimation':('Legacy.trunk.S.Methods.Weights.Dynamo_Supply.dynamo_supply_mass_estimation','dynamo_supply_mass_estimation')})
\ No newline at end of file
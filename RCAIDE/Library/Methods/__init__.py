@@ -9,18 +9,11 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from . import Aerodynamics
-from . import Costs 
-from . import Emissions
-from . import Energy 
-from . import Geometry
-from . import Noise
-from . import Performance 
-from . import Propulsors
-from . import Stability
-from . import Utilities
-from . import Weights
-from . import Geodesics
-
 from .skip import skip
 
+# subpackages are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, submodules = ['Aerodynamics','Costs','Emissions','Energy','Geometry','Noise',
+                                                           'Performance','Propulsors','Stability','Utilities','Weights',
+                                                           'Geodesics'])
+
@@ -10,6 +10,11 @@
 # RCAIDE imports 
 import RCAIDE 
 from RCAIDE.Framework.Core  import Data 
+from RCAIDE.Library.Mission.Solver.warm_start import seed_unknowns, store_unknowns, seed_leaves
+from RCAIDE.Library.Mission.Solver.adaptive_control_points import refine_control_points
+
+# python imports
+from copy import deepcopy
 
 def pre_process(mission): 
     for tag,segment in mission.segments.items():     
@@ -25,6 +30,28 @@ def sequential_segments(mission):
         
         segment.process.initialize.expand_state(segment) 
         segment.process.initialize.expand_state = RCAIDE.Library.Methods.skip        
+        
+        if not mission.warm_start:
+            evaluate_segment(segment)
+            continue
+        
+        # start from the last converged solution, fall back to the default guess
+        numerics         = segment.state.numerics
+        default_points   = numerics.discretization_method(numerics.number_of_control_points)[0]
+        default_unknowns = deepcopy(segment.state.unknowns)
+        seeded           = seed_unknowns(mission,segment)
+        evaluate_segment(segment)
+        if seeded and not segment.converged:
+            control_points = numerics.discretization_method(numerics.number_of_control_points)[0]
+            seed_leaves(segment.state.unknowns,default_unknowns,default_points,control_points)
+            evaluate_segment(segment)
+        if segment.converged:
+            store_unknowns(mission,segment)
+
+def evaluate_segment(segment):
+    if segment.state.numerics.adaptive_control_points:
+        refine_control_points(segment)
+    else:
         segment.evaluate()
         
 def update_segments(mission):   
@@ -3,6 +3,12 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import unshare_array
  
 # ----------------------------------------------------------------------------------------------------------------------
 #  Unpack Unknowns
@@ -16,7 +22,7 @@ def fuel_line_unknowns(segment,fuel_lines):
     if 'throttle' in segment:
         for fuel_line in fuel_lines:
             for propulsor in fuel_line.propulsors: 
-                state.conditions.energy[fuel_line.tag][propulsor.tag].throttle[:,0] = segment.throttle 
+                unshare_array(state.conditions.energy[fuel_line.tag][propulsor.tag],'throttle')[:,0] = segment.throttle 
     elif assigned_control_variables.throttle.active:                
         for i in range(len(assigned_control_variables.throttle.assigned_propulsors)):
             propulsor_tags = assigned_control_variables.throttle.assigned_propulsors[i]
@@ -43,7 +49,7 @@ def bus_unknowns(segment,busses):
     if 'throttle' in segment:
         for bus in busses:
             for propulsor in bus.propulsors: 
-                state.conditions.energy[bus.tag][propulsor.tag].throttle[:,0] = segment.throttle 
+                unshare_array(state.conditions.energy[bus.tag][propulsor.tag],'throttle')[:,0] = segment.throttle 
     elif assigned_control_variables.throttle.active:                
         for i in range(len(assigned_control_variables.throttle.assigned_propulsors)): 
             propulsor_tags = assigned_control_variables.throttle.assigned_propulsors[i]
@@ -93,4 +93,4 @@ def initialize_conditions(segment):
     segment.state.conditions.frames.body.velocity_vector[:,1]     = v_body_y
     segment.state.conditions.frames.inertial.time[:,0]            = time[:,0]
     segment.state.conditions.frames.planet.true_heading[:,0]      = true_course_control_points[:,0]
-    segment.state.conditions.frames.planet.true_course[:,0]       = true_course_control_points[:,0]
\ No newline at end of file
+    segment.state.conditions.frames.planet.true_course            = true_course_control_points[:,0][:,None]
\ No newline at end of file
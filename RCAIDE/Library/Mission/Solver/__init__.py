@@ -10,7 +10,11 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # @ingroup Methods-Mission
 
-from .converge_root import converge_root
-from .expand_state  import expand_state
-from .optimize      import converge_opt
+from .converge_root           import converge_root
+from .sparse_jacobian         import sparse_jacobian
+from .expand_state            import expand_state
+from .optimize                import converge_opt
+from .warm_start              import seed_unknowns, store_unknowns, clear_warm_start
+from .adaptive_control_points import refine_control_points
+from .contiguous_state        import pack_unknowns, unpack_unknowns, pack_residuals
  
\ No newline at end of file
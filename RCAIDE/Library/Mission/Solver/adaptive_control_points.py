@@ -0,0 +1,210 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/adaptive_control_points.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                    import Data
+from RCAIDE.Framework.Mission.Common          import Conditions
+
+# Package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# refine_control_points
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def refine_control_points(segment):
+    """Evaluates a segment with adaptively chosen control points. The segment is first solved on the minimum number
+    of control points, the discretization error is then estimated from the decay of the Chebyshev coefficients of
+    the unknowns. While the estimate is above the tolerance the segment is re-solved on 2N-1 points, which contain
+    the previous points, starting from an interpolation of the coarse solution.
+
+    Assumptions:
+    The unknowns are smooth functions of time on the segment, so the size of the highest Chebyshev coefficients
+    bounds the interpolation error of the solution. A segment that does not converge is refined as well.
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013, Ch. 8.
+
+    Inputs:
+    segment.state.numerics.minimum_number_of_control_points    [Unitless]
+    segment.state.numerics.maximum_number_of_control_points    [Unitless]
+    segment.state.numerics.adaptive_tolerance                  [Unitless]
+
+    Outputs:
+    segment.state.numerics.number_of_control_points            [Unitless]
+    segment.state.numerics.discretization_error                [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+    n_max    = int(numerics.maximum_number_of_control_points)
+    n_points = min(int(numerics.minimum_number_of_control_points),n_max)
+
+    if n_points != numerics.number_of_control_points:
+        resize_control_points(segment,n_points)
+
+    while True:
+        segment.evaluate()
+        numerics.discretization_error = chebyshev_error(segment.state.unknowns)
+        if (segment.converged and numerics.discretization_error <= numerics.adaptive_tolerance) or n_points >= n_max:
+            break
+        n_points = min(2*n_points - 1,n_max)
+        resize_control_points(segment,n_points)
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def resize_control_points(segment, n_points):
+    """Changes the number of control points of an expanded segment. Arrays in the state with one row per control
+    point are interpolated onto the new control points.
+
+    Assumptions:
+    Conditions are recomputed when the segment is evaluated, the interpolated values only serve as a first guess
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state                                     [Data]
+    n_points                                          [Unitless]
+
+    Outputs:
+    segment.state.numerics.number_of_control_points   [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+    n_old    = int(numerics.number_of_control_points)
+    x_old    = numerics.discretization_method(n_old)[0]
+    x_new    = numerics.discretization_method(n_points)[0]
+
+    for key,value in segment.state.items():
+        if key in ('initials','numerics'):
+            continue
+        if isinstance(value,Data):
+            resize_rows(value,x_old,x_new)
+    segment.state._size = n_points
+
+    numerics.number_of_control_points = n_points
+
+    return
+
+## @ingroup Library-Missions-Segments
+def resize_rows(data, x_old, x_new):
+    """Recursively interpolates the arrays with one row per control point onto new control points.
+
+    Assumptions:
+    Arrays of two or more dimensions whose first dimension is the number of control points hold one row per control
+    point, e.g. conditions of shape (n,1) or rotation matrices of shape (n,3,3). One dimensional arrays are left as
+    they are. Linear interpolation in the dimensionless control point coordinate.
+
+    Source:
+    N/A
+
+    Inputs:
+    data         [Data]
+    x_old        [array]
+    x_new        [array]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    n_old = len(x_old)
+    n_new = len(x_new)
+    for key,value in data.items():
+        if isinstance(value,Data):
+            resize_rows(value,x_old,x_new)
+        elif isinstance(value,np.ndarray) and value.ndim >= 2 and value.shape[0] == n_old:
+            columns = value.reshape((n_old,-1))
+            new     = np.empty((n_new,columns.shape[1]),dtype=value.dtype)
+            for col in range(columns.shape[1]):
+                new[:,col] = np.interp(x_new,x_old,columns[:,col])
+            data[key] = new.reshape((n_new,) + value.shape[1:])
+    if isinstance(data,Conditions):
+        data._size = n_new
+
+    return
+
+## @ingroup Library-Missions-Segments
+def chebyshev_error(unknowns):
+    """Estimates the relative discretization error of the unknowns from their two highest Chebyshev coefficients.
+
+    Assumptions:
+    Each column is scaled by its largest coefficient
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns     [Data]
+
+    Outputs:
+    error        [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    error = 0.
+    for key,value in unknowns.items():
+        if isinstance(value,Data):
+            error = max(error,chebyshev_error(value))
+        elif isinstance(value,np.ndarray) and value.ndim == 2 and value.shape[0] > 2:
+            a     = np.abs(chebyshev_coefficients(value))
+            scale = np.max(a,axis=0)
+            tail  = a[-1] + a[-2]
+            valid = scale > 0.
+            if np.any(valid):
+                error = max(error,np.max(tail[valid]/scale[valid]))
+
+    return error
+
+## @ingroup Library-Missions-Segments
+def chebyshev_coefficients(values):
+    """Chebyshev coefficients of the columns of an array sampled at the Chebyshev-Gauss-Lobatto control points.
+
+    Assumptions:
+    Control points as given by chebyshev_data, the sign of odd coefficients is flipped since those points run
+    from -1 to 1
+
+    Source:
+    N/A
+
+    Inputs:
+    values       [array]
+
+    Outputs:
+    a            [array]
+
+    Properties Used:
+    N/A
+    """
+
+    N      = values.shape[0]
+    k      = np.arange(N)
+    C      = np.cos(np.pi*np.outer(k,k)/(N-1))
+    w      = np.ones(N)
+    w[0]   = 0.5
+    w[-1]  = 0.5
+    a      = (2./(N-1))*np.dot(C*w[None,:],values)
+    a[0]   = 0.5*a[0]
+    a[-1]  = 0.5*a[-1]
+
+    return a
@@ -0,0 +1,247 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/contiguous_state.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# Package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# pack_unknowns
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def pack_unknowns(segment):
+    """Packs the unknowns of a segment into a vector for the root finder. With state.numerics.contiguous_state the
+    unknowns are also moved into one contiguous buffer, every unknown array becomes a view of its slice of the
+    buffer, so unpacking the solver vector is a single copy.
+
+    Assumptions:
+    The unknowns keep their names and shapes and are not replaced while the segment is solved, they are linked to 
+    the buffer again at the start of every solve
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state.unknowns                    [Data]
+    segment.state.numerics.contiguous_state   [boolean]
+
+    Outputs:
+    unknowns                                  [array]
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns = segment.state.unknowns
+    vector   = unknowns.pack_array()
+    if not segment.state.numerics.contiguous_state:
+        return vector
+
+    layout           = Data()
+    layout.leaves    = state_layout(unknowns)
+    layout.buffer    = vector.copy()
+    unknowns._layout = layout
+    link_views(unknowns,layout)
+
+    # residuals are laid out on the first evaluation of the solve
+    segment.state.residuals._layout = None
+
+    return vector
+
+## @ingroup Library-Missions-Segments
+def unpack_unknowns(segment, vector):
+    """Sets the unknowns of a segment from the root finder vector.
+
+    Assumptions:
+    The vector is copied, the root finder may reuse its memory between evaluations
+
+    Source:
+    N/A
+
+    Inputs:
+    vector                                    [array]
+    segment.state.numerics.contiguous_state   [boolean]
+
+    Outputs:
+    segment.state.unknowns                    [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns = segment.state.unknowns
+    layout   = unknowns._layout
+    if not segment.state.numerics.contiguous_state or layout is None or len(vector) != len(layout.buffer):
+        unknowns.unpack_array(vector)
+        return
+
+    buffer    = layout.buffer
+    buffer[:] = vector
+    for parent,key,index in layout.scalars:
+        if parent is None:
+            parent = unknowns
+        parent[key] = buffer[index]
+
+    return
+
+## @ingroup Library-Missions-Segments
+def pack_residuals(segment):
+    """Packs the residuals of a segment into a vector for the root finder. With state.numerics.contiguous_state the
+    residual arrays become views of one buffer on the first evaluation of the solve. Residuals written in place are
+    then already packed, only residuals that were replaced are copied into the buffer, and the buffer itself is 
+    returned.
+
+    Assumptions:
+    The residuals keep their names and shapes while the segment is solved. The returned buffer is overwritten by
+    the next evaluation, a caller keeping the residuals copies them
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state.residuals                   [Data]
+    segment.state.numerics.contiguous_state   [boolean]
+
+    Outputs:
+    residuals                                 [array]
+
+    Properties Used:
+    N/A
+    """
+
+    residuals = segment.state.residuals
+    layout    = residuals._layout
+    if not segment.state.numerics.contiguous_state:
+        return residuals.pack_array()
+    if layout is None:
+        vector            = residuals.pack_array()
+        layout            = Data()
+        layout.leaves     = state_layout(residuals)
+        layout.buffer     = vector.copy()
+        residuals._layout = layout
+        link_views(residuals,layout)
+        return vector
+
+    buffer = layout.buffer
+    for parent,key,view in layout.views:
+        if parent is None:
+            parent = residuals
+        value = parent[key]
+        if value is not view:
+            if np.shape(value) != view.shape:
+                residuals._layout = None
+                return pack_residuals(segment)
+            view[...]   = value
+            parent[key] = view
+    for parent,key,index in layout.scalars:
+        if parent is None:
+            parent = residuals
+        buffer[index] = parent[key]
+
+    return buffer
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def state_layout(data):
+    """Finds the position of every leaf of a data structure in the vector made by pack_array.
+
+    Assumptions:
+    Same leaves and order as Data.pack_array
+
+    Source:
+    N/A
+
+    Inputs:
+    data         [Data]
+
+    Outputs:
+    leaves       - list of (path, shape, start, stop), shape is () for scalars   [list]
+
+    Properties Used:
+    N/A
+    """
+
+    leaves = []
+    index  = [0]
+
+    def do_layout(D,path):
+        for k,v in D.items():
+            if isinstance(v,dict):
+                do_layout(v,path + (k,))
+                continue
+            elif not isinstance(v,(int,float,np.ndarray)):
+                continue
+            shape = np.shape(v)
+            if len(shape) > 2:
+                continue
+            size = int(np.prod(shape))
+            leaves.append((path + (k,),shape,index[0],index[0] + size))
+            index[0] += size
+
+    do_layout(data,())
+
+    return leaves
+
+## @ingroup Library-Missions-Segments
+def link_views(data, layout):
+    """Replaces the array leaves of a data structure with views of the layout buffer, and keeps the data structure
+    holding each leaf so packing and unpacking do not walk the paths again.
+
+    Assumptions:
+    The data structure itself is kept as None, so the layout it holds does not reference it
+
+    Source:
+    N/A
+
+    Inputs:
+    data           [Data]
+    layout         [Data]
+
+    Outputs:
+    layout.views   - list of (parent, key, view) of the arrays         [list]
+    layout.scalars - list of (parent, key, index) of the scalars       [list]
+
+    Properties Used:
+    N/A
+    """
+
+    layout.views   = []
+    layout.scalars = []
+    for path,shape,start,stop in layout.leaves:
+        parent = get_leaf(data,path[:-1])
+        key    = path[-1]
+        held   = None if parent is data else parent
+        if shape:
+            view        = layout.buffer[start:stop].reshape(shape,order='F')
+            view[...]   = parent[key]
+            parent[key] = view
+            layout.views.append((held,key,view))
+        else:
+            layout.scalars.append((held,key,start))
+
+    return
+
+## @ingroup Library-Missions-Segments
+def get_leaf(data, path):
+    """Gets a leaf of a data structure from its path of keys."""
+    for k in path:
+        data = data[k]
+    return data
+
+## @ingroup Library-Missions-Segments
+def set_leaf(data, path, value):
+    """Sets a leaf of a data structure from its path of keys."""
+    for k in path[:-1]:
+        data = data[k]
+    data[path[-1]] = value
+    return
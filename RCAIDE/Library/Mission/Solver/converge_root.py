@@ -11,6 +11,11 @@
 import scipy.optimize
 import numpy as np 
 
+from .sparse_jacobian  import sparse_jacobian
+from .contiguous_state import pack_unknowns, unpack_unknowns, pack_residuals
+from RCAIDE.Framework.Analyses.Profiler import profiler
+from RCAIDE.Framework.Core import Data
+
 # ----------------------------------------------------------------------------------------------------------------------
 # converge root
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -28,6 +33,8 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]
+    state.numerics.contiguous_state    [boolean]
 
     Outputs:
     state.unknowns                     [Any]
@@ -37,20 +44,32 @@ def converge_root(segment):
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    unknowns = pack_unknowns(segment)
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
-    
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+        
+    if segment.state.numerics.solver_jacobian == "sparse":
+        unknowns,infodict,ier,msg = sparse_root(root_finder,unknowns,segment)
+        
+        # a stalled solve may come from a pattern that misses a dependency, probe it again at the last unknowns
+        if ier in [4,5]:
+            nfev = infodict.get('nfev',0)
+            njev = infodict.get('njev',0)
+            segment.state.numerics.jacobian_sparsity = None
+            unknowns,infodict,ier,msg = sparse_root(root_finder,unknowns,segment)
+            infodict['nfev'] = infodict.get('nfev',0) + nfev
+            infodict['njev'] = infodict.get('njev',0) + njev
+    else:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             maxfev = segment.state.numerics.max_evaluations,
+                                             epsfcn = segment.state.numerics.step_size,
+                                             full_output = 1)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -60,6 +79,9 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        
+    if profiler.active:
+        profiler.record_solver(segment,infodict,segment.converged)
                             
     return
     
@@ -88,12 +110,78 @@ def iterate(unknowns, segment):
     N/A
     """       
     if isinstance(unknowns,np.ndarray):
-        segment.state.unknowns.unpack_array(unknowns)
+        unpack_unknowns(segment,unknowns)
     else:
         segment.state.unknowns = unknowns
         
     segment.process.iterate(segment)
     
-    residuals = segment.state.residuals.pack_array()
+    residuals = pack_residuals(segment)
+    
+    # the contiguous residuals are overwritten by the next evaluation, while the root finder keeps the array
+    if segment.state.numerics.contiguous_state:
+        residuals = residuals.copy()
         
-    return residuals 
\ No newline at end of file
+    return residuals
+
+## @ingroup Library-Missions-Segments
+def sparse_root(root_finder, unknowns, segment):
+    
+    """Solves the segment with the column-colored sparse Jacobian. The residuals of the last evaluation are handed
+    to the Jacobian when it is taken at the same unknowns, as MINPACK does for its dense forward differences, and a
+    Jacobian asked for again at the same unknowns, e.g. by the shape check of fsolve, is not evaluated again. The
+    first Jacobian so costs no more residual evaluations than the dense one.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    root_finder                        [function]
+    unknowns                           [array]
+    state.numerics.tolerance_solution  [Unitless]
+    state.numerics.max_evaluations     [int]
+
+    Outputs:
+    unknowns                           [array]
+    infodict                           [dict]
+    ier                                [int]
+    msg                                [string]
+
+    Properties Used:
+    N/A
+    """       
+    last = Data(unknowns = None, residuals = None, jacobian_unknowns = None, jacobian = None)
+    
+    def residuals(x):
+        f              = iterate(x,segment)
+        last.unknowns  = np.array(x,dtype=float)
+        last.residuals = np.array(f,dtype=float)
+        return f
+    
+    def jacobian(x):
+        if last.jacobian_unknowns is not None and np.array_equal(x,last.jacobian_unknowns):
+            return last.jacobian.copy()
+        f0 = None
+        if last.unknowns is not None and np.array_equal(x,last.unknowns):
+            f0 = last.residuals
+        # the probes leave the segment away from the last evaluation
+        last.unknowns          = None
+        last.jacobian_unknowns = np.array(x,dtype=float)
+        last.jacobian          = sparse_jacobian(x,segment,f0)
+        return last.jacobian.copy()
+    
+    unknowns,infodict,ier,msg = root_finder( residuals,
+                                         unknowns,
+                                         fprime = jacobian,
+                                         xtol = segment.state.numerics.tolerance_solution,
+                                         maxfev = segment.state.numerics.max_evaluations,
+                                         full_output = 1)
+    
+    # the last residual evaluation may have been a rejected step
+    if last.unknowns is None or not np.array_equal(unknowns,last.unknowns):
+        iterate(unknowns,segment)
+    
+    return unknowns,infodict,ier,msg
@@ -0,0 +1,220 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/sparse_jacobian.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from .contiguous_state import unpack_unknowns, pack_residuals
+
+# Package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# sparse_jacobian
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def sparse_jacobian(unknowns, segment, residuals=None):
+    """Computes the Jacobian of the segment residuals with column-colored finite differences. The first call
+    probes every column to find the sparsity pattern, which is the same work as the dense forward difference
+    Jacobian it replaces and gives that Jacobian as well. Columns that do not share any residual are then grouped
+    into colors and perturbed together on every later call. The pattern is stored in state.numerics so repeated
+    evaluations of the segment reuse it, a pattern stored there before the first call is used as is.
+
+    Assumptions:
+    The sparsity pattern found at the first Jacobian evaluation holds throughout the solve. Changes at the level
+    of the roundoff of the residual are not part of the pattern. With numerics.jacobian_probes above one, the
+    pattern is the union of that many probes with steps of different sizes and directions. Between Jacobian
+    evaluations the root finder (MINPACK hybrj) carries the Jacobian forward with Broyden rank-one updates.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974.
+
+    Inputs:
+    unknowns                                 [array]
+    residuals                                - residuals at the unknowns, evaluated
+                                               here if None                [array]
+    segment.state.numerics.step_size         [Unitless]
+    segment.state.numerics.jacobian_probes   [int]
+
+    Outputs:
+    jacobian                                 [array]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics  = segment.state.numerics
+    x0        = np.array(unknowns,dtype=float)
+    if residuals is None:
+        f0 = np.array(evaluate_residuals(x0,segment),dtype=float)
+    else:
+        f0 = np.array(residuals,dtype=float)
+    n_x       = len(x0)
+    n_f       = len(f0)
+    h         = finite_difference_steps(x0,numerics)
+
+    sparsity  = numerics.jacobian_sparsity
+    if not isinstance(sparsity,np.ndarray) or sparsity.shape != (n_f,n_x):
+        jacobian, sparsity         = probe_jacobian(x0,f0,h,numerics.jacobian_probes,segment)
+        numerics.jacobian_sparsity = sparsity
+        numerics.jacobian_colors   = color_jacobian_columns(sparsity)
+        return jacobian
+
+    colors   = numerics.jacobian_colors
+    jacobian = np.zeros((n_f,n_x))
+    for color in range(np.max(colors)+1):
+        columns     = np.where(colors == color)[0]
+        x           = x0.copy()
+        x[columns]  = x[columns] + h[columns]
+        df          = evaluate_residuals(x,segment) - f0
+        for j in columns:
+            rows             = sparsity[:,j]
+            jacobian[rows,j] = df[rows]/h[j]
+
+    return jacobian
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def finite_difference_steps(unknowns, numerics):
+    """Forward difference step sizes of the unknowns, the same as MINPACK fdjac1.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns               [array]
+    numerics.step_size     [Unitless]
+
+    Outputs:
+    h                      [array]
+
+    Properties Used:
+    N/A
+    """
+
+    epsfcn    = numerics.step_size
+    if epsfcn is None:
+        epsfcn = 0.
+    eps       = np.sqrt(np.maximum(epsfcn,np.finfo(float).eps))
+    h         = eps*np.abs(unknowns)
+    h[h==0.]  = eps
+
+    return h
+
+## @ingroup Library-Missions-Segments
+def probe_jacobian(x0, f0, h, probes, segment):
+    """Probes every column of the Jacobian of the segment residuals to find its sparsity pattern. Changes at the
+    level of the roundoff of the residual are not part of the pattern. With more than one probe, the pattern is the
+    union of the probes with steps of h, -2h, 4h, ...
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    x0           - unknowns                                  [array]
+    f0           - residuals at the unknowns                 [array]
+    h            - step sizes                                [array]
+    probes       - number of probes                          [int]
+    segment                                                  [Segment]
+
+    Outputs:
+    jacobian     - forward difference Jacobian of the first probe   [array]
+    sparsity                                                         [boolean array]
+
+    Properties Used:
+    N/A
+    """
+
+    n_x       = len(x0)
+    n_f       = len(f0)
+    tolerance = 4.*np.finfo(float).eps
+    jacobian  = np.zeros((n_f,n_x))
+    sparsity  = np.zeros((n_f,n_x),dtype=bool)
+    for probe in range(max(int(probes),1)):
+        step = h*(-2.)**probe
+        for j in range(n_x):
+            x              = x0.copy()
+            x[j]           = x[j] + step[j]
+            f              = evaluate_residuals(x,segment)
+            df             = f - f0
+            sparsity[:,j] |= np.abs(df) > tolerance*np.maximum(np.abs(f),np.abs(f0))
+            if probe == 0:
+                jacobian[:,j] = df/h[j]
+
+    return jacobian, sparsity
+
+## @ingroup Library-Missions-Segments
+def color_jacobian_columns(sparsity):
+    """Greedy column coloring of a Jacobian sparsity pattern. Two columns get the same color only if they have no
+    nonzero row in common, so they can be perturbed in the same residual evaluation.
+
+    Assumptions:
+    Columns are colored in order of decreasing number of nonzeros
+
+    Source:
+    Coleman, T. F., and More, J. J., "Estimation of Sparse Jacobian Matrices and Graph Coloring Problems",
+    SIAM Journal on Numerical Analysis, 1983.
+
+    Inputs:
+    sparsity    [boolean array]
+
+    Outputs:
+    colors      [integer array]
+
+    Properties Used:
+    N/A
+    """
+
+    n_f, n_x  = sparsity.shape
+    colors    = np.zeros(n_x,dtype=int)
+    used_rows = []
+    for j in np.argsort(-np.sum(sparsity,axis=0),kind='stable'):
+        rows = sparsity[:,j]
+        for color,used in enumerate(used_rows):
+            if not np.any(used & rows):
+                used |= rows
+                colors[j] = color
+                break
+        else:
+            colors[j] = len(used_rows)
+            used_rows.append(rows.copy())
+
+    return colors
+
+## @ingroup Library-Missions-Segments
+def evaluate_residuals(unknowns, segment):
+    """Runs one iteration of all analyses for the segment at the given unknowns and returns the packed residuals.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    segment.process.iterate       [Data]
+
+    Outputs:
+    residuals                     [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    unpack_unknowns(segment,unknowns)
+    segment.process.iterate(segment)
+
+    return pack_residuals(segment)
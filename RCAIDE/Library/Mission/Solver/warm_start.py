@@ -0,0 +1,163 @@
+## @ingroup Library-Missions-Segments
+# RCAIDE/Library/Missions/Segments/warm_start.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# Package imports
+import numpy as np
+from copy import deepcopy
+
+# ----------------------------------------------------------------------------------------------------------------------
+# seed_unknowns
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def seed_unknowns(mission, segment):
+    """Seeds the unknowns of a segment with the last converged solution of the segment with the same mission and
+    segment tags in mission.warm_start_store. If the number of control points has changed since the solution was
+    stored, the solution is interpolated onto the new control points.
+
+    Assumptions:
+    Unknowns that are not in the stored solution, or that have changed number of columns, keep their default guess
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.warm_start_store                  [Data]
+    mission.tag                               [string]
+    segment.tag                               [string]
+    segment.state.numerics.number_of_control_points [Unitless]
+
+    Outputs:
+    seeded                                    [boolean]
+    segment.state.unknowns                    [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    store = mission.warm_start_store
+    if mission.tag not in store or segment.tag not in store[mission.tag]:
+        return False
+
+    stored   = store[mission.tag][segment.tag]
+    numerics = segment.state.numerics
+    x_new    = numerics.discretization_method(numerics.number_of_control_points)[0]
+    x_old    = stored.control_points
+
+    return seed_leaves(segment.state.unknowns,stored.unknowns,x_old,x_new)
+
+## @ingroup Library-Missions-Segments
+def store_unknowns(mission, segment):
+    """Stores the converged unknowns of a segment in mission.warm_start_store, keyed by the mission and segment
+    tags, so later evaluations of the same mission can start from them. A store shared by missions rebuilt with the
+    same tags, e.g. in each iteration of an optimization, carries the solutions from one to the next.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.tag                               [string]
+    segment.tag                               [string]
+    segment.state.unknowns                    [Data]
+
+    Outputs:
+    mission.warm_start_store                  [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+
+    stored                = Data()
+    stored.control_points = numerics.discretization_method(numerics.number_of_control_points)[0]
+    stored.unknowns       = deepcopy(segment.state.unknowns)
+
+    store = mission.warm_start_store
+    if mission.tag not in store:
+        store[mission.tag] = Data()
+    store[mission.tag][segment.tag] = stored
+
+    return
+
+## @ingroup Library-Missions-Segments
+def clear_warm_start(mission):
+    """Removes the stored solutions of a mission, the solutions of other missions in a shared store are kept.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.tag                               [string]
+
+    Outputs:
+    mission.warm_start_store                  [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    if mission.tag in mission.warm_start_store:
+        del mission.warm_start_store[mission.tag]
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Missions-Segments
+def seed_leaves(unknowns, stored, x_old, x_new):
+    """Recursively copies stored unknown arrays into the current unknowns, interpolating along the control points.
+
+    Assumptions:
+    Linear interpolation in the dimensionless control point coordinate
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns     [Data]
+    stored       [Data]
+    x_old        [array]
+    x_new        [array]
+
+    Outputs:
+    seeded       [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    seeded = False
+    for key,value in unknowns.items():
+        if key not in stored:
+            continue
+        old = stored[key]
+        if isinstance(value,Data) and isinstance(old,Data):
+            seeded = seed_leaves(value,old,x_old,x_new) or seeded
+        elif isinstance(value,np.ndarray) and isinstance(old,np.ndarray) and value.ndim == 2 and old.ndim == 2:
+            if value.shape == old.shape:
+                unknowns[key] = old.copy()
+                seeded        = True
+            elif value.shape[1] == old.shape[1] and old.shape[0] == len(x_old) and value.shape[0] == len(x_new):
+                new = np.zeros_like(value)
+                for col in range(value.shape[1]):
+                    new[:,col] = np.interp(x_new,x_old,old[:,col])
+                unknowns[key] = new
+                seeded        = True
+
+    return seeded
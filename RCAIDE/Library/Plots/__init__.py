@@ -9,14 +9,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Geometry           import *  
-from .Aerodynamics       import * 
-from .Common             import *
-from .Emissions          import *  
-from .Energy             import * 
-from .Mission            import *  
-from .Noise              import *
-from .Thermal_Management import * 
-from .Topography         import * 
-from .Stability          import * 
-from .Weights            import *
\ No newline at end of file
+# the plotting functions of the subpackages are loaded on first use, as by 'from .Geometry import *' 
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, star_modules = ['Geometry','Aerodynamics','Common','Emissions','Energy','Mission',
+                                                             'Noise','Thermal_Management','Topography','Stability','Weights'])
@@ -7,9 +7,10 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
- 
 from . import Attributes
 from . import Components 
-from . import Methods 
 from . import Mission
-from . import Plots
\ No newline at end of file
+
+# Methods and Plots are loaded on first use
+from RCAIDE.Framework.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__, submodules = ['Methods','Plots'])
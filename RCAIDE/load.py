@@ -8,6 +8,7 @@
 
 import json
 import pickle
+import os
 from RCAIDE.Framework.Core import Data, DataOrdered
 import numpy as np
 from collections import OrderedDict
@@ -15,9 +16,13 @@ from collections import OrderedDict
 # ----------------------------------------------------------------------------------------------------------------------
 #  load
 # ----------------------------------------------------------------------------------------------------------------------    
-def load(filename,pickle_format = False):
+def load(filename,pickle_format = False,mmap_mode = 'c'):
     """Converts a JSON file into a RCAIDE data structure. 
     
+        A directory written by save(...,binary_format=True) is detected automatically. Its arrays are memory mapped
+        with mmap_mode, the default 'c' (copy on write) reads pages from disk when they are used and keeps any
+        changes in memory. Use mmap_mode = None to read all arrays into memory.
+    
         Assumptions:
             None
             
@@ -27,6 +32,7 @@ def load(filename,pickle_format = False):
         Args:
             filename (string)      : file to be loaded        [unitless] 
             pickle_format (boolean): pickle file format flag  [unitless]
+            mmap_mode (string)     : memory map mode of binary arrays [unitless]
             
         Returns:
             data  : RCAIDE data structure [unitless]  
@@ -36,6 +42,12 @@ def load(filename,pickle_format = False):
         load_file = filename + '.pkl' 
         with open(load_file, 'rb') as file:
             data = pickle.load(file)  
+    elif os.path.isdir(filename):
+        # Binary format, read the index and map the arrays
+        with open(os.path.join(filename,'index.json')) as f:
+            res_dict = json.load(f,object_pairs_hook=OrderedDict)
+        binary = (os.path.join(filename,'arrays'),mmap_mode)
+        data   = read_RCAIDE_json_dict(res_dict,binary)
     else: 
         # Get JSON string
         f = open(filename)
@@ -50,7 +62,7 @@ def load(filename,pickle_format = False):
     
     return data 
 
-def read_RCAIDE_json_dict(res_dict):
+def read_RCAIDE_json_dict(res_dict,binary=None):
     """Builds a RCAIDE data structure based on a dictionary from a JSON file. This is initial case.
 
     Assumptions:
@@ -61,6 +73,7 @@ def read_RCAIDE_json_dict(res_dict):
 
     Args: 
         res_dict     : Dictionary based on the RCAIDE data structure [unitless] 
+        binary       : array directory and memory map mode of a binary save, None otherwise [unitless] 
         
     Returns:
         RCAIDE_data  : RCAIDE data structure [unitless]   
@@ -72,10 +85,10 @@ def read_RCAIDE_json_dict(res_dict):
     for k in keys:
         k = str(k)
         v = res_dict[k]
-        RCAIDE_data[k] = build_data_r(v) # recursive function
+        RCAIDE_data[binary_key(k,binary)] = build_data_r(v,binary) # recursive function
     return RCAIDE_data
  
-def build_data_r(v):
+def build_data_r(v,binary=None):
     """Builds a RCAIDE data structure based on a dictionary from a JSON file. This is recursive step.
 
     Assumptions:
@@ -85,7 +98,8 @@ def build_data_r(v):
         None
 
     Args: 
-        v     : generic value [unitless]  
+        v      : generic value [unitless]  
+        binary : array directory and memory map mode of a binary save, None otherwise [unitless] 
         
     Returns:
         ret  :  value converted to needed format [unitless]   
@@ -93,13 +107,16 @@ def build_data_r(v):
     tv = type(v) # Get value type
     
     # Transform to RCAIDE data structure with appropriate types
-    if tv == OrderedDict:
+    if (tv == OrderedDict) and (binary is not None) and (list(v.keys()) == ['__npy__']):
+        # Arrays of a binary save
+        ret = np.load(os.path.join(binary[0],v['__npy__']),mmap_mode=binary[1])
+    elif tv == OrderedDict:
         keys = v.keys()
         # Recursively assign values
         ret = DataOrdered()
         for k in keys:
             k = str(k)
-            ret[k] = build_data_r(v[k])
+            ret[binary_key(k,binary)] = build_data_r(v[k],binary)
     elif tv == list:
         ret = np.array(v)
     elif (tv == str): 
@@ -113,4 +130,24 @@ def build_data_r(v):
     else:
         raise TypeError('Data type not expected in RCAIDE JSON structure')
 
-    return ret
\ No newline at end of file
+    return ret
+
+def binary_key(k,binary=None):
+    """Removes the escape of a key of a binary save, see RCAIDE.save.binary_key.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args: 
+        k      : key in the index [unitless]  
+        binary : array directory and memory map mode of a binary save, None otherwise [unitless] 
+        
+    Returns:
+        k      : key in the data structure [unitless]   
+    """    
+    if (binary is not None) and k.startswith('\\'):
+        k = k[1:]
+    return k
\ No newline at end of file
@@ -10,13 +10,19 @@ import numpy as np
 import types
 import json
 import pickle
+import os
+import shutil
 from collections import OrderedDict
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  save
 # ----------------------------------------------------------------------------------------------------------------------       
-def save(data,filename,pickle_format = False):
+def save(data,filename,pickle_format = False,binary_format = False):
     """Converts a RCAIDE data structure to a JSON file for storage. 
+    
+    With binary_format the data is stored in a directory instead, with every numpy array as a .npy file and the rest
+    of the structure in a JSON index (index.json) that refers to the arrays. load() memory maps the arrays, so large
+    results open instantly and only the arrays that are used are read.
 
     Assumptions:
         Data must be numpy arrays, strings, booleans, floats, ints, or lists.
@@ -29,6 +35,7 @@ def save(data,filename,pickle_format = False):
         data                   : RCAIDE data structure [unitless]
         filename (string)      : file to be output     [unitless] 
         pickle_format (boolean): pickle file format flag  [unitless]
+        binary_format (boolean): binary directory format flag  [unitless]
 
     Returns:
         None 
@@ -37,6 +44,8 @@ def save(data,filename,pickle_format = False):
         pickle_file  =  filename + '.pkl'
         with open(pickle_file, 'wb') as file:
             pickle.dump(data, file) 
+    elif binary_format:
+        save_binary(data,filename)
     else: 
         # Create a dictionary structure with the results
         res_dict = build_dict_base(data)
@@ -50,7 +59,50 @@ def save(data,filename,pickle_format = False):
         f.close()  
     return  
         
-def build_dict_base(base):
+def save_binary(data,filename):
+    """Writes a RCAIDE data structure to a directory of .npy arrays and a JSON index. The directory is written next
+    to the target and then moved into place, so arrays memory mapped from an earlier save of the same file stay valid.
+
+    Assumptions:
+        Arrays of python objects are stored in the index as lists. An array is referred to as {"__npy__": file}, keys
+        of the data equal to "__npy__" or starting with a backslash are escaped with a backslash so no data reads
+        back as an array.
+
+    Source:
+        None
+
+    Args:
+        data                   : RCAIDE data structure [unitless]
+        filename (string)      : directory to be output     [unitless] 
+
+    Returns:
+        None 
+    """      
+    filename  = os.path.abspath(filename)
+    temporary = filename + '.%d.tmp' % os.getpid()
+    if os.path.exists(temporary):
+        shutil.rmtree(temporary)
+    os.makedirs(os.path.join(temporary,'arrays'))
+    
+    # Create the index, writing the arrays as they are found
+    arrays    = []
+    res_dict  = build_dict_base(data,arrays)
+    for i,array in enumerate(arrays):
+        np.save(os.path.join(temporary,'arrays','%d.npy' % i),array)
+    with open(os.path.join(temporary,'index.json'),'w') as f:
+        json.dump(res_dict,f)
+        
+    # Replace an earlier save
+    if os.path.exists(filename):
+        previous = filename + '.%d.old' % os.getpid()
+        os.rename(filename,previous)
+        os.rename(temporary,filename)
+        shutil.rmtree(previous)
+    else:
+        os.rename(temporary,filename)
+    return
+        
+def build_dict_base(base,arrays=None):
     """Builds a dictionary based on a RCAIDE data structure. This is initial case.
 
     Assumptions:
@@ -61,7 +113,8 @@ def build_dict_base(base):
         None
 
     Args:
-        base  :     RCAIDE data structure [unitless]
+        base   :     RCAIDE data structure [unitless]
+        arrays :     list collecting the arrays of a binary save, None to store arrays as lists [unitless]
 
     Returns:
         base_dict :  Dictionary built on the data structure   [unitless]
@@ -75,10 +128,10 @@ def build_dict_base(base):
     # Assign all values
     for k in keys:
         v = base[k]
-        base_dict[k] = build_dict_r(v) # recursive function
+        base_dict[binary_key(k,arrays)] = build_dict_r(v,arrays) # recursive function
     return base_dict
      
-def build_dict_r(v):
+def build_dict_r(v,arrays=None):
     """Builds a dictionary based on a RCAIDE data structure. This the recursive step.
 
     Assumptions:
@@ -89,7 +142,8 @@ def build_dict_r(v):
         None
 
     Args:
-        v     :  value in a data structure [unitless]
+        v      :  value in a data structure [unitless]
+        arrays :  list collecting the arrays of a binary save, None to store arrays as lists [unitless]
 
     Returns:
         ret   : value based on type of v [unitless]
@@ -100,7 +154,12 @@ def build_dict_r(v):
         return None
     
     # Transform to basic python data type as appropriate
-    if (tv == np.ndarray) or (tv == np.float64):
+    if isinstance(v,np.ndarray) and (arrays is not None) and (v.dtype != object):
+        # Binary arrays are referred to by their file
+        ret = OrderedDict()
+        ret['__npy__'] = '%d.npy' % len(arrays)
+        arrays.append(v)
+    elif isinstance(v,np.ndarray) or (tv == np.float64):
         ret = v.tolist()
     elif (tv == str) or (tv == bool):
         ret = v
@@ -125,6 +184,26 @@ def build_dict_r(v):
         # Recursively assign values
         ret = OrderedDict()
         for k in keys:
-            ret[k] = build_dict_r(v[k])        
+            ret[binary_key(k,arrays)] = build_dict_r(v[k],arrays)        
     
-    return ret
\ No newline at end of file
+    return ret
+
+def binary_key(k,arrays=None):
+    """Escapes a key of a binary save that could be read back as an array reference.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        k      :  key in a data structure [unitless]
+        arrays :  list collecting the arrays of a binary save, None to store arrays as lists [unitless]
+
+    Returns:
+        k      :  key in the index, with a leading backslash if escaped [unitless]
+    """
+    if (arrays is not None) and isinstance(k,str) and ((k == '__npy__') or k.startswith('\\')):
+        k = '\\' + k
+    return k
\ No newline at end of file
@@ -0,0 +1,108 @@
+# Regression/scripts/Tests/benchmarks/airfoil_polar_database_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Library.Methods.Geometry.Airfoil import import_airfoil_geometry, compute_airfoil_properties, clear_airfoil_polar_database
+
+# python imports
+from   concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import tempfile
+import shutil
+import time
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+    try:
+        run_checks(directory)
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+    return
+
+def run_checks(directory):
+
+    airfoils    = os.path.join('..','..','Vehicles','Airfoils')
+    geometry    = import_airfoil_geometry(os.path.join(airfoils,'NACA_4412.txt'))
+    polar_files = [os.path.join(airfoils,'Polars','NACA_4412_polar_Re_%d.txt' % Re) for Re in [50000,100000,200000,500000,1000000]]
+
+    # the first computation stores the properties, the second one loads them
+    tic        = time.perf_counter()
+    computed   = compute_airfoil_properties(geometry,polar_files,use_database=True,database_directory=directory)
+    t_compute  = time.perf_counter() - tic
+    assert len(os.listdir(directory)) == 1
+
+    tic        = time.perf_counter()
+    loaded     = compute_airfoil_properties(geometry,polar_files,use_database=True,database_directory=directory)
+    t_load     = time.perf_counter() - tic
+    check_equal(computed,loaded,'polars')
+    assert isinstance(loaded.lift_coefficients,np.memmap)
+    check_equal(compute_airfoil_properties(geometry,polar_files),loaded,'polars')
+
+    # copies of the polar files give the same properties, other polars or another geometry are stored separately
+    copies     = []
+    for polar_file in polar_files:
+        copies.append(os.path.join(directory,os.path.basename(polar_file)))
+        shutil.copy(polar_file,copies[-1])
+    compute_airfoil_properties(geometry,copies,use_database=True,database_directory=directory)
+    assert len(stored(directory)) == 1
+    compute_airfoil_properties(geometry,polar_files[:3],use_database=True,database_directory=directory)
+    assert len(stored(directory)) == 2
+    geometry.y_coordinates = geometry.y_coordinates*1.01
+    compute_airfoil_properties(geometry,polar_files,use_database=True,database_directory=directory)
+    assert len(stored(directory)) == 3
+
+    # processes storing the same airfoil at once leave one complete entry
+    clear_airfoil_polar_database(directory)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(compute_polars,[directory]*2))
+    assert len(stored(directory)) == 1 and len(os.listdir(directory)) == len(polar_files) + 1
+    for result in results:
+        check_equal(computed,result,'polars')
+    check_equal(computed,compute_polars(directory),'polars')
+
+    print('airfoil properties computed:          %8.3f s' % t_compute)
+    print('airfoil properties from the database: %8.3f s' % t_load)
+
+    return
+
+def compute_polars(directory):
+    """ The properties of the NACA 4412 computed in another process """
+
+    airfoils    = os.path.join('..','..','Vehicles','Airfoils')
+    geometry    = import_airfoil_geometry(os.path.join(airfoils,'NACA_4412.txt'))
+    polar_files = [os.path.join(airfoils,'Polars','NACA_4412_polar_Re_%d.txt' % Re) for Re in [50000,100000,200000,500000,1000000]]
+    Airfoil_Data = compute_airfoil_properties(geometry,polar_files,use_database=True,database_directory=directory)
+
+    return Airfoil_Data
+
+def stored(directory):
+    """ The entries of the database """
+
+    return [key for key in os.listdir(directory) if os.path.isdir(os.path.join(directory,key))]
+
+def check_equal(a,b,path):
+    """ Checks that two data structures hold the same arrays """
+
+    assert set(a.keys()) == set(b.keys()), path
+    for key in a.keys():
+        if hasattr(a[key],'keys'):
+            check_equal(a[key],b[key],path + '.' + key)
+        else:
+            assert np.array_equal(a[key],b[key]), path + '.' + key
+
+    return
+
+if __name__ == '__main__':
+    main()
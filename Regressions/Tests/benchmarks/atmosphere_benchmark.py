@@ -0,0 +1,169 @@
+# Regression/scripts/Tests/benchmarks/atmosphere_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core                       import Units
+from   RCAIDE.Framework.Mission.Common.Conditions  import Conditions
+
+# python imports
+import numpy as np
+import time
+import warnings
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+
+    # tabulated values of the standard atmosphere at the breaks
+    check_standard_values(atmosphere)
+
+    # the layer lookup gives the values of the loop over the layers it replaced, on and between the breaks
+    Rad      = atmosphere.planet.mean_radius
+    breaks   = atmosphere.breaks.altitude
+    altitude = np.vstack([np.linspace(-1.5,85.9,1001)[:,None]*Units.km, (breaks*Rad/(Rad - breaks))[1:-1,None]])
+    for temperature_deviation in [0.,15.]:
+        atmo_data = atmosphere.compute_values(altitude,temperature_deviation)
+        reference = reference_values(atmosphere,altitude,temperature_deviation)
+        for key in reference.keys():
+            assert np.array_equal(atmo_data[key],reference[key]), key
+
+    # memoized values are copies, and are found again when the breaks change, in place as well
+    check_memo()
+
+    # time of a call for the altitudes of a segment
+    altitude   = np.linspace(0.,10.,16)[:,None]*Units.km
+    n          = 2000
+    t_loop     = time_loop(lambda: reference_values(atmosphere,altitude,0.), n)
+    t_layers   = time_loop(lambda: atmosphere.compute_values(altitude,0.), n)
+    atmosphere.settings.memoize_altitude = True
+    t_memo     = time_loop(lambda: atmosphere.compute_values(altitude,0.), n)
+    print('layer loop:   %8.1f us' % t_loop)
+    print('layer lookup: %8.1f us' % t_layers)
+    print('memoized:     %8.1f us' % t_memo)
+
+    return
+
+def check_standard_values(atmosphere):
+
+    Rad      = atmosphere.planet.mean_radius
+    h        = np.array([0.,11.,20.,32.])*Units.km
+    altitude = h*Rad/(Rad - h)
+    atmo     = atmosphere.compute_values(altitude)
+    assert np.all(np.abs(atmo.temperature[:,0] - np.array([288.15,216.65,216.65,228.65])) < 1e-8)
+    assert np.all(np.abs(atmo.pressure[:,0]/np.array([101325.,22632.1,5474.89,868.019]) - 1.) < 1e-4)
+    assert np.abs(atmo.density[0,0] - 1.225) < 1e-3
+
+    return
+
+def check_memo():
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.settings.memoize_altitude = True
+    altitude   = np.linspace(0.,10.,16)[:,None]*Units.km
+
+    first  = atmosphere.compute_values(altitude,0.)
+    second = atmosphere.compute_values(altitude.copy(),0.)
+    assert np.array_equal(first.pressure,second.pressure) and first.pressure is not second.pressure
+    second.pressure[0,0] = 0.
+    assert atmosphere.compute_values(altitude,0.).pressure[0,0] == first.pressure[0,0]
+
+    # a different deviation, or new breaks, are computed again
+    assert np.all(atmosphere.compute_values(altitude,10.).temperature == first.temperature + 10.)
+    atmosphere.breaks.pressure = atmosphere.breaks.pressure*2.
+    assert np.allclose(atmosphere.compute_values(altitude,0.).pressure,2.*first.pressure,rtol=1e-12)
+    atmosphere.breaks.pressure *= 0.5
+    assert np.allclose(atmosphere.compute_values(altitude,0.).pressure,first.pressure,rtol=1e-12)
+    atmosphere.breaks.temperature += 10.
+    assert np.allclose(atmosphere.compute_values(altitude,0.).temperature,first.temperature + 10.,rtol=1e-12)
+    atmosphere.breaks.temperature -= 10.
+
+    # the fluid and the planet are checked again only when their values change
+    gas = RCAIDE.Library.Attributes.Gases.Air()
+    gas.gas_specific_constant = 288.
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        atmosphere.compute_values(altitude,1.)
+        atmosphere.fluid_properties = gas
+        atmosphere.compute_values(altitude,2.)
+        atmosphere.compute_values(altitude,3.)
+        assert len(caught) == 1
+        atmosphere.fluid_properties = RCAIDE.Library.Attributes.Gases.Air()
+        atmosphere.compute_values(altitude,4.)
+        atmosphere.planet.sea_level_gravity = 9.7
+        atmosphere.compute_values(altitude,5.)
+        assert len(caught) == 2
+    assert atmosphere.compute_values(altitude,0.).pressure[-1,0] != first.pressure[-1,0]
+
+    return
+
+def time_loop(function, n):
+    """ Average time of a call in microseconds """
+
+    tic = time.perf_counter()
+    for i in range(n):
+        function()
+    return (time.perf_counter() - tic)/n*1e6
+
+def reference_values(atmosphere, altitude, temperature_deviation):
+    """ The loop over the layers of US_Standard_1976.compute_values before it used the layer constants, kept as a
+        reference
+    """
+
+    gas    = atmosphere.fluid_properties
+    grav   = atmosphere.planet.sea_level_gravity
+    Rad    = atmosphere.planet.mean_radius
+    R      = gas.gas_specific_constant
+    breaks = atmosphere.breaks
+
+    zs = altitude/(1 + altitude/Rad)
+    zs = np.clip(zs,breaks.altitude[0],breaks.altitude[-1])
+
+    zeros = np.zeros_like(zs)
+    p     = zeros * 0.0
+    z0    = zeros * 0.0
+    T0    = zeros * 0.0
+    p0    = zeros * 0.0
+    alpha = zeros * 0.0
+    for i in range( len(breaks.altitude)-1 ):
+        i_inside = (zs >= breaks.altitude[i]) & (zs <= breaks.altitude[i+1])
+        z0[ i_inside ]    = breaks.altitude[i]
+        T0[ i_inside ]    = breaks.temperature[i]
+        p0[ i_inside ]    = breaks.pressure[i]
+        alpha[ i_inside ] = -(breaks.temperature[i+1] - breaks.temperature[i])/ \
+                             (breaks.altitude[i+1]    - breaks.altitude[i])
+
+    dz = zs-z0
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+    T   = T0 - dz*alpha + temperature_deviation
+
+    rho = gas.compute_density(T,p)
+    mu  = gas.compute_absolute_viscosity(T)
+
+    atmo_data = Conditions()
+    atmo_data.expand_rows(zs.shape[0])
+    atmo_data.pressure             = p
+    atmo_data.temperature          = T
+    atmo_data.density              = rho
+    atmo_data.speed_of_sound       = gas.compute_speed_of_sound(T,p)
+    atmo_data.dynamic_viscosity    = mu
+    atmo_data.kinematic_viscosity  = mu/rho
+    atmo_data.thermal_conductivity = gas.compute_thermal_conductivity(T)
+    atmo_data.prandtl_number       = gas.compute_prandtl_number(T)
+
+    return atmo_data
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# Regression/scripts/Tests/benchmarks/bet_airfoil_lookup_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core                                   import Data, Units, interp2d
+from   RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import compute_airfoil_aerodynamics, airfoil_polar_table
+
+# python imports
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # a rotor with four airfoil sections along the blade
+    rng        = np.random.default_rng(0)
+    ctrl_pts   = 16
+    Nr         = 40
+    Na         = 36
+    airfoils   = [airfoil_polars(rng) for i in range(4)]
+    a_loc      = list(np.repeat(np.arange(4),Nr//4))
+    r          = np.linspace(0.2,1.,Nr)
+    c          = 0.1*np.ones(Nr)
+    beta       = np.linspace(30.,10.,Nr)*Units.degrees
+    tc         = 0.12*np.ones(Nr)
+
+    for use_2d_analysis in [True,False]:
+        shape  = (ctrl_pts,Nr,Na) if use_2d_analysis else (ctrl_pts,Nr)
+        Wa     = rng.uniform(5.,40.,size=shape)
+        Wt     = rng.uniform(20.,200.,size=shape)
+        a      = 340.*np.ones(shape)
+        nu     = 1.5E-5*np.ones(shape)
+        chord  = c[None,:,None] if use_2d_analysis else c[None,:]
+        twist  = beta[None,:,None] if use_2d_analysis else beta[None,:]
+
+        tic    = time.perf_counter()
+        for i in range(20):
+            Cl, Cdval, alpha, Ma, W, Re = compute_airfoil_aerodynamics(twist,chord,r,1.,3,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,
+                                                                        Nr,Na,tc,use_2d_analysis)
+        t_gather = (time.perf_counter() - tic)/20
+
+        tic    = time.perf_counter()
+        for i in range(20):
+            Cl_all, Cdval_all = all_stations_lookup(Re,alpha,airfoils,a_loc,shape)
+        t_all    = (time.perf_counter() - tic)/20
+
+        # the stations of each airfoil give the coefficients of the lookup at all the stations, to round-off
+        assert np.allclose(Cl,Cl_all,rtol=1e-12,atol=1e-12) and np.allclose(Cdval,Cdval_all,rtol=1e-12,atol=1e-12)
+
+        print('%s analysis, lookup at all stations: %8.3f ms, stations of each airfoil: %8.3f ms' %
+              ('2D' if use_2d_analysis else '1D',t_all*1E3,t_gather*1E3))
+
+    # the table of an airfoil is kept on its polars, outside of their keys, and follows changes made in place
+    polars = airfoils[0].polars
+    table  = airfoil_polar_table(polars)
+    assert airfoil_polar_table(polars) is table and '_polar_table' not in polars
+    polars.lift_coefficients *= 2.
+    assert np.allclose(airfoil_polar_table(polars)(Re,alpha)[0],2.*table(Re,alpha)[0],rtol=1e-12)
+
+    return
+
+def airfoil_polars(rng):
+    """ An airfoil with lift and drag polars on a grid of reynolds numbers and angles of attack """
+
+    airfoil                          = Data()
+    airfoil.polars                   = Data()
+    airfoil.polars.reynolds_numbers  = np.array([1E4,5E4,1E5,3E5,5E5,7.5E5,1E6])
+    airfoil.polars.angle_of_attacks  = np.linspace(-14,90,105)*Units.degrees
+    slope                            = rng.uniform(5.,6.5,size=(7,1))
+    airfoil.polars.lift_coefficients = slope*np.sin(airfoil.polars.angle_of_attacks)[None,:]
+    airfoil.polars.drag_coefficients = 0.01 + rng.uniform(1.,1.5,size=(7,1))*np.sin(airfoil.polars.angle_of_attacks)[None,:]**2
+
+    return airfoil
+
+def all_stations_lookup(Re,alpha,airfoils,a_loc,shape):
+    """ Coefficients looked up for every airfoil at all the stations, then kept at the stations of the airfoil """
+
+    a_loc = np.array(a_loc)
+    Cl    = np.zeros(shape)
+    Cdval = np.zeros(shape)
+    for jj,airfoil in enumerate(airfoils):
+        pd       = airfoil.polars
+        Cl_af    = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
+        Cdval_af = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
+        locs     = np.where(a_loc == jj)
+        Cl[:,locs]    = Cl_af[:,locs]
+        Cdval[:,locs] = Cdval_af[:,locs]
+    Cl[Cl==0] = 1e-6
+
+    return Cl, Cdval
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# Regression/scripts/Tests/benchmarks/boundary_layer_march_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core                                       import Units
+from   RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method    import airfoil_analysis, thwaites_method, heads_method
+from   RCAIDE.Library.Methods.Geometry.Airfoil                     import compute_naca_4series
+
+# python imports
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # surfaces of different lengths for each case and control point, starting after a masked part
+    npanel, ncases, ncpts = 60, 4, 3
+    rng        = np.random.default_rng(0)
+    start      = rng.integers(5,30,size=(ncases,ncpts))
+    rows       = np.arange(npanel)[:,None,None]
+    mask       = rows < start
+    x          = np.cumsum(rng.uniform(0.005,0.02,size=(npanel,ncases,ncpts)),axis=0)*(~mask)
+    x          = np.ma.array(x - np.take_along_axis(x,start[None],axis=0)*(~mask),mask=mask)
+    Ve         = np.ma.array(1. + 0.3*np.sqrt(x.data) - 0.5*x.data**2,mask=mask)
+    dVe        = np.ma.array(0.15/np.sqrt(x.data + 1E-3) - x.data,mask=mask)
+    L          = x.data[-1]
+    Re_L       = np.array([[1E5,5E5,1E6]])*np.ones((ncases,1))
+
+    # Thwaites method for all the cases and control points at once against one at a time
+    tic        = time.perf_counter()
+    results    = thwaites_method(npanel,ncases,ncpts,L,Re_L,x,Ve,dVe,1E0,1E-5)
+    t_thwaites = time.perf_counter() - tic
+    for case in range(ncases):
+        for cpt in range(ncpts):
+            theta, H, cf = thwaites_column(x[:,case,cpt],Ve[:,case,cpt],dVe[:,case,cpt],L[case,cpt],Re_L[case,cpt],1E0,1E-5)
+            on_surface   = ~mask[:,case,cpt]
+            assert np.allclose(results.THETA_T[on_surface,case,cpt],theta,rtol=1e-12,atol=0)
+            assert np.allclose(results.H_T[on_surface,case,cpt],H,rtol=1e-12,atol=0)
+            assert np.allclose(results.CF_T[on_surface,case,cpt],cf,rtol=1e-12,atol=0)
+            assert np.all(results.THETA_T[mask[:,case,cpt],case,cpt] == 0.)
+
+    # Head's method from the end of the laminar surface, which is empty when its length is zero
+    THETA_0    = results.THETA_T[-1]
+    H_0        = np.full((ncases,ncpts),1.4)
+    CF_0       = results.CF_T[-1]
+    DELTA_0    = 3.8*THETA_0
+    L_turb     = L*1.
+    L_turb[0,0]= 0.
+    tic        = time.perf_counter()
+    results    = heads_method(npanel,ncases,ncpts,DELTA_0,THETA_0,H_0*THETA_0,CF_0,H_0,Re_L,x,Ve,dVe,L_turb,1E0)
+    t_heads    = time.perf_counter() - tic
+    assert np.all(results.THETA_H[:,0,0] == 0.)
+    for case in range(ncases):
+        for cpt in range(ncpts):
+            if L_turb[case,cpt] == 0.:
+                continue
+            theta, H, cf = heads_column(x[:,case,cpt],Ve[:,case,cpt],dVe[:,case,cpt],L_turb[case,cpt],Re_L[case,cpt],
+                                        DELTA_0[case,cpt],THETA_0[case,cpt],H_0[case,cpt]*THETA_0[case,cpt],CF_0[case,cpt],H_0[case,cpt])
+            on_surface   = ~mask[:,case,cpt]
+            assert np.allclose(results.THETA_H[on_surface,case,cpt],theta,rtol=1e-12,atol=0)
+            assert np.allclose(results.H_H[on_surface,case,cpt],H,rtol=1e-12,atol=0)
+            assert np.allclose(results.CF_H[on_surface,case,cpt],cf,rtol=1e-12,atol=0)
+
+    # the sweep of reynolds numbers and angles of attack of the boundary layer properties of an airfoil
+    airfoil_geometry = compute_naca_4series('4412',npoints = 151)
+    AoA_sweep  = np.array([-4,0,2,4,8,10,14])*Units.degrees
+    Re_sweep   = np.array([1,5,10,30,50,75,100])*1E4
+    tic        = time.perf_counter()
+    af_res     = airfoil_analysis(airfoil_geometry,np.tile(AoA_sweep[None,:],(7,1)),np.tile(Re_sweep[:,None],(1,7)))
+    t_airfoil  = time.perf_counter() - tic
+    assert np.all(np.isfinite(af_res.cd_visc)) and np.all(af_res.cd_visc > 0)
+
+    print('Thwaites method of %d surfaces: %8.4f s' % (ncases*ncpts,t_thwaites))
+    print('Head\'s method of %d surfaces:   %8.4f s' % (ncases*ncpts,t_heads))
+    print('airfoil analysis of 7 x 7 cases: %8.3f s' % t_airfoil)
+
+    return
+
+def thwaites_column(x,Ve,dVe,l,Re_L,tol,theta_0):
+    """ Thwaites method of one surface, marched one point at a time """
+
+    x, Ve, dVe = x.compressed(), Ve.compressed(), dVe.compressed()
+    nu         = l/Re_L
+    n          = len(x)
+    theta2_Ve6 = np.zeros(n)
+    theta2_Ve6[0] = (theta_0**2)*Ve[0]**6
+    for i in range(1,n):
+        m             = 0.45*nu*Ve[i-1]**5
+        dx            = x[i] - x[i-1]
+        theta2_Ve6[i] = theta2_Ve6[i-1] + (dx/6)*(m + 2*m + 2*m + m)
+    theta      = np.sqrt(theta2_Ve6/Ve**6)
+    theta      = replace_unconverged(theta,tol)
+    lambda_val = theta**2*dVe/nu
+    H          = np.where(lambda_val > 0,2.61 - 3.75*lambda_val + 5.24*lambda_val**2,0.0731/(0.14 + lambda_val) + 2.088)
+    H[H<0]     = 1E-6
+    H          = replace_unconverged(H,tol)
+    l_val      = np.where(lambda_val > 0,0.22 + 1.57*lambda_val - 1.8*lambda_val**2,
+                          0.22 + 1.402*lambda_val + (0.018*lambda_val)/(0.107 + lambda_val))
+    cf         = abs(2*l_val/(Ve*theta/nu))
+
+    return theta, H, cf
+
+def heads_column(x,Ve,dVe,l,Re_L,delta_0,theta_0,delta_star_0,cf_0,H_0):
+    """ Head's method of one surface, marched one point at a time until the variables at each point converge """
+
+    x, Ve, dVe = x.compressed(), Ve.compressed(), dVe.compressed()
+    n          = len(x)
+    H, Theta, H1, cf, VeThetaH1 = np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n)
+    H[0], Theta[0], cf[0] = H_0, theta_0, cf_0
+    H1[0]        = (delta_0 - delta_star_0)/theta_0
+    H1[0]        = 3.417285 if H1[0] < 3.3 else H1[0]
+    VeThetaH1[0] = Ve[0]*Theta[0]*H1[0]
+    dTheta       = lambda j,T,V: 0.5*cf[j] - (T/Ve[j])*(2+H[j])*(dVe[j])
+    dVeThetaH1   = lambda j,T,V: Ve[j]*0.0306*(((V/(Ve[j]*T))-3)**-0.6169)
+    for i in range(1,n):
+        dx       = x[i] - x[i-1]
+        errors   = np.ones(4)
+        previous = np.array([H[i-1],H1[i-1],Theta[i-1],cf[i-1]])
+        while np.any(abs(errors) > 0.00001):
+            T, V   = Theta[i-1], VeThetaH1[i-1]
+            k1, l1 = dTheta(i-1,T,V), dVeThetaH1(i-1,T,V)
+            k2, l2 = dTheta(i-1,T + k1*dx/2,V + l1*dx/2), dVeThetaH1(i-1,T + k1*dx/2,V + l1*dx/2)
+            k3, l3 = dTheta(i-1,T + k2*dx/2,V + l2*dx/2), dVeThetaH1(i-1,T + k2*dx/2,V + l2*dx/2)
+            k4, l4 = dTheta(i-1,T + k3*dx,V + l2*dx), dVeThetaH1(i-1,T + k3*dx,V + l2*dx)
+            Theta[i]     = T + (dx/6)*(k1 + 2*k2 + 2*k3 + k4)
+            VeThetaH1[i] = V + (dx/6)*(l1 + 2*l2 + 2*l3 + l4)
+            if np.isnan(VeThetaH1[i]):
+                VeThetaH1[i] = VeThetaH1[i-1]
+            H1[i]    = VeThetaH1[i]/(Ve[i]*Theta[i])
+            if H1[i] < 3.3:
+                H[i] = 3.0
+            elif H1[i] < 5.39142:
+                H[i] = 0.6778 + 1.153793*(H1[i]-3.3)**-0.32637
+            else:
+                H[i] = 1.1 + 0.8598636*(H1[i] - 3.3)**-0.777
+            cf[i]    = 0.246*(10**(-0.678*H[i]))*(((Re_L/l)*Ve[i]*Theta[i])**-0.268)
+            current  = np.array([H[i],H1[i],Theta[i],cf[i]])
+            errors   = (current - previous)/current
+            previous = current
+
+    return Theta, H, cf
+
+def replace_unconverged(var,tol):
+    """ Replaces the values that change by more than tol by the previous value, if more than one does so """
+
+    idx1 = np.where(abs((var[1:] - var[:-1])/var[:-1]) > tol)[0]
+    if len(idx1) > 1:
+        np.put(var,idx1 + 1,var[idx1])
+
+    return var
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# Regression/scripts/Tests/benchmarks/contiguous_state_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Library.Mission.Solver import pack_unknowns, unpack_unknowns, pack_residuals
+
+# python imports
+import numpy as np
+import sys
+import time
+from   copy  import deepcopy
+
+sys.path.append('../network_turboprop')
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the solved turboprop climb, with the default and the contiguous state
+    default_segment    = solved_segment()
+    default_segment.state.numerics.contiguous_state = False
+    contiguous_segment = deepcopy(default_segment)
+    contiguous_segment.state.numerics.contiguous_state = True
+
+    vectors = {}
+    for segment in [default_segment,contiguous_segment]:
+        vector = pack_unknowns(segment)
+        segment.process.iterate(segment)
+        pack_residuals(segment)
+        vectors[segment.state.numerics.contiguous_state] = vector
+
+    # unpacking the root finder vector and packing the residuals, as done in every evaluation of the solve
+    n = 2000
+    for tag, segment in [('default',default_segment), ('contiguous',contiguous_segment)]:
+        vector     = vectors[segment.state.numerics.contiguous_state]*1.01
+        t_unpack   = time_loop(lambda: unpack_unknowns(segment,vector), n)
+        t_pack     = time_loop(lambda: pack_residuals(segment), n)
+        print('%-11s unpack unknowns: %6.2f us  pack residuals: %6.2f us' % (tag,t_unpack,t_pack))
+
+    # both give the same state
+    assert np.array_equal(contiguous_segment.state.unknowns.pack_array(),default_segment.state.unknowns.pack_array())
+    assert np.array_equal(pack_residuals(contiguous_segment),pack_residuals(default_segment))
+
+    return
+
+def time_loop(function, n, repeats=5):
+    """ Average time of a call in microseconds, best of several repeats """
+
+    times = []
+    for repeat in range(repeats):
+        tic = time.perf_counter()
+        for i in range(n):
+            function()
+        times.append((time.perf_counter() - tic)/n*1e6)
+    return min(times)
+
+def solved_segment():
+    """ The climb of the turboprop regression mission after it is solved """
+
+    import turboprop_network_test as turboprop
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+    mission  = turboprop.missions_setup(mission).base_mission
+    mission.evaluate()
+
+    return mission.segments.climbing_cruise
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# Regression/scripts/Tests/benchmarks/data_access_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core                       import Data, DataOrdered
+from   RCAIDE.Framework.Mission.Common.Conditions  import Conditions
+
+# python imports
+import numpy as np
+import sys
+import time
+import pickle
+from   copy  import copy, deepcopy
+
+sys.path.append('../../Vehicles')
+sys.path.append('../network_turboprop')
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the Data() api is unchanged
+    check_data_api()
+
+    # attribute access against the exception based lookup Data() used before
+    data      = Data()
+    data.x    = 1.
+    reference = Exception_Data()
+    reference['x'] = 1.
+
+    n = 200000
+    for tag, obj in [('exception lookup',reference), ('Data',data)]:
+        t_get    = time_loop(lambda: obj.x, n)
+        t_method = time_loop(lambda: obj.keys, n)
+        t_set    = time_loop(lambda: setattr(obj,'x',1.), n)
+        print('%-18s get key: %6.1f ns  get method: %6.1f ns  set key: %6.1f ns' % (tag,t_get,t_method,t_set))
+
+    # iterations of a full mission
+    t_iterate = mission_iteration_time()
+    print('turboprop mission iteration: %6.2f ms' % t_iterate)
+
+    return
+
+def check_data_api():
+
+    # keys and attributes are the same thing
+    data        = Data()
+    data.a      = 1.
+    data['b']   = Data()
+    data.b.c    = np.ones(3)
+    assert list(data.keys()) == ['a','b']
+    assert data['a'] == data.a
+    assert data.b.c is data['b']['c']
+    assert data.deep_get('b.c')[0] == 1.
+
+    # keys take precedence over methods, setting the name of a method sets an attribute and not a key
+    data.append       = 2.
+    assert data.append == 2. and 'append' not in data
+    del data.append
+    assert callable(data.append)
+    data['append'] = 3.
+    assert data.append == 3.
+    del data['append']
+
+    # missing keys raise attribute errors when read and key errors when deleted
+    assert not hasattr(data,'d')
+    try:
+        del data.d
+    except KeyError:
+        pass
+    else:
+        raise AssertionError('deleting a missing key did not raise a KeyError')
+
+    # class level attributes are not keys, callable or not
+    conditions          = Conditions()
+    conditions._size    = 4
+    conditions.ones_row = conditions.ones_row
+    conditions.e        = conditions.ones_row(2)
+    assert list(conditions.keys()) == ['e']
+    assert Conditions._size == 1 and conditions.e.shape == (4,2)
+    del conditions.ones_row
+    assert conditions._size == 4 and conditions.ones_row(1).shape == (4,1)
+    
+    # as are attributes added to a class later
+    Conditions._extra = None
+    try:
+        conditions._extra = 1.
+        assert list(conditions.keys()) == ['e'] and conditions._extra == 1.
+    finally:
+        del Conditions._extra
+
+    # copies and pickles keep both
+    for copied in [copy(conditions), deepcopy(conditions), pickle.loads(pickle.dumps(conditions))]:
+        assert type(copied) is Conditions
+        assert copied._size == 4
+        assert list(copied.keys()) == ['e']
+    assert copy(conditions).e is conditions.e
+    assert deepcopy(conditions).e is not conditions.e
+
+    # ordered data
+    ordered   = DataOrdered()
+    ordered.f = 1.
+    ordered.g = 2.
+    ordered.f = 3.
+    assert list(ordered.keys()) == ['f','g'] and ordered[0] == 3.
+    ordered.append = 4.
+    assert list(ordered.keys()) == ['f','g'] and ordered.append == 4.
+
+    return
+
+def time_loop(function, n):
+    """ Average time of a call in nanoseconds """
+
+    tic = time.perf_counter()
+    for i in range(n):
+        function()
+    return (time.perf_counter() - tic)/n*1e9
+
+def mission_iteration_time():
+    """ Average time of one iteration of the turboprop regression mission in milliseconds """
+
+    import turboprop_network_test as turboprop
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+    mission.evaluate()
+
+    segment  = mission.segments.climbing_cruise
+    n        = 50
+    tic      = time.perf_counter()
+    for i in range(n):
+        segment.process.iterate(segment)
+    return (time.perf_counter() - tic)/n*1e3
+
+class Exception_Data(dict):
+    """ The attribute lookup of Data() before it used the instance dictionary, kept as a reference """
+
+    def __getattribute__(self, k):
+        try:
+            return dict.__getitem__(self,k)
+        except:
+            return object.__getattribute__(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            object.__getattribute__(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# Regression/scripts/Tests/benchmarks/data_memory_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core                       import Data
+from   RCAIDE.Framework.Mission.Common.Conditions  import Conditions
+
+# python imports
+import numpy as np
+import sys
+import gc
+import time
+import pickle
+import weakref
+import tracemalloc
+from   copy  import copy, deepcopy
+
+sys.path.append('../network_turboprop')
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # a discarded Data() is freed by reference counting, without the garbage collector
+    check_reference_counting()
+
+    # the same in a full mission: no Data() is left for the garbage collector after an iteration, so the memory
+    # held by the iterations is not waiting for a collection
+    t_iterate, n_collected, held = mission_memory()
+    print('turboprop mission iteration: %6.2f ms' % t_iterate)
+    print('Data() left for the garbage collector per iteration: %6.1f  memory held by %i iterations: %8.1f kB' %
+          (n_collected,50,held/1e3))
+    assert n_collected == 0
+
+    return
+
+def check_reference_counting():
+
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        makes = [Data, Conditions, 
+                 lambda: copy(Data(a=1.)), 
+                 lambda: deepcopy(Data(a=Data(b=1.))), 
+                 lambda: pickle.loads(pickle.dumps(Conditions(a=np.ones(2))))]
+        for make in makes:
+            data           = make()
+            data.c         = np.ones(1000)
+            data.ones_row  = None
+            ref            = weakref.ref(data)
+            del data
+            assert ref() is None
+    finally:
+        if enabled:
+            gc.enable()
+
+    return
+
+def mission_memory():
+    """ Average time of one iteration of the turboprop regression mission in milliseconds, the Data() left for the
+    garbage collector per iteration, and the most memory held while iterating with the collector disabled in bytes """
+
+    import turboprop_network_test as turboprop
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+    mission.evaluate()
+    segment  = mission.segments.climbing_cruise
+
+    n   = 50
+    tic = time.perf_counter()
+    for i in range(n):
+        segment.process.iterate(segment)
+    t_iterate = (time.perf_counter() - tic)/n*1e3
+
+    # the memory held and the Data() left for the collector while it is disabled
+    gc.collect()
+    gc.disable()
+    gc.set_debug(gc.DEBUG_SAVEALL)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for i in range(n):
+            segment.process.iterate(segment)
+        held = tracemalloc.get_traced_memory()[1] - start
+        gc.collect()
+        n_collected = sum([isinstance(obj,Data) for obj in gc.garbage])/n
+    finally:
+        tracemalloc.stop()
+        gc.set_debug(0)
+        gc.garbage.clear()
+        gc.enable()
+
+    return t_iterate, n_collected, held
+
+if __name__ == '__main__':
+    main()
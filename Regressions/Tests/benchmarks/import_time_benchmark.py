@@ -0,0 +1,73 @@
+# Regression/scripts/Tests/benchmarks/import_time_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+
+# python imports
+import os
+import sys
+import subprocess
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the public access paths are unchanged
+    check_access_paths()
+
+    # import times in new interpreters, the best of a few runs
+    n = 3
+    t_import = min([float(run_python('import time; t = time.perf_counter(); import RCAIDE; print(time.perf_counter() - t)'))
+                    for i in range(n)])
+    t_full   = min([float(run_python('import time; t = time.perf_counter(); import RCAIDE;'
+                                     'from RCAIDE.Library.Plots import *; from RCAIDE.Library.Methods import *;'
+                                     'import Legacy.trunk.S.Methods, Legacy.trunk.S.Analyses, Legacy.trunk.S.Components;'
+                                     'print(time.perf_counter() - t)')) for i in range(n)])
+    print('%-32s %6.3f s' % ('import RCAIDE:',t_import))
+    print('%-32s %6.3f s' % ('import RCAIDE, Plots and Legacy:',t_full))
+
+    return
+
+def check_access_paths():
+
+    Library = RCAIDE.Library
+    assert callable(Library.Plots.plot_airfoil)
+    assert callable(Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM)
+    assert callable(Library.Methods.skip)
+    assert isinstance(Library.Methods.Energy.__name__, str)
+    assert isinstance(RCAIDE.Vehicle(), RCAIDE.Vehicle)
+
+    # legacy shims
+    from RCAIDE.Framework.Networks import legacy_turbojet
+    assert legacy_turbojet.__name__ == 'Turbojet_Super'
+    assert Library.Components.Landing_Gear.Main_Landing_Gear.__name__ == 'Main_Landing_Gear'
+
+    # a class imported after its module keeps the class name in the package
+    import Legacy.trunk.S.Analyses.Aerodynamics.Vortex_Lattice
+    from   Legacy.trunk.S.Analyses import Aerodynamics
+    assert isinstance(Aerodynamics.Vortex_Lattice, type)
+
+    # listing and star imports still see everything
+    assert 'Aerodynamics' in dir(Library.Methods)
+    assert 'plot_airfoil' in Library.Plots.__all__
+
+    return
+
+def run_python(code):
+    """ Runs python code in a new interpreter and returns what it prints """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(RCAIDE.__file__)))
+    env  = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([root] + [p for p in env.get('PYTHONPATH','').split(os.pathsep) if p])
+    return subprocess.check_output([sys.executable,'-c',code],env=env,text=True).strip()
+
+if __name__ == '__main__':
+    main()
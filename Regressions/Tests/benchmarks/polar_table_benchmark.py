@@ -0,0 +1,72 @@
+# Regression/scripts/Tests/benchmarks/polar_table_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core import Units, interp2d, Polar_Table
+
+# python imports
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # polars on the reynolds numbers of the polar files and the uniform angles of attack of the airfoil properties
+    rng      = np.random.default_rng(0)
+    Re_grid  = np.array([5E4,1E5,2E5,5E5,1E6])
+    aoa_grid = np.linspace(-14,90,105)*Units.degrees
+    Cl_grid  = rng.uniform(5.,6.5,size=(5,1))*np.sin(aoa_grid)[None,:]
+    Cd_grid  = 0.01 + rng.uniform(1.,1.5,size=(5,1))*np.sin(aoa_grid)[None,:]**2
+    table    = Polar_Table(Re_grid,aoa_grid,Cl_grid,Cd_grid)
+    assert table.x_spacing is None and np.isclose(table.y_spacing,Units.degrees)
+
+    # blade stations of a 2D rotor analysis, including points outside of the polars
+    shape    = (16,40,36)
+    Re       = rng.uniform(1E4,2E6,size=shape)
+    alpha    = rng.uniform(-20,100,size=shape)*Units.degrees
+    Cl, Cd   = table(Re,alpha)
+    assert np.allclose(Cl,interp2d(Re,alpha,Re_grid,aoa_grid,Cl_grid),rtol=1e-12,atol=1e-12)
+    assert np.allclose(Cd,interp2d(Re,alpha,Re_grid,aoa_grid,Cd_grid),rtol=1e-12,atol=1e-12)
+
+    # the grid points, a single point and the output arrays
+    Re_points, aoa_points = np.meshgrid(Re_grid,aoa_grid,indexing='ij')
+    Cl_points, Cd_points  = table(Re_points,aoa_points)
+    assert np.allclose(Cl_points,Cl_grid,rtol=0,atol=1e-12) and np.allclose(Cd_points,Cd_grid,rtol=0,atol=1e-12)
+    Cl_point, Cd_point    = table(3E5,4*Units.degrees)
+    assert np.shape(Cl_point) == () and np.isclose(Cl_point,interp2d(3E5,4*Units.degrees,Re_grid,aoa_grid,Cl_grid))
+    out      = (np.empty(shape),np.empty(shape))
+    results  = table(Re,alpha,out=out)
+    assert results[0] is out[0] and results[1] is out[1] and np.array_equal(out[0],Cl) and np.array_equal(out[1],Cd)
+
+    # uniform reynolds numbers are located as well as the other ones
+    uniform  = Polar_Table(np.linspace(5E4,1E6,5),aoa_grid,Cl_grid,Cd_grid)
+    assert uniform.x_spacing is not None
+    assert np.allclose(uniform(Re,alpha)[0],interp2d(Re,alpha,np.linspace(5E4,1E6,5),aoa_grid,Cl_grid),rtol=1e-12,atol=1e-12)
+
+    n_evals  = 50
+    tic      = time.perf_counter()
+    for i in range(n_evals):
+        interp2d(Re,alpha,Re_grid,aoa_grid,Cl_grid)
+        interp2d(Re,alpha,Re_grid,aoa_grid,Cd_grid)
+    t_interp = (time.perf_counter() - tic)/n_evals
+
+    tic      = time.perf_counter()
+    for i in range(n_evals):
+        table(Re,alpha,out=out)
+    t_table  = (time.perf_counter() - tic)/n_evals
+
+    print('lift and drag at %d points, interp2d:    %8.3f ms' % (Re.size,t_interp*1E3))
+    print('lift and drag at %d points, polar table: %8.3f ms' % (Re.size,t_table*1E3))
+
+    return
+
+if __name__ == '__main__':
+    main()
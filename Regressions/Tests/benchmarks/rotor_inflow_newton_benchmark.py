@@ -0,0 +1,107 @@
+# Regression/scripts/Tests/benchmarks/rotor_inflow_newton_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core import Data, Units
+from   Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_Zero.fidelity_zero_wake_convergence import newton_inflow_solve, compute_dR_dpsi, iteration
+
+# python imports
+import numpy as np
+import scipy as sp
+import time
+import sys
+
+sys.path.append('../../Vehicles/Rotors')
+from F8745_D4_Propeller  import F8745_D4_Propeller
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    prop = F8745_D4_Propeller()
+
+    # a rotor at 16 flight speeds, and at 4 flight speeds with an inflow varying around the azimuth
+    for use_2d_analysis, ctrl_pts, Na in [(False,16,1),(True,4,12)]:
+        wake_inputs = rotor_wake_inputs(prop,ctrl_pts,Na,use_2d_analysis)
+        shape       = (ctrl_pts,wake_inputs.Nr,Na) if use_2d_analysis else (ctrl_pts,wake_inputs.Nr)
+        PSI         = np.ones(shape)
+
+        # the analytical derivative against the residual of the iteration
+        R, dR_dpsi  = compute_dR_dpsi(PSI,wake_inputs,prop)
+        h           = 1E-6
+        dR_fd       = (iteration(PSI + h,wake_inputs,prop) - iteration(PSI - h,wake_inputs,prop)).reshape(shape)/(2*h)
+        assert np.allclose(R.flatten(),iteration(PSI,wake_inputs,prop),rtol=1e-12,atol=1e-12)
+        assert np.allclose(dR_dpsi,dR_fd,rtol=1e-5,atol=1e-8)
+
+        tic         = time.perf_counter()
+        PSI_newton, converged = newton_inflow_solve(PSI,wake_inputs,prop,prop.sol_tolerance)
+        t_newton    = time.perf_counter() - tic
+
+        tic         = time.perf_counter()
+        PSI_fsolve, infodict, ier, msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,prop),xtol=prop.sol_tolerance,full_output = 1,band=(1,0))
+        t_fsolve    = time.perf_counter() - tic
+
+        # all the stations converge to the inflow angles of fsolve
+        assert ier == 1 and np.all(converged)
+        assert np.allclose(PSI_newton,PSI_fsolve.reshape(shape),rtol=0,atol=1e-6)
+        assert np.max(abs(compute_dR_dpsi(PSI_newton,wake_inputs,prop)[0])) < 1e-5
+
+        print('%s analysis of %5d stations, fsolve: %8.3f s, Newton: %8.3f s' %
+              ('2D' if use_2d_analysis else '1D',np.prod(shape),t_fsolve,t_newton))
+
+    # a station that cannot converge in the iterations is flagged
+    wake_inputs = rotor_wake_inputs(prop,16,1,False)
+    PSI, converged = newton_inflow_solve(np.ones((16,wake_inputs.Nr)),wake_inputs,prop,prop.sol_tolerance,maximum_iterations=2)
+    assert not np.all(converged)
+
+    return
+
+def rotor_wake_inputs(prop,ctrl_pts,Na,use_2d_analysis):
+    """ The wake inputs of a rotor at 2200 rpm from 10 to 60 m/s, as packed by compute_rotor_performance """
+
+    V     = np.linspace(10.,60.,ctrl_pts)[:,None]
+    omega = 2200.*Units.rpm
+    r     = prop.radius_distribution
+    Nr    = len(r)
+    a     = 340.*np.ones((ctrl_pts,1))
+    nu    = 1.5E-5*np.ones((ctrl_pts,1))
+    if use_2d_analysis:
+        psi   = np.linspace(0,2*np.pi,Na + 1)[:-1]
+        Ua    = V[:,:,None]*(1. + 0.2*np.sin(psi))[None,None,:]*np.ones((1,Nr,1))
+        Ut    = np.tile((omega*r)[None,:,None],(ctrl_pts,1,Na)) - 0.1*V[:,:,None]*np.cos(psi)[None,None,:]
+        beta  = np.tile(prop.twist_distribution[None,:,None],(ctrl_pts,1,Na))
+        c     = np.tile(prop.chord_distribution[None,:,None],(ctrl_pts,1,Na))
+        r     = np.tile(r[None,:,None],(ctrl_pts,1,Na))
+        a     = np.tile(a[:,:,None],(1,Nr,Na))
+        nu    = np.tile(nu[:,:,None],(1,Nr,Na))
+    else:
+        Ua    = V*np.ones((1,Nr))
+        Ut    = np.tile(omega*r,(ctrl_pts,1))
+        beta  = prop.twist_distribution
+        c     = prop.chord_distribution
+
+    wake_inputs                       = Data()
+    wake_inputs.velocity_total        = np.sqrt(Ua*Ua + Ut*Ut)
+    wake_inputs.velocity_axial        = Ua
+    wake_inputs.velocity_tangential   = Ut
+    wake_inputs.ctrl_pts              = ctrl_pts
+    wake_inputs.Nr                    = Nr
+    wake_inputs.Na                    = Na
+    wake_inputs.use_2d_analysis       = use_2d_analysis
+    wake_inputs.twist_distribution    = beta
+    wake_inputs.chord_distribution    = c
+    wake_inputs.radius_distribution   = r
+    wake_inputs.speed_of_sounds       = a
+    wake_inputs.dynamic_viscosities   = nu
+
+    return wake_inputs
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+# Regression/scripts/Tests/benchmarks/rotor_performance_map_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core import Data, Units
+from   RCAIDE.Library.Methods.Propulsors.Converters.Rotor import compute_rotor_performance, compute_rotor_performance_map
+from   RCAIDE.Library.Methods.Propulsors.Converters.Rotor.evaluate_rotor_performance_map import evaluate_rotor_performance_map
+
+# python imports
+import numpy as np
+import time
+import sys
+import warnings
+
+sys.path.append('../../Vehicles/Rotors')
+from F8745_D4_Propeller  import F8745_D4_Propeller
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    prop                                      = F8745_D4_Propeller()
+    performance_map                           = prop.performance_map
+    performance_map.advance_ratios            = np.linspace(0.,1.2,25)
+    performance_map.tip_mach_numbers          = np.linspace(0.5,0.8,7)
+    performance_map.altitudes                 = np.array([0.,1500.,3000.])
+
+    # the accuracy of the map is checked at a sample of operating points
+    rng                                       = np.random.default_rng(0)
+    performance_map.accuracy_check_points     = Data(advance_ratios   = rng.uniform(0.05,1.15,30),
+                                                     tip_mach_numbers = rng.uniform(0.5,0.8,30),
+                                                     altitudes        = rng.uniform(0.,3000.,30))
+
+    tic     = time.perf_counter()
+    compute_rotor_performance_map(prop)
+    t_map   = time.perf_counter() - tic
+    assert performance_map.active
+    for tag, error in performance_map.accuracy.maximum_relative_error.items():
+        print('%-20s map error at the sample points: %8.5f' % (tag,error))
+        assert error < 1E-2
+
+    # the map evaluated by two processes gives the same tables
+    surrogates                              = performance_map.surrogates
+    performance_map.workers                 = 2
+    performance_map.points_per_evaluation   = 100
+    compute_rotor_performance_map(prop)
+    assert np.array_equal(surrogates.coefficients.values,performance_map.surrogates.coefficients.values)
+    assert np.array_equal(surrogates.blade_distributions.values,performance_map.surrogates.blade_distributions.values)
+
+    # at the grid points, the map gives the loads and blade distributions of the BEMT
+    a       = atmosphere_values(np.zeros((1,1))).speed_of_sound[0,0]
+    omega   = performance_map.tip_mach_numbers*a/prop.tip_radius
+    J       = performance_map.advance_ratios[[2,6,10,14,18,20,24]]
+    V       = (J*omega*prop.tip_radius/np.pi)[:,None]
+    BEMT    = rotor_performance(prop,V,omega[:,None],np.zeros_like(V),False)
+    tables  = rotor_performance(prop,V,omega[:,None],np.zeros_like(V),True)
+    for tag in ['thrust','torque','power','blade_dT_dr','blade_dQ_dr','blade_axial_velocity','lift_coefficient']:
+        assert np.allclose(tables[tag],BEMT[tag],rtol=1E-6,atol=1E-6*np.max(abs(BEMT[tag])))
+
+    # the map has a single pitch command, points at another pitch command are evaluated at it with a warning
+    points = np.array([[0.5,0.6,0.,0.,1000.]])
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        evaluate_rotor_performance_map(performance_map,points)
+        assert len(caught) == 0
+        points[0,2] = 5. * Units.degrees
+        evaluate_rotor_performance_map(performance_map,points)
+        assert len(caught) == 1 and 'pitch_commands' in str(caught[0].message)
+
+    # a climb between the grid points
+    ctrl_pts = 16
+    V        = np.linspace(10.,60.,ctrl_pts)[:,None]
+    omega    = np.linspace(2000.,2400.,ctrl_pts)[:,None]*Units.rpm
+    altitude = np.linspace(0.,2500.,ctrl_pts)[:,None]
+    n_evals  = 20
+
+    tic      = time.perf_counter()
+    for i in range(n_evals):
+        BEMT   = rotor_performance(prop,V,omega,altitude,False)
+    t_BEMT   = (time.perf_counter() - tic)/n_evals
+
+    tic      = time.perf_counter()
+    for i in range(n_evals):
+        tables = rotor_performance(prop,V,omega,altitude,True)
+    t_tables = (time.perf_counter() - tic)/n_evals
+
+    for tag in ['thrust','torque','power']:
+        assert np.max(abs(tables[tag] - BEMT[tag]))/np.max(abs(BEMT[tag])) < 1E-2
+
+    print('performance map of %d points: %8.3f s' % (surrogates.coefficients.values[...,0].size,t_map))
+    print('rotor at %d control points, BEMT: %8.3f ms, performance map: %8.3f ms' % (ctrl_pts,t_BEMT*1E3,t_tables*1E3))
+
+    return
+
+def atmosphere_values(altitude):
+    """ The US Standard 1976 atmosphere at the altitudes """
+
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+
+    return atmosphere.compute_values(altitude)
+
+def rotor_performance(prop,V,omega,altitude,use_performance_map):
+    """ The outputs of compute_rotor_performance of a propeller at full throttle, flying along its axis """
+
+    ctrl_pts    = len(V)
+    atmo_data   = atmosphere_values(altitude)
+    propulsor   = Data(tag = 'propulsor', propeller = prop)
+    bus         = Data(tag = 'bus')
+    state       = Data(conditions = Data())
+    conditions  = state.conditions
+    conditions.freestream                        = Data()
+    conditions.freestream.altitude               = altitude
+    conditions.freestream.density                = atmo_data.density
+    conditions.freestream.dynamic_viscosity      = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound         = atmo_data.speed_of_sound
+    conditions.freestream.temperature            = atmo_data.temperature
+    conditions.frames                            = Data(body = Data(), inertial = Data())
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.inertial.velocity_vector   = np.hstack([V,np.zeros((ctrl_pts,2))])
+    propulsor_conditions                         = Data(commanded_thrust_vector_angle = np.zeros((ctrl_pts,1)))
+    propulsor_conditions[prop.tag]               = Data(throttle      = np.ones((ctrl_pts,1)),
+                                                        omega         = omega,
+                                                        pitch_command = np.zeros((ctrl_pts,1)))
+    conditions.energy                            = Data()
+    conditions.energy[bus.tag]                   = Data()
+    conditions.energy[bus.tag][propulsor.tag]    = propulsor_conditions
+
+    compute_rotor_performance(propulsor,state,bus,use_performance_map = use_performance_map)
+
+    return conditions.energy[bus.tag][propulsor.tag][prop.tag]
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+# Regression/scripts/Tests/benchmarks/shared_identical_results_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core import Units, shared_view, unshare_array
+
+# python imports
+import numpy as np
+import time
+import sys
+from   copy  import deepcopy
+
+sys.path.append('../../Vehicles')
+sys.path.append('../network_turbofan')
+sys.path.append('../network_electric')
+from Lockheed_C5a         import vehicle_setup as C5a_vehicle_setup
+from Electric_Twin_Otter  import vehicle_setup as Twin_Otter_vehicle_setup, configs_setup as Twin_Otter_configs_setup
+import turbofan_network_test
+import electric_btms_test
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # a transport with 4 identical turbofans: the last 3 share the results of the first one
+    vehicle    = C5a_vehicle_setup()
+    mission    = C5a_mission_setup(turbofan_network_test.base_analysis(vehicle))
+    mission.evaluate()
+    segment    = mission.segments.cruise
+    fuel_line  = vehicle.networks.fuel.fuel_lines.fuel_line
+    conditions = segment.state.conditions.energy[fuel_line.tag]
+    tags       = [propulsor.tag for propulsor in fuel_line.propulsors]
+    for tag in tags[1:]:
+        check_shared_results(conditions[tags[0]],conditions[tag])
+
+    # a downstream consumer writing into a shared array copies it, the first turbofan does not change
+    throttle = conditions[tags[0]].throttle.copy()
+    unshare_array(conditions[tags[1]],'throttle')[:,0] = 0.5
+    assert np.array_equal(conditions[tags[0]].throttle,throttle)
+    assert np.all(conditions[tags[1]].throttle == 0.5)
+
+    t_deepcopy, t_shared = copy_times(conditions[tags[0]])
+    t_iterate            = iteration_time(segment)
+    print('turbofan results,     deepcopy: %8.3f ms  shared view: %8.3f ms' % (t_deepcopy,t_shared))
+    print('4 engine cruise iteration:      %8.3f ms' % t_iterate)
+
+    # an electric aircraft with 12 identical battery modules: the last 11 share the results of the first one
+    vehicle    = Twin_Otter_vehicle_setup('lithium_ion_nmc',None)
+    analyses   = electric_btms_test.analyses_setup(Twin_Otter_configs_setup(vehicle))
+    mission    = electric_btms_test.mission_setup(analyses)
+    mission.evaluate()
+    segment    = mission.segments.climb
+    bus        = vehicle.networks.electric.busses.bus
+    conditions = segment.state.conditions.energy[bus.tag].battery_modules
+    tags       = [battery.tag for battery in bus.battery_modules]
+    assert len(tags) == 12
+    for tag in tags[1:]:
+        check_shared_results(conditions[tags[0]],conditions[tag])
+
+    # the identical propulsors of the bus share the results of the first one as well
+    propulsor_0, propulsor_1 = bus.propulsors
+    for converter in ['motor','rotor','electronic_speed_controller']:
+        check_shared_results(segment.state.conditions.energy[bus.tag][propulsor_0.tag][propulsor_0[converter].tag],
+                             segment.state.conditions.energy[bus.tag][propulsor_1.tag][propulsor_1[converter].tag])
+
+    t_deepcopy, t_shared = copy_times(conditions[tags[0]])
+    t_iterate            = iteration_time(segment)
+    ctrl_pts             = segment.state.numerics.number_of_control_points
+    print('battery results,      deepcopy: %8.3f ms  shared view: %8.3f ms  (%d copies per iteration)' %
+          (t_deepcopy,t_shared,(len(tags) - 1)*ctrl_pts))
+    print('12 battery module iteration:    %8.3f ms' % t_iterate)
+
+    assert t_shared < t_deepcopy
+
+    return
+
+def check_shared_results(reference,shared):
+    """ The arrays of an identical unit are read-only views of the arrays of the reference unit, except the moments
+        which depend on the position of the unit """
+
+    reference_arrays = arrays(reference)
+    shared_arrays    = arrays(shared)
+    for path, array in reference_arrays.items():
+        if path[-1] == 'moment':
+            continue
+        view = shared_arrays[path]
+        assert view is not array and np.shares_memory(view,array)
+        assert not view.flags.writeable and np.array_equal(view,array)
+
+    # writing into a shared array raises an error instead of changing the reference unit
+    path, array = next((path, array) for path, array in shared_arrays.items() if not array.flags.writeable)
+    try:
+        array[...] = 0.
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('the shared array %s is writeable' % '.'.join(path))
+
+    return
+
+def arrays(data,path=()):
+    """ The arrays of a Data structure by their path """
+
+    found = {}
+    for key, value in dict.items(data):
+        if isinstance(value,np.ndarray):
+            found[path + (key,)] = value
+        elif isinstance(value,dict):
+            found.update(arrays(value,path + (key,)))
+
+    return found
+
+def copy_times(conditions):
+    """ Best time in milliseconds of a deepcopy and of a shared view of the conditions of a unit """
+
+    n          = 50
+    t_deepcopy = np.inf
+    t_shared   = np.inf
+    for repeat in range(5):
+        tic = time.perf_counter()
+        for i in range(n):
+            deepcopy(conditions)
+        t_deepcopy = min(t_deepcopy,(time.perf_counter() - tic)/n*1E3)
+
+        tic = time.perf_counter()
+        for i in range(n):
+            shared_view(conditions)
+        t_shared   = min(t_shared,(time.perf_counter() - tic)/n*1E3)
+
+    return t_deepcopy, t_shared
+
+def iteration_time(segment):
+    """ Average time in milliseconds of one iteration of a segment """
+
+    n   = 20
+    tic = time.perf_counter()
+    for i in range(n):
+        segment.process.iterate(segment)
+
+    return (time.perf_counter() - tic)/n*1E3
+
+def C5a_mission_setup(analyses):
+    """ A cruise of the 4 engine transport """
+
+    mission      = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag  = 'the_mission'
+    Segments     = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points = 16
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = 'cruise'
+    segment.analyses.extend(analyses)
+    segment.altitude                                                 = 9.  * Units.km
+    segment.air_speed                                                = 230. * Units['m/s']
+    segment.distance                                                 = 1000. * Units.km
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                                  = True
+    segment.flight_dynamics.force_z                                  = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['outer_starboard_propulsor','inner_starboard_propulsor',
+                                                                         'inner_port_propulsor','outer_port_propulsor']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# Regression/scripts/Tests/benchmarks/unit_conversion_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from   RCAIDE.Framework.Core            import Units
+from   RCAIDE.Framework.Core.Units      import registry
+from   Legacy.trunk.S.Core.Units        import Units as Legacy_Units, registry as legacy_registry
+
+# python imports
+import numpy as np
+import sys
+import time
+
+sys.path.append('../../Vehicles')
+sys.path.append('../network_turboprop')
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the table gives the conversions of pint
+    check_units()
+
+    # single conversions, pint against the table
+    x     = 25.
+    omega = np.linspace(100.,300.,16)[:,None]
+    n     = 20000
+    for tag, units in [('pint',registry), ('table',Units)]:
+        t_mul = time_loop(lambda: x * units.deg, n)
+        t_div = time_loop(lambda: omega / units.rpm, n)
+        t_exp = time_loop(lambda: x * units['ft/min'], n)
+        print('%-6s x*Units.deg: %8.1f ns  omega/Units.rpm: %8.1f ns  x*Units[\'ft/min\']: %8.1f ns' % (tag,t_mul,t_div,t_exp))
+
+    # a full mission, with the registries put back in place of the tables, after a first run which imports all the
+    # modules it uses
+    mission_time(pint=False)
+    t_pint, R_pint   = mission_time(pint=True)
+    t_table, R_table = mission_time(pint=False)
+    print('turboprop mission with pint:  %6.3f s' % t_pint)
+    print('turboprop mission with table: %6.3f s' % t_table)
+    assert np.abs(R_table/R_pint - 1) < 1e-10
+
+    return
+
+def check_units():
+
+    names       = ['deg','ft','feet','km','lbs','kg','inches','knots','min','rpm','nmi','kW','hours','hp','psi','slug',
+                   'mph','degR','Wh','less','N','fts']
+    expressions = ['m/s','ft/min','meters**2','kg/(m**3)','lb/hp/hr','J/(kg*K)','(rpm**2)*ohm/(V**2)']
+    x           = np.linspace(0.1,1000.,101)
+
+    for name in names:
+        ratio = getattr(Units,name)
+        assert type(ratio) in (int,float)
+        assert np.all(np.abs(x*ratio - x*getattr(registry,name)) <= 1e-15*np.abs(x*ratio))
+        assert np.all(np.abs(x/ratio - x/getattr(registry,name)) <= 1e-15*np.abs(x/ratio))
+        assert getattr(Units,name) is ratio
+    for expression in expressions:
+        assert np.abs(Units[expression] - 1.*registry[expression]) <= 1e-15*Units[expression]
+
+    # base units keep ints, as with pint
+    assert type(5*Units.kg) is int and type(5*Units['m/s']) is int
+
+    # units with an offset are converted by pint
+    assert 100.*Units.degF == 100.*registry.degF
+    assert np.all(np.array([0.,100.])*Units.degC == np.array([273.15,373.15]))
+    assert np.abs(373.15/Units.degC - 100.) < 1e-10
+
+    # the table is read-only
+    try:
+        Units.deg = 1.
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('the unit table was changed')
+
+    return
+
+def time_loop(function, n):
+    """ Average time of a call in nanoseconds """
+
+    tic = time.perf_counter()
+    for i in range(n):
+        function()
+    return (time.perf_counter() - tic)/n*1e9
+
+def mission_time(pint):
+    """ Time to set up and evaluate the turboprop regression mission, optionally with the pint registries in place
+        of the unit tables in every loaded module
+    """
+
+    import turboprop_network_test as turboprop
+
+    swaps = {id(Units): registry, id(Legacy_Units): legacy_registry}
+    moved = []
+    if pint:
+        for module in list(sys.modules.values()):
+            namespace = getattr(module,'__dict__',None)
+            if namespace is not None and id(namespace.get('Units')) in swaps:
+                moved.append((namespace,namespace['Units']))
+                namespace['Units'] = swaps[id(namespace['Units'])]
+
+    try:
+        tic      = time.perf_counter()
+        vehicle  = turboprop.vehicle_setup()
+        configs  = turboprop.configs_setup(vehicle)
+        analyses = turboprop.analyses_setup(configs)
+        mission  = turboprop.mission_setup(analyses)
+        results  = mission.evaluate()
+        elapsed  = time.perf_counter() - tic
+    finally:
+        for namespace, table in moved:
+            namespace['Units'] = table
+
+    return elapsed, results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+
+if __name__ == '__main__':
+    main()
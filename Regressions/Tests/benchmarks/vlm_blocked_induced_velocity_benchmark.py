@@ -0,0 +1,84 @@
+# Regression/scripts/Tests/benchmarks/vlm_blocked_induced_velocity_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import generate_vortex_distribution, compute_wing_induced_velocity
+
+# python imports
+import numpy as np
+import tracemalloc
+import time
+import sys
+
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    analysis = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    VD       = generate_vortex_distribution(vehicle,analysis.settings)
+    n_cp     = VD.n_cp
+
+    # subsonic and supersonic mach numbers, some of which make the transverse legs of the swept panels sonic
+    mach     = np.atleast_2d(np.array([0.3,0.8,1.1,1.15,1.2,2.0])).T
+    rng      = np.random.default_rng(0)
+    normals  = rng.standard_normal((n_cp,3))
+
+    # a single block of all the receiving points
+    tic                = time.perf_counter()
+    C_mn, s, RFLAG, EW = compute_wing_induced_velocity(VD,mach,compute_EW=True)
+    t_single           = time.perf_counter() - tic
+    assert C_mn.shape == (len(mach),n_cp,n_cp,3) and C_mn.dtype == np.float32
+    assert np.any(RFLAG == 0)
+    A_single           = compute_wing_induced_velocity(VD,mach,normals=normals)[0]
+    A_projected        = C_mn[...,0]*normals[:,0,None] + C_mn[...,1]*normals[:,1,None] + C_mn[...,2]*normals[:,2,None]
+    assert np.array_equal(A_single,A_projected)
+
+    # blocks of a few receiving points give the same matrices, also when a block does not end on a sonic panel
+    row_memory = 48*4*len(mach)*n_cp
+    for max_memory in [1,7*row_memory,100*row_memory]:
+        C_mn_b, s_b, RFLAG_b, EW_b = compute_wing_induced_velocity(VD,mach,compute_EW=True,max_memory=max_memory)
+        assert np.array_equal(C_mn_b,C_mn) and np.array_equal(EW_b,EW)
+        assert np.array_equal(RFLAG_b,RFLAG) and np.array_equal(s_b,s)
+        A_b = compute_wing_induced_velocity(VD,mach,max_memory=max_memory,normals=normals)[0]
+        assert np.array_equal(A_b,A_single)
+
+    # the peak memory of the blocks is bounded by the outputs and max_memory
+    max_memory  = 16*row_memory
+    peak_single = peak_memory(VD,mach,None,normals)
+    tic         = time.perf_counter()
+    peak_block  = peak_memory(VD,mach,max_memory,normals)
+    t_block     = time.perf_counter() - tic
+    outputs     = 2*A_single.nbytes + EW.nbytes
+    assert peak_block < peak_single/2
+    assert peak_block < outputs + 2*max_memory
+
+    print('induced velocities of %d panels at %d mach numbers' % (n_cp,len(mach)))
+    print('single block: %8.3f s, peak %8.1f MB' % (t_single,peak_single/1E6))
+    print('blocks:       %8.3f s, peak %8.1f MB' % (t_block,peak_block/1E6))
+
+    return
+
+def peak_memory(VD,mach,max_memory,normals):
+    """ Peak memory allocated while computing the influence coefficient and normalwash matrices """
+
+    tracemalloc.start()
+    compute_wing_induced_velocity(VD,mach,compute_EW=True,max_memory=max_memory,normals=normals)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+if __name__ == '__main__':
+    main()
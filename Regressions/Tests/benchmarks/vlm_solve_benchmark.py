@@ -0,0 +1,70 @@
+# Regression/scripts/Tests/benchmarks/vlm_solve_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method     import VLM
+from   RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM import solve_vortex_strengths
+
+# python imports
+import numpy as np
+import time
+import sys
+
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # one factorization per mach number solves every case of that mach number as np.linalg.solve does
+    rng     = np.random.default_rng(0)
+    n_cp    = 60
+    A_small = (rng.standard_normal((4,n_cp,n_cp)) + n_cp*np.eye(n_cp)).astype(np.float32)
+    inv     = rng.integers(0,3,size=25)
+    RHS     = rng.standard_normal((25,n_cp))
+    GAMMA   = solve_vortex_strengths(A_small,RHS,inv)
+    assert GAMMA.dtype == np.float64
+    assert np.allclose(GAMMA,np.linalg.solve(A_small[inv],RHS),rtol=1e-12,atol=1e-14)
+
+    # the VLM over the angles of attack and mach numbers of the surrogate training
+    vehicle    = vehicle_setup()
+    analysis   = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    AoA, Mach  = np.meshgrid(analysis.training.angle_of_attack,analysis.training.Mach[:9])
+    conditions = training_conditions(AoA.reshape(-1,1),Mach.reshape(-1,1))
+    VLM(conditions,analysis.settings,vehicle)
+
+    tic        = time.perf_counter()
+    results    = VLM(conditions,analysis.settings,vehicle)
+    t_VLM      = time.perf_counter() - tic
+    assert np.all(np.isfinite(results.CL)) and np.all(np.isfinite(results.CDi))
+
+    # the lift increases with the angle of attack at the subsonic mach numbers
+    CL = results.CL.reshape(AoA.shape)
+    assert np.all(np.diff(CL[:8,:4],axis=1) > 0)
+
+    print('VLM of %d cases at %d mach numbers: %8.3f s' % (AoA.size,Mach.shape[0],t_VLM))
+
+    return
+
+def training_conditions(AoA,Mach):
+    """ Conditions of the VLM at each pair of angle of attack and mach number """
+
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(len(AoA))
+    conditions.aerodynamics.angles.alpha = AoA
+    conditions.freestream.mach_number    = Mach
+    conditions.freestream.velocity       = Mach*340. + 1.
+
+    return conditions
+
+if __name__ == '__main__':
+    main()
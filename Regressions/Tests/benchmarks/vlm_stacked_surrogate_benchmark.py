@@ -0,0 +1,117 @@
+# Regression/scripts/Tests/benchmarks/vlm_stacked_surrogate_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core                                              import Units
+from   RCAIDE.Library.Methods.Utilities                                   import Cubic_Spline_Blender
+from   RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.evaluate_VLM import compute_coefficients, compute_stacked_coefficients, compute_blending_weights
+
+# python imports
+import numpy as np
+import time
+import sys
+
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    aerodynamics                = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle        = vehicle_setup()
+    aerodynamics.training.Mach  = np.array([1E-12, 0.3, 0.7, 0.9, 1.3, 2.0])
+    aerodynamics.initialize()
+
+    surrogates = aerodynamics.surrogates
+    h_sub, h_sup = blending_functions(aerodynamics)
+
+    # points in and outside of the training grids, across the three regimes
+    rng      = np.random.default_rng(0)
+    n_points = 200
+    Mach     = np.atleast_2d(np.hstack([rng.uniform(0.,2.5,n_points - 4),[0.85,1.,1.05,1.15]])).T
+    weights  = compute_blending_weights(h_sub,h_sup,Mach)
+    assert np.allclose(np.sum(weights,axis=1),1.)
+
+    # the stacked surrogates give the coefficients of the surrogates of each coefficient and regime
+    training = aerodynamics.training
+    ranges   = training_ranges(training)
+    for variable in surrogates.stacked.keys():
+        low, high = ranges[variable]
+        x         = np.atleast_2d(rng.uniform(low - 0.5*(high - low), high + 0.5*(high - low), n_points)).T
+        pts       = np.hstack((x,Mach))
+        stacked   = compute_stacked_coefficients(surrogates.stacked[variable],weights,pts)
+        reference = reference_coefficients(surrogates,variable,h_sub,h_sup,Mach,pts)
+        for coefficient in reference.keys():
+            assert stacked[coefficient].shape == reference[coefficient].shape
+            assert np.allclose(stacked[coefficient],reference[coefficient],rtol=1e-10,atol=1e-13), variable + ' ' + coefficient
+
+    # time of the coefficients of the perturbation variables for the points of a segment
+    Mach    = np.atleast_2d(np.linspace(0.3,0.8,16)).T
+    pts     = np.hstack((np.atleast_2d(np.linspace(0.,8.,16)).T*Units.deg,Mach))
+    n       = 200
+    names   = list(surrogates.stacked.keys())
+    tic     = time.perf_counter()
+    for i in range(n):
+        for variable in names:
+            reference_coefficients(surrogates,variable,h_sub,h_sup,Mach,pts)
+    t_each  = (time.perf_counter() - tic)/n*1e3
+    tic     = time.perf_counter()
+    for i in range(n):
+        weights = compute_blending_weights(h_sub,h_sup,Mach)
+        for variable in names:
+            compute_stacked_coefficients(surrogates.stacked[variable],weights,pts)
+    t_stack = (time.perf_counter() - tic)/n*1e3
+
+    print('surrogate of each coefficient and regime: %8.3f ms' % t_each)
+    print('stacked surrogates:                       %8.3f ms' % t_stack)
+
+    return
+
+def training_ranges(training):
+    """ Ranges of the training grids of the perturbation variables """
+
+    return {'alpha'  : (training.angle_of_attack.min()    , training.angle_of_attack.max()),
+            'beta'   : (training.sideslip_angle.min()     , training.sideslip_angle.max()),
+            'u'      : (training.u.min()                  , training.u.max()),
+            'v'      : (training.v.min()                  , training.v.max()),
+            'w'      : (training.w.min()                  , training.w.max()),
+            'p'      : (training.roll_rate.min()          , training.roll_rate.max()),
+            'q'      : (training.pitch_rate.min()         , training.pitch_rate.max()),
+            'r'      : (training.yaw_rate.min()           , training.yaw_rate.max()),
+            'delta_a': (training.aileron_deflection.min() , training.aileron_deflection.max()),
+            'delta_e': (training.elevator_deflection.min(), training.elevator_deflection.max()),
+            'delta_r': (training.rudder_deflection.min()  , training.rudder_deflection.max()),
+            'delta_f': (training.flap_deflection.min()    , training.flap_deflection.max()),
+            'delta_s': (training.slat_deflection.min()    , training.slat_deflection.max())}
+
+def blending_functions(aerodynamics):
+    """ Blending functions of the subsonic and supersonic surrogates of evaluate_surrogate """
+
+    sub_trans_spline = Cubic_Spline_Blender(aerodynamics.hsub_min,aerodynamics.hsub_max)
+    sup_trans_spline = Cubic_Spline_Blender(aerodynamics.hsup_max,aerodynamics.hsup_min)
+
+    return (lambda M:sub_trans_spline.compute(M)), (lambda M:sup_trans_spline.compute(M))
+
+def reference_coefficients(surrogates,variable,h_sub,h_sup,Mach,pts):
+    """ Coefficients from the surrogates of each coefficient and regime, as evaluate_surrogate computed them before
+        the stacked surrogates
+    """
+
+    tables = []
+    for regime in ['subsonic','transonic','supersonic']:
+        for coefficient in ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']:
+            tables.append(surrogates[regime][coefficient + '_' + variable])
+
+    return compute_coefficients(*tables,h_sub,h_sup,Mach,pts)
+
+if __name__ == '__main__':
+    main()
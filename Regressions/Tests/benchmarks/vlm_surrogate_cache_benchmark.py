@@ -0,0 +1,132 @@
+# Regression/scripts/Tests/benchmarks/vlm_surrogate_cache_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core                                   import Units
+from   RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import clear_VLM_surrogate_cache, save_VLM_surrogates, VLM_surrogate_cache_key
+
+# python imports
+import numpy as np
+import tempfile
+import shutil
+import time
+import os
+import sys
+
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+    try:
+        run_checks(directory)
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+    return
+
+def run_checks(directory):
+
+    # the first analysis trains and stores the tables, the second one loads them
+    vehicle = vehicle_setup()
+    tic     = time.perf_counter()
+    trained = VLM_analysis(vehicle,directory)
+    trained.initialize()
+    t_train = time.perf_counter() - tic
+    assert len(os.listdir(directory)) == 1
+
+    tic     = time.perf_counter()
+    loaded  = VLM_analysis(vehicle,directory)
+    loaded.initialize()
+    t_load  = time.perf_counter() - tic
+
+    # the loaded tables and surrogates are those of the training
+    for regime in ['subsonic','supersonic','transonic']:
+        check_equal(trained.training[regime],loaded.training[regime],regime)
+    for tag in ['S_ref','c_ref','b_ref','X_ref','aspect_ratio']:
+        assert np.all(trained.reference_values[tag] == loaded.reference_values[tag]), tag
+    assert loaded.elevator_flag and loaded.aileron_flag == trained.aileron_flag
+    points = np.array([[2.*Units.deg,0.3],[5.*Units.deg,0.7]])
+    for regime in ['subsonic','transonic']:
+        assert np.array_equal(trained.surrogates[regime].Clift_alpha(points),loaded.surrogates[regime].Clift_alpha(points))
+
+    # a config with deflected control surfaces uses the same tables, which are trained without deflection
+    config = vehicle_setup()
+    config.wings.main_wing.control_surfaces.flap.deflection = 30. * Units.deg
+    assert VLM_surrogate_cache_key(VLM_analysis(config,directory)) == VLM_surrogate_cache_key(loaded)
+
+    # a change of the geometry, the settings or the training grids gives a new key
+    changed = VLM_analysis(vehicle_setup(),directory)
+    keys    = set([VLM_surrogate_cache_key(changed)])
+    changed.vehicle.wings.main_wing.spans.projected *= 1.01
+    keys.add(VLM_surrogate_cache_key(changed))
+    changed.settings.number_of_spanwise_vortices += 1
+    keys.add(VLM_surrogate_cache_key(changed))
+    changed.training.angle_of_attack = changed.training.angle_of_attack*1.
+    changed.training.angle_of_attack[0] -= 1. * Units.deg
+    keys.add(VLM_surrogate_cache_key(changed))
+    assert len(keys) == 4
+
+    # tables are invalidated one at a time or all together
+    clear_VLM_surrogate_cache(loaded)
+    assert len(os.listdir(directory)) == 0
+    save_VLM_surrogates(trained)
+    assert len(os.listdir(directory)) == 1
+    clear_VLM_surrogate_cache(directory=directory)
+    assert len(os.listdir(directory)) == 0
+
+    # the least recently used tables are removed when the cache is full, here when it holds more than two tables
+    save_VLM_surrogates(trained)
+    size  = sum(os.path.getsize(os.path.join(root,name)) for root,dirs,names in os.walk(directory) for name in names)
+    other = VLM_analysis(vehicle_setup(),directory)
+    other.settings.surrogate_cache_size = int(2.5*size)
+    for regime in ['subsonic','supersonic','transonic']:
+        other.training[regime] = trained.training[regime]
+    for i in range(3):
+        time.sleep(0.05)
+        other.training.u = trained.training.u*(1. + 0.1*(i + 1))
+        save_VLM_surrogates(other)
+    assert len(os.listdir(directory)) == 2
+    assert not os.path.isdir(os.path.join(directory,VLM_surrogate_cache_key(trained)))
+
+    print('surrogate training:        %8.3f s' % t_train)
+    print('surrogates from the cache: %8.3f s' % t_load)
+
+    return
+
+def VLM_analysis(vehicle,directory):
+    """ A VLM analysis with a reduced training grid, storing its tables in directory """
+
+    aerodynamics                                    = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                            = vehicle
+    aerodynamics.settings.use_surrogate_cache       = True
+    aerodynamics.settings.surrogate_cache_directory = directory
+    aerodynamics.training.Mach                      = np.array([1E-12, 0.3, 0.7, 0.9, 1.3, 2.0])
+
+    return aerodynamics
+
+def check_equal(a,b,path):
+    """ Checks that two data structures hold the same arrays """
+
+    assert set(a.keys()) == set(b.keys()), path
+    for key in a.keys():
+        if hasattr(a[key],'keys'):
+            check_equal(a[key],b[key],path + '.' + key)
+        else:
+            assert np.array_equal(a[key],b[key]) and np.asarray(a[key]).dtype == np.asarray(b[key]).dtype, path + '.' + key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# Regression/scripts/Tests/benchmarks/vlm_training_workers_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core import Units
+
+# python imports
+import numpy as np
+import time
+import sys
+
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the same training with one process and with two
+    tic      = time.perf_counter()
+    serial   = VLM_analysis(1)
+    serial.initialize()
+    t_serial = time.perf_counter() - tic
+
+    tic      = time.perf_counter()
+    parallel = VLM_analysis(2)
+    parallel.initialize()
+    t_pool   = time.perf_counter() - tic
+
+    # the tables are identical, bit for bit
+    for regime in ['subsonic','supersonic','transonic']:
+        check_equal(serial.training[regime],parallel.training[regime],regime)
+    for tag in serial.reference_values.keys():
+        assert np.array_equal(serial.reference_values[tag],parallel.reference_values[tag]), tag
+    for flag in ['aileron_flag','elevator_flag','rudder_flag','flap_flag','slat_flag']:
+        assert serial[flag] == parallel[flag], flag
+
+    # the control surfaces of the vehicle are left undeflected as in a serial training
+    for wing in parallel.vehicle.wings:
+        for control_surface in wing.control_surfaces:
+            assert control_surface.deflection == 0.
+
+    print('training with one process:   %8.3f s' % t_serial)
+    print('training with two processes: %8.3f s' % t_pool)
+
+    return
+
+def VLM_analysis(workers):
+    """ A VLM analysis with a reduced training grid, trained by workers processes """
+
+    vehicle                                  = vehicle_setup()
+    vehicle.wings.main_wing.control_surfaces.flap.deflection = 20. * Units.deg
+    aerodynamics                             = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                     = vehicle
+    aerodynamics.settings.training_workers   = workers
+    aerodynamics.training.Mach               = np.array([1E-12, 0.3, 0.7, 0.9, 1.3, 2.0])
+
+    return aerodynamics
+
+def check_equal(a,b,path):
+    """ Checks that two data structures hold the same arrays """
+
+    assert set(a.keys()) == set(b.keys()), path
+    for key in a.keys():
+        if hasattr(a[key],'keys'):
+            check_equal(a[key],b[key],path + '.' + key)
+        else:
+            assert np.array_equal(a[key],b[key]) and np.asarray(a[key]).dtype == np.asarray(b[key]).dtype, path + '.' + key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# Regression/scripts/Tests/benchmarks/vortex_distribution_cache_benchmark.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from   RCAIDE.Framework.Core                                   import Units, content_hash
+from   RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import generate_vortex_distribution, clear_vortex_distribution_cache
+
+# python imports
+import numpy as np
+import os
+import shutil
+import tempfile
+import time
+import sys
+
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    settings = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+
+    # the same geometry and settings give a copy of the same vortex distribution, values set on it stay on the copy
+    clear_vortex_distribution_cache()
+    tic      = time.perf_counter()
+    VD       = generate_vortex_distribution(vehicle,settings)
+    t_new    = time.perf_counter() - tic
+    tic      = time.perf_counter()
+    VD_same  = generate_vortex_distribution(vehicle,settings)
+    t_cached = time.perf_counter() - tic
+    assert VD_same is not VD and VD_same.XC is VD.XC
+    assert vehicle.vortex_distribution is VD_same
+    VD_same.XBAR = np.zeros(1)
+    assert 'XBAR' not in generate_vortex_distribution(vehicle,settings)
+
+    # an equal copy of the vehicle is found as well
+    assert generate_vortex_distribution(vehicle_setup(),settings).XC is VD.XC
+
+    # a change of the geometry, of a control surface or of the discretization makes a new vortex distribution
+    wing                 = vehicle.wings.main_wing
+    wing.origin[0][0]   += 1.
+    VD_moved             = generate_vortex_distribution(vehicle,settings)
+    assert VD_moved.XC is not VD.XC and not np.array_equal(VD_moved.XC,VD.XC)
+    wing.origin[0][0]   -= 1.
+    assert generate_vortex_distribution(vehicle,settings).XC is VD.XC
+
+    aileron              = wing.control_surfaces.aileron
+    aileron.deflection  += 5. * Units.deg
+    assert generate_vortex_distribution(vehicle,settings).XC is not VD.XC
+    aileron.deflection  -= 5. * Units.deg
+
+    # so does a change of the contents of an airfoil coordinate file
+    airfoil = wing.Segments.root.Airfoil.airfoil
+    with tempfile.TemporaryDirectory() as directory:
+        coordinate_file         = airfoil.coordinate_file
+        airfoil.coordinate_file = os.path.join(directory,'airfoil.txt')
+        shutil.copy(coordinate_file,airfoil.coordinate_file)
+        VD_file = generate_vortex_distribution(vehicle,settings)
+        assert generate_vortex_distribution(vehicle,settings).XC is VD_file.XC
+        shutil.copy(wing.Segments.tip.Airfoil.airfoil.coordinate_file,airfoil.coordinate_file)
+        assert not np.array_equal(generate_vortex_distribution(vehicle,settings).ZC,VD_file.ZC)
+        airfoil.coordinate_file = coordinate_file
+
+    settings.number_of_spanwise_vortices += 1
+    VD_fine              = generate_vortex_distribution(vehicle,settings)
+    assert VD_fine.n_cp > VD.n_cp
+    settings.number_of_spanwise_vortices -= 1
+
+    # a cached vortex distribution is the same as a new one
+    clear_vortex_distribution_cache()
+    VD_again = generate_vortex_distribution(vehicle,settings)
+    assert VD_again.XC is not VD.XC
+    for key in ['XA1','YA1','ZA1','XB2','YB2','ZB2','XC','YC','ZC','CS','wing_areas']:
+        assert np.array_equal(VD_again[key],VD[key]), key
+
+    # the hash depends on the order of the keys and the types of the values
+    assert content_hash({'a':1,'b':2}) != content_hash({'b':2,'a':1})
+    assert content_hash(1) != content_hash(1.) and content_hash(np.ones(2)) != content_hash(np.ones(2,dtype=np.float32))
+
+    print('new vortex distribution:    %8.4f s' % t_new)
+    print('cached vortex distribution: %8.4f s' % t_cached)
+
+    return
+
+if __name__ == '__main__':
+    main()
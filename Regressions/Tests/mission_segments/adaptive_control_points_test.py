@@ -0,0 +1,100 @@
+# Regression/scripts/Tests/mission_segments/adaptive_control_points_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Mission.Common                        import Conditions
+from RCAIDE.Library.Mission.Solver.adaptive_control_points import resize_rows
+from RCAIDE.Library.Methods.Utilities.Chebyshev             import chebyshev_data
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../network_turboprop')
+import turboprop_network_test as turboprop
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # only arrays with one row per control point are interpolated
+    x_old          = chebyshev_data(5)[0]
+    x_new          = chebyshev_data(9)[0]
+    data           = Conditions()
+    data.linear    = 2.*x_old[:,None] + 1.
+    data.matrices  = np.ones((5,3,3))*x_old[:,None,None]
+    data.flags     = np.array([True,True,True,True,True])[:,None]
+    data.vector    = np.arange(5.)
+    resize_rows(data,x_old,x_new)
+    assert np.allclose(data.linear,2.*x_new[:,None] + 1.)
+    assert data.matrices.shape == (9,3,3) and np.allclose(data.matrices,x_new[:,None,None])
+    assert data.flags.shape == (9,1) and data.flags.dtype == bool and np.all(data.flags)
+    assert np.array_equal(data.vector,np.arange(5.))
+
+    # the climb on the default 16 control points
+    mission = missions_setup()
+    mission.evaluate()
+
+    # the same climb with the number of control points chosen from the Chebyshev coefficient decay, the smooth
+    # climb needs no more than the minimum number of points
+    adaptive_mission = missions_setup()
+    segment          = adaptive_mission.segments.climbing_cruise
+    numerics         = segment.state.numerics
+    numerics.adaptive_control_points = True
+    adaptive_mission.evaluate()
+    print('control points: %d  discretization error: %.3e' % (numerics.number_of_control_points,
+                                                               numerics.discretization_error))
+    assert segment.converged
+    assert numerics.discretization_error <= numerics.adaptive_tolerance
+    assert numerics.number_of_control_points == numerics.minimum_number_of_control_points
+
+    # a tighter tolerance refines the points to 2N-1
+    adaptive_mission = missions_setup()
+    segment          = adaptive_mission.segments.climbing_cruise
+    numerics         = segment.state.numerics
+    numerics.adaptive_control_points = True
+    numerics.adaptive_tolerance      = 1E-10
+    adaptive_mission.evaluate()
+    print('control points: %d  discretization error: %.3e' % (numerics.number_of_control_points,
+                                                               numerics.discretization_error))
+    assert segment.converged
+    assert numerics.discretization_error <= numerics.adaptive_tolerance
+    assert numerics.number_of_control_points == 9
+    assert len(segment.conditions.frames.inertial.time) == 9
+    assert len(segment.state.unknowns.body_angle) == 9
+
+    # the end of the climb matches the default discretization
+    check_list = [
+        'segments.climbing_cruise.conditions.frames.inertial.time',
+        'segments.climbing_cruise.conditions.weights.total_mass',
+        'segments.climbing_cruise.conditions.frames.inertial.position_vector',
+    ]
+    for k in check_list:
+        old_val = mission.deep_get(k)[-1]
+        new_val = adaptive_mission.deep_get(k)[-1]
+        err     = np.max(np.abs(new_val - old_val))/np.max(np.abs(old_val))
+        print(k,'error:',err)
+        assert err < 1E-4, 'Check Failed : %s' % k
+
+    return
+
+def missions_setup():
+    """ The single segment turboprop climb mission """
+
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+
+    return turboprop.missions_setup(mission).base_mission
+
+if __name__ == '__main__':
+    main()
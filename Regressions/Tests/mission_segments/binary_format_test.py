@@ -0,0 +1,88 @@
+# Regression/scripts/Tests/mission_segments/binary_format_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core           import Data
+from RCAIDE.Framework.Mission.Common import Results
+from RCAIDE.load                     import load as load_results
+from RCAIDE.save                     import save as save_results
+
+# python imports
+import numpy as np
+import os
+import tempfile
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the conditions of a mission segment, with float, integer, bool and 0-d arrays
+    n_cpts     = 4
+    conditions = Results()
+    conditions.expand_rows(n_cpts)
+    conditions.frames.inertial.time[:,0]             = np.linspace(0., 600., n_cpts)
+    conditions.frames.inertial.position_vector[:,0]  = np.linspace(0., 1E5, n_cpts)
+    conditions.weights.total_mass[:,0]               = np.linspace(7E4, 6.9E4, n_cpts)
+    conditions.aerodynamics.angles.alpha[:,0]        = np.linspace(0.02, 0.05, n_cpts)
+    conditions.flags                                 = Data()
+    conditions.flags.stall                           = np.array([[False],[True],[False],[False]])
+    conditions.flags.segment_index                   = np.arange(n_cpts)
+    conditions.flags.reference_mass                  = np.array(7E4)
+
+    # keys that look like the reference to an array file are kept as data
+    conditions.notes                                 = Data()
+    conditions.notes['__npy__']                      = '0.npy'
+    conditions.notes['\\escaped']                    = 'backslash'
+    conditions['__npy__']                            = Data()
+    conditions['__npy__']['__npy__']                 = 'top level'
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory,'conditions')
+        save_results(conditions, filename, binary_format = True)
+
+        # the arrays are memory mapped copy on write, changes stay in memory
+        loaded = load_results(filename)
+        check_binary_format(conditions, loaded)
+        loaded.frames.inertial.time[:,0] = 1.
+        loaded.flags.reference_mass[...] = 1.
+        check_binary_format(conditions, load_results(filename))
+
+        # saving again over the mapped arrays, then reading them into memory
+        save_results(loaded, filename, binary_format = True)
+        reloaded = load_results(filename, mmap_mode = None)
+
+    assert type(reloaded.frames.inertial.time) is np.ndarray
+    assert np.all(reloaded.frames.inertial.time == 1.) and reloaded.flags.reference_mass == 1.
+    assert np.array_equal(reloaded.flags.stall, conditions.flags.stall)
+    assert reloaded.notes['__npy__'] == '0.npy' and reloaded.notes['\\escaped'] == 'backslash'
+
+    return
+
+def check_binary_format(old_data, new_data, path = ''):
+    """ Compares every leaf of a data structure with its binary format round trip """
+
+    assert list(new_data.keys()) == list(old_data.keys()), 'Check Failed : %s' % path
+    for k in old_data.keys():
+        old_val = old_data[k]
+        new_val = new_data[k]
+        key     = path + '.' + k if path else k
+        if isinstance(old_val, dict):
+            check_binary_format(old_val, new_val, key)
+        elif isinstance(old_val, np.ndarray):
+            assert isinstance(new_val, np.memmap) and new_val.mode == 'c' , 'Check Failed : %s' % key
+            assert new_val.dtype == old_val.dtype and new_val.shape == old_val.shape , 'Check Failed : %s' % key
+            assert np.array_equal(new_val, old_val) , 'Check Failed : %s' % key
+        else:
+            assert new_val == old_val , 'Check Failed : %s' % key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# Regression/scripts/Tests/mission_segments/contiguous_state_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Mission.Solver import pack_unknowns, unpack_unknowns, pack_residuals
+
+# python imports
+import numpy as np
+import sys
+from   copy import deepcopy
+
+# local imports
+sys.path.append('../network_turboprop')
+import turboprop_network_test as turboprop
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the climb solved with the default packing
+    mission = missions_setup()
+    mission.evaluate()
+
+    # the state of the solved climb, packed and unpacked both ways
+    default_segment = deepcopy(mission.segments.climbing_cruise)
+    default_segment.state.numerics.contiguous_state = False
+    default_segment.state.unknowns.scalar = 2.
+    contiguous_segment = deepcopy(default_segment)
+    contiguous_segment.state.numerics.contiguous_state = True
+
+    default_vector    = pack_unknowns(default_segment)
+    contiguous_vector = pack_unknowns(contiguous_segment)
+    assert np.array_equal(contiguous_vector,default_vector)
+    assert default_segment.state.unknowns._layout is None
+
+    # every unknown array is a view of the one buffer
+    buffer = contiguous_segment.state.unknowns._layout.buffer
+    for path,shape,start,stop in contiguous_segment.state.unknowns._layout.leaves:
+        if shape:
+            assert np.shares_memory(contiguous_segment.state.unknowns.deep_get('.'.join(path)),buffer)
+
+    # unpacking a new vector sets the same unknowns, and the root finder may reuse the vector afterwards
+    vector = default_vector*1.1 + 0.01
+    for segment in [default_segment,contiguous_segment]:
+        unpacked = vector.copy()
+        unpack_unknowns(segment,unpacked)
+        unpacked[:] = np.nan
+    check_state(contiguous_segment.state.unknowns,default_segment.state.unknowns)
+    assert np.array_equal(contiguous_segment.state.unknowns.pack_array(),vector)
+
+    # an unknown replaced between solves is linked to the buffer again by the next solve
+    contiguous_segment.state.unknowns.body_angle = contiguous_segment.state.unknowns.body_angle.copy()
+    pack_unknowns(contiguous_segment)
+    buffer = contiguous_segment.state.unknowns._layout.buffer
+    assert np.shares_memory(contiguous_segment.state.unknowns.body_angle,buffer)
+    vector = vector*0.9
+    for segment in [default_segment,contiguous_segment]:
+        unpack_unknowns(segment,vector)
+    check_state(contiguous_segment.state.unknowns,default_segment.state.unknowns)
+
+    # the residuals pack the same on the first and the later evaluations, the later ones return the buffer
+    for segment in [default_segment,contiguous_segment]:
+        segment.process.iterate(segment)
+    for evaluation in range(2):
+        assert np.array_equal(pack_residuals(contiguous_segment),pack_residuals(default_segment))
+    layout = contiguous_segment.state.residuals._layout
+    assert pack_residuals(contiguous_segment) is layout.buffer
+
+    # residuals replaced by the segment are copied into the buffer
+    for segment in [default_segment,contiguous_segment]:
+        segment.state.residuals.force_x = segment.state.residuals.force_x*2.
+    assert np.array_equal(pack_residuals(contiguous_segment),pack_residuals(default_segment))
+    assert np.shares_memory(contiguous_segment.state.residuals.force_x,layout.buffer)
+
+    # residuals that change shape are laid out again
+    for segment in [default_segment,contiguous_segment]:
+        segment.state.residuals.force_x = np.ones((3,1))
+    assert np.array_equal(pack_residuals(contiguous_segment),pack_residuals(default_segment))
+
+    # the climb solved with the contiguous buffer matches the default solve
+    contiguous_mission = missions_setup()
+    contiguous_mission.segments.climbing_cruise.state.numerics.contiguous_state = True
+    contiguous_mission.evaluate()
+    assert contiguous_mission.segments.climbing_cruise.converged
+    check_results(contiguous_mission,mission)
+
+    # and with the sparse Jacobian, which keeps the residuals of its last evaluation
+    sparse_missions = []
+    for contiguous_state in [False,True]:
+        sparse_mission = missions_setup()
+        sparse_mission.segments.climbing_cruise.state.numerics.solver_jacobian  = 'sparse'
+        sparse_mission.segments.climbing_cruise.state.numerics.contiguous_state = contiguous_state
+        sparse_mission.evaluate()
+        assert sparse_mission.segments.climbing_cruise.converged
+        sparse_missions.append(sparse_mission)
+    check_results(sparse_missions[1],sparse_missions[0])
+
+    return
+
+def missions_setup():
+    """ The single segment turboprop climb mission """
+
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+
+    return turboprop.missions_setup(mission).base_mission
+
+def check_state(new_state,old_state):
+    """ Compares every leaf of two unknowns """
+
+    assert list(new_state.keys()) == list(old_state.keys())
+    for k in old_state.keys():
+        assert np.array_equal(new_state[k],old_state[k]), 'Check Failed : %s' % k
+
+    return
+
+def check_results(new_results,old_results):
+    """ Compares the climb conditions of two solves """
+
+    check_list = [
+        'segments.climbing_cruise.conditions.aerodynamics.angles.alpha',
+        'segments.climbing_cruise.conditions.aerodynamics.coefficients.lift.total',
+        'segments.climbing_cruise.conditions.weights.total_mass',
+        'segments.climbing_cruise.conditions.frames.inertial.time',
+    ]
+
+    for k in check_list:
+        old_val = old_results.deep_get(k)
+        new_val = new_results.deep_get(k)
+        err     = np.max(np.abs(new_val - old_val))/np.max(np.abs(old_val))
+        print(k,'error:',err)
+        assert err < 1E-6, 'Check Failed : %s' % k
+
+    return
+
+if __name__ == '__main__':
+    main()
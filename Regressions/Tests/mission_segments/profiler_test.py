@@ -0,0 +1,96 @@
+# Regression/scripts/Tests/mission_segments/profiler_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Analyses.Profiler import profiler
+
+# python imports
+import numpy as np
+import sys
+import tracemalloc
+
+# local imports
+sys.path.append('../network_turboprop')
+import turboprop_network_test as turboprop
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # the climb evaluated without the profiler
+    mission = missions_setup()
+    mission.evaluate()
+
+    # the same climb, recording the time of each process step
+    profiled_mission = missions_setup()
+    profiler.reset()
+    profiler.start()
+    profiled_mission.evaluate()
+    profiler.stop()
+    print(profiler.summary(10))
+    assert not profiler.active
+    assert profiler.solver['base_mission.climbing_cruise']['converged']
+    assert profiler.steps['base_mission.climbing_cruise.iterate.conditions.aerodynamics']['calls'] > 1
+    check_results(profiled_mission,mission)
+
+    # the memory of each step, tracemalloc is stopped again by the profiler that started it
+    assert not tracemalloc.is_tracing()
+    profiler.reset()
+    profiler.start(memory=True)
+    profiled_mission.evaluate()
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
+    assert profiler.steps['base_mission.climbing_cruise.iterate.conditions.aerodynamics']['peak_memory'] > 0
+
+    # tracemalloc started by the caller keeps running
+    tracemalloc.start()
+    try:
+        profiler.reset()
+        profiler.start(memory=True)
+        profiled_mission.evaluate()
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    profiler.reset()
+
+    return
+
+def missions_setup():
+    """ The single segment turboprop climb mission """
+
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+
+    return turboprop.missions_setup(mission).base_mission
+
+def check_results(new_results,old_results):
+    """ Compares the climb conditions of two solves """
+
+    check_list = [
+        'segments.climbing_cruise.conditions.aerodynamics.angles.alpha',
+        'segments.climbing_cruise.conditions.aerodynamics.coefficients.lift.total',
+        'segments.climbing_cruise.conditions.weights.total_mass',
+        'segments.climbing_cruise.conditions.frames.inertial.time',
+    ]
+
+    for k in check_list:
+        old_val = old_results.deep_get(k)
+        new_val = new_results.deep_get(k)
+        err     = np.max(np.abs(new_val - old_val))/np.max(np.abs(old_val))
+        print(k,'error:',err)
+        assert err < 1E-6, 'Check Failed : %s' % k
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# Regression/scripts/Tests/mission_segments/sparse_jacobian_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Mission.Solver.sparse_jacobian import sparse_jacobian, color_jacobian_columns
+from RCAIDE.Library.Mission.Solver.contiguous_state import pack_unknowns
+
+# python imports
+import numpy as np
+import time
+import sys
+
+# local imports
+sys.path.append('../network_turboprop')
+import turboprop_network_test as turboprop
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # columns without a common row share a color
+    sparsity = np.array([[1,0,0,1],
+                         [0,1,0,0],
+                         [0,0,1,1]],dtype=bool)
+    colors   = color_jacobian_columns(sparsity)
+    assert np.max(colors) + 1 == 2
+    for color in range(2):
+        assert np.all(np.sum(sparsity[:,colors == color],axis=1) <= 1)
+
+    # the default dense Jacobian solve
+    mission   = missions_setup()
+    count_iterations(mission)
+    tic       = time.perf_counter()
+    results   = mission.evaluate()
+    t_dense   = time.perf_counter() - tic
+    n_dense   = mission.segments.climbing_cruise.iterations
+
+    # the same segment solved with the sparse Jacobian, the first solve finds the pattern with the residual
+    # evaluations the dense Jacobian takes, so it is not slower than the dense solve
+    sparse_mission  = missions_setup()
+    segment         = sparse_mission.segments.climbing_cruise
+    segment.state.numerics.solver_jacobian = "sparse"
+    count_iterations(sparse_mission)
+    tic             = time.perf_counter()
+    sparse_results  = sparse_mission.evaluate()
+    t_sparse        = time.perf_counter() - tic
+    n_sparse        = segment.iterations
+    print('first solve, dense: %d residual evaluations %6.3f s  sparse: %d residual evaluations %6.3f s' %
+          (n_dense,t_dense,n_sparse,t_sparse))
+    assert segment.converged
+    assert n_sparse <= n_dense
+    check_results(sparse_results,results)
+
+    # the pattern is kept for the next evaluations and needs fewer residual evaluations than a dense probe
+    numerics  = segment.state.numerics
+    pattern   = numerics.jacobian_sparsity
+    n_colors  = np.max(numerics.jacobian_colors) + 1
+    n_x       = pattern.shape[1]
+    print('unknowns: %d  colors: %d  nonzeros: %d of %d' % (n_x,n_colors,np.sum(pattern),pattern.size))
+    assert pattern.dtype == bool
+    assert n_colors < n_x
+
+    # the colored Jacobian equals the Jacobian of a full probe at the converged unknowns
+    unknowns                   = pack_unknowns(segment)
+    colored                    = sparse_jacobian(unknowns,segment)
+    numerics.jacobian_sparsity = None
+    probed                     = sparse_jacobian(unknowns,segment)
+    scale                      = np.maximum(np.max(np.abs(probed),axis=0),1E-12)
+    err                        = np.max(np.abs(colored - probed)/scale)
+    print('colored Jacobian error:', err)
+    assert err < 1E-6
+
+    # the union of several probes holds at least the pattern of one probe
+    single                     = numerics.jacobian_sparsity
+    numerics.jacobian_sparsity = None
+    numerics.jacobian_probes   = 3
+    sparse_jacobian(unknowns,segment)
+    assert np.all(numerics.jacobian_sparsity[single])
+
+    # a repeated evaluation reuses the stored pattern and perturbs the columns by color
+    pattern            = numerics.jacobian_sparsity
+    segment.iterations = 0
+    sparse_mission.evaluate()
+    print('repeated solve, sparse: %d residual evaluations' % segment.iterations)
+    assert segment.converged
+    assert numerics.jacobian_sparsity is pattern
+    assert segment.iterations < n_dense
+    check_results(sparse_mission,results)
+
+    return
+
+def missions_setup():
+    """ The single segment turboprop climb mission """
+
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+
+    return turboprop.missions_setup(mission).base_mission
+
+def count_iterations(mission):
+    """ Counts the residual evaluations of the climb """
+
+    segment            = mission.segments.climbing_cruise
+    segment.iterations = 0
+    segment.process.iterate.count_iterations = add_iteration
+
+    return
+
+def add_iteration(segment):
+    """ Adds one residual evaluation """
+
+    segment.iterations += 1
+
+    return
+
+def check_results(new_results,old_results):
+    """ Compares the climb conditions of two solves """
+
+    check_list = [
+        'segments.climbing_cruise.conditions.aerodynamics.angles.alpha',
+        'segments.climbing_cruise.conditions.aerodynamics.coefficients.lift.total',
+        'segments.climbing_cruise.conditions.weights.total_mass',
+        'segments.climbing_cruise.conditions.frames.inertial.time',
+    ]
+
+    for k in check_list:
+        old_val = old_results.deep_get(k)
+        new_val = new_results.deep_get(k)
+        err     = np.max(np.abs(new_val - old_val))/np.max(np.abs(old_val))
+        print(k,'error:',err)
+        assert err < 1E-6, 'Check Failed : %s' % k
+
+    return
+
+if __name__ == '__main__':
+    main()
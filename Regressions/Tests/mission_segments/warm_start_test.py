@@ -0,0 +1,128 @@
+# Regression/scripts/Tests/mission_segments/warm_start_test.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core         import Data
+from RCAIDE.Library.Mission.Solver import clear_warm_start
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../network_turboprop')
+import turboprop_network_test as turboprop
+
+# ----------------------------------------------------------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+def main():
+
+    # a cold solve of the climb
+    mission = missions_setup()
+    mission.evaluate()
+    cold    = mission.segments.climbing_cruise.iterations
+
+    # the first evaluation of a warm started mission has nothing to start from
+    warm_mission = missions_setup()
+    warm_mission.warm_start = True
+    warm_mission.evaluate()
+    assert warm_mission.segments.climbing_cruise.iterations == cold
+    assert 'climbing_cruise' in warm_mission.warm_start_store[warm_mission.tag]
+    check_results(warm_mission,mission)
+
+    # a repeated evaluation starts from the stored solution and needs fewer iterations
+    warm_mission.segments.climbing_cruise.iterations = 0
+    warm_mission.evaluate()
+    warm = warm_mission.segments.climbing_cruise.iterations
+    print('cold iterations: %d  warm iterations: %d' % (cold,warm))
+    assert warm_mission.segments.climbing_cruise.converged
+    assert warm < cold
+    check_results(warm_mission,mission)
+
+    # another mission with the same tag does not see the solutions of the first one
+    other_mission = missions_setup()
+    other_mission.warm_start = True
+    assert other_mission.tag == warm_mission.tag
+    assert len(other_mission.warm_start_store) == 0
+    other_mission.evaluate()
+    assert other_mission.segments.climbing_cruise.iterations == cold
+
+    # a mission rebuilt with the same tags, as in each iteration of an optimization, starts from the solutions in
+    # a store passed to it
+    rebuilt_mission = missions_setup()
+    rebuilt_mission.warm_start       = True
+    rebuilt_mission.warm_start_store = warm_mission.warm_start_store
+    rebuilt_mission.evaluate()
+    assert rebuilt_mission.segments.climbing_cruise.converged
+    assert rebuilt_mission.segments.climbing_cruise.iterations < cold
+    check_results(rebuilt_mission,mission)
+
+    # missions with other tags in the same store are kept apart
+    shared                           = Data()
+    other_mission.tag                = 'other_mission'
+    other_mission.warm_start_store   = shared
+    rebuilt_mission.warm_start_store = shared
+    other_mission.segments.climbing_cruise.iterations = 0
+    other_mission.evaluate()
+    rebuilt_mission.segments.climbing_cruise.iterations = 0
+    rebuilt_mission.evaluate()
+    assert rebuilt_mission.segments.climbing_cruise.iterations == cold
+    assert list(shared.keys()) == ['other_mission',rebuilt_mission.tag]
+
+    # clearing the store of one mission brings back its cold solve and keeps the others
+    clear_warm_start(rebuilt_mission)
+    assert list(shared.keys()) == ['other_mission']
+    rebuilt_mission.segments.climbing_cruise.iterations = 0
+    rebuilt_mission.evaluate()
+    assert rebuilt_mission.segments.climbing_cruise.iterations == cold
+
+    return
+
+def missions_setup():
+    """ The single segment turboprop climb mission, counting the iterations of the segment """
+
+    vehicle  = turboprop.vehicle_setup()
+    configs  = turboprop.configs_setup(vehicle)
+    analyses = turboprop.analyses_setup(configs)
+    mission  = turboprop.mission_setup(analyses)
+    segment  = mission.segments.climbing_cruise
+    segment.iterations = 0
+    segment.process.iterate.count_iterations = count_iterations
+
+    return turboprop.missions_setup(mission).base_mission
+
+def count_iterations(segment):
+    """ Counts the residual evaluations of a segment """
+
+    segment.iterations += 1
+
+    return
+
+def check_results(new_results,old_results):
+    """ Compares the climb conditions of two solves """
+
+    check_list = [
+        'segments.climbing_cruise.conditions.aerodynamics.angles.alpha',
+        'segments.climbing_cruise.conditions.aerodynamics.coefficients.lift.total',
+        'segments.climbing_cruise.conditions.weights.total_mass',
+        'segments.climbing_cruise.conditions.frames.inertial.time',
+    ]
+
+    for k in check_list:
+        old_val = old_results.deep_get(k)
+        new_val = new_results.deep_get(k)
+        err     = np.max(np.abs(new_val - old_val))/np.max(np.abs(old_val))
+        print(k,'error:',err)
+        assert err < 1E-6, 'Check Failed : %s' % k
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -26,9 +26,34 @@ modules = [
     'Tests/analysis_stability/vlm_pertubation_test.py', 
     'Tests/analysis_weights/operating_empty_weight_test.py',
     'Tests/analysis_weights/cg_and_moi_test.py',
+    'Tests/benchmarks/data_access_benchmark.py',
+    'Tests/benchmarks/data_memory_benchmark.py',
+    'Tests/benchmarks/airfoil_polar_database_benchmark.py',
+    'Tests/benchmarks/atmosphere_benchmark.py',
+    'Tests/benchmarks/bet_airfoil_lookup_benchmark.py',
+    'Tests/benchmarks/boundary_layer_march_benchmark.py',
+    'Tests/benchmarks/contiguous_state_benchmark.py',
+    'Tests/benchmarks/import_time_benchmark.py',
+    'Tests/benchmarks/polar_table_benchmark.py',
+    'Tests/benchmarks/rotor_inflow_newton_benchmark.py',
+    'Tests/benchmarks/rotor_performance_map_benchmark.py',
+    'Tests/benchmarks/shared_identical_results_benchmark.py',
+    'Tests/benchmarks/unit_conversion_benchmark.py',
+    'Tests/benchmarks/vlm_blocked_induced_velocity_benchmark.py',
+    'Tests/benchmarks/vlm_solve_benchmark.py',
+    'Tests/benchmarks/vlm_stacked_surrogate_benchmark.py',
+    'Tests/benchmarks/vlm_surrogate_cache_benchmark.py',
+    'Tests/benchmarks/vlm_training_workers_benchmark.py',
+    'Tests/benchmarks/vortex_distribution_cache_benchmark.py',
     'Tests/geometry_airfoils/airfoil_import_test.py', 
     'Tests/geometry_airfoils/airfoil_interpolation_test.py',     
+    'Tests/mission_segments/adaptive_control_points_test.py',
+    'Tests/mission_segments/binary_format_test.py',
+    'Tests/mission_segments/contiguous_state_test.py',
+    'Tests/mission_segments/profiler_test.py',
+    'Tests/mission_segments/sparse_jacobian_test.py',
     'Tests/mission_segments/transition_segment_test.py', 
+    'Tests/mission_segments/warm_start_test.py',
     'Tests/network_electric/electric_btms_test.py', 
     'Tests/network_ducted_fan/electric_ducted_fan_network_test.py',
     'Tests/network_turbofan/turbofan_network_test.py',